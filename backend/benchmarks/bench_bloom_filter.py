@@ -0,0 +1,87 @@
+"""
+Breached password lookups: the former per-probe Bloom filter vs. the register-blocked `BloomFilter`.
+
+Run from `backend/` with `python -m benchmarks.bench_bloom_filter`. Both filters hold the same passwords at the same
+target false-positive rate. Hits are the worst case of the per-probe filter, which runs all of its probes, while a
+miss usually stops after one or two; the blocked filter costs the same either way.
+"""
+
+import pathlib
+import statistics
+import tempfile
+import time
+import typing
+import zlib
+
+from src.security.validation.bloom_filter import BloomFilter, get_false_positive_rate, normalize_password
+
+PASSWORDS: int = 1_000_000
+LOOKUPS: int = 200_000
+FALSE_POSITIVE_RATE: float = 0.001
+ROUNDS: int = 5
+
+
+class ProbingBloomFilter:
+    """
+    The previous layout: `hash_count` bits scattered over the whole array, probed one by one (double hashing).
+    """
+
+    def __init__(self, items: typing.Iterable[str], bit_count: int, hash_count: int) -> None:
+        self._bits = bytearray(bit_count // 8)
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        for item in items:
+            encoded_item = item.encode()
+            first_hash, second_hash = zlib.crc32(encoded_item), zlib.crc32(encoded_item[::-1]) | 1
+            for probe in range(hash_count):
+                bit_index = (first_hash + probe * second_hash) % bit_count
+                self._bits[bit_index >> 3] |= 1 << (bit_index & 7)
+
+    def __contains__(self, item: str) -> bool:
+        encoded_item = item.encode()
+        first_hash, second_hash = zlib.crc32(encoded_item), zlib.crc32(encoded_item[::-1]) | 1
+        bits, bit_count = self._bits, self.bit_count
+        for probe in range(self.hash_count):
+            bit_index = (first_hash + probe * second_hash) % bit_count
+            if not bits[bit_index >> 3] & (1 << (bit_index & 7)):
+                return False
+        return True
+
+
+def measure(label: str, bloom_filter: typing.Container[str], items: list[str]) -> None:
+    per_lookup_us: list[float] = list()
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        for item in items:
+            item in bloom_filter  # noqa: B015
+        per_lookup_us.append((time.perf_counter() - started_at) / len(items) * 1_000_000)
+    false_positives = sum(f"unseen-{index}" in bloom_filter for index in range(LOOKUPS)) / LOOKUPS
+    print(
+        f"{label:<40} {statistics.median(per_lookup_us):6.2f} us/lookup (median of {ROUNDS}),"
+        f" {false_positives:.3%} false positives"
+    )
+
+
+if __name__ == "__main__":
+    passwords = [normalize_password(password=f"Password{index}!") for index in range(PASSWORDS)]
+    hits = passwords[:: PASSWORDS // LOOKUPS]
+    misses = [f"unbreached{index}!" for index in range(LOOKUPS)]
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        blocked_filter = BloomFilter.build(
+            items=passwords, item_count=PASSWORDS, false_positive_rate=FALSE_POSITIVE_RATE
+        )
+        blocked_filter.save(path=pathlib.Path(root_dir) / "passwords.bloom")
+        blocked_filter = BloomFilter.load(path=pathlib.Path(root_dir) / "passwords.bloom")
+
+        # Classic optimum for the same target rate: ~14.4 bits and 10 probes per password
+        probing_filter = ProbingBloomFilter(items=passwords, bit_count=14_377_600, hash_count=10)
+        print(
+            f"--- {PASSWORDS} passwords, per-probe {probing_filter.bit_count // 8 // 1024} KiB,"
+            f" blocked {blocked_filter.bit_count // 8 // 1024} KiB (expected false positives"
+            f" {get_false_positive_rate(blocked_filter.bit_count / PASSWORDS, blocked_filter.hash_count):.3%})"
+        )
+        for lookup_label, items in (("hits", hits), ("misses", misses)):
+            measure(f"per-probe filter, {lookup_label}", probing_filter, items)
+            measure(f"register-blocked filter, {lookup_label}", blocked_filter, items)
+        del blocked_filter
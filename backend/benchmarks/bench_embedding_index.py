@@ -0,0 +1,91 @@
+"""
+Top-k cosine search: a Python loop over the vectors vs. the `EmbeddingIndex` matrix products, exhaustive and IVF.
+
+Run from `backend/` with `python -m benchmarks.bench_embedding_index`. The vectors are clustered random embeddings of
+the default dimension; the Python loop only scans a slice of them and is reported per full index size. IVF recall is
+measured against the exhaustive results, so it shows what the skipped lists cost.
+"""
+
+import statistics
+import time
+import typing
+import uuid
+
+import numpy
+
+from src.ml.embedding_index import EmbeddingIndex, normalize_rows
+
+IMAGES: int = 100_000
+DIMENSION: int = 256
+QUERIES: int = 64
+K: int = 10
+LISTS: int = 256
+PROBES: int = 16
+ROUNDS: int = 5
+
+
+def build_vectors(count: int) -> numpy.ndarray:
+    generator = numpy.random.default_rng(0)
+    centers = generator.standard_normal((1000, DIMENSION), dtype=numpy.float32)
+    return centers[generator.integers(0, len(centers), count)] + 0.5 * generator.standard_normal(
+        (count, DIMENSION), dtype=numpy.float32
+    )
+
+
+def search_per_vector(vectors: list[list[float]], query: list[float]) -> list[int]:
+    query_norm = sum(value * value for value in query) ** 0.5
+    scores = list()
+    for row, vector in enumerate(vectors):
+        dot = sum(left * right for left, right in zip(vector, query))
+        scores.append((dot / (query_norm * sum(value * value for value in vector) ** 0.5), row))
+    return [row for _, row in sorted(scores, reverse=True)[:K]]
+
+
+def measure(label: str, func: typing.Callable[[], typing.Any], queries: int, scale: float = 1.0) -> None:
+    queries_per_second: list[float] = list()
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        func()
+        queries_per_second.append(queries / ((time.perf_counter() - started_at) * scale))
+    print(f"{label:<40} {statistics.median(queries_per_second):10.1f} queries/s (median of {ROUNDS})")
+
+
+if __name__ == "__main__":
+    vectors = build_vectors(count=IMAGES)
+    queries = vectors[:QUERIES] + 0.1
+    ids = [uuid.UUID(int=row) for row in range(IMAGES)]
+
+    exhaustive_index = EmbeddingIndex(dimension=DIMENSION)
+    exhaustive_index.add_many(image_ids=ids, vectors=vectors)
+    ivf_index = EmbeddingIndex(dimension=DIMENSION, list_count=LISTS, probe_count=PROBES)
+    ivf_index.add_many(image_ids=ids, vectors=vectors)
+    started_at = time.perf_counter()
+    ivf_index.train(sample_size=LISTS * 64)
+    print(
+        f"--- {IMAGES} vectors of {DIMENSION} dimensions, top {K}; IVF trained in {time.perf_counter() - started_at:.1f}s"
+    )
+
+    loop_slice = normalize_rows(vectors[:2000]).tolist()
+    measure(
+        "Python loop (scaled to the full index)",
+        lambda: search_per_vector(vectors=loop_slice, query=queries[0].tolist()),
+        1,
+        scale=IMAGES / len(loop_slice),
+    )
+    measure(
+        "exhaustive, one query at a time",
+        lambda: [exhaustive_index.search(queries=query, k=K) for query in queries],
+        QUERIES,
+    )
+    measure(f"exhaustive, batch of {QUERIES}", lambda: exhaustive_index.search(queries=queries, k=K), QUERIES)
+    measure(f"IVF {LISTS} lists / {PROBES} probes", lambda: ivf_index.search(queries=queries, k=K), QUERIES)
+
+    exact = exhaustive_index.search(queries=queries, k=K)
+    approximate = ivf_index.search(queries=queries, k=K)
+    recall = numpy.mean(
+        [
+            len({image_id for image_id, _ in left} & {image_id for image_id, _ in right}) / K
+            for left, right in zip(exact, approximate)
+        ]
+    )
+    print(f"IVF recall@{K}: {recall:.1%}")
@@ -0,0 +1,101 @@
+"""
+Feature extraction throughput: a per-image Python loop vs. the batched NumPy pipeline of `FeatureExtractor`.
+
+Run from `backend/` with `python -m benchmarks.bench_features`. Both variants compute the same features from the same
+decoded pixels, so the difference is the cost of looping in Python; decoding is measured on its own because it is
+per image either way. Everything runs in one process, so the numbers are images/second per core.
+"""
+
+import io
+import math
+import statistics
+import time
+import typing
+
+import numpy
+from PIL import Image
+
+from src.ml.features import feature_extractor, FeatureExtractor
+
+IMAGES: int = 512
+BATCH_SIZE: int = 128
+ROUNDS: int = 5
+
+
+def build_images(count: int) -> list[bytes]:
+    images: list[bytes] = list()
+    for index in range(count):
+        image = Image.merge(
+            "RGB",
+            (
+                Image.linear_gradient("L").rotate(index * 7).resize((480, 360)),
+                Image.effect_noise((480, 360), 48),
+                Image.radial_gradient("L").resize((480, 360)),
+            ),
+        )
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=90)
+        images.append(buffer.getvalue())
+    return images
+
+
+def extract_per_image(extractor: FeatureExtractor, pixels: numpy.ndarray) -> numpy.ndarray:
+    rows: list[list[float]] = list()
+    cells_per_side = extractor.image_size // extractor.cell_size
+    for image in pixels:
+        row = [value / 255 for value in image.ravel().tolist()]
+
+        for channel in range(3):
+            histogram = [0.0] * extractor.color_bins
+            for value in image[:, :, channel].ravel().tolist():
+                histogram[value * extractor.color_bins // 256] += 1
+            row.extend(count / (extractor.image_size**2) for count in histogram)
+
+        gray = (image @ [0.299, 0.587, 0.114]).tolist()
+        orientations = [0.0] * (cells_per_side**2 * extractor.orientation_bins)
+        for y in range(extractor.image_size):
+            for x in range(extractor.image_size):
+                gradient_x = gray[y][x + 1] - gray[y][x - 1] if 0 < x < extractor.image_size - 1 else 0.0
+                gradient_y = gray[y + 1][x] - gray[y - 1][x] if 0 < y < extractor.image_size - 1 else 0.0
+                orientation = math.atan2(gradient_y, gradient_x) % math.pi
+                orientation_bin = min(
+                    int(orientation / math.pi * extractor.orientation_bins), extractor.orientation_bins - 1
+                )
+                cell = (y // extractor.cell_size) * cells_per_side + x // extractor.cell_size
+                orientations[cell * extractor.orientation_bins + orientation_bin] += math.hypot(gradient_x, gradient_y)
+        norm = math.sqrt(sum(value * value for value in orientations)) or 1e-6
+        row.extend(value / norm for value in orientations)
+        rows.append(row)
+    return numpy.asarray(rows, dtype=numpy.float32)
+
+
+def extract_batched(extractor: FeatureExtractor, pixels: numpy.ndarray) -> numpy.ndarray:
+    out = numpy.empty((BATCH_SIZE, extractor.dimension), dtype=numpy.float32)
+    features = numpy.empty((len(pixels), extractor.dimension), dtype=numpy.float32)
+    for offset in range(0, len(pixels), BATCH_SIZE):
+        batch = pixels[offset : offset + BATCH_SIZE]
+        features[offset : offset + len(batch)] = extractor.extract(pixels=batch, out=out[: len(batch)])
+    return features
+
+
+def measure(label: str, func: typing.Callable[[], typing.Any], count: int) -> None:
+    images_per_second: list[float] = list()
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+        func()
+        images_per_second.append(count / (time.perf_counter() - started_at))
+    print(f"{label:<40} {statistics.median(images_per_second):10.0f} images/s (median of {ROUNDS})")
+
+
+if __name__ == "__main__":
+    images = build_images(count=IMAGES)
+    pixels = feature_extractor.decode_batch(images=images)
+    assert numpy.allclose(
+        extract_per_image(feature_extractor, pixels[:8]), feature_extractor.extract(pixels=pixels[:8]), atol=1e-4
+    )
+
+    print(f"--- {IMAGES} JPEGs of 480x360, {feature_extractor.dimension} features ({feature_extractor.version})")
+    measure("decode", lambda: feature_extractor.decode_batch(images=images), IMAGES)
+    measure("extract, per-image Python loop", lambda: extract_per_image(feature_extractor, pixels[:64]), 64)
+    measure(f"extract, batches of {BATCH_SIZE}", lambda: extract_batched(feature_extractor, pixels), IMAGES)
+    measure("decode + extract, batched", lambda: feature_extractor.extract_from_bytes(images=images), IMAGES)
@@ -0,0 +1,77 @@
+"""
+Logging overhead per request: the former synchronous stderr sink vs. the queued, sampled JSON pipeline.
+
+Run from `backend/` with `python -m benchmarks.bench_logging`. Every "request" emits the records the auth and signup
+paths used to emit. Two streams are measured: `os.devnull` (pure CPU cost of the logging call) and a stream whose
+`write()` blocks like a congested stderr pipe, which is where a synchronous sink stalls the event loop.
+"""
+import os
+import statistics
+import time
+import typing
+
+import loguru
+
+from src.utility.logger.context import current_request_id
+from src.utility.logger.setup import configure_logger, dispose_sink
+
+REQUESTS: int = 5_000
+ROUNDS: int = 5
+BLOCKING_WRITE_SEC: float = 0.00005
+
+
+class BlockingStream:
+    def __init__(self, stream: typing.TextIO, write_delay: float) -> None:
+        self.stream = stream
+        self.write_delay = write_delay
+
+    def write(self, message: str) -> int:
+        time.sleep(self.write_delay)
+        return self.stream.write(message)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def emit_request_logs(request_index: int) -> None:
+    current_request_id.set(f"bench-{request_index}")
+    loguru.logger.info("Authorizing user")
+    loguru.logger.info("Evaluating password strength")
+    loguru.logger.info("Evaluating username length")
+    loguru.logger.debug("Updating account fields {fields}", fields=["email", "password"])
+
+
+def measure(label: str, configure: typing.Callable, write_delay: float) -> None:
+    per_request_us: list[float] = list()
+    with open(os.devnull, "w") as devnull:
+        stream = BlockingStream(stream=devnull, write_delay=write_delay) if write_delay else devnull
+        for _ in range(ROUNDS):
+            configure(stream)
+            started_at = time.perf_counter()
+            for request_index in range(REQUESTS):
+                emit_request_logs(request_index=request_index)
+            per_request_us.append((time.perf_counter() - started_at) / REQUESTS * 1_000_000)
+            dispose_sink()
+            loguru.logger.remove()
+    print(f"{label:<56} {statistics.median(per_request_us):8.2f} us/request (median of {ROUNDS})")
+
+
+def configure_synchronous(stream: typing.TextIO) -> None:
+    loguru.logger.remove()
+    loguru.logger.configure(patcher=None)  # type: ignore
+    loguru.logger.add(sink=stream, level="DEBUG")
+
+
+def configure_pipeline(sampling_rates: dict[str, float]) -> typing.Callable:
+    def _configure(stream: typing.TextIO) -> None:
+        configure_logger(level="INFO", is_json=True, sampling_rates=sampling_rates, rate_limits={}, stream=stream)
+
+    return _configure
+
+
+if __name__ == "__main__":
+    for stream_label, write_delay in (("devnull", 0.0), ("blocking stream", BLOCKING_WRITE_SEC)):
+        print(f"--- {stream_label}")
+        measure("synchronous sink, DEBUG", configure_synchronous, write_delay)
+        measure("queued JSON sink, INFO", configure_pipeline(sampling_rates={}), write_delay)
+        measure("queued JSON sink, INFO, 1% sampling", configure_pipeline(sampling_rates={"": 0.01}), write_delay)
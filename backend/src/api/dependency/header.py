@@ -1,7 +1,6 @@
 import typing
 
 import fastapi
-import loguru
 import pydantic
 
 from src.api.dependency.crud import get_crud
@@ -47,8 +46,6 @@ async def _retrieve_current_user(
     account_crud: AccountCRUDRepository = fastapi.Depends(get_crud(AccountCRUDRepository)),
     token: str = fastapi.Depends(_get_auth_header_retriever()),
 ) -> Account:
-    loguru.logger.info(f"Authorizing user")
-
     try:
         username, email = jwt_manager.retrieve_details_from_jwt(token=token)
 
@@ -0,0 +1,7 @@
+from src.config.setup import settings
+from src.storage.base import BaseStorage
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+
+def get_storage() -> BaseStorage:
+    return get_storage_backend(backend=settings.STORAGE_BACKEND)
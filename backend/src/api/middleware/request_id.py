@@ -0,0 +1,50 @@
+import re
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utility.logger.context import current_request_id
+
+REQUEST_ID_HEADER: str = "X-Request-ID"
+VALID_REQUEST_ID_PATTERN: re.Pattern = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware binding a request id to every log record of the request and echoing it back.
+
+    A well-formed incoming `X-Request-ID` (e.g. from the load balancer) is kept so logs can be correlated across
+    services; anything else is replaced by a fresh UUID.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.header_name: bytes = REQUEST_ID_HEADER.lower().encode("latin-1")
+
+    def _get_request_id(self, scope: Scope) -> str:
+        for name, value in scope["headers"]:
+            if name == self.header_name:
+                request_id = value.decode("latin-1")
+                if VALID_REQUEST_ID_PATTERN.match(request_id):
+                    return request_id
+                break
+        return uuid.uuid4().hex
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._get_request_id(scope=scope)
+        request_id_token = current_request_id.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            current_request_id.reset(request_id_token)
@@ -0,0 +1,65 @@
+import time
+import typing
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.repository.profiler import query_profiler
+from src.utility.metrics.definitions import (
+    http_request_db_duration_seconds,
+    http_request_db_pool_wait_seconds,
+    http_request_db_statements,
+    http_request_duration_seconds,
+)
+from src.utility.metrics.request import current_request_stats, RequestStats
+
+UNMATCHED_ROUTE: str = "<unmatched>"
+
+
+class RequestTimingMiddleware:
+    """
+    Pure ASGI middleware that times every HTTP request, collects its SQL statistics and reports both through the
+    Prometheus histograms and a `Server-Timing` response header.
+
+    Routes are labelled by their path template (`/api/v1/profiles/{id}`) so the metric cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: typing.Iterable[str] = ()) -> None:
+        self.app = app
+        self.excluded_paths: frozenset[str] = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        request_stats = RequestStats(route=scope["path"])
+        stats_token = current_request_stats.set(request_stats)
+        status_code = 500
+        started_at = time.perf_counter()
+
+        async def send_with_server_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", request_stats.as_server_timing(time.perf_counter() - started_at))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_request_stats.reset(stats_token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+
+            http_request_duration_seconds.observe(
+                time.perf_counter() - started_at, method, route_path, str(status_code)
+            )
+            http_request_db_duration_seconds.observe(request_stats.db_duration, method, route_path)
+            http_request_db_statements.observe(request_stats.statement_count, method, route_path)
+            http_request_db_pool_wait_seconds.observe(request_stats.pool_wait_duration, method, route_path)
+            query_profiler.notify_request_completed(
+                method=method, route=route_path, statement_count=request_stats.statement_count
+            )
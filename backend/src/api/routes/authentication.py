@@ -1,6 +1,5 @@
 import datetime
 import typing
-from random import randint
 
 import fastapi
 import loguru
@@ -24,6 +23,7 @@ from src.models.schema.account import (
     AccountInSignupResponse,
     AccountInStateUpdate,
     AccountInVerification,
+    AccountInVerificationResend,
     AccountOutVerification,
     AccountWithToken,
 )
@@ -31,16 +31,18 @@ from src.models.schema.base import ActionSuccessResponse
 from src.models.schema.otp import OtpIn, OtpInGenerateResponse, OtpInVerifyResponse
 from src.repository.crud.account import AccountCRUDRepository
 from src.repository.crud.profile import ProfileCRUDRepository
+from src.repository.crud.verification_challenge import VerificationChallengeCRUDRepository
 from src.security.authorizations import two_factor_auth
 from src.security.authorizations.jwt import jwt_manager
 from src.utility.email.email_sender import send_email_background
 from src.utility.exceptions.base_exception import BaseException
-from src.utility.exceptions.custom import EmailAlreadyExists, UsernameAlreadyExists
+from src.utility.exceptions.custom import EmailAlreadyExists, UsernameAlreadyExists, VerificationResendThrottled
 from src.utility.exceptions.http.http_4xx import (
     http_exc_400_bad_request,
     http_exc_401_unauthorized_request,
     http_exc_403_forbidden_request,
     http_exc_404_resource_not_found,
+    http_exc_429_too_many_requests,
 )
 from src.utility.exceptions.http.http_5xx import http_exc_500_internal_server_error
 
@@ -61,6 +63,9 @@ async def account_signup_endpoint(
     account_signup: AccountInSignup = fastapi.Body(..., embed=True),
     account_crud: AccountCRUDRepository = fastapi.Depends(get_crud(repo_type=AccountCRUDRepository)),
     profile_crud: ProfileCRUDRepository = fastapi.Depends(get_crud(repo_type=ProfileCRUDRepository)),
+    verification_crud: VerificationChallengeCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=VerificationChallengeCRUDRepository)
+    ),
 ) -> AccountInSignupResponse:
     is_credential_available = await account_crud.is_credentials_available(account_input=account_signup)
 
@@ -70,6 +75,7 @@ async def account_signup_endpoint(
     try:
         new_account = await account_crud.create_account(account_signup=account_signup)
         await profile_crud.create_profile(parent_account=new_account)
+        verification_code = await verification_crud.issue_challenge(account=new_account)
 
     except BaseException as e:
         loguru.logger.error(e)
@@ -78,7 +84,7 @@ async def account_signup_endpoint(
     send_email_background(
         background_tasks=background_tasks,
         email_to=new_account.email,
-        body={"verification_code": new_account.verification_code},
+        body={"verification_code": verification_code},
     )
 
     return AccountInSignupResponse(username=new_account.username, email=new_account.email, is_profile_created=True)
@@ -124,16 +130,58 @@ async def account_singin_endpoint(
 async def account_verification(
     request: fastapi.Request,
     account_in_verification: AccountInVerification = fastapi.Body(..., embed=True),
-    account_crud: AccountCRUDRepository = fastapi.Depends(get_crud(repo_type=AccountCRUDRepository)),
+    verification_crud: VerificationChallengeCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=VerificationChallengeCRUDRepository)
+    ),
 ) -> dict:
     try:
-        is_verified = await account_crud.verify_account(account_in_verification=account_in_verification)
+        is_verified = await verification_crud.verify_challenge(account_in_verification=account_in_verification)
     except BaseException as e:
         raise await http_exc_400_bad_request(error_msg=e.error_msg)
 
     return AccountOutVerification(email=account_in_verification.email, is_verified=is_verified)
 
 
+@router.post(
+    path="/account_verfication/resend",
+    name="auth:account-verfication-resend",
+    response_model=ActionSuccessResponse,
+    status_code=fastapi.status.HTTP_202_ACCEPTED,
+)
+@limiter.limit("5/120seconds")
+async def account_verification_resend(
+    request: fastapi.Request,
+    background_tasks: FastApiBackgroundTasks,
+    account_in_verification_resend: AccountInVerificationResend = fastapi.Body(..., embed=True),
+    account_crud: AccountCRUDRepository = fastapi.Depends(get_crud(repo_type=AccountCRUDRepository)),
+    verification_crud: VerificationChallengeCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=VerificationChallengeCRUDRepository)
+    ),
+) -> ActionSuccessResponse:
+    try:
+        db_account = await account_crud.read_account(AccountInRead(email=account_in_verification_resend.email))
+    except BaseException:
+        raise await http_exc_400_bad_request(error_msg="Invalid email")
+
+    if db_account.is_verified:
+        raise await http_exc_400_bad_request(error_msg="Account is already verified!")
+
+    try:
+        verification_code = await verification_crud.issue_challenge(account=db_account)
+    except VerificationResendThrottled as e:
+        raise await http_exc_429_too_many_requests(error_msg=e.error_msg)
+    except BaseException as e:
+        raise await http_exc_500_internal_server_error(error_msg=e.error_msg)
+
+    send_email_background(
+        background_tasks=background_tasks,
+        email_to=db_account.email,
+        body={"verification_code": verification_code},
+    )
+
+    return ActionSuccessResponse(action="Resending verification code", success=True)
+
+
 @router.post(
     path="/signout",
     name="auth:account-signout",
@@ -0,0 +1,19 @@
+import fastapi
+from fastapi.responses import PlainTextResponse
+
+from src.utility.metrics.prometheus import metrics_registry
+
+router = fastapi.APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    path="/metrics",
+    name="metrics:read-prometheus-metrics",
+    response_class=PlainTextResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def get_prometheus_metrics() -> fastapi.Response:
+    return fastapi.Response(content=metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,13 +1,43 @@
+import asyncio
 import typing
+import uuid
 
 import fastapi
 import loguru
 import pydantic
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import object_session
 
 from src.api.dependency.crud import get_crud
 from src.api.dependency.header import get_auth_current_user
+from src.api.dependency.storage import get_storage
+from src.config.setup import settings
+from src.jobs.pokemon_image_variant import generate_pokemon_image_variants
+from src.media.near_duplicates import (
+    ensure_not_near_duplicate,
+    ensure_not_owned_near_duplicate,
+    is_near_duplicate,
+    perceptual_hash_index,
+    read_profile_perceptual_hashes,
+)
+from src.media.normalization import normalize_stored_image
+from src.media.perceptual_hash import to_unsigned_hash
+from src.media.serving import (
+    format_etag,
+    format_http_date,
+    IMMUTABLE_CACHE_CONTROL,
+    is_not_modified,
+    is_range_applicable,
+    parse_byte_range,
+    StorageObjectResponse,
+)
+from src.media.upload import discard_stored_images, receive_bulk_image_upload, receive_image_upload, StoredImage
+from src.media.variants import variant_generator
+from src.ml.embedding_index import embedding_index, embedding_projection
+from src.ml.evaluation import model_evaluator
+from src.ml.feature_store import feature_store
+from src.ml.predictions import prediction_cache
 from src.models.db.account import Account
 from src.models.schema.account import (
     AccountInRead,
@@ -17,15 +47,47 @@ from src.models.schema.account import (
     AccountInUpdate,
 )
 from src.models.schema.base import BaseSchemaModel
-from src.models.schema.pokemon_image import PokemonImageInCreate, PokemonImageInResponse
+from src.models.schema.pokemon_image import (
+    PokemonImageBulkUploadResult,
+    PokemonImageInBulkUploadResponse,
+    PokemonImageInCreate,
+    PokemonImageInCreateByHash,
+    PokemonImageInDeletionResponse,
+    PokemonImageInResponse,
+    PokemonImageNearDuplicate,
+    PokemonImageSimilar,
+    PokemonImageVariantInResponse,
+)
+from src.models.schema.prediction import PredictionInResponse
 from src.repository.crud.account import AccountCRUDRepository
+from src.repository.crud.blob import BlobCRUDRepository
 from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.crud.pokemon_image_variant import PokemonImageVariantCRUDRepository
 from src.repository.crud.profile import ProfileCRUDRepository
-from src.utility.exceptions.custom import EntityDoesNotExist
+from src.storage.base import BaseStorage
+from src.utility.enums.image_format import ImageVariantFormats
+from src.utility.exceptions.custom import (
+    EntityDoesNotExist,
+    ImageTooLarge,
+    InvalidModelArtifact,
+    MalformedMultipartRequest,
+    ModelDoesNotExist,
+    NearDuplicateImage,
+    RangeNotSatisfiable,
+    UnsupportedImageType,
+)
 from src.utility.exceptions.database import DatabaseError
-from src.utility.exceptions.http.exc_400 import http_exc_400_bad_request
 from src.utility.exceptions.http.exc_403 import http_exc_403_forbidden_request
 from src.utility.exceptions.http.exc_404 import http_exc_404_id_not_found_request
+from src.utility.exceptions.http.http_4xx import (
+    http_exc_400_bad_request,
+    http_exc_404_resource_not_found,
+    http_exc_409_conflict,
+    http_exc_413_payload_too_large,
+    http_exc_415_unsupported_media_type,
+    http_exc_416_range_not_satisfiable,
+)
+from src.utility.exceptions.http.http_5xx import http_exc_503_service_unavailable
 
 router = fastapi.APIRouter(prefix="/pokemon_images", tags=["pokemon_images"])
 
@@ -54,24 +116,647 @@ async def get_pokemon_image(
     return pokemon_image_list
 
 
+UPLOAD_POKEMON_IMAGE_REQUEST_BODY: dict = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["name", "nickname", "image"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "nickname": {"type": "string"},
+                    "image": {"type": "string", "format": "binary"},
+                },
+            }
+        }
+    },
+}
+
+
 @router.post(
     path="",
     name="pokemon_images:uploaded-pokemon_image",
     response_model=PokemonImageInResponse,
     status_code=fastapi.status.HTTP_200_OK,
+    openapi_extra={"requestBody": UPLOAD_POKEMON_IMAGE_REQUEST_BODY},
 )
 async def upload_pokemon_image(
-    pokemon_image_create: PokemonImageInCreate = fastapi.Body(..., embed=True),
+    request: fastapi.Request,
+    background_tasks: fastapi.BackgroundTasks,
     pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
     profile_crud_repo: ProfileCRUDRepository = fastapi.Depends(get_crud(repo_type=ProfileCRUDRepository)),
     current_account: Account = fastapi.Depends(get_auth_current_user()),
+    storage: BaseStorage = fastapi.Depends(get_storage),
 ) -> PokemonImageInResponse:
     current_profile = await profile_crud_repo.read_profile_by_account_id(account_id=current_account.id)
 
-    db_pokemon_image = await pokemon_image_repo.create_pokemon_image(
-        pokemon_image_create=pokemon_image_create, current_profile=current_profile
+    try:
+        form_fields, stored_image = await receive_image_upload(
+            content_type=request.headers.get("content-type"),
+            stream=request.stream(),
+            storage=storage,
+            storage_dir=f"{settings.POKEMON_IMAGE_STORAGE_DIR}/incoming",
+            max_image_size=settings.POKEMON_IMAGE_MAX_SIZE_BYTES,
+        )
+
+    except MalformedMultipartRequest as e:
+        raise await http_exc_400_bad_request(error_msg=e.error_msg)
+
+    except ImageTooLarge as e:
+        raise await http_exc_413_payload_too_large(error_msg=e.error_msg)
+
+    except UnsupportedImageType as e:
+        raise await http_exc_415_unsupported_media_type(error_msg=e.error_msg)
+
+    # The row is only committed once the bytes are stored; any failure from here on removes the stored object
+    try:
+        pokemon_image_create = PokemonImageInCreate(**form_fields)
+        perceptual_hash = await normalize_stored_image(
+            storage=storage,
+            stored_image=stored_image,
+            max_dimension=settings.POKEMON_IMAGE_MASTER_MAX_DIMENSION,
+            max_pixels=settings.POKEMON_IMAGE_MAX_PIXELS,
+        )
+        if settings.IS_NEAR_DUPLICATE_UPLOAD_REJECTED:
+            await ensure_not_near_duplicate(
+                perceptual_hash=perceptual_hash,
+                profile_id=current_profile.id,
+                pokemon_image_repo=pokemon_image_repo,
+                max_distance=settings.PERCEPTUAL_HASH_MAX_DISTANCE,
+            )
+        db_pokemon_image = await pokemon_image_repo.create_pokemon_image(
+            pokemon_image_create=pokemon_image_create,
+            current_profile=current_profile,
+            stored_image=stored_image,
+            storage=storage,
+        )
+
+    except BaseException as e:
+        await discard_stored_images(storage=storage, stored_images=[stored_image])
+        if isinstance(e, pydantic.ValidationError):
+            raise RequestValidationError(errors=e.raw_errors) from e
+        if isinstance(e, ImageTooLarge):
+            raise await http_exc_413_payload_too_large(error_msg=e.error_msg) from e
+        if isinstance(e, UnsupportedImageType):
+            raise await http_exc_415_unsupported_media_type(error_msg=e.error_msg) from e
+        if isinstance(e, NearDuplicateImage):
+            raise await http_exc_409_conflict(error_msg=e.error_msg) from e
+        raise
+
+    perceptual_hash_index.add(
+        image_id=db_pokemon_image.id, profile_id=current_profile.id, perceptual_hash=perceptual_hash
     )
+    if settings.IS_POKEMON_IMAGE_VARIANT_EAGER:
+        background_tasks.add_task(generate_pokemon_image_variants, content_hash=db_pokemon_image.content_hash)
 
     new_pokemon_image = PokemonImageInResponse(**db_pokemon_image.__dict__)
 
     return new_pokemon_image
+
+
+BULK_UPLOAD_POKEMON_IMAGES_REQUEST_BODY: dict = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["items", "images"],
+                "properties": {
+                    "items": {
+                        "type": "string",
+                        "description": "JSON array of `{name, nickname}`, one per image and in the same order",
+                    },
+                    "images": {"type": "array", "items": {"type": "string", "format": "binary"}},
+                },
+            }
+        }
+    },
+}
+
+
+@router.post(
+    path="/bulk",
+    name="pokemon_images:bulk-upload-pokemon_images",
+    response_model=PokemonImageInBulkUploadResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+    openapi_extra={"requestBody": BULK_UPLOAD_POKEMON_IMAGES_REQUEST_BODY},
+)
+async def upload_pokemon_images(
+    request: fastapi.Request,
+    background_tasks: fastapi.BackgroundTasks,
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+    profile_crud_repo: ProfileCRUDRepository = fastapi.Depends(get_crud(repo_type=ProfileCRUDRepository)),
+    current_account: Account = fastapi.Depends(get_auth_current_user()),
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> PokemonImageInBulkUploadResponse:
+    """
+    Upload up to `POKEMON_IMAGE_BULK_MAX_IMAGES` images in one request. Images are stored concurrently and created
+    in a single transaction; every image gets its own result, so a rejected image does not fail the others.
+    """
+    current_profile = await profile_crud_repo.read_profile_by_account_id(account_id=current_account.id)
+
+    try:
+        form_fields, upload_results = await receive_bulk_image_upload(
+            content_type=request.headers.get("content-type"),
+            stream=request.stream(),
+            storage=storage,
+            storage_dir=f"{settings.POKEMON_IMAGE_STORAGE_DIR}/incoming",
+            max_image_size=settings.POKEMON_IMAGE_MAX_SIZE_BYTES,
+            max_images=settings.POKEMON_IMAGE_BULK_MAX_IMAGES,
+            max_concurrency=settings.POKEMON_IMAGE_BULK_MAX_CONCURRENCY,
+        )
+
+    except MalformedMultipartRequest as e:
+        raise await http_exc_400_bad_request(error_msg=e.error_msg)
+
+    stored_images: dict[int, StoredImage] = dict()
+    errors: dict[int, str] = dict()
+    for index, upload_result in enumerate(upload_results):
+        if isinstance(upload_result, StoredImage):
+            stored_images[index] = upload_result
+        else:
+            errors[index] = upload_result.error_msg
+
+    # Every stored object is deleted again on failure, or once its image was rejected or created
+    try:
+        pokemon_image_creates = pydantic.parse_raw_as(list[PokemonImageInCreate], form_fields.get("items", "[]"))
+        if len(pokemon_image_creates) != len(upload_results):
+            raise MalformedMultipartRequest(
+                f"`items` describes {len(pokemon_image_creates)} images but {len(upload_results)} were uploaded!"
+            )
+
+        normalization_results = await asyncio.gather(
+            *(
+                normalize_stored_image(
+                    storage=storage,
+                    stored_image=stored_image,
+                    max_dimension=settings.POKEMON_IMAGE_MASTER_MAX_DIMENSION,
+                    max_pixels=settings.POKEMON_IMAGE_MAX_PIXELS,
+                )
+                for stored_image in stored_images.values()
+            ),
+            return_exceptions=True,
+        )
+        perceptual_hashes: dict[int, int] = dict()
+        for index, normalization_result in zip(stored_images, normalization_results):
+            if isinstance(normalization_result, (ImageTooLarge, UnsupportedImageType)):
+                errors[index] = normalization_result.error_msg
+            elif isinstance(normalization_result, BaseException):
+                raise normalization_result
+            else:
+                perceptual_hashes[index] = normalization_result
+
+        accepted_uploads: list[tuple[int, PokemonImageInCreate, StoredImage]] = list()
+        accepted_hashes: list[int] = list()
+        owned_hashes = (
+            await read_profile_perceptual_hashes(profile_id=current_profile.id, pokemon_image_repo=pokemon_image_repo)
+            if settings.IS_NEAR_DUPLICATE_UPLOAD_REJECTED
+            else []
+        )
+        for index, stored_image in stored_images.items():
+            if index in errors:
+                continue
+            if settings.IS_NEAR_DUPLICATE_UPLOAD_REJECTED:
+                try:
+                    ensure_not_owned_near_duplicate(
+                        perceptual_hash=perceptual_hashes[index],
+                        owned_hashes=owned_hashes,
+                        max_distance=settings.PERCEPTUAL_HASH_MAX_DISTANCE,
+                    )
+                    # The database does not hold the images of this request yet
+                    if is_near_duplicate(
+                        perceptual_hash=perceptual_hashes[index],
+                        other_hashes=accepted_hashes,
+                        max_distance=settings.PERCEPTUAL_HASH_MAX_DISTANCE,
+                    ):
+                        raise NearDuplicateImage("This request already contains a near-identical copy of this image!")
+
+                except NearDuplicateImage as e:
+                    errors[index] = e.error_msg
+                    continue
+            accepted_uploads.append((index, pokemon_image_creates[index], stored_image))
+            accepted_hashes.append(perceptual_hashes[index])
+
+        await discard_stored_images(
+            storage=storage, stored_images=[stored_images[index] for index in errors if index in stored_images]
+        )
+        db_pokemon_images = (
+            await pokemon_image_repo.create_pokemon_images(
+                pokemon_image_uploads=[
+                    (pokemon_image_create, stored_image) for _, pokemon_image_create, stored_image in accepted_uploads
+                ],
+                current_profile=current_profile,
+                storage=storage,
+            )
+            if accepted_uploads
+            else []
+        )
+
+    except BaseException as e:
+        await discard_stored_images(storage=storage, stored_images=stored_images.values())
+        if isinstance(e, pydantic.ValidationError):
+            raise RequestValidationError(errors=e.raw_errors) from e
+        if isinstance(e, MalformedMultipartRequest):
+            raise await http_exc_400_bad_request(error_msg=e.error_msg) from e
+        raise
+
+    results = [
+        PokemonImageBulkUploadResult(index=index, pokemon_image=None, error=error_msg)
+        for index, error_msg in errors.items()
+    ]
+    for (index, _, _), db_pokemon_image in zip(accepted_uploads, db_pokemon_images):
+        perceptual_hash_index.add(
+            image_id=db_pokemon_image.id, profile_id=current_profile.id, perceptual_hash=perceptual_hashes[index]
+        )
+        results.append(
+            PokemonImageBulkUploadResult(
+                index=index, pokemon_image=PokemonImageInResponse(**db_pokemon_image.__dict__), error=None
+            )
+        )
+    if settings.IS_POKEMON_IMAGE_VARIANT_EAGER:
+        for content_hash in {db_pokemon_image.content_hash for db_pokemon_image in db_pokemon_images}:
+            background_tasks.add_task(generate_pokemon_image_variants, content_hash=content_hash)
+
+    return PokemonImageInBulkUploadResponse(results=sorted(results, key=lambda result: result.index))
+
+
+@router.post(
+    path="/by_hash",
+    name="pokemon_images:create-pokemon_image-by-hash",
+    response_model=PokemonImageInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def create_pokemon_image_by_hash(
+    pokemon_image_create: PokemonImageInCreateByHash = fastapi.Body(..., embed=True),
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+    profile_crud_repo: ProfileCRUDRepository = fastapi.Depends(get_crud(repo_type=ProfileCRUDRepository)),
+    blob_repo: BlobCRUDRepository = fastapi.Depends(get_crud(repo_type=BlobCRUDRepository)),
+    current_account: Account = fastapi.Depends(get_auth_current_user()),
+) -> PokemonImageInResponse:
+    """
+    Clients hash the image locally first; a 404 means the content is unknown and has to be uploaded.
+    """
+    current_profile = await profile_crud_repo.read_profile_by_account_id(account_id=current_account.id)
+
+    try:
+        blob = await blob_repo.read_blob(sha256=pokemon_image_create.content_hash)
+        perceptual_hash = (
+            None if blob.perceptual_hash is None else to_unsigned_hash(signed_bigint=blob.perceptual_hash)
+        )
+        if perceptual_hash is not None and settings.IS_NEAR_DUPLICATE_UPLOAD_REJECTED:
+            await ensure_not_near_duplicate(
+                perceptual_hash=perceptual_hash,
+                profile_id=current_profile.id,
+                pokemon_image_repo=pokemon_image_repo,
+                max_distance=settings.PERCEPTUAL_HASH_MAX_DISTANCE,
+            )
+        db_pokemon_image = await pokemon_image_repo.create_pokemon_image_by_hash(
+            pokemon_image_create=pokemon_image_create, current_profile=current_profile
+        )
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    except NearDuplicateImage as e:
+        raise await http_exc_409_conflict(error_msg=e.error_msg)
+
+    if perceptual_hash is not None:
+        perceptual_hash_index.add(
+            image_id=db_pokemon_image.id, profile_id=current_profile.id, perceptual_hash=perceptual_hash
+        )
+
+    return PokemonImageInResponse(**db_pokemon_image.__dict__)
+
+
+@router.delete(
+    path="/{id}",
+    name="pokemon_images:delete-pokemon_image-by-id",
+    response_model=PokemonImageInDeletionResponse,
+    status_code=fastapi.status.HTTP_202_ACCEPTED,
+)
+async def delete_pokemon_image(
+    id: uuid.UUID,
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+    profile_crud_repo: ProfileCRUDRepository = fastapi.Depends(get_crud(repo_type=ProfileCRUDRepository)),
+    current_account: Account = fastapi.Depends(get_auth_current_user()),
+) -> PokemonImageInDeletionResponse:
+    current_profile = await profile_crud_repo.read_profile_by_account_id(account_id=current_account.id)
+
+    try:
+        await pokemon_image_repo.delete_pokemon_image(id=id, profile_id=current_profile.id)
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    perceptual_hash_index.remove(image_id=id)
+    # Takes the index lock that searches and trainings hold in threads, and may compact the matrix
+    await asyncio.to_thread(embedding_index.remove, image_id=id)
+
+    return PokemonImageInDeletionResponse(is_deleted=True)
+
+
+@router.get(
+    path="/{id}/near_duplicates",
+    name="pokemon_images:read-near-duplicate-pokemon_images",
+    response_model=list[PokemonImageNearDuplicate],
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_near_duplicate_pokemon_images(
+    id: uuid.UUID,
+    max_distance: int = fastapi.Query(default=settings.PERCEPTUAL_HASH_MAX_DISTANCE, ge=0, le=16),
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+) -> list[PokemonImageNearDuplicate]:
+    try:
+        pokemon_image = await pokemon_image_repo.read_pokemon_image_perceptual_hash(id=id)
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    candidates = [
+        candidate
+        for candidate in perceptual_hash_index.find_near_duplicates(
+            perceptual_hash=to_unsigned_hash(signed_bigint=pokemon_image.perceptual_hash), max_distance=max_distance
+        )
+        if candidate[0] != id
+    ]
+    existing_ids = await pokemon_image_repo.read_existing_pokemon_image_ids(
+        ids=[candidate[0] for candidate in candidates]
+    )
+
+    return [
+        PokemonImageNearDuplicate(id=image_id, profile_id=profile_id, distance=distance)
+        for image_id, profile_id, distance in candidates
+        if image_id in existing_ids
+    ]
+
+
+@router.get(
+    path="/{id}/similar",
+    name="pokemon_images:read-similar-pokemon_images",
+    response_model=list[PokemonImageSimilar],
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_similar_pokemon_images(
+    id: uuid.UUID,
+    limit: int = fastapi.Query(default=settings.SIMILAR_POKEMON_IMAGE_LIMIT, ge=1, le=100),
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+    variant_repo: PokemonImageVariantCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=PokemonImageVariantCRUDRepository)
+    ),
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> list[PokemonImageSimilar]:
+    """
+    Return the images that look most like this one by the cosine similarity of their embeddings, closest first.
+    """
+    embedding = await asyncio.to_thread(embedding_index.get, image_id=id)
+    if embedding is None:
+        # Not indexed yet, embed it on the fly
+        try:
+            variant_source = await variant_repo.read_variant_source(pokemon_image_id=id)
+
+        except EntityDoesNotExist as e:
+            raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+        features = await feature_store.load(
+            storage=storage, images=[(variant_source.content_hash, variant_source.storage_key)]
+        )
+        embedding = embedding_projection.project(features=features)[0]
+
+    (candidates,) = await asyncio.to_thread(embedding_index.search, queries=embedding, k=limit + 1)
+    candidates = [candidate for candidate in candidates if candidate[0] != id][:limit]
+    existing_ids = await pokemon_image_repo.read_existing_pokemon_image_ids(
+        ids=[id] + [candidate[0] for candidate in candidates]
+    )
+    # Images deleted through other workers are dropped from this worker's index as they show up
+    deleted_ids = [
+        image_id for image_id in [id] + [candidate[0] for candidate in candidates] if image_id not in existing_ids
+    ]
+    if deleted_ids:
+        await asyncio.to_thread(embedding_index.remove_many, image_ids=deleted_ids)
+    if id not in existing_ids:
+        raise await http_exc_404_resource_not_found(error_msg=f"Pokemon image with id `{id}` does not exist!")
+
+    return [
+        PokemonImageSimilar(id=image_id, similarity=similarity)
+        for image_id, similarity in candidates
+        if image_id in existing_ids
+    ]
+
+
+@router.get(
+    path="/{id}/variants",
+    name="pokemon_images:read-pokemon_image-variants",
+    response_model=list[PokemonImageVariantInResponse],
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_pokemon_image_variants(
+    id: uuid.UUID,
+    variant_repo: PokemonImageVariantCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=PokemonImageVariantCRUDRepository)
+    ),
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> list[PokemonImageVariantInResponse]:
+    try:
+        variant_source = await variant_repo.read_variant_source(pokemon_image_id=id)
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    return [
+        PokemonImageVariantInResponse(
+            **pokemon_image_variant.__dict__,
+            url=await storage.presigned_url(
+                key=pokemon_image_variant.storage_key, expires_in=settings.POKEMON_IMAGE_VARIANT_URL_TTL_SEC
+            ),
+        )
+        for pokemon_image_variant in await variant_repo.read_variants(content_hash=variant_source.content_hash)
+    ]
+
+
+@router.get(
+    path="/{id}/variants/{variant}",
+    name="pokemon_images:read-pokemon_image-variant",
+    response_model=PokemonImageVariantInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_pokemon_image_variant(
+    id: uuid.UUID,
+    variant: str,
+    image_format: ImageVariantFormats = fastapi.Query(default=ImageVariantFormats.WEBP, alias="format"),
+    variant_repo: PokemonImageVariantCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=PokemonImageVariantCRUDRepository)
+    ),
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> PokemonImageVariantInResponse:
+    """
+    Return a variant, generating it on first request; concurrent requests for the same missing variant share one
+    encode.
+    """
+    if not variant_generator.is_supported(variant=variant, image_format=image_format):
+        raise await http_exc_404_resource_not_found(
+            error_msg=f"Variant `{variant}.{image_format.value}` is not offered!"
+        )
+
+    try:
+        variant_source = await variant_repo.read_variant_source(pokemon_image_id=id)
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    try:
+        pokemon_image_variant = await variant_repo.read_variant(
+            content_hash=variant_source.content_hash, variant=variant, image_format=image_format
+        )
+
+    except EntityDoesNotExist:
+        try:
+            generated_variant = await variant_generator.generate(
+                storage=storage,
+                source_key=variant_source.storage_key,
+                sha256=variant_source.content_hash,
+                variant=variant,
+                image_format=image_format,
+            )
+
+        except UnsupportedImageType as e:
+            raise await http_exc_415_unsupported_media_type(error_msg=e.error_msg)
+
+        pokemon_image_variant = await variant_repo.create_variant(
+            content_hash=variant_source.content_hash,
+            variant=variant,
+            image_format=image_format,
+            generated_variant=generated_variant,
+        )
+
+    return PokemonImageVariantInResponse(
+        **pokemon_image_variant.__dict__,
+        url=await storage.presigned_url(
+            key=pokemon_image_variant.storage_key, expires_in=settings.POKEMON_IMAGE_VARIANT_URL_TTL_SEC
+        ),
+    )
+
+
+@router.get(
+    path="/{id}/prediction",
+    name="pokemon_images:read-pokemon_image-prediction",
+    response_model=PredictionInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_pokemon_image_prediction(
+    id: uuid.UUID,
+    model_name: str = fastapi.Query(default=settings.POKEMON_CLASSIFIER_MODEL_NAME, alias="model"),
+    variant_repo: PokemonImageVariantCRUDRepository = fastapi.Depends(
+        get_crud(repo_type=PokemonImageVariantCRUDRepository)
+    ),
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> PredictionInResponse:
+    """
+    Return what the latest version of the model predicts for the image. Images sharing the same content share one
+    prediction, which is computed once per model version and cached from then on.
+
+    While a candidate model is evaluated, part of the default model's traffic is served by the candidate instead.
+    """
+    try:
+        variant_source = await variant_repo.read_variant_source(pokemon_image_id=id)
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    try:
+        if model_name == settings.POKEMON_CLASSIFIER_MODEL_NAME:
+            return await model_evaluator.predict(
+                storage=storage,
+                pokemon_image_id=id,
+                content_hash=variant_source.content_hash,
+                source_key=variant_source.storage_key,
+            )
+
+        return await prediction_cache.predict(
+            storage=storage,
+            content_hash=variant_source.content_hash,
+            source_key=variant_source.storage_key,
+            model_name=model_name,
+        )
+
+    except ModelDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    except InvalidModelArtifact as e:
+        raise await http_exc_503_service_unavailable(error_msg=e.error_msg)
+
+
+@router.api_route(
+    path="/{id}/content",
+    methods=["GET", "HEAD"],
+    name="pokemon_images:read-pokemon_image-content",
+    response_class=fastapi.Response,
+    status_code=fastapi.status.HTTP_200_OK,
+    responses={
+        fastapi.status.HTTP_200_OK: {"content": {"image/*": {}}},
+        fastapi.status.HTTP_206_PARTIAL_CONTENT: {"description": "Requested byte range"},
+        fastapi.status.HTTP_304_NOT_MODIFIED: {"description": "Cached copy is still current"},
+        fastapi.status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {"description": "Range lies outside the content"},
+    },
+)
+async def get_pokemon_image_content(
+    id: uuid.UUID,
+    request: fastapi.Request,
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> fastapi.Response:
+    """
+    Stream the image bytes. The content of an image never changes, so responses are cacheable forever and a repeat
+    view with `If-None-Match` costs one row lookup and a bodiless 304.
+    """
+    try:
+        pokemon_image_content = await pokemon_image_repo.read_pokemon_image_content(id=id)
+
+    except EntityDoesNotExist as e:
+        raise await http_exc_404_resource_not_found(error_msg=e.error_msg)
+
+    etag = format_etag(content_hash=pokemon_image_content.content_hash)
+    last_modified = pokemon_image_content.updated_at or pokemon_image_content.created_at
+    headers = {
+        "etag": etag,
+        "last-modified": format_http_date(moment=last_modified),
+        "cache-control": IMMUTABLE_CACHE_CONTROL,
+        "accept-ranges": "bytes",
+    }
+
+    if is_not_modified(headers=request.headers, etag=etag, last_modified=last_modified):
+        return fastapi.Response(status_code=fastapi.status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    size = pokemon_image_content.size
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header and is_range_applicable(
+        if_range=request.headers.get("if-range"), etag=etag, last_modified=last_modified
+    ):
+        try:
+            byte_range = parse_byte_range(range_header=range_header, size=size)
+
+        except RangeNotSatisfiable as e:
+            raise await http_exc_416_range_not_satisfiable(error_msg=e.error_msg, size=size)
+
+    if byte_range is None:
+        return StorageObjectResponse(
+            storage=storage,
+            key=pokemon_image_content.storage_key,
+            start=0,
+            end=size - 1,
+            headers=headers,
+            media_type=pokemon_image_content.content_type,
+        )
+
+    start, end = byte_range
+    headers["content-range"] = f"bytes {start}-{end}/{size}"
+    return StorageObjectResponse(
+        storage=storage,
+        key=pokemon_image_content.storage_key,
+        start=start,
+        end=end,
+        status_code=fastapi.status.HTTP_206_PARTIAL_CONTENT,
+        headers=headers,
+        media_type=pokemon_image_content.content_type,
+    )
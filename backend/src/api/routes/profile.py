@@ -6,14 +6,18 @@ import pydantic
 
 from src.api.dependency.crud import get_crud
 from src.api.dependency.header import get_auth_current_user
+from src.config.setup import settings
 from src.models.db.account import Account
+from src.models.schema.pokemon_image import PokemonImageInResponse, PokemonImagePage
 from src.models.schema.profile import ProfileInResponse, ProfileInUpdate
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
 from src.repository.crud.profile import ProfileCRUDRepository
-from src.utility.exceptions.custom import EntityDoesNotExist
+from src.utility.exceptions.custom import EntityDoesNotExist, InvalidPaginationCursor
 from src.utility.exceptions.database import DatabaseError
-from src.utility.exceptions.http.exc_400 import http_exc_400_bad_request
 from src.utility.exceptions.http.exc_403 import http_exc_403_forbidden_request
 from src.utility.exceptions.http.exc_404 import http_exc_404_id_not_found_request
+from src.utility.exceptions.http.http_4xx import http_exc_400_bad_request
+from src.utility.formatters.cursor import decode_keyset_cursor, encode_keyset_cursor
 
 router = fastapi.APIRouter(prefix="/profiles", tags=["profiles"])
 
@@ -79,3 +83,44 @@ async def update_profile_by_id(
         created_at=updated_profile.created_at,
         updated_at=updated_profile.updated_at,
     )
+
+
+@router.get(
+    path="/{id}/pokemon_images",
+    name="profiles:read-profile-pokemon_images",
+    response_model=PokemonImagePage,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_profile_pokemon_images(
+    id: uuid.UUID,
+    limit: int = fastapi.Query(
+        default=settings.POKEMON_IMAGE_PAGE_SIZE, ge=1, le=settings.POKEMON_IMAGE_MAX_PAGE_SIZE
+    ),
+    cursor: str | None = fastapi.Query(default=None),
+    include_count: bool = fastapi.Query(default=False),
+    pokemon_image_repo: PokemonImageCRUDRepository = fastapi.Depends(get_crud(repo_type=PokemonImageCRUDRepository)),
+) -> PokemonImagePage:
+    """
+    Page through a profile's images, newest first. Pass the returned `next_cursor` to get the next page; it is
+    `null` on the last one.
+    """
+    try:
+        created_before, id_before = decode_keyset_cursor(cursor=cursor) if cursor else (None, None)
+
+    except InvalidPaginationCursor as e:
+        raise await http_exc_400_bad_request(error_msg=e.error_msg)
+
+    # One extra row tells whether another page follows without a separate count
+    db_pokemon_images = await pokemon_image_repo.read_pokemon_images_by_profile(
+        profile_id=id, limit=limit + 1, created_before=created_before, id_before=id_before
+    )
+    next_cursor = None
+    if len(db_pokemon_images) > limit:
+        db_pokemon_images = db_pokemon_images[:limit]
+        next_cursor = encode_keyset_cursor(created_at=db_pokemon_images[-1].created_at, id=db_pokemon_images[-1].id)
+
+    return PokemonImagePage(
+        items=[PokemonImageInResponse(**db_pokemon_image.__dict__) for db_pokemon_image in db_pokemon_images],
+        next_cursor=next_cursor,
+        total_count=await pokemon_image_repo.count_pokemon_images_by_profile(profile_id=id) if include_count else None,
+    )
@@ -0,0 +1,56 @@
+import mimetypes
+import time
+import urllib.parse
+
+import fastapi
+
+from src.api.dependency.storage import get_storage
+from src.config.setup import settings
+from src.media.serving import StorageObjectResponse
+from src.storage.base import BaseStorage
+from src.storage.local import LocalStorage
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+from src.utility.exceptions.http.http_4xx import http_exc_403_forbidden_request, http_exc_404_resource_not_found
+
+router = fastapi.APIRouter(tags=["storage"])
+
+STORAGE_PATH: str = urllib.parse.urlsplit(settings.STORAGE_LOCAL_BASE_URL).path.rstrip("/")
+
+
+@router.get(
+    path=f"{STORAGE_PATH}/{{key:path}}",
+    name="storage:read-storage-object",
+    status_code=fastapi.status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def get_storage_object(
+    key: str,
+    expires: int,
+    signature: str,
+    method: str = "GET",
+    storage: BaseStorage = fastapi.Depends(get_storage),
+) -> StorageObjectResponse:
+    """
+    Serve the presigned URLs handed out by `LocalStorage`; the other backends point their URLs elsewhere.
+    """
+    if (
+        not isinstance(storage, LocalStorage)
+        or method != "GET"
+        or not storage.verify_presigned_url(key=key, method=method, expires_at=expires, signature=signature)
+    ):
+        raise await http_exc_403_forbidden_request(error_msg="Invalid or expired storage URL!")
+
+    try:
+        storage_object = await storage.stat(key=key)
+    except (StorageObjectDoesNotExist, ValueError):
+        raise await http_exc_404_resource_not_found()
+
+    return StorageObjectResponse(
+        storage=storage,
+        key=key,
+        start=0,
+        end=storage_object.size - 1,
+        # The signature is the credential, so shared caches must not keep the object past its expiry
+        headers={"cache-control": f"private, max-age={max(expires - int(time.time()), 0)}"},
+        media_type=storage_object.content_type or mimetypes.guess_type(key)[0] or "application/octet-stream",
+    )
@@ -3,12 +3,26 @@ import typing
 import fastapi
 import loguru
 
+from src.config.setup import settings
+from src.jobs.embedding_index import initialize_embedding_index
+from src.jobs.events import dispose_background_jobs, initialize_background_jobs
+from src.jobs.perceptual_hash_index import initialize_perceptual_hash_index
+from src.ml.evaluation import model_evaluator
+from src.ml.events import initialize_model_registry
+from src.ml.inference import inference_engine
 from src.repository.events import dispose_db_connection, initialize_db_connection
+from src.utility.concurrency.process_pool import process_pool
+from src.utility.design_patterns.factory.storage import get_storage_backend
+from src.utility.logger.setup import dispose_logger
 
 
 def execute_backend_server_event_handler(app: fastapi.FastAPI) -> typing.Any:
     async def launch_backend_server_events() -> None:
         await initialize_db_connection(app=app)
+        await initialize_perceptual_hash_index()
+        await initialize_embedding_index()
+        await initialize_model_registry()
+        await initialize_background_jobs(app=app)
 
     return launch_backend_server_events
 
@@ -16,6 +30,12 @@ def execute_backend_server_event_handler(app: fastapi.FastAPI) -> typing.Any:
 def terminate_backend_server_event_handler(app: fastapi.FastAPI) -> typing.Any:
     @loguru.logger.catch
     async def stop_backend_server_events() -> None:
+        await dispose_background_jobs(app=app)
         await dispose_db_connection(app=app)
+        await model_evaluator.close()
+        await inference_engine.close()
+        await get_storage_backend(backend=settings.STORAGE_BACKEND).close()
+        process_pool.shutdown()
+        await dispose_logger()
 
     return stop_backend_server_events
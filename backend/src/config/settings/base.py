@@ -41,6 +41,9 @@ class Settings(pydantic.BaseSettings):
     IS_DB_ECHO_LOG: bool = decouple.config("IS_DB_ECHO_LOG", cast=bool)  # type: ignore
     IS_DB_FORCE_ROLLBACK: bool = decouple.config("IS_DB_FORCE_ROLLBACK", cast=bool)  # type: ignore
     IS_DB_EXPIRE_ON_COMMIT: bool = decouple.config("IS_DB_EXPIRE_ON_COMMIT", cast=bool)  # type: ignore
+    IS_DB_QUERY_PROFILER_ENABLED: bool = decouple.config("IS_DB_QUERY_PROFILER_ENABLED", default=True, cast=bool)  # type: ignore
+    DB_SLOW_QUERY_THRESHOLD_MS: int = decouple.config("DB_SLOW_QUERY_THRESHOLD_MS", default=200, cast=int)  # type: ignore
+    DB_N_PLUS_ONE_THRESHOLD: int = decouple.config("DB_N_PLUS_ONE_THRESHOLD", default=3, cast=int)  # type: ignore
 
     API_HEADER_KEY_TITLE: pydantic.SecretStr = pydantic.SecretStr(decouple.config("API_HEADER_KEY_TITLE", cast=str))  # type: ignore
     API_COOKIE_KEY_TITLE: pydantic.SecretStr = pydantic.SecretStr(decouple.config("API_COOKIE_KEY_TITLE", cast=str))  # type: ignore
@@ -67,6 +70,9 @@ class Settings(pydantic.BaseSettings):
 
     LOGGING_LEVEL: int = logging.INFO
     LOGGERS: tuple[str, str] = ("uvicorn.asgi", "uvicorn.access")
+    IS_LOGGING_JSON: bool = decouple.config("IS_LOGGING_JSON", default=True, cast=bool)  # type: ignore
+    LOGGING_SAMPLING_RATES: str = decouple.config("LOGGING_SAMPLING_RATES", default="", cast=str)  # type: ignore
+    LOGGING_RATE_LIMITS: str = decouple.config("LOGGING_RATE_LIMITS", default="", cast=str)  # type: ignore
 
     BCRYPT_HASHING_ALGORITHM: str = decouple.config("BCRYPT_HASHING_ALGORITHM", cast=str)  # type: ignore
     ARGON2_HASHING_ALGORITHM: str = decouple.config("ARGON2_HASHING_ALGORITHM", cast=str)  # type: ignore
@@ -100,6 +106,91 @@ class Settings(pydantic.BaseSettings):
     PT_MODEL_FILE_EXTENSION_1: str = decouple.config("PT_MODEL_FILE_EXTENSION_1", cast=str)  # type: ignore
     PT_MODEL_FILE_EXTENSION_2: str = decouple.config("PT_MODEL_FILE_EXTENSION_2", cast=str)  # type: ignore
 
+    VERIFICATION_CODE_TTL_MIN: int = decouple.config("VERIFICATION_CODE_TTL_MIN", default=15, cast=int)  # type: ignore
+    VERIFICATION_CODE_MAX_ATTEMPTS: int = decouple.config("VERIFICATION_CODE_MAX_ATTEMPTS", default=5, cast=int)  # type: ignore
+    VERIFICATION_CODE_RESEND_INTERVAL_SEC: int = decouple.config("VERIFICATION_CODE_RESEND_INTERVAL_SEC", default=60, cast=int)  # type: ignore
+    VERIFICATION_CHALLENGE_PURGE_INTERVAL_SEC: int = decouple.config("VERIFICATION_CHALLENGE_PURGE_INTERVAL_SEC", default=300, cast=int)  # type: ignore
+    VERIFICATION_CHALLENGE_PURGE_BATCH_SIZE: int = decouple.config("VERIFICATION_CHALLENGE_PURGE_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+
+    IS_BREACHED_PASSWORD_CHECK_ENABLED: bool = decouple.config("IS_BREACHED_PASSWORD_CHECK_ENABLED", default=False, cast=bool)  # type: ignore
+    BREACHED_PASSWORD_FILTER_PATH: str = decouple.config("BREACHED_PASSWORD_FILTER_PATH", default=f"{str(ROOT_DIR)}/backend/data/breached_passwords.bloom", cast=str)  # type: ignore
+
+    STORAGE_BACKEND: str = decouple.config("STORAGE_BACKEND", default="local", cast=str)  # type: ignore
+    STORAGE_LOCAL_DIR: str = decouple.config("STORAGE_LOCAL_DIR", default=f"{str(ROOT_DIR)}/backend/storage", cast=str)  # type: ignore
+    STORAGE_LOCAL_BASE_URL: str = decouple.config("STORAGE_LOCAL_BASE_URL", default="/storage", cast=str)  # type: ignore
+    STORAGE_S3_ENDPOINT_URL: str = decouple.config("STORAGE_S3_ENDPOINT_URL", default="", cast=str)  # type: ignore
+    STORAGE_S3_MAX_POOL_CONNECTIONS: int = decouple.config("STORAGE_S3_MAX_POOL_CONNECTIONS", default=32, cast=int)  # type: ignore
+    STORAGE_S3_PART_SIZE_BYTES: int = decouple.config("STORAGE_S3_PART_SIZE_BYTES", default=8 * 1024 * 1024, cast=int)  # type: ignore
+    STORAGE_S3_MAX_CONCURRENCY: int = decouple.config("STORAGE_S3_MAX_CONCURRENCY", default=4, cast=int)  # type: ignore
+    POKEMON_IMAGE_STORAGE_DIR: str = decouple.config("POKEMON_IMAGE_STORAGE_DIR", default="pokemon_images", cast=str)  # type: ignore
+    POKEMON_IMAGE_MAX_SIZE_BYTES: int = decouple.config("POKEMON_IMAGE_MAX_SIZE_BYTES", default=10 * 1024 * 1024, cast=int)  # type: ignore
+    POKEMON_IMAGE_MAX_PIXELS: int = decouple.config("POKEMON_IMAGE_MAX_PIXELS", default=40_000_000, cast=int)  # type: ignore
+    POKEMON_IMAGE_MASTER_MAX_DIMENSION: int = decouple.config("POKEMON_IMAGE_MASTER_MAX_DIMENSION", default=2048, cast=int)  # type: ignore
+    POKEMON_IMAGE_BULK_MAX_IMAGES: int = decouple.config("POKEMON_IMAGE_BULK_MAX_IMAGES", default=50, cast=int)  # type: ignore
+    POKEMON_IMAGE_BULK_MAX_CONCURRENCY: int = decouple.config("POKEMON_IMAGE_BULK_MAX_CONCURRENCY", default=4, cast=int)  # type: ignore
+    POKEMON_IMAGE_PAGE_SIZE: int = decouple.config("POKEMON_IMAGE_PAGE_SIZE", default=24, cast=int)  # type: ignore
+    POKEMON_IMAGE_MAX_PAGE_SIZE: int = decouple.config("POKEMON_IMAGE_MAX_PAGE_SIZE", default=100, cast=int)  # type: ignore
+    POKEMON_IMAGE_COUNT_CACHE_TTL_SEC: int = decouple.config("POKEMON_IMAGE_COUNT_CACHE_TTL_SEC", default=30, cast=int)  # type: ignore
+    POKEMON_IMAGE_COUNT_CACHE_MAX_SIZE: int = decouple.config("POKEMON_IMAGE_COUNT_CACHE_MAX_SIZE", default=10000, cast=int)  # type: ignore
+    PERCEPTUAL_HASH_MAX_DISTANCE: int = decouple.config("PERCEPTUAL_HASH_MAX_DISTANCE", default=6, cast=int)  # type: ignore
+    PERCEPTUAL_HASH_INDEX_SYNC_INTERVAL_SEC: int = decouple.config("PERCEPTUAL_HASH_INDEX_SYNC_INTERVAL_SEC", default=30, cast=int)  # type: ignore
+    PERCEPTUAL_HASH_INDEX_SYNC_BATCH_SIZE: int = decouple.config("PERCEPTUAL_HASH_INDEX_SYNC_BATCH_SIZE", default=5000, cast=int)  # type: ignore
+    IS_NEAR_DUPLICATE_UPLOAD_REJECTED: bool = decouple.config("IS_NEAR_DUPLICATE_UPLOAD_REJECTED", default=True, cast=bool)  # type: ignore
+    POKEMON_IMAGE_VARIANT_SIZES: str = decouple.config("POKEMON_IMAGE_VARIANT_SIZES", default="thumbnail=128,small=320,medium=640", cast=str)  # type: ignore
+    POKEMON_IMAGE_VARIANT_FORMATS: str = decouple.config("POKEMON_IMAGE_VARIANT_FORMATS", default="webp,avif", cast=str)  # type: ignore
+    POKEMON_IMAGE_VARIANT_QUALITY: int = decouple.config("POKEMON_IMAGE_VARIANT_QUALITY", default=80, cast=int)  # type: ignore
+    POKEMON_IMAGE_VARIANT_URL_TTL_SEC: int = decouple.config("POKEMON_IMAGE_VARIANT_URL_TTL_SEC", default=3600, cast=int)  # type: ignore
+    IS_POKEMON_IMAGE_VARIANT_EAGER: bool = decouple.config("IS_POKEMON_IMAGE_VARIANT_EAGER", default=True, cast=bool)  # type: ignore
+    MEDIA_PROCESS_POOL_WORKERS: int = decouple.config("MEDIA_PROCESS_POOL_WORKERS", default=2, cast=int)  # type: ignore
+    BLOB_GC_INTERVAL_SEC: int = decouple.config("BLOB_GC_INTERVAL_SEC", default=600, cast=int)  # type: ignore
+    BLOB_GC_BATCH_SIZE: int = decouple.config("BLOB_GC_BATCH_SIZE", default=500, cast=int)  # type: ignore
+    BLOB_GC_GRACE_PERIOD_SEC: int = decouple.config("BLOB_GC_GRACE_PERIOD_SEC", default=3600, cast=int)  # type: ignore
+    ORPHAN_GC_INTERVAL_SEC: int = decouple.config("ORPHAN_GC_INTERVAL_SEC", default=3600, cast=int)  # type: ignore
+    ORPHAN_GC_BATCH_SIZE: int = decouple.config("ORPHAN_GC_BATCH_SIZE", default=500, cast=int)  # type: ignore
+    ORPHAN_GC_BATCH_PAUSE_SEC: float = decouple.config("ORPHAN_GC_BATCH_PAUSE_SEC", default=0.5, cast=float)  # type: ignore
+    ORPHAN_GC_STORAGE_GRACE_PERIOD_SEC: int = decouple.config("ORPHAN_GC_STORAGE_GRACE_PERIOD_SEC", default=86400, cast=int)  # type: ignore
+    IS_ORPHAN_GC_DRY_RUN: bool = decouple.config("IS_ORPHAN_GC_DRY_RUN", default=False, cast=bool)  # type: ignore
+    MODEL_CACHE_DIR: str = decouple.config("MODEL_CACHE_DIR", default=f"{str(ROOT_DIR)}/backend/model_cache", cast=str)  # type: ignore
+    IS_MODEL_REGISTRY_PRELOADED: bool = decouple.config("IS_MODEL_REGISTRY_PRELOADED", default=True, cast=bool)  # type: ignore
+    MODEL_REGISTRY_SYNC_INTERVAL_SEC: int = decouple.config("MODEL_REGISTRY_SYNC_INTERVAL_SEC", default=300, cast=int)  # type: ignore
+    INFERENCE_MAX_BATCH_SIZE: int = decouple.config("INFERENCE_MAX_BATCH_SIZE", default=64, cast=int)  # type: ignore
+    INFERENCE_MAX_WAIT_MS: float = decouple.config("INFERENCE_MAX_WAIT_MS", default=5.0, cast=float)  # type: ignore
+    INFERENCE_WORKERS: int = decouple.config("INFERENCE_WORKERS", default=2, cast=int)  # type: ignore
+    FEATURE_IMAGE_SIZE: int = decouple.config("FEATURE_IMAGE_SIZE", default=32, cast=int)  # type: ignore
+    FEATURE_COLOR_BINS: int = decouple.config("FEATURE_COLOR_BINS", default=8, cast=int)  # type: ignore
+    FEATURE_ORIENTATION_BINS: int = decouple.config("FEATURE_ORIENTATION_BINS", default=9, cast=int)  # type: ignore
+    FEATURE_CELL_SIZE: int = decouple.config("FEATURE_CELL_SIZE", default=8, cast=int)  # type: ignore
+    FEATURE_STORE_DIR: str = decouple.config("FEATURE_STORE_DIR", default=f"{str(ROOT_DIR)}/backend/feature_store", cast=str)  # type: ignore
+    FEATURE_STORE_CACHE_SIZE: int = decouple.config("FEATURE_STORE_CACHE_SIZE", default=10000, cast=int)  # type: ignore
+    POKEMON_CLASSIFIER_MODEL_NAME: str = decouple.config("POKEMON_CLASSIFIER_MODEL_NAME", default="pokemon_classifier", cast=str)  # type: ignore
+    PREDICTION_CACHE_MAX_SIZE: int = decouple.config("PREDICTION_CACHE_MAX_SIZE", default=10000, cast=int)  # type: ignore
+    PREDICTION_CACHE_TTL_SEC: int = decouple.config("PREDICTION_CACHE_TTL_SEC", default=3600, cast=int)  # type: ignore
+    BATCH_SCORING_BATCH_SIZE: int = decouple.config("BATCH_SCORING_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+    BATCH_SCORING_CHECKPOINT_PATH: str = decouple.config("BATCH_SCORING_CHECKPOINT_PATH", default=f"{str(ROOT_DIR)}/backend/data/batch_scoring.checkpoint.json", cast=str)  # type: ignore
+    CANDIDATE_MODEL_NAME: str = decouple.config("CANDIDATE_MODEL_NAME", default="", cast=str)  # type: ignore
+    CANDIDATE_MODEL_VERSION: str = decouple.config("CANDIDATE_MODEL_VERSION", default="", cast=str)  # type: ignore
+    CANDIDATE_TRAFFIC_FRACTION: float = decouple.config("CANDIDATE_TRAFFIC_FRACTION", default=0.0, cast=float)  # type: ignore
+    IS_CANDIDATE_SHADOWED: bool = decouple.config("IS_CANDIDATE_SHADOWED", default=True, cast=bool)  # type: ignore
+    CANDIDATE_MAX_PENDING_SHADOWS: int = decouple.config("CANDIDATE_MAX_PENDING_SHADOWS", default=32, cast=int)  # type: ignore
+    EVALUATION_LOG_DIR: str = decouple.config("EVALUATION_LOG_DIR", default=f"{str(ROOT_DIR)}/backend/data/evaluation", cast=str)  # type: ignore
+    EVALUATION_LOG_FLUSH_SIZE: int = decouple.config("EVALUATION_LOG_FLUSH_SIZE", default=256, cast=int)  # type: ignore
+    ONLINE_LEARNING_BATCH_SIZE: int = decouple.config("ONLINE_LEARNING_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+    ONLINE_LEARNING_HOLDOUT_FRACTION: float = decouple.config("ONLINE_LEARNING_HOLDOUT_FRACTION", default=0.1, cast=float)  # type: ignore
+    ONLINE_LEARNING_MIN_HOLDOUT_SIZE: int = decouple.config("ONLINE_LEARNING_MIN_HOLDOUT_SIZE", default=200, cast=int)  # type: ignore
+    ONLINE_LEARNING_MAX_HOLDOUT_SIZE: int = decouple.config("ONLINE_LEARNING_MAX_HOLDOUT_SIZE", default=20000, cast=int)  # type: ignore
+    ONLINE_LEARNING_MAX_ACCURACY_DROP: float = decouple.config("ONLINE_LEARNING_MAX_ACCURACY_DROP", default=0.0, cast=float)  # type: ignore
+    DATASET_EXPORT_DIR: str = decouple.config("DATASET_EXPORT_DIR", default=f"{str(ROOT_DIR)}/backend/data/datasets", cast=str)  # type: ignore
+    DATASET_SHARD_SIZE: int = decouple.config("DATASET_SHARD_SIZE", default=50000, cast=int)  # type: ignore
+    DATASET_EXPORT_BATCH_SIZE: int = decouple.config("DATASET_EXPORT_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+    EMBEDDING_DIMENSION: int = decouple.config("EMBEDDING_DIMENSION", default=256, cast=int)  # type: ignore
+    EMBEDDING_INDEX_PATH: str = decouple.config("EMBEDDING_INDEX_PATH", default=f"{str(ROOT_DIR)}/backend/data/embedding_index.npz", cast=str)  # type: ignore
+    EMBEDDING_INDEX_LISTS: int = decouple.config("EMBEDDING_INDEX_LISTS", default=0, cast=int)  # type: ignore
+    EMBEDDING_INDEX_PROBES: int = decouple.config("EMBEDDING_INDEX_PROBES", default=8, cast=int)  # type: ignore
+    EMBEDDING_INDEX_MIN_ROWS_PER_LIST: int = decouple.config("EMBEDDING_INDEX_MIN_ROWS_PER_LIST", default=64, cast=int)  # type: ignore
+    EMBEDDING_INDEX_SYNC_INTERVAL_SEC: int = decouple.config("EMBEDDING_INDEX_SYNC_INTERVAL_SEC", default=60, cast=int)  # type: ignore
+    EMBEDDING_INDEX_SYNC_BATCH_SIZE: int = decouple.config("EMBEDDING_INDEX_SYNC_BATCH_SIZE", default=1000, cast=int)  # type: ignore
+    SIMILAR_POKEMON_IMAGE_LIMIT: int = decouple.config("SIMILAR_POKEMON_IMAGE_LIMIT", default=10, cast=int)  # type: ignore
+
     MAIL_USERNAME: str = decouple.config("MAIL_USERNAME", cast=str)  # type: ignore
     MAIL_PASSWORD: str = decouple.config("MAIL_PASSWORD", cast=str)  # type: ignore
     MAIL_FROM: str = decouple.config("MAIL_FROM", cast=str)  # type: ignore
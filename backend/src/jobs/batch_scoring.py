@@ -0,0 +1,217 @@
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import time
+import typing
+
+import loguru
+import numpy
+
+from src.config.setup import settings
+from src.ml.feature_store import feature_store, FeatureStore
+from src.ml.registry import model_registry, ModelHandle
+from src.repository.crud.blob import BlobCRUDRepository
+from src.repository.crud.prediction import PredictionCRUDRepository
+from src.repository.database import db
+from src.storage.base import BaseStorage
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+
+class ScoringCheckpoint:
+    """
+    Progress of one scoring run: the last content hash whose batch was committed. Blobs are scored in hash order,
+    so a resumed run continues right after it. A checkpoint of another model version is ignored.
+    """
+
+    __slots__ = ("path", "model_name", "model_version", "last_content_hash", "scored", "is_complete")
+
+    def __init__(self, path: pathlib.Path, model_name: str, model_version: str) -> None:
+        self.path = path
+        self.model_name = model_name
+        self.model_version = model_version
+        self.last_content_hash = ""
+        self.scored = 0
+        self.is_complete = False
+
+    @classmethod
+    def load(cls, path: pathlib.Path, model_name: str, model_version: str) -> "ScoringCheckpoint":
+        checkpoint = cls(path=path, model_name=model_name, model_version=model_version)
+        try:
+            state = json.loads(path.read_text())
+        except FileNotFoundError:
+            return checkpoint
+
+        if (state["model_name"], state["model_version"]) == (model_name, model_version):
+            checkpoint.last_content_hash = state["last_content_hash"]
+            checkpoint.scored = state["scored"]
+            checkpoint.is_complete = state["is_complete"]
+        return checkpoint
+
+    def save(self) -> None:
+        state = {name: getattr(self, name) for name in self.__slots__ if name != "path"}
+        temporary_path = self.path.with_name(f".{self.path.name}.part")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path.write_text(json.dumps(state))
+        os.replace(temporary_path, self.path)
+
+
+class BatchScoringReport:
+    __slots__ = ("model_name", "model_version", "scored", "resumed_from", "started_at", "finished_at")
+
+    def __init__(self, model_name: str, model_version: str, resumed_from: int) -> None:
+        self.model_name = model_name
+        self.model_version = model_version
+        self.scored = 0
+        self.resumed_from = resumed_from
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def images_per_second(self) -> float:
+        return self.scored / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Scored {self.scored} images with `{self.model_name}:{self.model_version}` in {self.elapsed:.1f}s"
+            f" ({self.images_per_second:.0f} images/s, {self.resumed_from} scored before resuming)"
+        )
+
+
+async def extract_batch_features(
+    feature_store: FeatureStore, storage: BaseStorage, blob_sources: typing.Sequence[typing.Any], workers: int
+) -> numpy.ndarray:
+    """
+    Load the features of one batch, split into one slice per pool worker so every worker extracts in parallel.
+    """
+    slice_size = -(-len(blob_sources) // workers)
+    feature_slices = await asyncio.gather(
+        *(
+            feature_store.load(
+                storage=storage,
+                images=[
+                    (source.content_hash, source.storage_key) for source in blob_sources[offset : offset + slice_size]
+                ],
+            )
+            for offset in range(0, len(blob_sources), slice_size)
+        )
+    )
+    return numpy.concatenate(feature_slices)
+
+
+def classify_batch(handle: ModelHandle, features: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    probabilities = handle.model.predict_proba(features)
+    best_classes = probabilities.argmax(axis=1)
+    return handle.model.classes_[best_classes], probabilities[numpy.arange(len(probabilities)), best_classes]
+
+
+async def score_library(
+    model_name: str = settings.POKEMON_CLASSIFIER_MODEL_NAME,
+    model_version: str | None = None,
+    batch_size: int = settings.BATCH_SCORING_BATCH_SIZE,
+    checkpoint_path: pathlib.Path | str = settings.BATCH_SCORING_CHECKPOINT_PATH,
+    is_restarted: bool = False,
+) -> BatchScoringReport:
+    """
+    Score every stored content with one model version, the latest unless `model_version` is given, and refresh the
+    prediction statistics of the pokemon images showing it.
+
+    Blobs are streamed from a server-side cursor in `batch_size` batches. Each batch is featurized in the process
+    pool (features already in the feature store are reused), scored with a single vectorized `predict_proba` and
+    `COPY`ed into the `prediction` table while the next batch is being featurized. The checkpoint is saved after
+    every committed batch, so an interrupted run picks up where it stopped.
+    """
+    storage = get_storage_backend(backend=settings.STORAGE_BACKEND)
+    await model_registry.discover(storage=storage)
+    handle = await model_registry.load(storage=storage, name=model_name, version=model_version)
+
+    checkpoint = ScoringCheckpoint.load(
+        path=pathlib.Path(checkpoint_path), model_name=handle.name, model_version=handle.version
+    )
+    if is_restarted:
+        checkpoint = ScoringCheckpoint(path=checkpoint.path, model_name=handle.name, model_version=handle.version)
+    report = BatchScoringReport(model_name=handle.name, model_version=handle.version, resumed_from=checkpoint.scored)
+    if checkpoint.is_complete:
+        loguru.logger.info(f"Batch Scoring --- `{handle.name}:{handle.version}` already scored the whole library")
+        report.finished_at = time.perf_counter()
+        return report
+
+    blob_crud = BlobCRUDRepository(async_session=db.async_session)
+    prediction_crud = PredictionCRUDRepository(async_session=db.async_session)
+    pending_write: asyncio.Task | None = None
+
+    async def _write_batch(predictions: list[tuple[str, str, float]]) -> None:
+        await prediction_crud.copy_predictions(
+            model_name=handle.name, model_version=handle.version, predictions=predictions
+        )
+        checkpoint.last_content_hash = predictions[-1][0]
+        checkpoint.scored += len(predictions)
+        await asyncio.to_thread(checkpoint.save)
+        report.scored += len(predictions)
+        loguru.logger.info(f"Batch Scoring --- {report}")
+
+    try:
+        async for blob_sources in blob_crud.stream_blob_sources(
+            after_sha256=checkpoint.last_content_hash, batch_size=batch_size
+        ):
+            features = await extract_batch_features(
+                feature_store=feature_store,
+                storage=storage,
+                blob_sources=blob_sources,
+                workers=feature_store.process_pool.max_workers,
+            )
+            labels, confidences = await asyncio.to_thread(classify_batch, handle, features)
+
+            if pending_write is not None:
+                await pending_write
+            pending_write = asyncio.create_task(
+                _write_batch(
+                    predictions=[
+                        (source.content_hash, str(label), float(confidence))
+                        for source, label, confidence in zip(blob_sources, labels, confidences)
+                    ]
+                )
+            )
+
+        if pending_write is not None:
+            await pending_write
+        checkpoint.is_complete = True
+        await asyncio.to_thread(checkpoint.save)
+
+    finally:
+        if pending_write is not None and not pending_write.done():
+            pending_write.cancel()
+            await asyncio.gather(pending_write, return_exceptions=True)
+        await blob_crud.async_session.close()
+        await prediction_crud.async_session.close()
+
+    report.finished_at = time.perf_counter()
+    loguru.logger.info(f"Batch Scoring --- Completed! {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score every stored pokemon image with a model version.")
+    parser.add_argument("--model", default=settings.POKEMON_CLASSIFIER_MODEL_NAME, help="Model name.")
+    parser.add_argument("--version", default=None, help="Model version, the latest one if omitted.")
+    parser.add_argument("--batch-size", type=int, default=settings.BATCH_SCORING_BATCH_SIZE, help="Images per batch.")
+    parser.add_argument("--checkpoint", default=settings.BATCH_SCORING_CHECKPOINT_PATH, help="Checkpoint file.")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and score everything again.")
+    arguments = parser.parse_args()
+
+    print(
+        asyncio.run(
+            score_library(
+                model_name=arguments.model,
+                model_version=arguments.version,
+                batch_size=arguments.batch_size,
+                checkpoint_path=arguments.checkpoint,
+                is_restarted=arguments.restart,
+            )
+        )
+    )
@@ -0,0 +1,23 @@
+import loguru
+
+from src.config.setup import settings
+from src.repository.crud.blob import BlobCRUDRepository
+from src.repository.database import db
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+
+async def collect_released_blobs() -> int:
+    blob_crud = BlobCRUDRepository(async_session=db.async_session)
+
+    try:
+        collected_blobs = await blob_crud.collect_released_blobs(
+            storage=get_storage_backend(backend=settings.STORAGE_BACKEND),
+            batch_size=settings.BLOB_GC_BATCH_SIZE,
+            grace_period=settings.BLOB_GC_GRACE_PERIOD_SEC,
+        )
+    finally:
+        await blob_crud.async_session.close()
+
+    if collected_blobs:
+        loguru.logger.info(f"Blob Garbage Collection --- Removed {collected_blobs} unreferenced blobs")
+    return collected_blobs
@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import pathlib
+import time
+
+import loguru
+
+from src.config.setup import settings
+from src.jobs.batch_scoring import extract_batch_features
+from src.ml.dataset import DatasetManifest, DatasetWriter
+from src.ml.feature_store import feature_store
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.database import db
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+
+class DatasetExportReport:
+    __slots__ = ("dataset_dir", "exported", "deleted", "rows", "shards", "started_at", "finished_at")
+
+    def __init__(self, dataset_dir: pathlib.Path) -> None:
+        self.dataset_dir = dataset_dir
+        self.exported = self.deleted = self.rows = self.shards = 0
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def __str__(self) -> str:
+        return (
+            f"Exported {self.exported} images to `{self.dataset_dir}` in {self.elapsed:.1f}s"
+            f" ({self.rows} rows in {self.shards} shards, {self.deleted} images deleted since their export)"
+        )
+
+
+async def export_dataset(
+    export_dir: pathlib.Path | str = settings.DATASET_EXPORT_DIR,
+    shard_size: int = settings.DATASET_SHARD_SIZE,
+    batch_size: int = settings.DATASET_EXPORT_BATCH_SIZE,
+    is_restarted: bool = False,
+) -> DatasetExportReport:
+    """
+    Export the features of the stored pokemon images, labelled with their names, as memory-mappable `.npy` shards
+    under `{export_dir}/{feature version}`, next to a manifest.
+
+    Only images uploaded or updated since the manifest's cursor are read, `batch_size` at a time from a
+    server-side cursor, and featurized through the feature store, so rows already featurized for predictions are
+    not decoded again. Exported images deleted since are looked up `batch_size` ids at a time and recorded in the
+    manifest, so readers drop their rows. `is_restarted` exports the whole library into a fresh manifest; existing
+    shards are overwritten.
+    """
+    storage = get_storage_backend(backend=settings.STORAGE_BACKEND)
+    extractor = feature_store.extractor
+    dataset_dir = pathlib.Path(export_dir) / extractor.version
+    manifest = (DatasetManifest if is_restarted else DatasetManifest.load)(
+        dataset_dir=dataset_dir,
+        feature_version=extractor.version,
+        dimension=extractor.dimension,
+        shard_size=shard_size,
+    )
+    # Read before the writer takes over the short last shard
+    exported_ids = await asyncio.to_thread(manifest.read_ids)
+    writer = DatasetWriter(manifest=manifest)
+    last_changed_at, last_id = manifest.last_changed_at, manifest.last_id
+    report = DatasetExportReport(dataset_dir=dataset_dir)
+
+    pokemon_image_crud = PokemonImageCRUDRepository(async_session=db.async_session)
+    try:
+        for start in range(0, len(exported_ids), batch_size):
+            ids = exported_ids[start : start + batch_size]
+            existing_ids = await pokemon_image_crud.read_existing_pokemon_image_ids(ids=ids)
+            deleted_ids = [id for id in ids if id not in existing_ids]
+            writer.delete(ids=deleted_ids)
+            report.deleted += len(deleted_ids)
+
+        async for examples in pokemon_image_crud.stream_labelled_examples(
+            after_changed_at=last_changed_at, after_id=last_id, batch_size=batch_size
+        ):
+            features = await extract_batch_features(
+                feature_store=feature_store,
+                storage=storage,
+                blob_sources=examples,
+                workers=feature_store.process_pool.max_workers,
+            )
+            await asyncio.to_thread(
+                writer.append,
+                features=features,
+                labels=[example.name for example in examples],
+                ids=[example.id for example in examples],
+            )
+            last_changed_at, last_id = examples[-1].changed_at, examples[-1].id
+            report.exported += len(examples)
+
+        await asyncio.to_thread(writer.flush, last_changed_at=last_changed_at, last_id=last_id)
+
+    finally:
+        await pokemon_image_crud.async_session.close()
+
+    report.rows, report.shards = manifest.rows, len(manifest.shards)
+    report.finished_at = time.perf_counter()
+    loguru.logger.info(f"Dataset Export --- Completed! {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the labelled pokemon images as NumPy training shards.")
+    parser.add_argument("--export-dir", default=settings.DATASET_EXPORT_DIR, help="Dataset directory.")
+    parser.add_argument("--shard-size", type=int, default=settings.DATASET_SHARD_SIZE, help="Rows per shard.")
+    parser.add_argument("--restart", action="store_true", help="Ignore the manifest and export everything again.")
+    arguments = parser.parse_args()
+
+    print(
+        asyncio.run(
+            export_dataset(
+                export_dir=arguments.export_dir, shard_size=arguments.shard_size, is_restarted=arguments.restart
+            )
+        )
+    )
@@ -0,0 +1,82 @@
+import asyncio
+import datetime
+
+import loguru
+
+from src.config.setup import settings
+from src.jobs.batch_scoring import extract_batch_features
+from src.ml.embedding_index import embedding_index, embedding_projection
+from src.ml.feature_store import feature_store
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.database import db
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+# Re-read images changed shortly before the last sync, in case their transaction committed after it
+EMBEDDING_INDEX_SYNC_OVERLAP: datetime.timedelta = datetime.timedelta(minutes=1)
+
+
+def get_embedding_index_version() -> str:
+    return f"{feature_store.extractor.version}-{embedding_projection.version}"
+
+
+async def synchronize_embedding_index() -> int:
+    """
+    Embed the images uploaded since the last run into the embedding index, (re)train its IVF lists once the index
+    doubled, and persist it if anything changed.
+    """
+    storage = get_storage_backend(backend=settings.STORAGE_BACKEND)
+    changed_after = (
+        None if embedding_index.synced_until is None else embedding_index.synced_until - EMBEDDING_INDEX_SYNC_OVERLAP
+    )
+    synchronized_images = 0
+
+    pokemon_image_crud = PokemonImageCRUDRepository(async_session=db.async_session)
+    try:
+        async for examples in pokemon_image_crud.stream_labelled_examples(
+            after_changed_at=changed_after, after_id=None, batch_size=settings.EMBEDDING_INDEX_SYNC_BATCH_SIZE
+        ):
+            # An image's content never changes, so indexed images are not embedded again
+            new_examples = [example for example in examples if example.id not in embedding_index]
+            if new_examples:
+                features = await extract_batch_features(
+                    feature_store=feature_store,
+                    storage=storage,
+                    blob_sources=new_examples,
+                    workers=feature_store.process_pool.max_workers,
+                )
+                embeddings = await asyncio.to_thread(embedding_projection.project, features)
+                await asyncio.to_thread(
+                    embedding_index.add_many, image_ids=[example.id for example in new_examples], vectors=embeddings
+                )
+                synchronized_images += len(new_examples)
+            if embedding_index.synced_until is None or examples[-1].changed_at > embedding_index.synced_until:
+                embedding_index.synced_until = examples[-1].changed_at
+    finally:
+        await pokemon_image_crud.async_session.close()
+
+    is_trained = embedding_index.is_training_due(min_rows_per_list=settings.EMBEDDING_INDEX_MIN_ROWS_PER_LIST)
+    if is_trained:
+        await asyncio.to_thread(
+            embedding_index.train, sample_size=embedding_index.list_count * settings.EMBEDDING_INDEX_MIN_ROWS_PER_LIST
+        )
+    if synchronized_images or is_trained:
+        await asyncio.to_thread(
+            embedding_index.save, path=settings.EMBEDDING_INDEX_PATH, version=get_embedding_index_version()
+        )
+
+    loguru.logger.debug(
+        f"Embedding Index --- Synchronized {synchronized_images} images, {len(embedding_index)} indexed"
+    )
+    return synchronized_images
+
+
+async def initialize_embedding_index() -> None:
+    loguru.logger.info("Embedding Index --- Loading . . .")
+
+    # New images are embedded by the periodic synchronization, so startup never waits for featurization
+    if await asyncio.to_thread(
+        embedding_index.load, path=settings.EMBEDDING_INDEX_PATH, version=get_embedding_index_version()
+    ):
+        loguru.logger.info(f"Embedding Index --- Successfully Loaded with {len(embedding_index)} images!")
+    else:
+        loguru.logger.info("Embedding Index --- Nothing Stored for the Current Features, Starting Empty!")
@@ -0,0 +1,83 @@
+import asyncio
+import typing
+
+import fastapi
+import loguru
+
+from src.config.setup import settings
+from src.jobs.blob import collect_released_blobs
+from src.jobs.embedding_index import synchronize_embedding_index
+from src.jobs.garbage_collection import collect_orphans
+from src.jobs.perceptual_hash_index import synchronize_perceptual_hash_index
+from src.jobs.verification_challenge import purge_expired_verification_challenges
+from src.ml.events import discover_models
+
+
+async def run_periodically(name: str, job: typing.Callable[[], typing.Awaitable[typing.Any]], interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except Exception as e:
+            loguru.logger.error(f"Background Job `{name}` --- Failed: {e}")
+
+
+async def initialize_background_jobs(app: fastapi.FastAPI) -> None:
+    loguru.logger.info("Background Jobs --- Scheduling . . .")
+
+    app.state.background_jobs = [
+        asyncio.create_task(
+            run_periodically(
+                name="purge-expired-verification-challenges",
+                job=purge_expired_verification_challenges,
+                interval=settings.VERIFICATION_CHALLENGE_PURGE_INTERVAL_SEC,
+            )
+        ),
+        asyncio.create_task(
+            run_periodically(
+                name="collect-released-blobs",
+                job=collect_released_blobs,
+                interval=settings.BLOB_GC_INTERVAL_SEC,
+            )
+        ),
+        asyncio.create_task(
+            run_periodically(
+                name="collect-orphans",
+                job=collect_orphans,
+                interval=settings.ORPHAN_GC_INTERVAL_SEC,
+            )
+        ),
+        asyncio.create_task(
+            run_periodically(
+                name="synchronize-perceptual-hash-index",
+                job=synchronize_perceptual_hash_index,
+                interval=settings.PERCEPTUAL_HASH_INDEX_SYNC_INTERVAL_SEC,
+            )
+        ),
+        asyncio.create_task(
+            run_periodically(
+                name="synchronize-embedding-index",
+                job=synchronize_embedding_index,
+                interval=settings.EMBEDDING_INDEX_SYNC_INTERVAL_SEC,
+            )
+        ),
+        asyncio.create_task(
+            run_periodically(
+                name="discover-models",
+                job=discover_models,
+                interval=settings.MODEL_REGISTRY_SYNC_INTERVAL_SEC,
+            )
+        ),
+    ]
+
+    loguru.logger.info("Background Jobs --- Successfully Scheduled!")
+
+
+async def dispose_background_jobs(app: fastapi.FastAPI) -> None:
+    loguru.logger.info("Background Jobs --- Cancelling . . .")
+
+    for background_job in app.state.background_jobs:
+        background_job.cancel()
+    await asyncio.gather(*app.state.background_jobs, return_exceptions=True)
+
+    loguru.logger.info("Background Jobs --- Successfully Cancelled!")
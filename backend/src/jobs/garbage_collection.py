@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import datetime
+
+import loguru
+
+from src.config.setup import settings
+from src.media.near_duplicates import perceptual_hash_index
+from src.ml.embedding_index import embedding_index
+from src.repository.crud.blob import BlobCRUDRepository
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.crud.profile import ProfileCRUDRepository
+from src.repository.database import db
+from src.storage.base import BaseStorage, StoredObject
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+
+class OrphanCollectionReport:
+    __slots__ = ("is_dry_run", "profiles", "pokemon_images", "storage_objects", "reclaimable_bytes")
+
+    def __init__(self, is_dry_run: bool) -> None:
+        self.is_dry_run = is_dry_run
+        self.profiles = 0
+        self.pokemon_images = 0
+        self.storage_objects = 0
+        self.reclaimable_bytes = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{'Reclaimable' if self.is_dry_run else 'Removed'}: {self.profiles} profiles, {self.pokemon_images} pokemon"
+            f" images, {self.storage_objects} storage objects, {self.reclaimable_bytes} bytes"
+        )
+
+
+async def _collect_orphaned_storage_batch(
+    blob_crud: BlobCRUDRepository,
+    storage: BaseStorage,
+    stored_objects: list[StoredObject],
+    report: OrphanCollectionReport,
+) -> None:
+    referenced_keys = await blob_crud.read_referenced_storage_keys(
+        storage_keys=[stored_object.key for stored_object in stored_objects]
+    )
+    orphaned_objects = [stored_object for stored_object in stored_objects if stored_object.key not in referenced_keys]
+    if not report.is_dry_run:
+        await asyncio.gather(*(storage.delete(key=stored_object.key) for stored_object in orphaned_objects))
+
+    report.storage_objects += len(orphaned_objects)
+    report.reclaimable_bytes += sum(stored_object.size for stored_object in orphaned_objects)
+
+
+async def collect_orphaned_storage_objects(
+    blob_crud: BlobCRUDRepository,
+    storage: BaseStorage,
+    prefix: str,
+    batch_size: int,
+    batch_pause: float,
+    grace_period: int,
+    report: OrphanCollectionReport,
+) -> None:
+    """
+    Delete stored objects below `prefix` that no blob or variant row points to, checking `batch_size` keys per
+    query. Objects younger than `grace_period` seconds are skipped: they may belong to an upload whose row is not
+    committed yet.
+    """
+    stored_before = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(seconds=grace_period)
+    stored_objects: list[StoredObject] = list()
+
+    async for stored_object in storage.list_objects(prefix=prefix):
+        if stored_object.last_modified is None or stored_object.last_modified > stored_before:
+            continue
+        stored_objects.append(stored_object)
+        if len(stored_objects) >= batch_size:
+            await _collect_orphaned_storage_batch(
+                blob_crud=blob_crud, storage=storage, stored_objects=stored_objects, report=report
+            )
+            stored_objects = list()
+            await asyncio.sleep(batch_pause)
+
+    if stored_objects:
+        await _collect_orphaned_storage_batch(
+            blob_crud=blob_crud, storage=storage, stored_objects=stored_objects, report=report
+        )
+
+
+async def collect_orphans(is_dry_run: bool = settings.IS_ORPHAN_GC_DRY_RUN) -> OrphanCollectionReport:
+    """
+    Delete profiles whose account is gone, then images whose profile is gone, then stored objects no row points to.
+
+    Rows go in `ORPHAN_GC_BATCH_SIZE` batches of one short transaction each, with `ORPHAN_GC_BATCH_PAUSE_SEC` in
+    between so the collector never holds locks or saturates the database for long. A dry run deletes nothing and
+    reports what a real run would reclaim.
+    """
+    profile_crud = ProfileCRUDRepository(async_session=db.async_session)
+    pokemon_image_crud = PokemonImageCRUDRepository(async_session=db.async_session)
+    blob_crud = BlobCRUDRepository(async_session=db.async_session)
+    batch_size, batch_pause = settings.ORPHAN_GC_BATCH_SIZE, settings.ORPHAN_GC_BATCH_PAUSE_SEC
+    report = OrphanCollectionReport(is_dry_run=is_dry_run)
+
+    try:
+        if is_dry_run:
+            report.profiles = await profile_crud.read_orphaned_profile_count()
+            orphaned_pokemon_images = await pokemon_image_crud.read_orphaned_pokemon_image_summary()
+            report.pokemon_images = orphaned_pokemon_images.pokemon_images
+            report.reclaimable_bytes = orphaned_pokemon_images.reclaimable_bytes
+
+        else:
+            while True:
+                deleted_profiles = await profile_crud.delete_orphaned_profiles(batch_size=batch_size)
+                report.profiles += deleted_profiles
+                if deleted_profiles < batch_size:
+                    break
+                await asyncio.sleep(batch_pause)
+
+            while True:
+                deleted_ids, released_bytes = await pokemon_image_crud.delete_orphaned_pokemon_images(
+                    batch_size=batch_size
+                )
+                for deleted_id in deleted_ids:
+                    perceptual_hash_index.remove(image_id=deleted_id)
+                await asyncio.to_thread(embedding_index.remove_many, image_ids=deleted_ids)
+                report.pokemon_images += len(deleted_ids)
+                report.reclaimable_bytes += released_bytes
+                if len(deleted_ids) < batch_size:
+                    break
+                await asyncio.sleep(batch_pause)
+
+        await collect_orphaned_storage_objects(
+            blob_crud=blob_crud,
+            storage=get_storage_backend(backend=settings.STORAGE_BACKEND),
+            prefix=f"{settings.POKEMON_IMAGE_STORAGE_DIR}/",
+            batch_size=batch_size,
+            batch_pause=batch_pause,
+            grace_period=settings.ORPHAN_GC_STORAGE_GRACE_PERIOD_SEC,
+            report=report,
+        )
+
+    finally:
+        await profile_crud.async_session.close()
+        await pokemon_image_crud.async_session.close()
+        await blob_crud.async_session.close()
+
+    if report.is_dry_run or report.profiles or report.pokemon_images or report.storage_objects:
+        loguru.logger.info(f"Orphan Garbage Collection --- {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collect orphaned profiles, pokemon images and storage objects.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be reclaimed.")
+    arguments = parser.parse_args()
+
+    print(asyncio.run(collect_orphans(is_dry_run=arguments.dry_run)))
@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import pathlib
+import uuid
+
+from src.config.setup import settings
+from src.ml.evaluation import EvaluationLog, summarize_evaluation
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.database import db
+
+IMAGE_NAME_BATCH_SIZE: int = 10000
+
+
+async def report_model_evaluation(log_dir: str, since: str | None) -> str:
+    """
+    Summarize the evaluation logs of `log_dir`, starting with the day `since` (`YYYY-MM-DD`) if given.
+    """
+    log_paths = sorted(
+        log_path for log_path in pathlib.Path(log_dir).glob("*.evaluation") if since is None or log_path.stem >= since
+    )
+    records = await asyncio.to_thread(EvaluationLog.read, log_paths)
+    pokemon_image_ids = list({uuid.UUID(bytes=bytes(image_id)) for image_id in records["pokemon_image_id"]})
+
+    pokemon_image_crud = PokemonImageCRUDRepository(async_session=db.async_session)
+    image_names: dict[uuid.UUID, str] = dict()
+    try:
+        for offset in range(0, len(pokemon_image_ids), IMAGE_NAME_BATCH_SIZE):
+            image_names.update(
+                await pokemon_image_crud.read_pokemon_image_names(
+                    ids=pokemon_image_ids[offset : offset + IMAGE_NAME_BATCH_SIZE]
+                )
+            )
+    finally:
+        await pokemon_image_crud.async_session.close()
+
+    summaries = summarize_evaluation(records=records, image_names=image_names)
+    return "\n".join(
+        [f"{len(records)} predictions in {len(log_paths)} log files"] + [str(summary) for summary in summaries]
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the models recorded in the evaluation logs.")
+    parser.add_argument("--log-dir", default=settings.EVALUATION_LOG_DIR, help="Evaluation log directory.")
+    parser.add_argument("--since", default=None, help="First day to include, as YYYY-MM-DD.")
+    arguments = parser.parse_args()
+
+    print(asyncio.run(report_model_evaluation(log_dir=arguments.log_dir, since=arguments.since)))
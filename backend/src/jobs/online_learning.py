@@ -0,0 +1,250 @@
+import argparse
+import asyncio
+import datetime
+import hashlib
+import json
+import pathlib
+import time
+import uuid
+
+import loguru
+import numpy
+
+from src.config.setup import settings
+from src.jobs.batch_scoring import extract_batch_features
+from src.ml.feature_store import feature_store
+from src.ml.registry import model_registry, ModelArtifact
+from src.ml.training import get_next_online_version, IncrementalTrainer, is_held_out
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.database import db
+from src.storage.base import BaseStorage, iterate_content
+from src.utility.design_patterns.factory.storage import get_storage_backend
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+
+TRAINING_STATE_FILE_NAME: str = "training.json"
+
+
+def get_training_state_key(artifact: ModelArtifact) -> str:
+    return f"{pathlib.PurePosixPath(artifact.storage_key).parent}/{TRAINING_STATE_FILE_NAME}"
+
+
+class TrainingState:
+    """
+    How far the examples a model version was trained on reach, stored next to its artifact. Versions published by
+    online learning carry one, so the next run only learns from images uploaded or updated since; any other
+    version starts from the first image.
+    """
+
+    __slots__ = ("last_changed_at", "last_id", "trained")
+
+    def __init__(self, last_changed_at: datetime.datetime | None, last_id: uuid.UUID | None, trained: int) -> None:
+        self.last_changed_at = last_changed_at
+        self.last_id = last_id
+        self.trained = trained
+
+    @classmethod
+    async def load(cls, storage: BaseStorage, artifact: ModelArtifact) -> "TrainingState":
+        try:
+            state = json.loads(await storage.read(key=get_training_state_key(artifact=artifact)))
+        except StorageObjectDoesNotExist:
+            return cls(last_changed_at=None, last_id=None, trained=0)
+
+        return cls(
+            last_changed_at=state["last_changed_at"] and datetime.datetime.fromisoformat(state["last_changed_at"]),
+            last_id=state["last_id"] and uuid.UUID(state["last_id"]),
+            trained=state["trained"],
+        )
+
+    def to_bytes(self) -> bytes:
+        return json.dumps(
+            {
+                "last_changed_at": self.last_changed_at and self.last_changed_at.isoformat(),
+                "last_id": self.last_id and str(self.last_id),
+                "trained": self.trained,
+            }
+        ).encode()
+
+
+class OnlineLearningReport:
+    __slots__ = (
+        "model_name",
+        "base_version",
+        "published_version",
+        "trained",
+        "skipped",
+        "held_out",
+        "base_accuracy",
+        "candidate_accuracy",
+        "rejection",
+        "started_at",
+        "finished_at",
+    )
+
+    def __init__(self, model_name: str, base_version: str) -> None:
+        self.model_name = model_name
+        self.base_version = base_version
+        self.published_version: str | None = None
+        self.trained = self.skipped = self.held_out = 0
+        self.base_accuracy = self.candidate_accuracy = float("nan")
+        self.rejection: str | None = None
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def __str__(self) -> str:
+        outcome = (
+            f"published `{self.model_name}:{self.published_version}`"
+            if self.published_version
+            else f"nothing published ({self.rejection})"
+        )
+        return (
+            f"Updated `{self.model_name}:{self.base_version}` with {self.trained} images ({self.skipped} of unknown"
+            f" labels skipped) in {self.elapsed:.1f}s, holdout accuracy {self.base_accuracy:.2%} ->"
+            f" {self.candidate_accuracy:.2%} on {self.held_out} images: {outcome}"
+        )
+
+
+async def publish_model_version(
+    storage: BaseStorage, artifact: ModelArtifact, version: str, model: bytes, training_state: TrainingState
+) -> str:
+    """
+    Store `model` as `version` of the artifact's model, beside its checksum and training state, and return its key.
+
+    The model file is written last: discovery only lists model files, so the version never shows up without the
+    checksum the registry verifies it against.
+    """
+    artifact_path = pathlib.PurePosixPath(artifact.storage_key)
+    storage_key = str(artifact_path.parent.parent / version / artifact_path.name)
+
+    await storage.put(
+        key=f"{pathlib.PurePosixPath(storage_key).parent}/{TRAINING_STATE_FILE_NAME}",
+        chunks=iterate_content(content=training_state.to_bytes()),
+        content_type="application/json",
+    )
+    await storage.put(
+        key=f"{storage_key}.sha256",
+        chunks=iterate_content(content=hashlib.sha256(model).hexdigest().encode()),
+        content_type="text/plain",
+    )
+    await storage.put(key=storage_key, chunks=iterate_content(content=model))
+    return storage_key
+
+
+async def train_online(
+    model_name: str = settings.POKEMON_CLASSIFIER_MODEL_NAME,
+    batch_size: int = settings.ONLINE_LEARNING_BATCH_SIZE,
+    holdout_fraction: float = settings.ONLINE_LEARNING_HOLDOUT_FRACTION,
+    min_holdout_size: int = settings.ONLINE_LEARNING_MIN_HOLDOUT_SIZE,
+    max_holdout_size: int = settings.ONLINE_LEARNING_MAX_HOLDOUT_SIZE,
+    max_accuracy_drop: float = settings.ONLINE_LEARNING_MAX_ACCURACY_DROP,
+) -> OnlineLearningReport:
+    """
+    Update the latest version of `model_name` with the images uploaded or updated since it was trained, named by
+    their players, and publish the result as the next online version if it holds up on the holdout images.
+
+    Images are streamed in `batch_size` mini-batches and featurized in the process pool (reusing the feature
+    store), while the previous mini-batch is `partial_fit` in a worker thread. Images whose content hash falls
+    into `holdout_fraction` are never trained on; up to `max_holdout_size` of them are kept to compare both
+    versions. The update is published only with at least `min_holdout_size` of them and an accuracy at most
+    `max_accuracy_drop` below the base version's. Images the model kept getting wrong weigh more.
+    """
+    storage = get_storage_backend(backend=settings.STORAGE_BACKEND)
+    await model_registry.discover(storage=storage)
+    artifact = model_registry.get_artifact(name=model_name)
+    handle = await model_registry.load(storage=storage, name=model_name, version=artifact.version)
+    trainer = IncrementalTrainer(handle=handle)
+
+    training_state = await TrainingState.load(storage=storage, artifact=artifact)
+    report = OnlineLearningReport(model_name=handle.name, base_version=handle.version)
+    holdout_features: list[numpy.ndarray] = list()
+    holdout_labels: list[str] = list()
+    pokemon_image_crud = PokemonImageCRUDRepository(async_session=db.async_session)
+    pending_fit: asyncio.Future | None = None
+    offered = 0
+
+    try:
+        async for examples in pokemon_image_crud.stream_labelled_examples(
+            after_changed_at=training_state.last_changed_at, after_id=training_state.last_id, batch_size=batch_size
+        ):
+            features = await extract_batch_features(
+                feature_store=feature_store,
+                storage=storage,
+                blob_sources=examples,
+                workers=feature_store.process_pool.max_workers,
+            )
+            is_holdout = numpy.array(
+                [
+                    is_held_out(content_hash=example.content_hash, holdout_fraction=holdout_fraction)
+                    for example in examples
+                ]
+            )
+            kept_holdout = numpy.flatnonzero(is_holdout)[: max_holdout_size - len(holdout_labels)]
+            holdout_features.append(features[kept_holdout])
+            holdout_labels.extend(examples[index].name for index in kept_holdout)
+
+            if pending_fit is not None:
+                report.trained += await pending_fit
+            training_examples = [
+                example for example, is_example_held_out in zip(examples, is_holdout) if not is_example_held_out
+            ]
+            offered += len(training_examples)
+            pending_fit = asyncio.ensure_future(
+                asyncio.to_thread(
+                    trainer.fit_batch,
+                    features[~is_holdout],
+                    [example.name for example in training_examples],
+                    numpy.array([1 + example.wrong_predicted for example in training_examples], dtype=numpy.float64),
+                )
+            )
+            training_state.last_changed_at, training_state.last_id = examples[-1].changed_at, examples[-1].id
+
+        if pending_fit is not None:
+            report.trained += await pending_fit
+
+    finally:
+        if pending_fit is not None and not pending_fit.done():
+            await asyncio.gather(pending_fit, return_exceptions=True)
+        await pokemon_image_crud.async_session.close()
+
+    report.skipped = offered - report.trained
+    holdout_classes, is_known = trainer.map_labels(labels=holdout_labels)
+    holdout = numpy.concatenate(holdout_features)[is_known] if holdout_features else numpy.empty((0, 0))
+    report.held_out = int(holdout_classes.size)
+    if report.held_out:
+        report.base_accuracy, report.candidate_accuracy = await asyncio.gather(
+            asyncio.to_thread(trainer.score, handle.model, holdout, holdout_classes),
+            asyncio.to_thread(trainer.score, trainer.model, holdout, holdout_classes),
+        )
+
+    if not report.trained:
+        report.rejection = "no new images"
+    elif report.held_out < min_holdout_size:
+        report.rejection = f"only {report.held_out} holdout images, {min_holdout_size} needed"
+    elif report.candidate_accuracy < report.base_accuracy - max_accuracy_drop:
+        report.rejection = "holdout accuracy dropped"
+    else:
+        training_state.trained += report.trained
+        report.published_version = get_next_online_version(version=handle.version)
+        await publish_model_version(
+            storage=storage,
+            artifact=artifact,
+            version=report.published_version,
+            model=await asyncio.to_thread(trainer.dump),
+            training_state=training_state,
+        )
+
+    report.finished_at = time.perf_counter()
+    loguru.logger.info(f"Online Learning --- Completed! {report}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update a model with the images uploaded since it was trained.")
+    parser.add_argument("--model", default=settings.POKEMON_CLASSIFIER_MODEL_NAME, help="Model name.")
+    parser.add_argument("--batch-size", type=int, default=settings.ONLINE_LEARNING_BATCH_SIZE, help="Mini-batch size.")
+    arguments = parser.parse_args()
+
+    print(asyncio.run(train_online(model_name=arguments.model, batch_size=arguments.batch_size)))
@@ -0,0 +1,30 @@
+import loguru
+
+from src.config.setup import settings
+from src.media.near_duplicates import perceptual_hash_index
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.repository.database import db
+
+
+async def synchronize_perceptual_hash_index() -> int:
+    pokemon_image_crud = PokemonImageCRUDRepository(async_session=db.async_session)
+
+    try:
+        synchronized_images = await perceptual_hash_index.synchronize(
+            pokemon_image_repo=pokemon_image_crud, batch_size=settings.PERCEPTUAL_HASH_INDEX_SYNC_BATCH_SIZE
+        )
+    finally:
+        await pokemon_image_crud.async_session.close()
+
+    loguru.logger.debug(
+        f"Perceptual Hash Index --- Synchronized {synchronized_images} images, {len(perceptual_hash_index)} indexed"
+    )
+    return synchronized_images
+
+
+async def initialize_perceptual_hash_index() -> None:
+    loguru.logger.info("Perceptual Hash Index --- Building . . .")
+
+    await synchronize_perceptual_hash_index()
+
+    loguru.logger.info(f"Perceptual Hash Index --- Successfully Built with {len(perceptual_hash_index)} images!")
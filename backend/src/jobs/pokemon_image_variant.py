@@ -0,0 +1,67 @@
+import asyncio
+
+import loguru
+
+from src.config.setup import settings
+from src.media.variants import variant_generator
+from src.repository.crud.blob import BlobCRUDRepository
+from src.repository.crud.pokemon_image_variant import PokemonImageVariantCRUDRepository
+from src.repository.database import db
+from src.utility.design_patterns.factory.storage import get_storage_backend
+from src.utility.exceptions.custom import EntityDoesNotExist, UnsupportedImageType
+from src.utility.exceptions.database import DatabaseError
+
+
+async def generate_pokemon_image_variants(content_hash: str) -> int:
+    """
+    Generate every configured variant of a freshly uploaded original that does not exist yet.
+
+    The encodes run concurrently in the process pool; a failure is only logged because the variant endpoint
+    generates whatever is still missing on first request.
+    """
+    blob_crud = BlobCRUDRepository(async_session=db.async_session)
+    variant_crud = PokemonImageVariantCRUDRepository(async_session=db.async_session)
+    storage = get_storage_backend(backend=settings.STORAGE_BACKEND)
+
+    try:
+        blob = await blob_crud.read_blob(sha256=content_hash)
+        existing_variants = {
+            (pokemon_image_variant.variant, pokemon_image_variant.format)
+            for pokemon_image_variant in await variant_crud.read_variants(content_hash=content_hash)
+        }
+        missing_variants = [
+            (variant, image_format)
+            for variant in variant_generator.variant_sizes
+            for image_format in variant_generator.variant_formats
+            if (variant, image_format.value) not in existing_variants
+        ]
+        generated_variants = await asyncio.gather(
+            *(
+                variant_generator.generate(
+                    storage=storage,
+                    source_key=blob.master_storage_key or blob.storage_key,
+                    sha256=content_hash,
+                    variant=variant,
+                    image_format=image_format,
+                )
+                for variant, image_format in missing_variants
+            )
+        )
+        # One session cannot run statements concurrently, so the rows are recorded one after another
+        for (variant, image_format), generated_variant in zip(missing_variants, generated_variants):
+            await variant_crud.create_variant(
+                content_hash=content_hash,
+                variant=variant,
+                image_format=image_format,
+                generated_variant=generated_variant,
+            )
+
+    except (EntityDoesNotExist, UnsupportedImageType, DatabaseError) as e:
+        loguru.logger.warning(f"Image Variants --- Generation for `{content_hash}` failed: {e}")
+        return 0
+
+    finally:
+        await blob_crud.async_session.close()
+        await variant_crud.async_session.close()
+
+    return len(missing_variants)
@@ -0,0 +1,20 @@
+import loguru
+
+from src.config.setup import settings
+from src.repository.crud.verification_challenge import VerificationChallengeCRUDRepository
+from src.repository.database import db
+
+
+async def purge_expired_verification_challenges() -> int:
+    verification_crud = VerificationChallengeCRUDRepository(async_session=db.async_session)
+
+    try:
+        purged_challenges = await verification_crud.purge_expired_challenges(
+            batch_size=settings.VERIFICATION_CHALLENGE_PURGE_BATCH_SIZE
+        )
+    finally:
+        await verification_crud.async_session.close()
+
+    if purged_challenges:
+        loguru.logger.info(f"Verification Challenge Purge --- Removed {purged_challenges} expired challenges")
+    return purged_challenges
@@ -3,11 +3,17 @@ import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.endpoints import router as api_endpoint_router
+from src.api.middleware.request_id import RequestIDMiddleware
+from src.api.middleware.timing import RequestTimingMiddleware
+from src.api.routes.metrics import router as metrics_router
+from src.api.routes.storage import router as storage_router
 from src.config.events import execute_backend_server_event_handler, terminate_backend_server_event_handler
 from src.config.setup import settings
+from src.utility.logger.setup import initialize_logger
 
 
 def initialize_application() -> fastapi.FastAPI:
+    initialize_logger()
     app = fastapi.FastAPI(**settings.set_backend_app_attributes)
     app.add_middleware(
         CORSMiddleware,
@@ -16,6 +22,8 @@ def initialize_application() -> fastapi.FastAPI:
         allow_methods=settings.ALLOWED_METHODS,
         allow_headers=settings.ALLOWED_HEADERS,
     )
+    app.add_middleware(RequestTimingMiddleware, excluded_paths=("/metrics",))
+    app.add_middleware(RequestIDMiddleware)
     app.add_event_handler(
         "startup",
         execute_backend_server_event_handler(app=app),
@@ -25,6 +33,8 @@ def initialize_application() -> fastapi.FastAPI:
         terminate_backend_server_event_handler(app=app),
     )
     app.include_router(router=api_endpoint_router, prefix=settings.API_PREFIX)
+    app.include_router(router=metrics_router)
+    app.include_router(router=storage_router)
     return app
 
 
@@ -0,0 +1,77 @@
+import typing
+
+from src.media.perceptual_hash import hamming_distance
+
+
+class BKTreeNode:
+    __slots__ = ("image_hash", "children", "items")
+
+    def __init__(self, image_hash: int) -> None:
+        self.image_hash = image_hash
+        self.children: dict[int, BKTreeNode] = dict()
+        self.items: dict[typing.Hashable, typing.Any] = dict()
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over 64-bit hashes under the Hamming metric.
+
+    A query with radius `d` only descends into children whose edge distance lies in `[D - d, D + d]` (triangle
+    inequality), so small radii touch a small fraction of the nodes. Each distinct hash is one node holding every
+    item with that hash; removing an item keeps the node as a routing point.
+    """
+
+    def __init__(self) -> None:
+        self.root: BKTreeNode | None = None
+        self._item_hashes: dict[typing.Hashable, int] = dict()
+
+    def __len__(self) -> int:
+        return len(self._item_hashes)
+
+    def __contains__(self, item: typing.Hashable) -> bool:
+        return item in self._item_hashes
+
+    def _find_or_create_node(self, image_hash: int) -> BKTreeNode:
+        if self.root is None:
+            self.root = BKTreeNode(image_hash=image_hash)
+            return self.root
+
+        node = self.root
+        while True:
+            distance = hamming_distance(first_hash=image_hash, second_hash=node.image_hash)
+            if distance == 0:
+                return node
+            child = node.children.get(distance)
+            if child is None:
+                child = node.children[distance] = BKTreeNode(image_hash=image_hash)
+                return child
+            node = child
+
+    def add(self, item: typing.Hashable, image_hash: int, value: typing.Any = None) -> None:
+        if item in self._item_hashes:
+            self.remove(item=item)
+        self._find_or_create_node(image_hash=image_hash).items[item] = value
+        self._item_hashes[item] = image_hash
+
+    def remove(self, item: typing.Hashable) -> None:
+        image_hash = self._item_hashes.pop(item, None)
+        if image_hash is not None:
+            self._find_or_create_node(image_hash=image_hash).items.pop(item, None)
+
+    def search(self, image_hash: int, max_distance: int) -> list[tuple[typing.Hashable, typing.Any, int]]:
+        """
+        Return `(item, value, distance)` for every item within `max_distance` of `image_hash`, closest first.
+        """
+        matches: list[tuple[typing.Hashable, typing.Any, int]] = list()
+        pending_nodes = [self.root] if self.root is not None else []
+
+        while pending_nodes:
+            node = pending_nodes.pop()
+            distance = hamming_distance(first_hash=image_hash, second_hash=node.image_hash)
+            if distance <= max_distance:
+                matches.extend((item, value, distance) for item, value in node.items.items())
+            for edge_distance, child in node.children.items():
+                if distance - max_distance <= edge_distance <= distance + max_distance:
+                    pending_nodes.append(child)
+
+        return sorted(matches, key=lambda match: match[2])
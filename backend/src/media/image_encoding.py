@@ -0,0 +1,80 @@
+import io
+
+from PIL import Image, ImageCms, ImageOps
+
+from src.media.perceptual_hash import compute_image_dhash
+
+MASTER_IMAGE_FORMAT: str = "PNG"
+MASTER_CONTENT_TYPE: str = "image/png"
+SRGB_PROFILE: ImageCms.ImageCmsProfile = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB"))
+
+
+def encode_image_variant(
+    image_bytes: bytes, max_dimension: int, image_format: str, quality: int
+) -> tuple[bytes, int, int]:
+    """
+    Downscale so the longest side fits `max_dimension` (never upscale) and encode; returns `(content, width, height)`.
+
+    Runs inside a pool worker process, hence the plain picklable arguments and result and the Pillow-only imports.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as source_image:
+        # JPEG decodes straight at a reduced scale, skipping most of the IDCT work for large originals
+        source_image.draft("RGB", (max_dimension, max_dimension))
+        image = ImageOps.exif_transpose(source_image)
+        image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format.upper(), quality=quality)
+        return buffer.getvalue(), image.width, image.height
+
+
+def _to_canonical_mode(image: Image.Image) -> Image.Image:
+    """
+    Convert to 8-bit sRGB `RGB`, or `RGBA` when the image has transparency. Embedded colour profiles are applied
+    rather than dropped, so a Display P3 or CMYK upload keeps its colours once its metadata is gone.
+    """
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    canonical_mode = "RGBA" if has_alpha else "RGB"
+
+    icc_profile = image.info.get("icc_profile")
+    if icc_profile and image.mode in ("RGB", "RGBA", "CMYK", "L"):
+        try:
+            return ImageCms.profileToProfile(  # type: ignore
+                image, ImageCms.ImageCmsProfile(io.BytesIO(icc_profile)), SRGB_PROFILE, outputMode=canonical_mode
+            )
+        except ImageCms.PyCMSError:
+            # A broken or mismatching profile is treated like no profile at all
+            pass
+
+    return image if image.mode == canonical_mode else image.convert(canonical_mode)
+
+
+def normalize_image(image_bytes: bytes, max_dimension: int, max_pixels: int) -> tuple[bytes, int, int, int]:
+    """
+    Decode an upload into its canonical master: orientation applied, EXIF and every other metadata chunk dropped,
+    sRGB `RGB` or `RGBA`, longest side within `max_dimension` and stored as lossless PNG. Returns
+    `(content, width, height, dhash)`; the hash is taken from the master, so it no longer depends on how the upload
+    happened to be encoded.
+
+    The pixel count is checked from the header before any pixel is decoded, so a decompression bomb (a few KB that
+    inflate to gigabytes) is refused with `Image.DecompressionBombError` at the cost of parsing its header. Only the
+    first frame of an animation is kept.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as source_image:
+        if source_image.width * source_image.height > max_pixels:
+            raise Image.DecompressionBombError(
+                f"Image has {source_image.width * source_image.height} pixels, at most {max_pixels} are decoded!"
+            )
+
+        source_image.draft("RGB", (max_dimension, max_dimension))
+        image = ImageOps.exif_transpose(source_image)
+        image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        image = _to_canonical_mode(image=image)
+
+        buffer = io.BytesIO()
+        # Nothing from `image.info` is passed on, so neither EXIF nor ICC nor text chunks reach the master
+        image.save(buffer, format=MASTER_IMAGE_FORMAT, compress_level=3)
+        return buffer.getvalue(), image.width, image.height, compute_image_dhash(image=image)
@@ -0,0 +1,160 @@
+import typing
+
+from multipart.multipart import MultipartParser, parse_options_header
+
+from src.utility.exceptions.custom import MalformedMultipartRequest
+
+PART_BEGIN: str = "part_begin"
+PART_HEADERS: str = "part_headers"
+PART_DATA: str = "part_data"
+PART_END: str = "part_end"
+BODY_END: str = "body_end"
+
+
+class MultipartPart:
+    """
+    One part of a `multipart/form-data` body. Its data can be consumed exactly once, either streamed with
+    `iter_chunks()` or read whole with `read()` (bounded, meant for small form fields).
+    """
+
+    def __init__(self, reader: "StreamingMultipartReader", headers: dict[bytes, bytes]) -> None:
+        self._reader = reader
+        self._is_consumed = False
+        disposition, options = parse_options_header(headers.get(b"content-disposition"))
+        if disposition != b"form-data" or b"name" not in options:
+            raise MalformedMultipartRequest("Multipart part without a form-data `name`!")
+
+        self.name: str = options[b"name"].decode()
+        self.filename: str | None = options[b"filename"].decode() if b"filename" in options else None
+        self.content_type: str | None = headers[b"content-type"].decode() if b"content-type" in headers else None
+
+    async def iter_chunks(self) -> typing.AsyncIterator[bytes]:
+        if self._is_consumed:
+            raise RuntimeError(f"Multipart part `{self.name}` was already consumed!")
+        self._is_consumed = True
+
+        while True:
+            event, data = await self._reader.next_event()
+            if event in (PART_END, BODY_END):
+                return
+            if data:
+                yield data
+
+    async def read(self, max_size: int) -> bytes:
+        data = bytearray()
+        async for chunk in self.iter_chunks():
+            data.extend(chunk)
+            if len(data) > max_size:
+                raise MalformedMultipartRequest(f"Form field `{self.name}` exceeds {max_size} bytes!")
+        return bytes(data)
+
+    async def skip(self) -> None:
+        if not self._is_consumed:
+            async for _ in self.iter_chunks():
+                pass
+
+
+class StreamingMultipartReader:
+    """
+    Pull-based `multipart/form-data` reader over an ASGI body stream.
+
+    Starlette's `request.form()` spools every file to a temporary file before the endpoint runs. Here the
+    python-multipart push parser is fed one network chunk at a time and only when the consumer asks for more, so a
+    request never holds more than one chunk of body in memory regardless of the file size.
+    """
+
+    def __init__(self, content_type: str | None, stream: typing.AsyncIterator[bytes]) -> None:
+        mime_type, options = parse_options_header(content_type)
+        if mime_type != b"multipart/form-data" or b"boundary" not in options:
+            raise MalformedMultipartRequest("Expected a multipart/form-data body with a boundary!")
+
+        self._stream = stream
+        self._is_stream_exhausted = False
+        self._events: list[tuple[str, typing.Any]] = list()
+        self._event_index = 0
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._headers: dict[bytes, bytes] = dict()
+        self._current_part: MultipartPart | None = None
+        self._parser = MultipartParser(
+            boundary=options[b"boundary"],
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_end": self._on_end,
+            },
+        )
+
+    def _on_part_begin(self) -> None:
+        self._headers = dict()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._events.append((PART_DATA, data[start:end]))
+
+    def _on_part_end(self) -> None:
+        self._events.append((PART_END, None))
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field.extend(data[start:end])
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value.extend(data[start:end])
+
+    def _on_header_end(self) -> None:
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_headers_finished(self) -> None:
+        self._events.append((PART_HEADERS, self._headers))
+
+    def _on_end(self) -> None:
+        self._events.append((BODY_END, None))
+
+    async def next_event(self) -> tuple[str, typing.Any]:
+        while self._event_index >= len(self._events):
+            if self._is_stream_exhausted:
+                raise MalformedMultipartRequest("Multipart body ended before its closing boundary!")
+
+            self._events.clear()
+            self._event_index = 0
+            try:
+                chunk = await self._stream.__anext__()
+            except StopAsyncIteration:
+                self._is_stream_exhausted = True
+                self._parser.finalize()
+                continue
+
+            try:
+                self._parser.write(chunk)
+            except Exception as e:
+                raise MalformedMultipartRequest(f"Malformed multipart body: {e}") from e
+
+        event = self._events[self._event_index]
+        self._event_index += 1
+        return event
+
+    async def next_part(self) -> MultipartPart | None:
+        """
+        Return the next part, skipping whatever the consumer left unread of the previous one.
+        """
+        if self._current_part is not None:
+            await self._current_part.skip()
+            self._current_part = None
+
+        while True:
+            event, data = await self.next_event()
+            if event == BODY_END:
+                return None
+            if event == PART_HEADERS:
+                self._current_part = MultipartPart(reader=self, headers=data)
+                return self._current_part
+
+    async def __aiter__(self) -> typing.AsyncIterator[MultipartPart]:
+        while (part := await self.next_part()) is not None:
+            yield part
@@ -0,0 +1,114 @@
+import datetime
+import typing
+import uuid
+
+from src.media.bk_tree import BKTree
+from src.media.perceptual_hash import hamming_distance, to_unsigned_hash
+from src.repository.crud.pokemon_image import PokemonImageCRUDRepository
+from src.utility.exceptions.custom import NearDuplicateImage
+
+
+class PerceptualHashIndex:
+    """
+    In-process BK-tree of every hashed pokemon image, mapping image id to `(profile_id, hash)`.
+
+    Each worker holds its own copy: it is rebuilt from the database at startup, updated in place by the uploads and
+    deletions this worker serves, and topped up by `synchronize()` with images created through other workers. It
+    only proposes candidates; callers confirm them against the database, so a stale entry never leaks out.
+    """
+
+    def __init__(self, sync_overlap: datetime.timedelta = datetime.timedelta(minutes=1)) -> None:
+        self.tree = BKTree()
+        self.sync_overlap = sync_overlap
+        self._synced_until: datetime.datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def add(self, image_id: uuid.UUID, profile_id: uuid.UUID, perceptual_hash: int) -> None:
+        self.tree.add(item=image_id, image_hash=perceptual_hash, value=profile_id)
+
+    def remove(self, image_id: uuid.UUID) -> None:
+        self.tree.remove(item=image_id)
+
+    def find_near_duplicates(self, perceptual_hash: int, max_distance: int) -> list[tuple[uuid.UUID, uuid.UUID, int]]:
+        """
+        Return `(image_id, profile_id, distance)` of every indexed image within `max_distance` bits, closest first.
+        """
+        return self.tree.search(image_hash=perceptual_hash, max_distance=max_distance)  # type: ignore
+
+    async def synchronize(self, pokemon_image_repo: PokemonImageCRUDRepository, batch_size: int) -> int:
+        """
+        Add images created since the last run. The window re-reads `sync_overlap` of already seen rows, so an image
+        whose transaction committed after a later one was read is still picked up; re-adding is idempotent.
+        """
+        created_after = None if self._synced_until is None else self._synced_until - self.sync_overlap
+        id_after: uuid.UUID | None = None
+        synchronized_images = 0
+
+        while True:
+            entries = await pokemon_image_repo.read_perceptual_hash_entries(
+                created_after=created_after, id_after=id_after, limit=batch_size
+            )
+            for entry in entries:
+                self.add(
+                    image_id=entry.id,
+                    profile_id=entry.profile_id,
+                    perceptual_hash=to_unsigned_hash(signed_bigint=entry.perceptual_hash),
+                )
+            synchronized_images += len(entries)
+
+            if entries:
+                created_after, id_after = entries[-1].created_at, entries[-1].id
+                if self._synced_until is None or created_after > self._synced_until:
+                    self._synced_until = created_after
+            if len(entries) < batch_size:
+                return synchronized_images
+
+
+def get_perceptual_hash_index() -> PerceptualHashIndex:
+    return PerceptualHashIndex()
+
+
+perceptual_hash_index: PerceptualHashIndex = get_perceptual_hash_index()
+
+
+def is_near_duplicate(perceptual_hash: int, other_hashes: typing.Iterable[int], max_distance: int) -> bool:
+    return any(
+        hamming_distance(first_hash=perceptual_hash, second_hash=other_hash) <= max_distance
+        for other_hash in other_hashes
+    )
+
+
+async def read_profile_perceptual_hashes(
+    profile_id: uuid.UUID, pokemon_image_repo: PokemonImageCRUDRepository
+) -> list[int]:
+    return [
+        to_unsigned_hash(signed_bigint=perceptual_hash)
+        for perceptual_hash in await pokemon_image_repo.read_profile_perceptual_hashes(profile_id=profile_id)
+    ]
+
+
+def ensure_not_owned_near_duplicate(perceptual_hash: int, owned_hashes: list[int], max_distance: int) -> None:
+    if is_near_duplicate(perceptual_hash=perceptual_hash, other_hashes=owned_hashes, max_distance=max_distance):
+        raise NearDuplicateImage("You already own this image or a near-identical copy of it!")
+
+
+async def ensure_not_near_duplicate(
+    perceptual_hash: int, profile_id: uuid.UUID, pokemon_image_repo: PokemonImageCRUDRepository, max_distance: int
+) -> None:
+    """
+    Refuse an image when the same profile already owns one within `max_distance` bits, which stops players from
+    farming `correct_predicted` with re-encoded or slightly edited copies.
+
+    The profile's hashes are read from the database rather than the worker's `perceptual_hash_index`, so an image
+    uploaded through another worker a moment ago is still caught; a profile owns few enough images to compare them
+    all.
+    """
+    ensure_not_owned_near_duplicate(
+        perceptual_hash=perceptual_hash,
+        owned_hashes=await read_profile_perceptual_hashes(
+            profile_id=profile_id, pokemon_image_repo=pokemon_image_repo
+        ),
+        max_distance=max_distance,
+    )
@@ -0,0 +1,39 @@
+from PIL import Image
+
+from src.media.image_encoding import MASTER_CONTENT_TYPE, normalize_image
+from src.media.upload import StoredImage
+from src.storage.base import BaseStorage, iterate_content
+from src.utility.concurrency.process_pool import process_pool
+from src.utility.exceptions.custom import ImageTooLarge, UnsupportedImageType
+
+
+async def normalize_stored_image(
+    storage: BaseStorage, stored_image: StoredImage, max_dimension: int, max_pixels: int
+) -> int:
+    """
+    Ingestion stage between the upload and the database: decode the stored original once in the process pool, store
+    its canonical master next to it and record the master's key, dimensions and perceptual hash on `stored_image`.
+    Returns the perceptual hash.
+
+    The master is moved to its content-addressed key together with the original, so every later consumer reads a
+    small, upright, metadata-free sRGB image instead of decoding whatever the client sent.
+    """
+    image_bytes = await storage.read(key=stored_image.storage_key)
+    try:
+        content, width, height, perceptual_hash = await process_pool.run(
+            normalize_image, image_bytes, max_dimension=max_dimension, max_pixels=max_pixels
+        )
+    except Image.DecompressionBombError as e:
+        raise ImageTooLarge(f"Image exceeds the maximum of {max_pixels} pixels!") from e
+    except Exception as e:
+        raise UnsupportedImageType("Image could not be decoded!") from e
+
+    master_storage_key = f"{stored_image.storage_key}.master"
+    await storage.put(
+        key=master_storage_key, chunks=iterate_content(content=content), content_type=MASTER_CONTENT_TYPE
+    )
+    stored_image.master_storage_key = master_storage_key
+    stored_image.width = width
+    stored_image.height = height
+    stored_image.perceptual_hash = perceptual_hash
+    return perceptual_hash
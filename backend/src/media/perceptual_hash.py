@@ -0,0 +1,47 @@
+import io
+
+from PIL import Image
+
+DHASH_SIZE: int = 8
+SIGNED_BIGINT_OFFSET: int = 1 << 64
+
+
+def compute_dhash(image_bytes: bytes, hash_size: int = DHASH_SIZE) -> int:
+    """
+    Difference hash: shrink to `(hash_size + 1) x hash_size` greyscale and set one bit per pixel that is brighter
+    than its right neighbour. Re-encoding, resizing or small edits flip only a few of the 64 bits.
+
+    CPU bound, run it off the event loop.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        # JPEG can decode straight at a reduced scale, which skips most of the IDCT work
+        image.draft("L", (hash_size * 8, hash_size * 8))
+        return compute_image_dhash(image=image, hash_size=hash_size)
+
+
+def compute_image_dhash(image: Image.Image, hash_size: int = DHASH_SIZE) -> int:
+    """
+    `compute_dhash()` of an already decoded image.
+    """
+    pixels = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR).tobytes()
+
+    dhash = 0
+    for row_offset in range(0, len(pixels), hash_size + 1):
+        for column in range(hash_size):
+            dhash = (dhash << 1) | (pixels[row_offset + column] > pixels[row_offset + column + 1])
+    return dhash
+
+
+def hamming_distance(first_hash: int, second_hash: int) -> int:
+    return (first_hash ^ second_hash).bit_count()
+
+
+def to_signed_bigint(unsigned_hash: int) -> int:
+    """
+    PostgreSQL has no unsigned 64-bit integer; store the hash bit pattern in a signed `BIGINT`.
+    """
+    return unsigned_hash - SIGNED_BIGINT_OFFSET if unsigned_hash >= 1 << 63 else unsigned_hash
+
+
+def to_unsigned_hash(signed_bigint: int) -> int:
+    return signed_bigint + SIGNED_BIGINT_OFFSET if signed_bigint < 0 else signed_bigint
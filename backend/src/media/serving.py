@@ -0,0 +1,153 @@
+import asyncio
+import datetime
+import email.utils
+import re
+import typing
+
+import fastapi
+from starlette.types import Receive, Scope, Send
+
+from src.storage.base import BaseStorage
+from src.utility.exceptions.custom import RangeNotSatisfiable
+
+IMMUTABLE_CACHE_CONTROL: str = "public, max-age=31536000, immutable"
+ZERO_COPY_SEND_EXTENSION: str = "http.response.zerocopysend"
+BYTE_RANGE_PATTERN: re.Pattern = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+def format_etag(content_hash: str) -> str:
+    # Strong validator: the content hash changes with every byte of the representation
+    return f'"{content_hash}"'
+
+
+def format_http_date(moment: datetime.datetime) -> str:
+    return email.utils.format_datetime(moment.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def _parse_http_date(value: str) -> datetime.datetime | None:
+    try:
+        moment = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=datetime.timezone.utc)
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    """
+    `If-None-Match` uses the weak comparison, so a `W/` prefix is ignored; `*` matches any representation.
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def is_not_modified(headers: typing.Mapping[str, str], etag: str, last_modified: datetime.datetime) -> bool:
+    """
+    Evaluate the conditional GET; `If-Modified-Since` only counts when the client sent no `If-None-Match`.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return is_etag_matched(if_none_match=if_none_match, etag=etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None:
+        modified_since = _parse_http_date(value=if_modified_since)
+        return modified_since is not None and last_modified.replace(microsecond=0) <= modified_since
+    return False
+
+
+def is_range_applicable(if_range: str | None, etag: str, last_modified: datetime.datetime) -> bool:
+    """
+    Honour `Range` only while the client's copy is current; `If-Range` needs the strong comparison.
+    """
+    if if_range is None:
+        return True
+    if if_range.strip().startswith(("W/", '"')):
+        return if_range.strip() == etag
+    range_date = _parse_http_date(value=if_range)
+    return range_date is not None and last_modified.replace(microsecond=0) == range_date
+
+
+def parse_byte_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Resolve a single `bytes=` range into inclusive `(start, end)` offsets.
+
+    Returns `None` when the whole object should be sent instead: unknown units, malformed or multiple ranges may be
+    ignored. A well-formed range that lies outside the object raises `RangeNotSatisfiable`.
+    """
+    range_match = BYTE_RANGE_PATTERN.match(range_header)
+    if range_match is None:
+        return None
+
+    first, last = range_match.groups()
+    if not first:
+        if not last:
+            return None
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            raise RangeNotSatisfiable(f"Range `{range_header}` lies outside the {size} byte content!")
+        return max(size - suffix_length, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(f"Range `{range_header}` lies outside the {size} byte content!")
+    return start, min(end, size - 1)
+
+
+class StorageObjectResponse(fastapi.Response):
+    """
+    Stream `[start, end]` of a stored object.
+
+    Objects that live on the local filesystem are handed to the server with the ASGI `zerocopysend` extension when
+    the server offers it, so the kernel copies file pages straight to the socket (`sendfile`). Everything else is
+    streamed chunk by chunk from the storage backend.
+    """
+
+    def __init__(
+        self,
+        storage: BaseStorage,
+        key: str,
+        start: int,
+        end: int,
+        status_code: int = fastapi.status.HTTP_200_OK,
+        headers: typing.Mapping[str, str] | None = None,
+        media_type: str | None = None,
+    ) -> None:
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.storage = storage
+        self.key = key
+        self.start = start
+        self.end = end
+        self.headers["content-length"] = str(end - start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"] == "HEAD" or self.end < self.start:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        local_path = self.storage.get_local_path(key=self.key)
+        if local_path is not None and ZERO_COPY_SEND_EXTENSION in scope.get("extensions", {}):
+            storage_file = await asyncio.to_thread(open, local_path, "rb")
+            try:
+                await send(
+                    {
+                        "type": ZERO_COPY_SEND_EXTENSION,
+                        "file": storage_file,
+                        "offset": self.start,
+                        "count": self.end - self.start + 1,
+                        "more_body": False,
+                    }
+                )
+            finally:
+                await asyncio.to_thread(storage_file.close)
+            return
+
+        async for chunk in self.storage.get(key=self.key, start=self.start, end=self.end):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -0,0 +1,256 @@
+import asyncio
+import typing
+import uuid
+
+from src.media.multipart import MultipartPart, StreamingMultipartReader
+from src.media.validation import ImageStreamInspector
+from src.storage.base import BaseStorage
+from src.utility.exceptions.custom import ImageTooLarge, MalformedMultipartRequest, UnsupportedImageType
+
+MAX_FORM_FIELDS: int = 16
+MAX_FORM_FIELD_SIZE: int = 1024
+# The bulk body describes every image in one JSON form field
+MAX_BULK_FORM_FIELD_SIZE: int = 64 * 1024
+
+
+class StoredImage:
+    __slots__ = (
+        "file_name",
+        "storage_key",
+        "content_hash",
+        "content_type",
+        "size",
+        "perceptual_hash",
+        "master_storage_key",
+        "width",
+        "height",
+    )
+
+    def __init__(
+        self,
+        file_name: str,
+        storage_key: str,
+        content_hash: str,
+        content_type: str,
+        size: int,
+        perceptual_hash: int | None = None,
+        master_storage_key: str | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> None:
+        self.file_name = file_name
+        self.storage_key = storage_key
+        self.content_hash = content_hash
+        self.content_type = content_type
+        self.size = size
+        self.perceptual_hash = perceptual_hash
+        self.master_storage_key = master_storage_key
+        self.width = width
+        self.height = height
+
+    @property
+    def storage_keys(self) -> list[str]:
+        """
+        Every object stored for this upload: the original and, once normalized, its master.
+        """
+        return [self.storage_key] if self.master_storage_key is None else [self.storage_key, self.master_storage_key]
+
+
+async def discard_stored_images(storage: BaseStorage, stored_images: typing.Iterable[StoredImage]) -> None:
+    await asyncio.gather(
+        *(
+            storage.delete(key=storage_key)
+            for stored_image in stored_images
+            for storage_key in stored_image.storage_keys
+        )
+    )
+
+
+def generate_image_file_name() -> str:
+    return str(uuid.uuid4())
+
+
+async def _store_image_part(
+    part: MultipartPart, storage: BaseStorage, storage_dir: str, max_image_size: int
+) -> StoredImage:
+    inspector = ImageStreamInspector(max_size=max_image_size)
+    inspected_chunks = (inspector.inspect(chunk=chunk) async for chunk in part.iter_chunks())
+
+    # Sniff the format before the first storage write so the object is created with its real content type
+    leading_chunks: list[bytes] = list()
+    async for chunk in inspected_chunks:
+        leading_chunks.append(chunk)
+        if inspector.content_type is not None:
+            break
+
+    async def _replay_chunks() -> typing.AsyncIterator[bytes]:
+        for chunk in leading_chunks:
+            yield chunk
+        leading_chunks.clear()
+        async for chunk in inspected_chunks:
+            yield chunk
+
+    file_name = generate_image_file_name()
+    storage_key = f"{storage_dir}/{file_name}"
+    size = await storage.put(key=storage_key, chunks=_replay_chunks(), content_type=inspector.content_type)
+    try:
+        content_hash = inspector.finalize()
+    except BaseException:
+        await storage.delete(key=storage_key)
+        raise
+
+    return StoredImage(
+        file_name=file_name,
+        storage_key=storage_key,
+        content_hash=content_hash,
+        content_type=inspector.content_type,  # type: ignore
+        size=size,
+    )
+
+
+async def receive_image_upload(
+    content_type: str | None,
+    stream: typing.AsyncIterator[bytes],
+    storage: BaseStorage,
+    storage_dir: str,
+    max_image_size: int,
+    image_field: str = "image",
+) -> tuple[dict[str, str], StoredImage]:
+    """
+    Stream the `image_field` file part of a multipart body straight into `storage` and collect the plain form fields.
+
+    Memory stays bounded by one network chunk per request. If anything fails after the image was stored, the
+    object is deleted again; the caller owns the cleanup once this function returned.
+    """
+    reader = StreamingMultipartReader(content_type=content_type, stream=stream)
+    form_fields: dict[str, str] = dict()
+    stored_image: StoredImage | None = None
+
+    try:
+        async for part in reader:
+            if part.filename is None:
+                if len(form_fields) >= MAX_FORM_FIELDS:
+                    raise MalformedMultipartRequest(f"Too many form fields, at most {MAX_FORM_FIELDS} are accepted!")
+                form_fields[part.name] = (await part.read(max_size=MAX_FORM_FIELD_SIZE)).decode(errors="replace")
+
+            elif part.name == image_field and stored_image is None:
+                stored_image = await _store_image_part(
+                    part=part, storage=storage, storage_dir=storage_dir, max_image_size=max_image_size
+                )
+
+    except BaseException:
+        if stored_image is not None:
+            await storage.delete(key=stored_image.storage_key)
+        raise
+
+    if stored_image is None:
+        raise MalformedMultipartRequest(f"Multipart body has no `{image_field}` file part!")
+
+    return form_fields, stored_image
+
+
+async def _buffer_image_part(part: MultipartPart, max_image_size: int) -> tuple[list[bytes], ImageStreamInspector]:
+    inspector = ImageStreamInspector(max_size=max_image_size)
+    chunks = [inspector.inspect(chunk=chunk) async for chunk in part.iter_chunks()]
+    inspector.finalize()
+    return chunks, inspector
+
+
+async def _put_buffered_image(
+    chunks: list[bytes], inspector: ImageStreamInspector, storage: BaseStorage, storage_dir: str
+) -> StoredImage:
+    async def _iterate_chunks() -> typing.AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    file_name = generate_image_file_name()
+    storage_key = f"{storage_dir}/{file_name}"
+    size = await storage.put(key=storage_key, chunks=_iterate_chunks(), content_type=inspector.content_type)
+    return StoredImage(
+        file_name=file_name,
+        storage_key=storage_key,
+        content_hash=inspector.finalize(),
+        content_type=inspector.content_type,  # type: ignore
+        size=size,
+    )
+
+
+async def receive_bulk_image_upload(
+    content_type: str | None,
+    stream: typing.AsyncIterator[bytes],
+    storage: BaseStorage,
+    storage_dir: str,
+    max_image_size: int,
+    max_images: int,
+    max_concurrency: int,
+    image_field: str = "images",
+) -> tuple[dict[str, str], list[StoredImage | ImageTooLarge | UnsupportedImageType]]:
+    """
+    Store every `image_field` file part of a multipart body and collect the plain form fields.
+
+    Parts arrive one after another on the request stream, so each image is validated and buffered while it is read,
+    then written to storage by a task of its own while the next part is read already. At most `max_concurrency`
+    images are buffered or being written at any time, which bounds memory by `max_concurrency * max_image_size`.
+
+    The result holds one entry per image part, in order: the stored image, or the validation error that rejected
+    it. If the request as a whole fails, every stored object is deleted again; otherwise the caller owns them.
+    """
+    reader = StreamingMultipartReader(content_type=content_type, stream=stream)
+    form_fields: dict[str, str] = dict()
+    write_slots = asyncio.Semaphore(max_concurrency)
+    results: list[asyncio.Task | ImageTooLarge | UnsupportedImageType] = list()
+
+    async def _store_buffered_image(chunks: list[bytes], inspector: ImageStreamInspector) -> StoredImage:
+        try:
+            return await _put_buffered_image(
+                chunks=chunks, inspector=inspector, storage=storage, storage_dir=storage_dir
+            )
+        finally:
+            write_slots.release()
+
+    try:
+        async for part in reader:
+            if part.filename is None:
+                if len(form_fields) >= MAX_FORM_FIELDS:
+                    raise MalformedMultipartRequest(f"Too many form fields, at most {MAX_FORM_FIELDS} are accepted!")
+                form_fields[part.name] = (await part.read(max_size=MAX_BULK_FORM_FIELD_SIZE)).decode(errors="replace")
+                continue
+
+            if part.name != image_field:
+                continue
+            if len(results) >= max_images:
+                raise MalformedMultipartRequest(f"Too many images, at most {max_images} are accepted per request!")
+
+            await write_slots.acquire()
+            try:
+                chunks, inspector = await _buffer_image_part(part=part, max_image_size=max_image_size)
+            except (ImageTooLarge, UnsupportedImageType) as e:
+                # Only this image is rejected; the reader skips the rest of its part
+                write_slots.release()
+                results.append(e)
+                continue
+            except BaseException:
+                write_slots.release()
+                raise
+            results.append(asyncio.create_task(_store_buffered_image(chunks=chunks, inspector=inspector)))
+
+        await asyncio.gather(*(result for result in results if isinstance(result, asyncio.Task)))
+
+    except BaseException:
+        await _discard_stored_images(storage=storage, results=results)
+        raise
+
+    return form_fields, [result.result() if isinstance(result, asyncio.Task) else result for result in results]
+
+
+async def _discard_stored_images(
+    storage: BaseStorage, results: list[asyncio.Task | ImageTooLarge | UnsupportedImageType]
+) -> None:
+    write_tasks = [result for result in results if isinstance(result, asyncio.Task)]
+    for write_task in write_tasks:
+        write_task.cancel()
+    stored_images = await asyncio.gather(*write_tasks, return_exceptions=True)
+    await discard_stored_images(
+        storage=storage,
+        stored_images=[stored_image for stored_image in stored_images if isinstance(stored_image, StoredImage)],
+    )
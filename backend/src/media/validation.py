@@ -0,0 +1,60 @@
+import hashlib
+
+from src.utility.exceptions.custom import ImageTooLarge, UnsupportedImageType
+
+MAGIC_BYTES_LENGTH: int = 12
+
+
+def sniff_image_content_type(header: bytes) -> str | None:
+    """
+    Identify the image format from its leading magic bytes; the client supplied `Content-Type` is never trusted.
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class ImageStreamInspector:
+    """
+    Validate an image while it streams: the magic bytes are checked as soon as the first 12 bytes arrived, the size
+    on every chunk and the SHA-256 is updated incrementally, so a bad upload is rejected before it is fully received.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self.content_type: str | None = None
+        self._sha256 = hashlib.sha256()
+        self._header = bytearray()
+
+    def inspect(self, chunk: bytes) -> bytes:
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise ImageTooLarge(f"Image exceeds the maximum size of {self.max_size} bytes!")
+
+        if self.content_type is None and len(self._header) < MAGIC_BYTES_LENGTH:
+            self._header.extend(chunk[: MAGIC_BYTES_LENGTH - len(self._header)])
+            if len(self._header) == MAGIC_BYTES_LENGTH:
+                self._detect_content_type()
+
+        self._sha256.update(chunk)
+        return chunk
+
+    def _detect_content_type(self) -> None:
+        self.content_type = sniff_image_content_type(header=bytes(self._header))
+        if self.content_type is None:
+            raise UnsupportedImageType("Only JPEG, PNG, GIF and WebP images are accepted!")
+
+    def finalize(self) -> str:
+        """
+        Return the hex SHA-256 once the stream is complete.
+        """
+        if self.content_type is None:
+            self._detect_content_type()
+        return self._sha256.hexdigest()
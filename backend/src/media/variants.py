@@ -0,0 +1,132 @@
+import loguru
+from PIL import features as pillow_features
+
+from src.config.setup import settings
+from src.media.image_encoding import encode_image_variant
+from src.storage.base import BaseStorage, iterate_content
+from src.utility.concurrency.process_pool import process_pool, ProcessPool
+from src.utility.concurrency.single_flight import SingleFlight
+from src.utility.enums.image_format import ImageVariantFormats
+from src.utility.exceptions.custom import UnsupportedImageType
+
+VARIANT_CONTENT_TYPES: dict[ImageVariantFormats, str] = {
+    ImageVariantFormats.WEBP: "image/webp",
+    ImageVariantFormats.AVIF: "image/avif",
+}
+
+
+class GeneratedVariant:
+    __slots__ = ("storage_key", "content_type", "width", "height", "size")
+
+    def __init__(self, storage_key: str, content_type: str, width: int, height: int, size: int) -> None:
+        self.storage_key = storage_key
+        self.content_type = content_type
+        self.width = width
+        self.height = height
+        self.size = size
+
+
+def parse_variant_sizes(variant_sizes: str) -> dict[str, int]:
+    """
+    Parse `"thumbnail=128,small=320"` into `{"thumbnail": 128, "small": 320}`; sizes bound the longest side.
+    """
+    parsed_sizes: dict[str, int] = dict()
+    for entry in filter(None, (entry.strip() for entry in variant_sizes.split(","))):
+        variant, _, max_dimension = entry.partition("=")
+        parsed_sizes[variant.strip()] = int(max_dimension)
+    return parsed_sizes
+
+
+def parse_variant_formats(variant_formats: str) -> tuple[ImageVariantFormats, ...]:
+    """
+    Parse `"webp,avif"`, dropping the encoders this Pillow build lacks so a missing codec degrades instead of failing
+    every request.
+    """
+    parsed_formats: list[ImageVariantFormats] = list()
+    for entry in filter(None, (entry.strip().lower() for entry in variant_formats.split(","))):
+        image_format = ImageVariantFormats(entry)
+        if pillow_features.check(image_format.value):
+            parsed_formats.append(image_format)
+        else:
+            loguru.logger.warning(f"Image Variants --- Pillow has no `{image_format.value}` encoder, skipping it")
+    return tuple(parsed_formats)
+
+
+def get_variant_storage_key(storage_dir: str, sha256: str, variant: str, image_format: ImageVariantFormats) -> str:
+    # Next to the blob fan-out, one directory per original so all its variants go together
+    return f"{storage_dir}/variants/{sha256[:2]}/{sha256}/{variant}.{image_format.value}"
+
+
+class VariantGenerator:
+    """
+    Encode derivatives of stored originals in the process pool and store them through the storage layer.
+
+    Concurrent requests for the same `(sha256, variant, format)` share one encode. The storage key is derived from
+    the content, so two workers racing on the same variant write the same bytes to the same key.
+    """
+
+    def __init__(
+        self,
+        storage_dir: str,
+        variant_sizes: dict[str, int],
+        variant_formats: tuple[ImageVariantFormats, ...],
+        quality: int,
+        process_pool: ProcessPool,
+    ) -> None:
+        self.storage_dir = storage_dir
+        self.variant_sizes = variant_sizes
+        self.variant_formats = variant_formats
+        self.quality = quality
+        self.process_pool = process_pool
+        self._single_flight = SingleFlight()
+
+    def is_supported(self, variant: str, image_format: ImageVariantFormats) -> bool:
+        return variant in self.variant_sizes and image_format in self.variant_formats
+
+    async def generate(
+        self, storage: BaseStorage, source_key: str, sha256: str, variant: str, image_format: ImageVariantFormats
+    ) -> GeneratedVariant:
+        return await self._single_flight.do(
+            key=(sha256, variant, image_format),
+            func=lambda: self._generate(
+                storage=storage, source_key=source_key, sha256=sha256, variant=variant, image_format=image_format
+            ),
+        )
+
+    async def _generate(
+        self, storage: BaseStorage, source_key: str, sha256: str, variant: str, image_format: ImageVariantFormats
+    ) -> GeneratedVariant:
+        image_bytes = await storage.read(key=source_key)
+        try:
+            content, width, height = await self.process_pool.run(
+                encode_image_variant,
+                image_bytes,
+                max_dimension=self.variant_sizes[variant],
+                image_format=image_format.value,
+                quality=self.quality,
+            )
+        except Exception as e:
+            raise UnsupportedImageType("Image could not be decoded!") from e
+
+        storage_key = get_variant_storage_key(
+            storage_dir=self.storage_dir, sha256=sha256, variant=variant, image_format=image_format
+        )
+        content_type = VARIANT_CONTENT_TYPES[image_format]
+        size = await storage.put(key=storage_key, chunks=iterate_content(content=content), content_type=content_type)
+
+        return GeneratedVariant(
+            storage_key=storage_key, content_type=content_type, width=width, height=height, size=size
+        )
+
+
+def get_variant_generator() -> VariantGenerator:
+    return VariantGenerator(
+        storage_dir=settings.POKEMON_IMAGE_STORAGE_DIR,
+        variant_sizes=parse_variant_sizes(variant_sizes=settings.POKEMON_IMAGE_VARIANT_SIZES),
+        variant_formats=parse_variant_formats(variant_formats=settings.POKEMON_IMAGE_VARIANT_FORMATS),
+        quality=settings.POKEMON_IMAGE_VARIANT_QUALITY,
+        process_pool=process_pool,
+    )
+
+
+variant_generator: VariantGenerator = get_variant_generator()
@@ -0,0 +1,150 @@
+import asyncio
+import concurrent.futures
+import time
+import typing
+
+import loguru
+import numpy
+
+from src.utility.metrics.definitions import (
+    inference_batch_duration_seconds,
+    inference_batch_size,
+    inference_request_duration_seconds,
+)
+
+
+class PendingPrediction:
+    __slots__ = ("features", "future", "enqueued_at")
+
+    def __init__(self, features: numpy.ndarray, future: asyncio.Future, enqueued_at: float) -> None:
+        self.features = features
+        self.future = future
+        self.enqueued_at = enqueued_at
+
+
+class MicroBatcher:
+    """
+    Queue single predictions and evaluate them together: a batch is dispatched once it holds `max_batch_size`
+    predictions or its first one has waited `max_wait_ms`, whichever comes first.
+
+    `predict_batch` receives the stacked feature rows and returns one result row per input row; it runs in
+    `executor` so the event loop keeps accepting requests, and up to `max_concurrent_batches` batches are evaluated
+    at once. Under load the wait never expires and batches fill up, which is where the vectorized call pays off;
+    when idle a lone prediction is delayed by at most `max_wait_ms`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        predict_batch: typing.Callable[[numpy.ndarray], numpy.ndarray],
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_concurrent_batches: int = 1,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        self.name = name
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self._queue: asyncio.Queue[PendingPrediction] = asyncio.Queue()
+        self._batch_slots = asyncio.Semaphore(max_concurrent_batches)
+        self._worker: asyncio.Task | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._outstanding_predictions = 0
+        self._is_idle = asyncio.Event()
+        self._is_idle.set()
+
+    async def predict(self, features: numpy.ndarray) -> numpy.ndarray:
+        """
+        Return the result row for one feature row once the batch it was grouped into has been evaluated.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._collect_batches())
+
+        pending_prediction = PendingPrediction(
+            features=features, future=asyncio.get_running_loop().create_future(), enqueued_at=time.perf_counter()
+        )
+        self._queue.put_nowait(pending_prediction)
+        self._outstanding_predictions += 1
+        self._is_idle.clear()
+        try:
+            result = await pending_prediction.future
+        finally:
+            self._outstanding_predictions -= 1
+            if not self._outstanding_predictions:
+                self._is_idle.set()
+        inference_request_duration_seconds.observe(time.perf_counter() - pending_prediction.enqueued_at, self.name)
+        return result
+
+    async def _collect_batch(self) -> list[PendingPrediction]:
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+        # Callers that gave up while waiting (e.g. disconnected clients) are not evaluated
+        return [pending_prediction for pending_prediction in batch if not pending_prediction.future.done()]
+
+    async def _collect_batches(self) -> None:
+        while True:
+            await self._batch_slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._batch_slots.release()
+                raise
+            if not batch:
+                self._batch_slots.release()
+                continue
+
+            batch_task = asyncio.create_task(self._evaluate_batch(batch=batch))
+            self._batch_tasks.add(batch_task)
+            batch_task.add_done_callback(self._batch_tasks.discard)
+
+    async def _evaluate_batch(self, batch: list[PendingPrediction]) -> None:
+        try:
+            features = numpy.stack([pending_prediction.features for pending_prediction in batch])
+            started_at = time.perf_counter()
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, self.predict_batch, features)
+            inference_batch_duration_seconds.observe(time.perf_counter() - started_at, self.name)
+            inference_batch_size.observe(len(batch), self.name)
+
+            if len(results) != len(batch):
+                raise ValueError(f"Model returned {len(results)} results for a batch of {len(batch)}!")
+            for pending_prediction, result in zip(batch, results):
+                if not pending_prediction.future.done():
+                    pending_prediction.future.set_result(result)
+
+        except Exception as e:
+            loguru.logger.error(f"Inference --- Batch of {len(batch)} for `{self.name}` failed: {e}")
+            for pending_prediction in batch:
+                if not pending_prediction.future.done():
+                    pending_prediction.future.set_exception(e)
+
+        finally:
+            self._batch_slots.release()
+
+    async def drain(self) -> None:
+        """
+        Wait until every prediction handed to the batcher so far has been answered.
+        """
+        await self._is_idle.wait()
+
+    async def close(self) -> None:
+        tasks = [task for task in (self._worker, *self._batch_tasks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+
+        while not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
@@ -0,0 +1,259 @@
+import datetime
+import json
+import os
+import pathlib
+import typing
+import uuid
+
+import numpy
+
+MANIFEST_FILE_NAME: str = "manifest.json"
+LABEL_DTYPE: numpy.dtype = numpy.dtype("<U124")
+ID_DTYPE: numpy.dtype = numpy.dtype("V16")
+
+
+def _save_array_atomically(path: pathlib.Path, array: numpy.ndarray) -> None:
+    temporary_path = path.with_name(f".{path.name}.part")
+    with open(temporary_path, "wb") as array_file:
+        numpy.save(array_file, array)
+    os.replace(temporary_path, path)
+
+
+class DatasetShard:
+    """
+    `rows` examples stored as three `.npy` files sharing the `shard-{index}` stem: `features` (`float32`, one row per
+    example), `labels` (the image names) and `ids` (the pokemon image UUIDs as 16 raw bytes).
+    """
+
+    __slots__ = ("index", "rows")
+
+    def __init__(self, index: int, rows: int) -> None:
+        self.index = index
+        self.rows = rows
+
+    def get_path(self, dataset_dir: pathlib.Path, array_name: str) -> pathlib.Path:
+        return dataset_dir / f"shard-{self.index:05d}.{array_name}.npy"
+
+    def open(self, dataset_dir: pathlib.Path) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Memory-map the `(features, labels, ids)` arrays read-only.
+        """
+        return tuple(  # type: ignore
+            numpy.load(self.get_path(dataset_dir=dataset_dir, array_name=array_name), mmap_mode="r")
+            for array_name in ("features", "labels", "ids")
+        )
+
+
+class DatasetManifest:
+    """
+    Describe one exported dataset: its feature layout, its shards and how far the exported images reach.
+
+    An export only appends images uploaded or updated after `(last_changed_at, last_id)`. An updated image is
+    exported again in a later shard, so readers keep only the last occurrence of every id, and a deleted image is
+    recorded in `deleted_ids` instead of being cut out of its shard, so readers drop its rows (`read_dataset()` does
+    both).
+    """
+
+    __slots__ = (
+        "dataset_dir",
+        "feature_version",
+        "dimension",
+        "shard_size",
+        "shards",
+        "last_changed_at",
+        "last_id",
+        "deleted_ids",
+    )
+
+    def __init__(self, dataset_dir: pathlib.Path, feature_version: str, dimension: int, shard_size: int) -> None:
+        self.dataset_dir = dataset_dir
+        self.feature_version = feature_version
+        self.dimension = dimension
+        self.shard_size = shard_size
+        self.shards: list[DatasetShard] = list()
+        self.last_changed_at: datetime.datetime | None = None
+        self.last_id: uuid.UUID | None = None
+        self.deleted_ids: set[uuid.UUID] = set()
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.dataset_dir / MANIFEST_FILE_NAME
+
+    @property
+    def rows(self) -> int:
+        return sum(shard.rows for shard in self.shards)
+
+    @classmethod
+    def load(
+        cls, dataset_dir: pathlib.Path, feature_version: str, dimension: int, shard_size: int
+    ) -> "DatasetManifest":
+        manifest = cls(
+            dataset_dir=dataset_dir, feature_version=feature_version, dimension=dimension, shard_size=shard_size
+        )
+        try:
+            state = json.loads(manifest.path.read_text())
+        except FileNotFoundError:
+            return manifest
+
+        # Shards already written keep the size they were written with
+        manifest.shard_size = state["shard_size"]
+        manifest.shards = [DatasetShard(index=shard["index"], rows=shard["rows"]) for shard in state["shards"]]
+        manifest.last_changed_at = state["last_changed_at"] and datetime.datetime.fromisoformat(
+            state["last_changed_at"]
+        )
+        manifest.last_id = state["last_id"] and uuid.UUID(state["last_id"])
+        manifest.deleted_ids = {uuid.UUID(deleted_id) for deleted_id in state.get("deleted_ids", list())}
+        return manifest
+
+    def read_ids(self) -> list[uuid.UUID]:
+        """
+        Return the ids of the exported images that are not recorded as deleted, each once.
+        """
+        ids = numpy.empty(0, dtype=ID_DTYPE)
+        for shard in self.shards:
+            shard_ids = numpy.load(shard.get_path(dataset_dir=self.dataset_dir, array_name="ids"), mmap_mode="r")
+            ids = numpy.union1d(ids, shard_ids)
+        return [id for id in (uuid.UUID(bytes=bytes(id)) for id in ids) if id not in self.deleted_ids]
+
+    def save(self) -> None:
+        state = {
+            "feature_version": self.feature_version,
+            "dimension": self.dimension,
+            "shard_size": self.shard_size,
+            "shards": [{"index": shard.index, "rows": shard.rows} for shard in self.shards],
+            "last_changed_at": self.last_changed_at and self.last_changed_at.isoformat(),
+            "last_id": self.last_id and str(self.last_id),
+            "deleted_ids": sorted(str(deleted_id) for deleted_id in self.deleted_ids),
+        }
+        temporary_path = self.path.with_name(f".{self.path.name}.part")
+        self.dataset_dir.mkdir(parents=True, exist_ok=True)
+        temporary_path.write_text(json.dumps(state))
+        os.replace(temporary_path, self.path)
+
+
+class DatasetWriter:
+    """
+    Append examples to a dataset in shards of exactly `shard_size` rows; only the last shard may be shorter.
+
+    The features of the shard being filled go straight into a memory-mapped `.npy` file, so memory stays bounded
+    by the labels and ids of one shard. A short last shard left by the previous export is copied into the new one
+    and refilled, then replaced under the same name. Files are replaced atomically, so a training job that already
+    mapped the old file keeps reading it. The manifest is saved after every shard, but only `flush()` advances its
+    cursor: after a crash the next export writes the same images again, and readers drop the duplicates like any
+    updated image.
+    """
+
+    def __init__(self, manifest: DatasetManifest) -> None:
+        self.manifest = manifest
+        self._shard = DatasetShard(index=len(manifest.shards), rows=0)
+        if manifest.shards and manifest.shards[-1].rows < manifest.shard_size:
+            self._shard = manifest.shards.pop()
+        self._features: numpy.memmap | None = None
+        self._labels = numpy.empty(manifest.shard_size, dtype=LABEL_DTYPE)
+        self._ids = numpy.empty(manifest.shard_size, dtype=ID_DTYPE)
+
+    @property
+    def _part_path(self) -> pathlib.Path:
+        return self.manifest.dataset_dir / f".shard-{self._shard.index:05d}.features.npy.filling"
+
+    def _open_features(self) -> numpy.memmap:
+        if self._features is None:
+            self.manifest.dataset_dir.mkdir(parents=True, exist_ok=True)
+            self._features = numpy.lib.format.open_memmap(
+                self._part_path,
+                mode="w+",
+                dtype=numpy.float32,
+                shape=(self.manifest.shard_size, self.manifest.dimension),
+            )
+            if self._shard.rows:
+                features, labels, ids = self._shard.open(dataset_dir=self.manifest.dataset_dir)
+                self._features[: self._shard.rows] = features
+                self._labels[: self._shard.rows] = labels
+                self._ids[: self._shard.rows] = ids
+        return self._features
+
+    def _write_shard(self) -> None:
+        features = self._open_features()
+        rows = self._shard.rows
+        features_path = self._shard.get_path(dataset_dir=self.manifest.dataset_dir, array_name="features")
+        if rows == self.manifest.shard_size:
+            features.flush()
+            os.replace(self._part_path, features_path)
+        else:
+            # A `.npy` header records the shape, so a short shard gets a file of its own size
+            _save_array_atomically(path=features_path, array=features[:rows])
+            self._part_path.unlink()
+        self._features = None
+
+        for array_name, array in (("labels", self._labels[:rows]), ("ids", self._ids[:rows])):
+            _save_array_atomically(
+                path=self._shard.get_path(dataset_dir=self.manifest.dataset_dir, array_name=array_name), array=array
+            )
+        self.manifest.shards.append(self._shard)
+        self.manifest.save()
+
+    def append(self, features: numpy.ndarray, labels: typing.Sequence[str], ids: typing.Sequence[uuid.UUID]) -> None:
+        offset = 0
+        while offset < len(features):
+            shard_features = self._open_features()
+            start = self._shard.rows
+            rows = min(len(features) - offset, self.manifest.shard_size - start)
+            shard_features[start : start + rows] = features[offset : offset + rows]
+            self._labels[start : start + rows] = labels[offset : offset + rows]
+            self._ids[start : start + rows] = [id.bytes for id in ids[offset : offset + rows]]
+            self._shard.rows += rows
+            offset += rows
+
+            if self._shard.rows == self.manifest.shard_size:
+                self._write_shard()
+                self._shard = DatasetShard(index=len(self.manifest.shards), rows=0)
+
+    def delete(self, ids: typing.Iterable[uuid.UUID]) -> None:
+        """
+        Record images deleted since they were exported; their rows stay in place until the dataset is exported from
+        scratch, but readers drop them. The ids are saved together with the manifest.
+        """
+        self.manifest.deleted_ids.update(ids)
+
+    def flush(self, last_changed_at: datetime.datetime | None, last_id: uuid.UUID | None) -> None:
+        """
+        Write the rows of the shard being filled as a short last shard and move the cursor past the examples
+        appended so far.
+        """
+        if self._features is not None:
+            self._write_shard()
+        elif self._shard.rows:
+            # The short last shard of the previous export got no new rows and stays as it is
+            self.manifest.shards.append(self._shard)
+        self.manifest.last_changed_at, self.manifest.last_id = last_changed_at, last_id
+        self.manifest.save()
+
+
+def read_dataset(dataset_dir: pathlib.Path | str) -> list[tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+    """
+    Memory-map every shard of the dataset in `dataset_dir` and return its `(features, labels, is_current)`, where
+    `is_current` masks out the rows a later shard exported again and the rows of deleted images. Shards without
+    such rows are used as is, `features[is_current]` only copies the others.
+    """
+    dataset_dir = pathlib.Path(dataset_dir)
+    state = json.loads((dataset_dir / MANIFEST_FILE_NAME).read_text())
+    shards = [
+        DatasetShard(index=shard["index"], rows=shard["rows"]).open(dataset_dir=dataset_dir)
+        for shard in state["shards"]
+    ]
+
+    all_ids = numpy.concatenate([ids for _, _, ids in shards]) if shards else numpy.empty(0, dtype=ID_DTYPE)
+    # `unique()` reports the first occurrence, so searching the reversed ids finds the last one of every id
+    _, last_occurrences = numpy.unique(all_ids[::-1], return_index=True)
+    is_current = numpy.zeros(len(all_ids), dtype=bool)
+    is_current[len(all_ids) - 1 - last_occurrences] = True
+    deleted_ids = numpy.array(
+        [uuid.UUID(deleted_id).bytes for deleted_id in state.get("deleted_ids", list())], dtype=ID_DTYPE
+    )
+    is_current &= ~numpy.isin(all_ids, deleted_ids)
+
+    shard_offsets = numpy.cumsum([0] + [len(ids) for _, _, ids in shards])
+    return [
+        (features, labels, is_current[shard_offsets[index] : shard_offsets[index + 1]])
+        for index, (features, labels, _) in enumerate(shards)
+    ]
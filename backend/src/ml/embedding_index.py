@@ -0,0 +1,339 @@
+import datetime
+import os
+import pathlib
+import threading
+import typing
+import uuid
+
+import numpy
+
+from src.config.setup import settings
+from src.ml.features import feature_extractor
+
+ID_DTYPE: numpy.dtype = numpy.dtype("V16")
+
+
+def normalize_rows(vectors: numpy.ndarray) -> numpy.ndarray:
+    norms = numpy.linalg.norm(vectors, axis=1, keepdims=True)
+    return numpy.divide(vectors, norms, out=numpy.zeros_like(vectors), where=norms > 0)
+
+
+class EmbeddingProjection:
+    """
+    Map feature rows to short embeddings with a fixed Gaussian random projection, which approximately preserves
+    their cosine similarities (Johnson-Lindenstrauss) at a fraction of their size. The matrix is derived from
+    `seed`, so every worker and every restart embeds the same image identically without storing it.
+    """
+
+    def __init__(self, input_dimension: int, dimension: int, seed: int = 0) -> None:
+        self.input_dimension = input_dimension
+        self.dimension = dimension
+        self.seed = seed
+        self.matrix = numpy.random.default_rng(seed).standard_normal(
+            (input_dimension, dimension), dtype=numpy.float32
+        ) / numpy.float32(numpy.sqrt(dimension))
+
+    @property
+    def version(self) -> str:
+        return f"rp{self.seed}-{self.input_dimension}x{self.dimension}"
+
+    def project(self, features: numpy.ndarray) -> numpy.ndarray:
+        return features @ self.matrix
+
+
+class EmbeddingIndex:
+    """
+    Cosine top-k search over one `float32` embedding per pokemon image.
+
+    Embeddings are L2-normalized and stored as the rows of one contiguous matrix that grows by doubling, so a
+    batch of queries is scored with a single BLAS matrix product. Removing or re-adding an image only tombstones
+    its row; tombstoned rows are compacted away once they make up half of the matrix.
+
+    With `list_count` lists, `train()` runs spherical k-means over the stored embeddings and every row is
+    assigned to its closest centroid (IVF). Before searching, the matrix is reordered so every list is one
+    contiguous block, and each probed list is scored against all the queries probing it with one matrix product.
+    A query only scores the rows of its `probe_count` closest lists, which is sublinear in the index size at the
+    cost of exact recall; untrained, every row is scored.
+
+    Like the perceptual hash index, each worker holds its own copy: it is loaded from disk at startup, updated in
+    place by the deletions this worker serves and topped up from the database periodically. Results are only
+    candidates that callers confirm against the database.
+    """
+
+    def __init__(
+        self, dimension: int, list_count: int = 0, probe_count: int = 8, initial_capacity: int = 1024
+    ) -> None:
+        self.dimension = dimension
+        self.list_count = list_count
+        self.probe_count = probe_count
+        self.synced_until: datetime.datetime | None = None
+        self._vectors = numpy.empty((max(initial_capacity, 1), dimension), dtype=numpy.float32)
+        self._is_live = numpy.zeros(len(self._vectors), dtype=bool)
+        self._assignments = numpy.zeros(len(self._vectors), dtype=numpy.int32)
+        self._ids: list[uuid.UUID] = list()
+        self._rows: dict[uuid.UUID, int] = dict()
+        self._centroids: numpy.ndarray | None = None
+        self._trained_size = 0
+        self._list_bounds: numpy.ndarray | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, image_id: uuid.UUID) -> bool:
+        return image_id in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ("_vectors", "_is_live", "_assignments"):
+            array = getattr(self, name)
+            grown_array = numpy.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown_array[: len(self._ids)] = array[: len(self._ids)]
+            setattr(self, name, grown_array)
+
+    def _assign(self, vectors: numpy.ndarray) -> numpy.ndarray:
+        return (vectors @ self._centroids.T).argmax(axis=1).astype(numpy.int32)  # type: ignore
+
+    def _compact(self) -> None:
+        """
+        Drop the tombstoned rows and, once trained, order the rest by list so every list is a contiguous block.
+        """
+        size = len(self._ids)
+        live_rows = numpy.flatnonzero(self._is_live[:size])
+        if self._centroids is not None:
+            live_rows = live_rows[numpy.argsort(self._assignments[live_rows], kind="stable")]
+            self._list_bounds = numpy.searchsorted(
+                self._assignments[live_rows], numpy.arange(len(self._centroids) + 1)
+            )
+
+        for name in ("_vectors", "_is_live", "_assignments"):
+            array = getattr(self, name)
+            array[: len(live_rows)] = array[live_rows]
+        self._is_live[len(live_rows) : size] = False
+        self._ids = [self._ids[row] for row in live_rows.tolist()]
+        self._rows = dict(zip(self._ids, range(len(self._ids))))
+
+    def get(self, image_id: uuid.UUID) -> numpy.ndarray | None:
+        """
+        Return a copy of the normalized embedding of `image_id`, or `None` if it is not indexed.
+        """
+        with self._lock:
+            row = self._rows.get(image_id)
+            return None if row is None else self._vectors[row].copy()
+
+    def add_many(self, image_ids: list[uuid.UUID], vectors: numpy.ndarray) -> None:
+        """
+        Index `vectors[i]` for `image_ids[i]`, replacing the embedding of ids that are indexed already.
+        """
+        vectors = normalize_rows(numpy.asarray(vectors, dtype=numpy.float32))
+        with self._lock:
+            for image_id in image_ids:
+                row = self._rows.pop(image_id, None)
+                if row is not None:
+                    self._is_live[row] = False
+
+            start, end = len(self._ids), len(self._ids) + len(image_ids)
+            self._reserve(size=end)
+            self._vectors[start:end] = vectors
+            self._is_live[start:end] = True
+            if self._centroids is not None:
+                self._assignments[start:end] = self._assign(vectors=vectors)
+            self._ids.extend(image_ids)
+            self._rows.update(zip(image_ids, range(start, end)))
+            # The new rows sit outside of the list blocks until the next search reorders the matrix
+            self._list_bounds = None
+
+    def remove(self, image_id: uuid.UUID) -> None:
+        self.remove_many(image_ids=[image_id])
+
+    def remove_many(self, image_ids: typing.Iterable[uuid.UUID]) -> None:
+        """
+        Tombstone the rows of `image_ids`; once they outnumber the live rows the matrix is compacted, which is O(N),
+        so callers on the event loop run this in a thread.
+        """
+        with self._lock:
+            for image_id in image_ids:
+                row = self._rows.pop(image_id, None)
+                if row is not None:
+                    self._is_live[row] = False
+            if len(self._rows) * 2 < len(self._ids):
+                self._compact()
+
+    def is_training_due(self, min_rows_per_list: int) -> bool:
+        """
+        Whether `train()` should run: IVF is on, enough rows exist and the index doubled since its last training.
+        """
+        return (
+            self.list_count > 0
+            and len(self._rows) >= self.list_count * min_rows_per_list
+            and len(self._rows) >= 2 * self._trained_size
+        )
+
+    def train(self, iterations: int = 10, sample_size: int | None = None, seed: int = 0) -> None:
+        """
+        Fit `list_count` centroids with spherical k-means on (a sample of) the live rows and reassign every row.
+        """
+        generator = numpy.random.default_rng(seed)
+        with self._lock:
+            live_rows = numpy.flatnonzero(self._is_live[: len(self._ids)])
+            if sample_size is not None and sample_size < len(live_rows):
+                live_rows = generator.choice(live_rows, size=sample_size, replace=False)
+            samples = self._vectors[live_rows]
+        if not len(samples):
+            return
+
+        list_count = min(self.list_count, len(samples))
+        centroids = samples[generator.choice(len(samples), size=list_count, replace=False)]
+        for _ in range(iterations):
+            assignments = (samples @ centroids.T).argmax(axis=1)
+            order = numpy.argsort(assignments, kind="stable")
+            lists, starts = numpy.unique(assignments[order], return_index=True)
+            sums = numpy.add.reduceat(samples[order], starts, axis=0)
+            # Lists left empty are reseeded with random samples instead of collapsing
+            centroids = samples[generator.choice(len(samples), size=list_count, replace=False)]
+            centroids[lists] = normalize_rows(sums)
+
+        with self._lock:
+            self._centroids = centroids
+            self._assignments[: len(self._ids)] = self._assign(vectors=self._vectors[: len(self._ids)])
+            self._trained_size = len(self._rows)
+            self._list_bounds = None
+
+    def _top_k(self, scores: numpy.ndarray, rows: numpy.ndarray, k: int) -> list[tuple[uuid.UUID, float]]:
+        top = numpy.argpartition(-scores, k - 1)[:k] if k < len(scores) else numpy.arange(len(scores))
+        top = top[numpy.argsort(-scores[top], kind="stable")]
+        return [
+            (self._ids[row], score)
+            for row, score in zip(rows[top].tolist(), scores[top].tolist())
+            if score != -numpy.inf
+        ]
+
+    def _search_lists(self, queries: numpy.ndarray, k: int) -> list[list[tuple[uuid.UUID, float]]]:
+        if self._list_bounds is None:
+            self._compact()
+        list_bounds: numpy.ndarray = self._list_bounds  # type: ignore
+        probe_count = min(self.probe_count, len(self._centroids))  # type: ignore
+        probed_lists = numpy.argpartition(-(queries @ self._centroids.T), probe_count - 1, axis=1)  # type: ignore
+        probed_lists = probed_lists[:, :probe_count].ravel()
+
+        # Walk the probed lists instead of the queries: one matrix product per list for every query probing it
+        candidate_rows: list[list[numpy.ndarray]] = [list() for _ in queries]
+        candidate_scores: list[list[numpy.ndarray]] = [list() for _ in queries]
+        order = numpy.argsort(probed_lists, kind="stable")
+        lists, starts = numpy.unique(probed_lists[order], return_index=True)
+        for list_index, query_indexes in zip(lists.tolist(), numpy.split(order // probe_count, starts[1:])):
+            start, end = list_bounds[list_index], list_bounds[list_index + 1]
+            if start == end:
+                continue
+            scores = queries[query_indexes] @ self._vectors[start:end].T
+            scores[:, ~self._is_live[start:end]] = -numpy.inf
+            if k < end - start:
+                top = numpy.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = numpy.take_along_axis(scores, top, axis=1)
+            else:
+                top = numpy.broadcast_to(numpy.arange(end - start), scores.shape)
+            for query_index, query_rows, query_scores in zip(query_indexes.tolist(), top + start, scores):
+                candidate_rows[query_index].append(query_rows)
+                candidate_scores[query_index].append(query_scores)
+
+        return [
+            self._top_k(scores=numpy.concatenate(scores), rows=numpy.concatenate(rows), k=k) if rows else list()
+            for rows, scores in zip(candidate_rows, candidate_scores)
+        ]
+
+    def search(self, queries: numpy.ndarray, k: int) -> list[list[tuple[uuid.UUID, float]]]:
+        """
+        Return the `(image_id, cosine similarity)` of the `k` closest images for every query row, closest first.
+        """
+        queries = normalize_rows(numpy.atleast_2d(numpy.asarray(queries, dtype=numpy.float32)))
+        with self._lock:
+            if self._centroids is not None:
+                return self._search_lists(queries=queries, k=k)
+
+            size = len(self._ids)
+            scores = queries @ self._vectors[:size].T
+            scores[:, ~self._is_live[:size]] = -numpy.inf
+            return [self._top_k(scores=query_scores, rows=numpy.arange(size), k=k) for query_scores in scores]
+
+    def save(self, path: pathlib.Path | str, version: str) -> None:
+        """
+        Persist the live rows, the centroids and the sync position under `version`, atomically replacing `path`.
+        """
+        path = pathlib.Path(path)
+        with self._lock:
+            live_rows = numpy.flatnonzero(self._is_live[: len(self._ids)])
+            vectors = self._vectors[live_rows]
+            ids = numpy.array([self._ids[row].bytes for row in live_rows.tolist()], dtype=ID_DTYPE)
+            centroids = self._centroids if self._centroids is not None else numpy.empty((0, self.dimension))
+            synced_until = numpy.array(self.synced_until.isoformat() if self.synced_until else "")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Every worker saves its own copy, so temporary files must not collide
+        temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        try:
+            with open(temporary_path, "wb") as index_file:
+                numpy.savez(
+                    index_file,
+                    version=numpy.array(version),
+                    vectors=vectors,
+                    ids=ids,
+                    centroids=centroids,
+                    synced_until=synced_until,
+                )
+            os.replace(temporary_path, path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+    def load(self, path: pathlib.Path | str, version: str) -> bool:
+        """
+        Replace the content with what `save()` stored at `path`; returns `False`, leaving the index as it is, if
+        nothing was stored or it was stored for another `version`.
+        """
+        try:
+            with numpy.load(path) as stored:
+                if str(stored["version"]) != version:
+                    return False
+                vectors, ids, centroids = stored["vectors"], stored["ids"], stored["centroids"]
+                synced_until = str(stored["synced_until"])
+        except FileNotFoundError:
+            return False
+
+        with self._lock:
+            self._ids = list()
+            self._reserve(size=len(vectors))
+            self._vectors[: len(vectors)] = vectors
+            self._is_live[:] = False
+            self._is_live[: len(vectors)] = True
+            self._ids = [uuid.UUID(bytes=bytes(image_id)) for image_id in ids]
+            self._rows = dict(zip(self._ids, range(len(self._ids))))
+            self._centroids = centroids if len(centroids) else None
+            if self._centroids is not None:
+                self._assignments[: len(self._ids)] = self._assign(vectors=self._vectors[: len(self._ids)])
+            self._trained_size = len(self._rows) if self._centroids is not None else 0
+            self._list_bounds = None
+            self.synced_until = datetime.datetime.fromisoformat(synced_until) if synced_until else None
+        return True
+
+
+def get_embedding_projection() -> EmbeddingProjection:
+    return EmbeddingProjection(input_dimension=feature_extractor.dimension, dimension=settings.EMBEDDING_DIMENSION)
+
+
+def get_embedding_index() -> EmbeddingIndex:
+    return EmbeddingIndex(
+        dimension=settings.EMBEDDING_DIMENSION,
+        list_count=settings.EMBEDDING_INDEX_LISTS,
+        probe_count=settings.EMBEDDING_INDEX_PROBES,
+    )
+
+
+embedding_projection: EmbeddingProjection = get_embedding_projection()
+embedding_index: EmbeddingIndex = get_embedding_index()
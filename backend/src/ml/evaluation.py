@@ -0,0 +1,351 @@
+import asyncio
+import datetime
+import pathlib
+import random
+import time
+import typing
+import uuid
+
+import loguru
+import numpy
+
+from src.config.setup import settings
+from src.ml.predictions import prediction_cache, PredictionCache
+from src.models.schema.prediction import PredictionInResponse
+from src.storage.base import BaseStorage
+from src.utility.exceptions.custom import InvalidModelArtifact, ModelDoesNotExist
+
+EVALUATION_RECORD_DTYPE: numpy.dtype = numpy.dtype(
+    [
+        ("recorded_at", "<f8"),
+        ("request_id", "<u8"),
+        ("pokemon_image_id", "V16"),
+        # As wide as the `prediction` columns, in bytes; `EvaluationLog.record` skips values whose UTF-8 is longer
+        ("model_name", "S124"),
+        ("model_version", "S64"),
+        ("is_served", "?"),
+        ("is_cache_hit", "?"),
+        ("label", "S124"),
+        ("confidence", "<f4"),
+        ("latency", "<f4"),
+    ]
+)
+
+
+class EvaluationLog:
+    """
+    Append-only log of every prediction made while a candidate model is evaluated, one fixed-size binary record per
+    prediction and one file per UTC day, so a report reads millions of records with a single `numpy.fromfile`.
+
+    Records are buffered in memory and appended `flush_size` at a time with one `write()` to a file opened with
+    `O_APPEND`, so workers sharing the directory never interleave partial records.
+    """
+
+    def __init__(self, log_dir: pathlib.Path | str, flush_size: int) -> None:
+        self.log_dir = pathlib.Path(log_dir)
+        self.flush_size = flush_size
+        self._pending_records: list[tuple] = list()
+
+    def __len__(self) -> int:
+        return len(self._pending_records)
+
+    def record(
+        self,
+        request_id: int,
+        pokemon_image_id: uuid.UUID,
+        prediction: PredictionInResponse,
+        is_served: bool,
+        is_cache_hit: bool,
+        latency: float,
+    ) -> bool:
+        """
+        Buffer one record; returns whether the buffer is due to be flushed. A prediction whose model name, version or
+        label does not fit its field is skipped rather than truncated.
+        """
+        model_name, model_version, label = (
+            prediction.model_name.encode(),
+            prediction.model_version.encode(),
+            prediction.label.encode(),
+        )
+        if (
+            len(model_name) > EVALUATION_RECORD_DTYPE["model_name"].itemsize
+            or len(model_version) > EVALUATION_RECORD_DTYPE["model_version"].itemsize
+            or len(label) > EVALUATION_RECORD_DTYPE["label"].itemsize
+        ):
+            loguru.logger.warning(
+                f"Model Evaluation --- Prediction of `{prediction.model_name}:{prediction.model_version}` is too long"
+                " to be recorded"
+            )
+            return False
+
+        self._pending_records.append(
+            (
+                time.time(),
+                request_id,
+                pokemon_image_id.bytes,
+                model_name,
+                model_version,
+                is_served,
+                is_cache_hit,
+                label,
+                prediction.confidence,
+                latency,
+            )
+        )
+        return len(self._pending_records) >= self.flush_size
+
+    def _append(self, records: numpy.ndarray) -> None:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.log_dir / f"{datetime.datetime.now(tz=datetime.timezone.utc):%Y-%m-%d}.evaluation"
+        with open(log_path, "ab") as log_file:
+            log_file.write(records.tobytes())
+
+    async def flush(self) -> int:
+        pending_records, self._pending_records = self._pending_records, list()
+        if pending_records:
+            await asyncio.to_thread(self._append, numpy.array(pending_records, dtype=EVALUATION_RECORD_DTYPE))
+        return len(pending_records)
+
+    @staticmethod
+    def read(paths: typing.Iterable[pathlib.Path]) -> numpy.ndarray:
+        record_batches = list()
+        for path in paths:
+            # A record cut off by a crash is ignored
+            record_count = path.stat().st_size // EVALUATION_RECORD_DTYPE.itemsize
+            record_batches.append(numpy.fromfile(path, dtype=EVALUATION_RECORD_DTYPE, count=record_count))
+        return numpy.concatenate(record_batches) if record_batches else numpy.empty(0, dtype=EVALUATION_RECORD_DTYPE)
+
+
+class ModelEvaluator:
+    """
+    Compare a candidate model with the live one on real traffic.
+
+    `traffic_fraction` of the contents are served by the candidate instead of the live model (A/B); the split is
+    taken from the content hash, so a content always gets the same model and keeps hitting the prediction cache.
+    With shadowing on, the model that did not serve a request predicts it too, in a background task after the
+    response was produced, so it adds nothing to the user's latency. At most `max_pending_shadows` shadow
+    predictions run at once; beyond that they are skipped rather than queued. Every prediction is logged together
+    with its latency and whether the prediction cache answered it, so cache hits do not hide the model's own latency.
+    """
+
+    def __init__(
+        self,
+        prediction_cache: PredictionCache,
+        evaluation_log: EvaluationLog,
+        live_model_name: str,
+        candidate_model_name: str,
+        candidate_model_version: str | None,
+        traffic_fraction: float,
+        is_shadowed: bool,
+        max_pending_shadows: int,
+    ) -> None:
+        self.prediction_cache = prediction_cache
+        self.evaluation_log = evaluation_log
+        self.live_model_name = live_model_name
+        self.candidate_model_name = candidate_model_name
+        self.candidate_model_version = candidate_model_version
+        self.traffic_fraction = traffic_fraction
+        self.is_shadowed = is_shadowed
+        self.max_pending_shadows = max_pending_shadows
+        self._background_tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_enabled(self) -> bool:
+        return bool(self.candidate_model_name)
+
+    def is_routed_to_candidate(self, content_hash: str) -> bool:
+        return int(content_hash[:8], 16) < self.traffic_fraction * 2**32
+
+    def _run_in_background(self, coroutine: typing.Coroutine) -> None:
+        background_task = asyncio.create_task(coroutine)
+        self._background_tasks.add(background_task)
+        background_task.add_done_callback(self._background_tasks.discard)
+
+    async def _predict_and_record(
+        self,
+        storage: BaseStorage,
+        request_id: int,
+        pokemon_image_id: uuid.UUID,
+        content_hash: str,
+        source_key: str,
+        model: tuple[str, str | None],
+        is_served: bool,
+    ) -> PredictionInResponse:
+        started_at = time.perf_counter()
+        prediction, is_cache_hit = await self.prediction_cache.predict_with_cache_status(
+            storage=storage,
+            content_hash=content_hash,
+            source_key=source_key,
+            model_name=model[0],
+            model_version=model[1],
+        )
+        is_flush_due = self.evaluation_log.record(
+            request_id=request_id,
+            pokemon_image_id=pokemon_image_id,
+            prediction=prediction,
+            is_served=is_served,
+            is_cache_hit=is_cache_hit,
+            latency=time.perf_counter() - started_at,
+        )
+        if is_flush_due:
+            self._run_in_background(self.evaluation_log.flush())
+        return prediction
+
+    async def _shadow(self, **kwargs: typing.Any) -> None:
+        try:
+            await self._predict_and_record(**kwargs, is_served=False)
+        except Exception as e:
+            loguru.logger.warning(f"Model Evaluation --- Shadow prediction with `{kwargs['model'][0]}` failed: {e}")
+
+    async def predict(
+        self, storage: BaseStorage, pokemon_image_id: uuid.UUID, content_hash: str, source_key: str
+    ) -> PredictionInResponse:
+        """
+        Return the prediction served for the image: the live model's, or the candidate's for the routed fraction.
+        """
+        live_model = (self.live_model_name, None)
+        if not self.is_enabled:
+            return await self.prediction_cache.predict(
+                storage=storage, content_hash=content_hash, source_key=source_key, model_name=live_model[0]
+            )
+
+        candidate_model = (self.candidate_model_name, self.candidate_model_version)
+        served_model, shadow_model = (
+            (candidate_model, live_model)
+            if self.is_routed_to_candidate(content_hash)
+            else (live_model, candidate_model)
+        )
+        request = dict(
+            storage=storage,
+            request_id=random.getrandbits(63),
+            pokemon_image_id=pokemon_image_id,
+            content_hash=content_hash,
+            source_key=source_key,
+        )
+
+        try:
+            prediction = await self._predict_and_record(**request, model=served_model, is_served=True)  # type: ignore
+
+        except (ModelDoesNotExist, InvalidModelArtifact) as e:
+            if served_model is live_model:
+                raise
+            # A broken candidate must not take the route down, its share of traffic falls back to the live model
+            loguru.logger.warning(
+                f"Model Evaluation --- Candidate `{self.candidate_model_name}` failed: {e.error_msg}"
+            )
+            return await self.prediction_cache.predict(
+                storage=storage, content_hash=content_hash, source_key=source_key, model_name=live_model[0]
+            )
+
+        if self.is_shadowed and len(self._background_tasks) < self.max_pending_shadows:
+            self._run_in_background(self._shadow(**request, model=shadow_model))
+        return prediction
+
+    async def close(self) -> None:
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.evaluation_log.flush()
+
+
+class ModelEvaluationSummary:
+    __slots__ = (
+        "model_name",
+        "model_version",
+        "served",
+        "shadowed",
+        "labelled",
+        "correct",
+        "agreed",
+        "compared",
+        "cache_hits",
+        "served_latency_p50",
+        "served_latency_p99",
+        "shadow_latency_p99",
+    )
+
+    def __init__(self, model_name: str, model_version: str) -> None:
+        self.model_name = model_name
+        self.model_version = model_version
+        self.served = self.shadowed = self.labelled = self.correct = self.agreed = self.compared = self.cache_hits = 0
+        self.served_latency_p50 = self.served_latency_p99 = self.shadow_latency_p99 = float("nan")
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.labelled if self.labelled else float("nan")
+
+    @property
+    def agreement(self) -> float:
+        return self.agreed / self.compared if self.compared else float("nan")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.model_name}:{self.model_version} --- served {self.served}, shadowed {self.shadowed},"
+            f" accuracy {self.accuracy:.2%} of {self.labelled}, agreement {self.agreement:.2%} of {self.compared},"
+            f" cache hits {self.cache_hits},"
+            f" served latency p50 {self.served_latency_p50 * 1000:.1f} ms"
+            f" / p99 {self.served_latency_p99 * 1000:.1f} ms,"
+            f" shadow latency p99 {self.shadow_latency_p99 * 1000:.1f} ms"
+        )
+
+
+def summarize_evaluation(records: numpy.ndarray, image_names: dict[uuid.UUID, str]) -> list[ModelEvaluationSummary]:
+    """
+    Aggregate evaluation records per model version: accuracy against the names players gave their images,
+    agreement with the other model on the same requests, and latency percentiles of the served and shadow
+    predictions that missed the prediction cache.
+    """
+    labels = numpy.char.lower(numpy.char.decode(records["label"]))
+    names = numpy.array(
+        [image_names.get(uuid.UUID(bytes=bytes(image_id)), "").lower() for image_id in records["pokemon_image_id"]],
+        dtype=labels.dtype if len(records) else str,
+    )
+    models = numpy.char.add(numpy.char.add(records["model_name"], b":"), records["model_version"])
+
+    summaries: list[ModelEvaluationSummary] = list()
+    for model in numpy.unique(models):
+        is_model = models == model
+        model_name, model_version = model.decode().rsplit(":", 1)
+        summary = ModelEvaluationSummary(model_name=model_name, model_version=model_version)
+        is_served = records["is_served"] & is_model
+        is_shadow = ~records["is_served"] & is_model
+        summary.served, summary.shadowed = int(is_served.sum()), int(is_shadow.sum())
+
+        is_labelled = is_model & (names != "")
+        summary.labelled = int(is_labelled.sum())
+        summary.correct = int((labels[is_labelled] == names[is_labelled]).sum())
+
+        # Requests both models answered, matched through their request id
+        other_labels = dict(zip(records["request_id"][~is_model].tolist(), labels[~is_model].tolist()))
+        for request_id, label in zip(records["request_id"][is_model].tolist(), labels[is_model].tolist()):
+            if request_id in other_labels:
+                summary.compared += 1
+                summary.agreed += other_labels[request_id] == label
+
+        summary.cache_hits = int((records["is_cache_hit"] & is_model).sum())
+        is_served_miss, is_shadow_miss = is_served & ~records["is_cache_hit"], is_shadow & ~records["is_cache_hit"]
+        if is_served_miss.any():
+            summary.served_latency_p50, summary.served_latency_p99 = (
+                float(latency) for latency in numpy.percentile(records["latency"][is_served_miss], (50, 99))
+            )
+        if is_shadow_miss.any():
+            summary.shadow_latency_p99 = float(numpy.percentile(records["latency"][is_shadow_miss], 99))
+        summaries.append(summary)
+
+    return summaries
+
+
+def get_model_evaluator() -> ModelEvaluator:
+    return ModelEvaluator(
+        prediction_cache=prediction_cache,
+        evaluation_log=EvaluationLog(
+            log_dir=settings.EVALUATION_LOG_DIR, flush_size=settings.EVALUATION_LOG_FLUSH_SIZE
+        ),
+        live_model_name=settings.POKEMON_CLASSIFIER_MODEL_NAME,
+        candidate_model_name=settings.CANDIDATE_MODEL_NAME,
+        candidate_model_version=settings.CANDIDATE_MODEL_VERSION or None,
+        traffic_fraction=settings.CANDIDATE_TRAFFIC_FRACTION,
+        is_shadowed=settings.IS_CANDIDATE_SHADOWED,
+        max_pending_shadows=settings.CANDIDATE_MAX_PENDING_SHADOWS,
+    )
+
+
+model_evaluator: ModelEvaluator = get_model_evaluator()
@@ -0,0 +1,30 @@
+import loguru
+
+from src.config.setup import settings
+from src.ml.registry import model_registry
+from src.utility.design_patterns.factory.storage import get_storage_backend
+from src.utility.exceptions.custom import InvalidModelArtifact
+
+
+async def discover_models() -> int:
+    artifacts = await model_registry.discover(storage=get_storage_backend(backend=settings.STORAGE_BACKEND))
+    return len(artifacts)
+
+
+async def initialize_model_registry() -> None:
+    """
+    Discover the stored models and, if preloading is on, load the latest version of each so the first request does
+    not pay for it. A model that fails to load is only logged; requests for it fail until a valid artifact exists.
+    """
+    loguru.logger.info("Model Registry --- Discovering . . .")
+
+    storage = get_storage_backend(backend=settings.STORAGE_BACKEND)
+    artifacts = await model_registry.discover(storage=storage)
+    if settings.IS_MODEL_REGISTRY_PRELOADED:
+        for name in sorted({artifact.name for artifact in artifacts}):
+            try:
+                await model_registry.load(storage=storage, name=name)
+            except InvalidModelArtifact as e:
+                loguru.logger.error(f"Model Registry --- {e.error_msg}")
+
+    loguru.logger.info(f"Model Registry --- Successfully Discovered {len(artifacts)} model artifacts!")
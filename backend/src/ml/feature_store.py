@@ -0,0 +1,201 @@
+import asyncio
+import fcntl
+import math
+import os
+import pathlib
+import threading
+import typing
+
+import numpy
+
+from src.config.setup import settings
+from src.ml.features import feature_extractor, FeatureExtractor
+from src.storage.base import BaseStorage
+from src.utility.cache.ttl import TTLCache
+from src.utility.concurrency.process_pool import process_pool, ProcessPool
+
+INDEX_RECORD_DTYPE: numpy.dtype = numpy.dtype([("content_hash", "V32"), ("row", "<u8")])
+
+
+class FeatureStore:
+    """
+    Persist extracted feature rows keyed by `(content hash, feature version)`, so an image is decoded and
+    featurized once no matter how often it is shown or scored.
+
+    Each feature version owns a directory with two append-only files: `features.f32`, the raw `float32` rows, and
+    `index.bin`, fixed-size `(sha256 digest, row number)` records. Rows are read through a read-only memory map, so
+    every worker on the host shares the same pages, and copies of the most recently used rows are kept in an
+    in-process LRU; the copies keep no reference to the map, which is dropped when the file outgrows it.
+    Writers from several workers serialize on an exclusive `flock`; a row is written before its index record, so
+    readers never see a record whose row is incomplete, and whatever a crash leaves half-written is cut off by the
+    next writer.
+    """
+
+    def __init__(
+        self, root_dir: pathlib.Path | str, extractor: FeatureExtractor, cache_size: int, process_pool: ProcessPool
+    ) -> None:
+        self.extractor = extractor
+        self.process_pool = process_pool
+        self.version_dir = pathlib.Path(root_dir) / extractor.version
+        self.row_size = extractor.dimension * numpy.dtype(numpy.float32).itemsize
+        self._cache: TTLCache[str, numpy.ndarray] = TTLCache(max_size=cache_size, ttl=math.inf)
+        self._rows: dict[str, int] = dict()
+        self._index_size = 0
+        self._features: numpy.ndarray | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def features_path(self) -> pathlib.Path:
+        return self.version_dir / "features.f32"
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        return self.version_dir / "index.bin"
+
+    def __len__(self) -> int:
+        self._refresh_index()
+        return len(self._rows)
+
+    def _refresh_index(self) -> None:
+        """
+        Read the index records appended since the last refresh, by this or any other process.
+        """
+        try:
+            index_size = os.stat(self.index_path).st_size
+        except FileNotFoundError:
+            return
+        index_size -= index_size % INDEX_RECORD_DTYPE.itemsize
+        if index_size <= self._index_size:
+            return
+
+        with open(self.index_path, "rb") as index_file:
+            index_file.seek(self._index_size)
+            records = numpy.frombuffer(index_file.read(index_size - self._index_size), dtype=INDEX_RECORD_DTYPE)
+        self._rows.update(
+            zip((bytes(content_hash).hex() for content_hash in records["content_hash"]), records["row"].tolist())
+        )
+        self._index_size = index_size
+
+    def _map_row(self, row: int) -> numpy.ndarray:
+        if self._features is None or row >= len(self._features):
+            row_count = os.stat(self.features_path).st_size // self.row_size
+            self._features = numpy.memmap(
+                self.features_path, dtype=numpy.float32, mode="r", shape=(row_count, self.extractor.dimension)
+            )
+        return self._features[row]
+
+    def get(self, content_hash: str) -> numpy.ndarray | None:
+        """
+        Return the read-only feature row of `content_hash`, or `None` if it was never stored.
+        """
+        features = self._cache.get(content_hash)
+        if features is not None:
+            return features
+
+        with self._lock:
+            row = self._rows.get(content_hash)
+            if row is None:
+                self._refresh_index()
+                row = self._rows.get(content_hash)
+                if row is None:
+                    return None
+            features = self._map_row(row=row).copy()
+        features.flags.writeable = False
+
+        self._cache.set(content_hash, features)
+        return features
+
+    def put_many(self, features_by_content_hash: dict[str, numpy.ndarray]) -> None:
+        """
+        Append the rows that are not stored yet; rows another worker stored in the meantime are skipped.
+        """
+        self.version_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.version_dir / "lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._refresh_index()
+            new_features = {
+                content_hash: features
+                for content_hash, features in features_by_content_hash.items()
+                if content_hash not in self._rows
+            }
+            if not new_features:
+                return
+
+            with open(self.features_path, "ab") as features_file:
+                features_size = features_file.tell()
+                if features_size % self.row_size:
+                    features_file.truncate(features_size - features_size % self.row_size)
+                first_row = features_size // self.row_size
+                features_file.write(numpy.stack(list(new_features.values())).astype(numpy.float32, order="C").data)
+
+            records = numpy.empty(len(new_features), dtype=INDEX_RECORD_DTYPE)
+            records["content_hash"] = [bytes.fromhex(content_hash) for content_hash in new_features]
+            records["row"] = numpy.arange(first_row, first_row + len(new_features))
+            with open(self.index_path, "ab") as index_file:
+                index_size = index_file.tell()
+                if index_size % INDEX_RECORD_DTYPE.itemsize:
+                    index_file.truncate(index_size - index_size % INDEX_RECORD_DTYPE.itemsize)
+                index_file.write(records.data)
+
+            self._refresh_index()
+
+    def get_many(self, content_hashes: typing.Sequence[str]) -> list[numpy.ndarray | None]:
+        """
+        `get()` for several contents; a miss stats and reads the index and may remap the features, so async callers
+        run this in a thread.
+        """
+        return [self.get(content_hash=content_hash) for content_hash in content_hashes]
+
+    async def load(self, storage: BaseStorage, images: typing.Sequence[tuple[str, str]]) -> numpy.ndarray:
+        """
+        Return the `(n, dimension)` feature rows of `(content hash, storage key)` pairs. Rows cached in this process
+        are copied right away and the others are looked up in the files in a thread; only the misses are read from
+        storage and featurized in the process pool, then stored.
+        """
+        features = numpy.empty((len(images), self.extractor.dimension), dtype=numpy.float32)
+        uncached_rows: dict[str, list[int]] = dict()
+        storage_keys: dict[str, str] = dict()
+        for row, (content_hash, storage_key) in enumerate(images):
+            cached_features = self._cache.get(content_hash)
+            if cached_features is None:
+                uncached_rows.setdefault(content_hash, list()).append(row)
+                storage_keys[content_hash] = storage_key
+            else:
+                features[row] = cached_features
+
+        missing_rows: dict[str, list[int]] = dict()
+        if uncached_rows:
+            stored_rows = await asyncio.to_thread(self.get_many, list(uncached_rows))
+            for (content_hash, rows), stored_features in zip(uncached_rows.items(), stored_rows):
+                if stored_features is None:
+                    missing_rows[content_hash] = rows
+                else:
+                    features[rows] = stored_features
+
+        if missing_rows:
+            image_bytes = await asyncio.gather(
+                *(storage.read(key=storage_keys[content_hash]) for content_hash in missing_rows)
+            )
+            extracted_features = await self.process_pool.run(self.extractor.extract_from_bytes, image_bytes)
+            for content_hash, extracted_row in zip(missing_rows, extracted_features):
+                features[missing_rows[content_hash]] = extracted_row
+            await asyncio.to_thread(self.put_many, dict(zip(missing_rows, extracted_features)))
+
+        return features
+
+    def close(self) -> None:
+        with self._lock:
+            self._features = None
+            self._cache.clear()
+
+
+def get_feature_store() -> FeatureStore:
+    return FeatureStore(
+        root_dir=settings.FEATURE_STORE_DIR,
+        extractor=feature_extractor,
+        cache_size=settings.FEATURE_STORE_CACHE_SIZE,
+        process_pool=process_pool,
+    )
+
+
+feature_store: FeatureStore = get_feature_store()
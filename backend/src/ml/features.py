@@ -0,0 +1,142 @@
+import io
+import typing
+
+import numpy
+from PIL import Image, ImageOps
+
+from src.config.setup import settings
+
+GRAYSCALE_WEIGHTS: numpy.ndarray = numpy.array([0.299, 0.587, 0.114], dtype=numpy.float32)
+
+
+class FeatureExtractor:
+    """
+    Turn images into fixed-length `float32` feature rows: the downscaled pixels scaled to `[0, 1]`, a per-channel
+    colour histogram and a HOG-style histogram of gradient orientations per cell.
+
+    Decoding is the only per-image step; it writes every image into one preallocated `uint8` batch. Everything
+    after that works on the whole batch at once, and the features are written into a single C-contiguous output
+    array that can be handed to `predict_proba` as is. Instances hold plain parameters only, so bound methods can
+    be sent to the process pool.
+    """
+
+    def __init__(self, image_size: int, color_bins: int, orientation_bins: int, cell_size: int) -> None:
+        if color_bins & (color_bins - 1) or not 1 <= color_bins <= 256:
+            raise ValueError(f"Colour bins must be a power of two up to 256, got {color_bins}!")
+        if image_size % cell_size:
+            raise ValueError(f"Image size {image_size} is not a multiple of the cell size {cell_size}!")
+
+        self.image_size = image_size
+        self.color_bins = color_bins
+        self.orientation_bins = orientation_bins
+        self.cell_size = cell_size
+
+    @property
+    def version(self) -> str:
+        """
+        Identify the feature layout; a model is only valid for the features of the version it was trained on.
+        """
+        return f"v1-s{self.image_size}-c{self.color_bins}-o{self.orientation_bins}x{self.cell_size}"
+
+    @property
+    def pixel_dimension(self) -> int:
+        return self.image_size * self.image_size * 3
+
+    @property
+    def color_dimension(self) -> int:
+        return 3 * self.color_bins
+
+    @property
+    def orientation_dimension(self) -> int:
+        return (self.image_size // self.cell_size) ** 2 * self.orientation_bins
+
+    @property
+    def dimension(self) -> int:
+        return self.pixel_dimension + self.color_dimension + self.orientation_dimension
+
+    def decode(self, image_bytes: bytes, out: numpy.ndarray) -> None:
+        """
+        Decode one image into `out`, an `(image_size, image_size, 3)` `uint8` view: centre-cropped to a square,
+        downscaled and flattened onto white where it is transparent.
+        """
+        size = (self.image_size, self.image_size)
+        with Image.open(io.BytesIO(image_bytes)) as source_image:
+            source_image.draft("RGB", (self.image_size * 2, self.image_size * 2))
+            image = ImageOps.fit(ImageOps.exif_transpose(source_image), size, method=Image.Resampling.BILINEAR)
+
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            image = Image.alpha_composite(Image.new("RGBA", size, "white"), image.convert("RGBA"))
+        out[...] = numpy.asarray(image.convert("RGB"))
+
+    def decode_batch(self, images: typing.Sequence[bytes]) -> numpy.ndarray:
+        pixels = numpy.empty((len(images), self.image_size, self.image_size, 3), dtype=numpy.uint8)
+        for image_index, image_bytes in enumerate(images):
+            self.decode(image_bytes=image_bytes, out=pixels[image_index])
+        return pixels
+
+    def _extract_color_histograms(self, pixels: numpy.ndarray, out: numpy.ndarray) -> None:
+        image_count, pixel_count = len(pixels), self.image_size * self.image_size
+        # Every (image, channel, bin) triple gets its own slot, so one `bincount` fills all histograms of the batch
+        channel_offsets = (numpy.arange(image_count * 3).reshape(image_count, 1, 3)) * self.color_bins
+        bins = pixels.reshape(image_count, pixel_count, 3) >> (8 - (self.color_bins.bit_length() - 1))
+        counts = numpy.bincount((channel_offsets + bins).ravel(), minlength=image_count * self.color_dimension)
+        numpy.multiply(counts.reshape(image_count, -1), 1 / pixel_count, out=out, casting="unsafe")
+
+    def _extract_orientation_histograms(self, pixels: numpy.ndarray, out: numpy.ndarray) -> None:
+        image_count, cells_per_side = len(pixels), self.image_size // self.cell_size
+        gray = pixels @ GRAYSCALE_WEIGHTS
+
+        gradient_x = numpy.zeros_like(gray)
+        gradient_y = numpy.zeros_like(gray)
+        numpy.subtract(gray[:, :, 2:], gray[:, :, :-2], out=gradient_x[:, :, 1:-1])
+        numpy.subtract(gray[:, 2:, :], gray[:, :-2, :], out=gradient_y[:, 1:-1, :])
+        magnitude = numpy.hypot(gradient_x, gradient_y)
+        # Unsigned orientations: a dark-to-light edge and a light-to-dark edge fall into the same bin
+        orientation = numpy.arctan2(gradient_y, gradient_x) % numpy.pi
+        orientation_bins = numpy.minimum(
+            (orientation * (self.orientation_bins / numpy.pi)).astype(numpy.intp), self.orientation_bins - 1
+        )
+
+        cell_indices = numpy.arange(self.image_size) // self.cell_size
+        cells = cell_indices[:, None] * cells_per_side + cell_indices[None, :]
+        image_offsets = numpy.arange(image_count).reshape(image_count, 1, 1) * cells_per_side**2
+        slots = (image_offsets + cells) * self.orientation_bins + orientation_bins
+        histograms = numpy.bincount(
+            slots.ravel(), weights=magnitude.ravel(), minlength=image_count * self.orientation_dimension
+        ).reshape(image_count, -1)
+
+        norms = numpy.linalg.norm(histograms, axis=1, keepdims=True)
+        numpy.divide(histograms, numpy.maximum(norms, 1e-6), out=out, casting="unsafe")
+
+    def extract(self, pixels: numpy.ndarray, out: numpy.ndarray | None = None) -> numpy.ndarray:
+        """
+        Compute the `(n, dimension)` feature rows of an `(n, image_size, image_size, 3)` `uint8` batch, writing
+        them into `out` when given so a caller processing many batches can reuse one buffer.
+        """
+        image_count = len(pixels)
+        if out is None:
+            out = numpy.empty((image_count, self.dimension), dtype=numpy.float32)
+
+        color_offset = self.pixel_dimension
+        orientation_offset = color_offset + self.color_dimension
+        numpy.multiply(
+            pixels.reshape(image_count, -1), numpy.float32(1 / 255), out=out[:, :color_offset], casting="unsafe"
+        )
+        self._extract_color_histograms(pixels=pixels, out=out[:, color_offset:orientation_offset])
+        self._extract_orientation_histograms(pixels=pixels, out=out[:, orientation_offset:])
+        return out
+
+    def extract_from_bytes(self, images: typing.Sequence[bytes]) -> numpy.ndarray:
+        return self.extract(pixels=self.decode_batch(images=images))
+
+
+def get_feature_extractor() -> FeatureExtractor:
+    return FeatureExtractor(
+        image_size=settings.FEATURE_IMAGE_SIZE,
+        color_bins=settings.FEATURE_COLOR_BINS,
+        orientation_bins=settings.FEATURE_ORIENTATION_BINS,
+        cell_size=settings.FEATURE_CELL_SIZE,
+    )
+
+
+feature_extractor: FeatureExtractor = get_feature_extractor()
@@ -0,0 +1,87 @@
+import asyncio
+import concurrent.futures
+
+import numpy
+
+from src.config.setup import settings
+from src.ml.batching import MicroBatcher
+from src.ml.registry import model_registry, ModelHandle
+
+
+class InferenceEngine:
+    """
+    Serve `predict_proba` for loaded models through one micro-batcher per model version.
+
+    Batches run on a small thread pool rather than the process pool: the loaded model lives in this process, and
+    the vectorized NumPy/BLAS work inside `predict_proba` releases the GIL, so threads scale without pickling the
+    model or the features.
+
+    A batcher holds its model and a collecting task, so when the registry promotes a new version the batchers of
+    the older ones are retired: requests already queued on them are answered, then they are closed.
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float, max_workers: int) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_workers = max_workers
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._batchers: dict[tuple[str, str], MicroBatcher] = dict()
+        self._retiring_tasks: set[asyncio.Task] = set()
+
+    async def _retire(self, batcher: MicroBatcher) -> None:
+        await batcher.drain()
+        await batcher.close()
+
+    def retire_model(self, model_name: str, model_version: str) -> None:
+        """
+        Drop the batchers of every version of `model_name` other than `model_version` and close them in the
+        background once their queued predictions are answered.
+        """
+        for key in [key for key in self._batchers if key[0] == model_name and key[1] != model_version]:
+            retiring_task = asyncio.create_task(self._retire(batcher=self._batchers.pop(key)))
+            self._retiring_tasks.add(retiring_task)
+            retiring_task.add_done_callback(self._retiring_tasks.discard)
+
+    def _get_batcher(self, handle: ModelHandle) -> MicroBatcher:
+        batcher = self._batchers.get((handle.name, handle.version))
+        if batcher is None:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="inference"
+                )
+            batcher = self._batchers[(handle.name, handle.version)] = MicroBatcher(
+                name=handle.name,
+                predict_batch=handle.model.predict_proba,
+                max_batch_size=self.max_batch_size,
+                max_wait_ms=self.max_wait_ms,
+                max_concurrent_batches=self.max_workers,
+                executor=self._executor,
+            )
+        return batcher
+
+    async def predict_proba(self, handle: ModelHandle, features: numpy.ndarray) -> numpy.ndarray:
+        """
+        Return the class probabilities of one feature row, in the order of `handle.model.classes_`.
+        """
+        return await self._get_batcher(handle=handle).predict(features=features)
+
+    async def close(self) -> None:
+        await asyncio.gather(*self._retiring_tasks, return_exceptions=True)
+        for batcher in self._batchers.values():
+            await batcher.close()
+        self._batchers.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def get_inference_engine() -> InferenceEngine:
+    return InferenceEngine(
+        max_batch_size=settings.INFERENCE_MAX_BATCH_SIZE,
+        max_wait_ms=settings.INFERENCE_MAX_WAIT_MS,
+        max_workers=settings.INFERENCE_WORKERS,
+    )
+
+
+inference_engine: InferenceEngine = get_inference_engine()
+model_registry.add_promotion_listener(listener=inference_engine.retire_model)
@@ -0,0 +1,38 @@
+import pathlib
+import typing
+
+import joblib
+
+from src.utility.enums.model import ModelFrameworks
+from src.utility.exceptions.custom import InvalidModelArtifact
+
+
+def load_sklearn_model(path: pathlib.Path) -> typing.Any:
+    # Uncompressed numpy arrays inside the pickle are memory-mapped read-only instead of copied onto the heap, so
+    # every worker that loads the same cached file shares its pages through the page cache
+    return joblib.load(path, mmap_mode="r")
+
+
+def load_tf_model(path: pathlib.Path) -> typing.Any:
+    try:
+        import tensorflow
+    except ImportError as e:
+        raise InvalidModelArtifact("TensorFlow is not installed, TF models cannot be loaded!") from e
+
+    return tensorflow.keras.models.load_model(path, compile=False)
+
+
+def load_pt_model(path: pathlib.Path) -> typing.Any:
+    try:
+        import torch
+    except ImportError as e:
+        raise InvalidModelArtifact("PyTorch is not installed, PT models cannot be loaded!") from e
+
+    return torch.jit.load(str(path), map_location="cpu").eval()
+
+
+MODEL_LOADERS: dict[ModelFrameworks, typing.Callable[[pathlib.Path], typing.Any]] = {
+    ModelFrameworks.SKLEARN: load_sklearn_model,
+    ModelFrameworks.TF: load_tf_model,
+    ModelFrameworks.PT: load_pt_model,
+}
@@ -0,0 +1,143 @@
+import typing
+
+import numpy
+
+from src.config.setup import settings
+from src.ml.feature_store import feature_store, FeatureStore
+from src.ml.inference import inference_engine, InferenceEngine
+from src.ml.registry import model_registry, ModelHandle, ModelRegistry
+from src.models.schema.prediction import PredictionInResponse
+from src.repository.crud.prediction import PredictionCRUDRepository
+from src.repository.database import db
+from src.storage.base import BaseStorage
+from src.utility.cache.ttl import TTLCache
+from src.utility.concurrency.single_flight import SingleFlight
+from src.utility.exceptions.custom import EntityDoesNotExist
+
+
+class PredictionCache:
+    """
+    Predictions keyed by `(content hash, model name, model version)`: bounded, expiring, and written through to the
+    `prediction` table, so a restarted worker refills from the database instead of running the model again.
+
+    A model version is immutable, so entries never go stale by themselves; when the registry promotes a new
+    version the older versions' entries are dropped at once instead of occupying the cache until they expire.
+    Concurrent misses for the same key share one lookup and at most one inference.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        registry: ModelRegistry,
+        feature_store: FeatureStore,
+        inference_engine: InferenceEngine,
+        prediction_crud_factory: typing.Callable[[], PredictionCRUDRepository],
+    ) -> None:
+        self.registry = registry
+        self.feature_store = feature_store
+        self.inference_engine = inference_engine
+        self.prediction_crud_factory = prediction_crud_factory
+        self._cache: TTLCache[tuple[str, str, str], PredictionInResponse] = TTLCache(max_size=max_size, ttl=ttl)
+        self._single_flight = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def invalidate_model(self, model_name: str, model_version: str) -> None:
+        """
+        Drop the cached predictions of every version of `model_name` other than `model_version`.
+        """
+        self._cache.invalidate_where(predicate=lambda key: key[1] == model_name and key[2] != model_version)
+
+    async def _predict(
+        self, storage: BaseStorage, handle: ModelHandle, content_hash: str, source_key: str
+    ) -> PredictionInResponse:
+        # Shared by every waiting request, so it must not borrow a session that belongs to one of them
+        prediction_crud = self.prediction_crud_factory()
+        try:
+            try:
+                prediction = await prediction_crud.read_prediction(
+                    content_hash=content_hash, model_name=handle.name, model_version=handle.version
+                )
+
+            except EntityDoesNotExist:
+                features = await self.feature_store.load(storage=storage, images=[(content_hash, source_key)])
+                probabilities = await self.inference_engine.predict_proba(handle=handle, features=features[0])
+                best_class = int(numpy.argmax(probabilities))
+                prediction = await prediction_crud.create_prediction(
+                    content_hash=content_hash,
+                    model_name=handle.name,
+                    model_version=handle.version,
+                    label=str(handle.model.classes_[best_class]),
+                    confidence=float(probabilities[best_class]),
+                )
+
+            prediction_in_response = PredictionInResponse.from_orm(prediction)
+        finally:
+            await prediction_crud.async_session.close()
+
+        self._cache.set((content_hash, handle.name, handle.version), prediction_in_response)
+        return prediction_in_response
+
+    async def predict(
+        self,
+        storage: BaseStorage,
+        content_hash: str,
+        source_key: str,
+        model_name: str,
+        model_version: str | None = None,
+    ) -> PredictionInResponse:
+        """
+        Return the prediction of `model_name` at `model_version`, or at its latest version, for the content stored
+        at `source_key`.
+        """
+        prediction, _ = await self.predict_with_cache_status(
+            storage=storage,
+            content_hash=content_hash,
+            source_key=source_key,
+            model_name=model_name,
+            model_version=model_version,
+        )
+        return prediction
+
+    async def predict_with_cache_status(
+        self,
+        storage: BaseStorage,
+        content_hash: str,
+        source_key: str,
+        model_name: str,
+        model_version: str | None = None,
+    ) -> tuple[PredictionInResponse, bool]:
+        """
+        Like `predict`, but also return whether the in-process cache answered without a lookup or an inference.
+        """
+        handle = await self.registry.load(storage=storage, name=model_name, version=model_version)
+        key = (content_hash, handle.name, handle.version)
+
+        prediction = self._cache.get(key)
+        if prediction is not None:
+            return prediction, True
+
+        prediction = await self._single_flight.do(
+            key=key,
+            func=lambda: self._predict(
+                storage=storage, handle=handle, content_hash=content_hash, source_key=source_key
+            ),
+        )
+        return prediction, False
+
+
+def get_prediction_cache() -> PredictionCache:
+    return PredictionCache(
+        max_size=settings.PREDICTION_CACHE_MAX_SIZE,
+        ttl=settings.PREDICTION_CACHE_TTL_SEC,
+        registry=model_registry,
+        feature_store=feature_store,
+        inference_engine=inference_engine,
+        prediction_crud_factory=lambda: PredictionCRUDRepository(async_session=db.async_session),
+    )
+
+
+prediction_cache: PredictionCache = get_prediction_cache()
+prediction_cache.registry.add_promotion_listener(listener=prediction_cache.invalidate_model)
@@ -0,0 +1,266 @@
+import asyncio
+import datetime
+import hashlib
+import os
+import pathlib
+import re
+import typing
+import uuid
+
+import loguru
+
+from src.config.setup import settings
+from src.ml.loaders import MODEL_LOADERS
+from src.storage.base import BaseStorage
+from src.utility.concurrency.single_flight import SingleFlight
+from src.utility.enums.model import ModelFrameworks
+from src.utility.exceptions.custom import InvalidModelArtifact, ModelDoesNotExist, StorageObjectDoesNotExist
+
+CHECKSUM_SUFFIX: str = ".sha256"
+
+
+class ModelArtifact:
+    """
+    A model file discovered in storage at `{model_dir}/{name}/{version}/{file}`, next to its `{file}.sha256`.
+    """
+
+    __slots__ = ("framework", "name", "version", "storage_key")
+
+    def __init__(self, framework: ModelFrameworks, name: str, version: str, storage_key: str) -> None:
+        self.framework = framework
+        self.name = name
+        self.version = version
+        self.storage_key = storage_key
+
+    @property
+    def checksum_key(self) -> str:
+        return f"{self.storage_key}{CHECKSUM_SUFFIX}"
+
+
+class ModelHandle:
+    """
+    A loaded model pinned to one version. Handles are created once per worker and shared by every request, so
+    callers must treat `model` as read-only.
+    """
+
+    __slots__ = ("framework", "name", "version", "sha256", "model", "loaded_at")
+
+    def __init__(self, framework: ModelFrameworks, name: str, version: str, sha256: str, model: typing.Any) -> None:
+        self.framework = framework
+        self.name = name
+        self.version = version
+        self.sha256 = sha256
+        self.model = model
+        self.loaded_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+
+def parse_model_artifact_key(
+    key: str, framework: ModelFrameworks, model_dir: str, extensions: tuple[str, ...]
+) -> ModelArtifact | None:
+    name, _, remainder = key.removeprefix(f"{model_dir}/").partition("/")
+    version, _, file_name = remainder.partition("/")
+    if not name or not version or not file_name or "/" in file_name or not file_name.endswith(extensions):
+        return None
+    return ModelArtifact(framework=framework, name=name, version=version, storage_key=key)
+
+
+def get_version_sort_key(version: str) -> tuple:
+    # Numeric runs compare as numbers, so `v10` sorts after `v9` and `2024.1.10` after `2024.1.9`
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.split(r"(\d+)", version) if part
+    )
+
+
+def _write_chunk(model_file: typing.BinaryIO, sha256: "hashlib._Hash", chunk: bytes) -> None:
+    sha256.update(chunk)
+    model_file.write(chunk)
+
+
+class ModelRegistry:
+    """
+    Discover model artifacts in storage and load each of them at most once per worker process.
+
+    Artifacts are downloaded into `cache_dir` under their SHA-256, verified against their checksum file before
+    they are renamed into place, and loaded from there. Every worker on a host therefore reads the same file, and
+    the memory-mapped arrays of scikit-learn models share their pages instead of being copied per worker.
+    Concurrent requests for a model that is still loading wait for the same load.
+    """
+
+    def __init__(
+        self,
+        model_dirs: dict[ModelFrameworks, str],
+        model_extensions: dict[ModelFrameworks, tuple[str, ...]],
+        cache_dir: pathlib.Path | str,
+    ) -> None:
+        self.model_dirs = model_dirs
+        self.model_extensions = model_extensions
+        self.cache_dir = pathlib.Path(cache_dir)
+        self._artifacts: dict[str, dict[str, ModelArtifact]] = dict()
+        self._handles: dict[tuple[str, str], ModelHandle] = dict()
+        self._single_flight = SingleFlight()
+        self._promotion_listeners: list[typing.Callable[[str, str], None]] = list()
+
+    @property
+    def handles(self) -> list[ModelHandle]:
+        return list(self._handles.values())
+
+    def add_promotion_listener(self, listener: typing.Callable[[str, str], None]) -> None:
+        """
+        Call `listener(name, version)` whenever a rediscovery finds that the latest version of a known model changed.
+        """
+        self._promotion_listeners.append(listener)
+
+    async def discover(self, storage: BaseStorage) -> list[ModelArtifact]:
+        """
+        (Re)list the model directories. Calls without a version resolve to the latest version found here, so
+        publishing a new version folder and running a discovery promotes it.
+        """
+        latest_versions = {name: self.get_versions(name=name)[-1] for name in self._artifacts}
+        discovered_artifacts: dict[str, dict[str, ModelArtifact]] = dict()
+
+        for framework, model_dir in self.model_dirs.items():
+            extensions = self.model_extensions.get(framework, ())
+            if not model_dir or not extensions:
+                continue
+            async for stored_object in storage.list_objects(prefix=f"{model_dir}/"):
+                artifact = parse_model_artifact_key(
+                    key=stored_object.key, framework=framework, model_dir=model_dir, extensions=extensions
+                )
+                if artifact is None:
+                    continue
+                if artifact.version in discovered_artifacts.setdefault(artifact.name, dict()):
+                    loguru.logger.warning(f"Model Registry --- `{artifact.name}:{artifact.version}` is ambiguous")
+                discovered_artifacts[artifact.name][artifact.version] = artifact
+
+        self._artifacts = discovered_artifacts
+        for name, latest_version in latest_versions.items():
+            versions = self.get_versions(name=name)
+            if versions and versions[-1] != latest_version:
+                loguru.logger.info(f"Model Registry --- Promoted `{name}:{versions[-1]}` over `{latest_version}`")
+                # Superseded handles would otherwise stay in memory for the life of the worker; a caller that still
+                # pins an older version loads it again on demand
+                self._handles = {
+                    key: handle
+                    for key, handle in self._handles.items()
+                    if handle.name != name or handle.version == versions[-1]
+                }
+                for listener in self._promotion_listeners:
+                    listener(name, versions[-1])
+        return [artifact for versions in discovered_artifacts.values() for artifact in versions.values()]
+
+    def get_versions(self, name: str) -> list[str]:
+        """
+        Return the discovered versions of `name`, oldest first.
+        """
+        return sorted(self._artifacts.get(name, dict()), key=get_version_sort_key)
+
+    def get_artifact(self, name: str, version: str | None = None) -> ModelArtifact:
+        """
+        Return the discovered artifact of `name` at `version`, or at its latest version.
+        """
+        return self._resolve(name=name, version=version)
+
+    def _resolve(self, name: str, version: str | None) -> ModelArtifact:
+        versions = self.get_versions(name=name)
+        if version is None and versions:
+            version = versions[-1]
+        if version not in versions:
+            raise ModelDoesNotExist(f"Model `{name}:{version or 'latest'}` does not exist!")
+        return self._artifacts[name][version]  # type: ignore
+
+    async def load(self, storage: BaseStorage, name: str, version: str | None = None) -> ModelHandle:
+        """
+        Return the handle of `name` at `version`, or at its latest version, loading the model on first use.
+        """
+        artifact = self._resolve(name=name, version=version)
+        handle = self._handles.get((artifact.name, artifact.version))
+        if handle is not None:
+            return handle
+
+        return await self._single_flight.do(
+            key=(artifact.name, artifact.version), func=lambda: self._load(storage=storage, artifact=artifact)
+        )
+
+    async def _read_checksum(self, storage: BaseStorage, artifact: ModelArtifact) -> str:
+        try:
+            checksum = (await storage.read(key=artifact.checksum_key)).decode(errors="replace")
+        except StorageObjectDoesNotExist as e:
+            raise InvalidModelArtifact(f"Model artifact `{artifact.storage_key}` has no checksum file!") from e
+
+        # Accepts a bare digest as well as the `<digest>  <file name>` lines of `sha256sum`
+        expected_sha256 = checksum.split(maxsplit=1)[0].lower() if checksum.strip() else ""
+        if not re.fullmatch(r"[0-9a-f]{64}", expected_sha256):
+            raise InvalidModelArtifact(f"Checksum file of model artifact `{artifact.storage_key}` is malformed!")
+        return expected_sha256
+
+    async def _fetch(self, storage: BaseStorage, artifact: ModelArtifact, expected_sha256: str) -> pathlib.Path:
+        path = self.cache_dir / f"{expected_sha256}{pathlib.PurePosixPath(artifact.storage_key).suffix}"
+        # Only verified files are ever renamed into the cache, so a present file needs no second check
+        if await asyncio.to_thread(path.exists):
+            return path
+
+        await asyncio.to_thread(self.cache_dir.mkdir, parents=True, exist_ok=True)
+        # Chunks are hashed and written as they arrive, so a download never holds more than one chunk in memory
+        sha256 = hashlib.sha256()
+        temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        try:
+            model_file = await asyncio.to_thread(open, temporary_path, "wb")
+            try:
+                async for chunk in storage.get(key=artifact.storage_key):
+                    await asyncio.to_thread(_write_chunk, model_file, sha256, chunk)
+            finally:
+                await asyncio.to_thread(model_file.close)
+            if sha256.hexdigest() != expected_sha256:
+                raise InvalidModelArtifact(
+                    f"Model artifact `{artifact.storage_key}` does not match its SHA-256 checksum!"
+                )
+            await asyncio.to_thread(os.replace, temporary_path, path)
+        finally:
+            await asyncio.to_thread(temporary_path.unlink, missing_ok=True)
+        return path
+
+    async def _load(self, storage: BaseStorage, artifact: ModelArtifact) -> ModelHandle:
+        expected_sha256 = await self._read_checksum(storage=storage, artifact=artifact)
+        path = await self._fetch(storage=storage, artifact=artifact, expected_sha256=expected_sha256)
+        try:
+            model = await asyncio.to_thread(MODEL_LOADERS[artifact.framework], path)
+        except InvalidModelArtifact:
+            raise
+        except Exception as e:
+            raise InvalidModelArtifact(f"Model artifact `{artifact.storage_key}` could not be loaded!") from e
+
+        handle = ModelHandle(
+            framework=artifact.framework,
+            name=artifact.name,
+            version=artifact.version,
+            sha256=expected_sha256,
+            model=model,
+        )
+        self._handles[(artifact.name, artifact.version)] = handle
+        loguru.logger.info(
+            f"Model Registry --- Loaded `{artifact.name}:{artifact.version}` ({artifact.framework.value})"
+        )
+        return handle
+
+
+def get_model_registry() -> ModelRegistry:
+    return ModelRegistry(
+        model_dirs={
+            ModelFrameworks.SKLEARN: settings.AWS_S3_SKLEARN_MODEL_DIR,
+            ModelFrameworks.TF: settings.AWS_S3_TF_MODEL_DIR,
+            ModelFrameworks.PT: settings.AWS_S3_PT_MODEL_DIR,
+        },
+        model_extensions={
+            ModelFrameworks.SKLEARN: tuple(filter(None, (settings.SKLEARN_MODEL_FILE_EXTENSION_1,))),
+            ModelFrameworks.TF: tuple(
+                filter(None, (settings.TF_MODEL_FILE_EXTENSION_1, settings.TF_MODEL_FILE_EXTENSION_2))
+            ),
+            ModelFrameworks.PT: tuple(
+                filter(None, (settings.PT_MODEL_FILE_EXTENSION_1, settings.PT_MODEL_FILE_EXTENSION_2))
+            ),
+        },
+        cache_dir=settings.MODEL_CACHE_DIR,
+    )
+
+
+model_registry: ModelRegistry = get_model_registry()
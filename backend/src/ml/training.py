@@ -0,0 +1,76 @@
+import copy
+import io
+import re
+import typing
+
+import joblib
+import numpy
+
+from src.ml.registry import ModelHandle
+from src.utility.enums.model import ModelFrameworks
+from src.utility.exceptions.custom import ModelNotTrainable
+
+ONLINE_VERSION_PATTERN: re.Pattern = re.compile(r"(?P<base_version>.+)\+online\.(?P<update>\d+)")
+
+
+def is_held_out(content_hash: str, holdout_fraction: float) -> bool:
+    # Decided by the end of the hash, independently of the A/B split that uses its start; a held-out content is
+    # never trained on by any run, so it stays a fair test for every version
+    return int(content_hash[-8:], 16) < holdout_fraction * 2**32
+
+
+def get_next_online_version(version: str) -> str:
+    """
+    Name the version an online update of `version` is published as: `3` becomes `3+online.1`, which becomes
+    `3+online.2`. Both sort after the version they update and before the next regular version `4`.
+    """
+    match = ONLINE_VERSION_PATTERN.fullmatch(version)
+    if match is None:
+        return f"{version}+online.1"
+    return f"{match['base_version']}+online.{int(match['update']) + 1}"
+
+
+class IncrementalTrainer:
+    """
+    Update a copy of a scikit-learn estimator with `partial_fit`, one mini-batch at a time.
+
+    Registry handles are shared and their arrays memory-mapped read-only, so the estimator is deep-copied first.
+    Incremental updates cannot add classes, therefore labels are matched case-insensitively against the classes
+    the model was trained with, and examples of any other label are skipped.
+    """
+
+    def __init__(self, handle: ModelHandle) -> None:
+        if handle.framework != ModelFrameworks.SKLEARN or not hasattr(handle.model, "partial_fit"):
+            raise ModelNotTrainable(f"Model `{handle.name}:{handle.version}` does not support incremental training!")
+
+        self.model = copy.deepcopy(handle.model)
+        self.classes_by_label: dict[str, typing.Any] = {str(cls).lower(): cls for cls in self.model.classes_}
+
+    def map_labels(self, labels: typing.Sequence[str]) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Return the model classes of `labels` and the mask of the labels the model knows.
+        """
+        classes = [self.classes_by_label.get(label.lower()) for label in labels]
+        is_known = numpy.array([cls is not None for cls in classes], dtype=bool)
+        return numpy.array([cls for cls in classes if cls is not None], dtype=self.model.classes_.dtype), is_known
+
+    def fit_batch(self, features: numpy.ndarray, labels: typing.Sequence[str], sample_weight: numpy.ndarray) -> int:
+        """
+        Update the model with one mini-batch and return how many of its examples were used.
+        """
+        classes, is_known = self.map_labels(labels=labels)
+        if classes.size:
+            self.model.partial_fit(
+                features[is_known], classes, classes=self.model.classes_, sample_weight=sample_weight[is_known]
+            )
+        return int(classes.size)
+
+    @staticmethod
+    def score(model: typing.Any, features: numpy.ndarray, classes: numpy.ndarray) -> float:
+        return float((model.predict(features) == classes).mean()) if classes.size else float("nan")
+
+    def dump(self) -> bytes:
+        # Uncompressed, so the published artifact is memory-mapped by the registry like any other
+        buffer = io.BytesIO()
+        joblib.dump(self.model, buffer)
+        return buffer.getvalue()
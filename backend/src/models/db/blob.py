@@ -0,0 +1,41 @@
+import datetime
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.models.db.base import DBBaseTable
+
+
+class Blob(DBBaseTable):
+    """
+    One stored object per distinct content, keyed by its SHA-256 and shared by every row that references it.
+
+    `master_storage_key` points to the normalized master that thumbnails, hashing and inference read instead of the
+    original; blobs stored before the normalization stage existed have none and fall back to the original.
+
+    `released_at` is set when `ref_count` drops to zero; the garbage collector deletes such blobs once they stayed
+    unreferenced for a grace period.
+    """
+
+    __tablename__ = "blob"
+
+    sha256: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), primary_key=True)
+    storage_key: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=256), nullable=False)
+    content_type: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=32), nullable=False)
+    size: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.BigInteger(), nullable=False)
+    perceptual_hash: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.BigInteger(), nullable=True)
+    master_storage_key: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=256), nullable=True)
+    width: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.Integer(), nullable=True)
+    height: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.Integer(), nullable=True)
+    ref_count: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
+        sqlalchemy.Integer(), nullable=False, default=1, server_default="1"
+    )
+    created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
+    released_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True, index=True
+    )
+
+    __table_args__ = (sqlalchemy.CheckConstraint("ref_count >= 0", name="blob_ref_count_non_negative"),)
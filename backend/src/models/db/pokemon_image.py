@@ -16,10 +16,17 @@ from src.models.db.base import DBBaseTable
 class PokemonImage(DBBaseTable):
     __tablename__ = "pokemon_image"
 
-    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
     file_name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
         sqlalchemy.String(length=124), nullable=False, default=None
     )
+    content_hash: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("blob.sha256"), nullable=True, index=True
+    )
+    content_type: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=32), nullable=True)
+    size: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.BigInteger(), nullable=True)
     name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=124), nullable=False, default=None)
     nickname: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
         sqlalchemy.String(length=124), nullable=False, default=name
@@ -39,7 +46,14 @@ class PokemonImage(DBBaseTable):
         server_onupdate=sqlalchemy.schema.FetchedValue(for_update=True),
         default=None,
     )
-    profile_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("profile.id"))
+    # Not `CASCADE`: the orphan garbage collector deletes the image so its blob reference is released as well
+    profile_id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("profile.id", ondelete="SET NULL"), nullable=True
+    )
     profile = sqlalchemy_relationship("Profile", back_populates="pokemon_images")
 
+    __table_args__ = (
+        # Keyset pagination of a profile's gallery; also serves the `profile_id` foreign key lookups
+        sqlalchemy.Index("ix_pokemon_image_profile_id_created_at_id", "profile_id", "created_at", "id"),
+    )
     __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,41 @@
+import datetime
+import uuid
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.models.db.base import DBBaseTable
+
+
+class PokemonImageVariant(DBBaseTable):
+    """
+    A resized and re-encoded derivative of a stored original.
+
+    Variants hang off the blob rather than the pokemon image, so every image sharing the same content shares its
+    variants too, and they go away together with the blob.
+    """
+
+    __tablename__ = "pokemon_image_variant"
+
+    id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    content_hash: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("blob.sha256", ondelete="CASCADE"), nullable=False
+    )
+    variant: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=32), nullable=False)
+    format: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=8), nullable=False)
+    storage_key: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=256), nullable=False)
+    content_type: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=32), nullable=False)
+    width: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.Integer(), nullable=False)
+    height: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.Integer(), nullable=False)
+    size: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.BigInteger(), nullable=False)
+    created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
+
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint("content_hash", "variant", "format", name="pokemon_image_variant_unique"),
+    )
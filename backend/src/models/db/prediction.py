@@ -0,0 +1,40 @@
+import datetime
+import uuid
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.models.db.base import DBBaseTable
+
+
+class Prediction(DBBaseTable):
+    """
+    The class one model version predicted for one content.
+
+    Like variants, predictions hang off the blob rather than the pokemon image: every image sharing the same content
+    shares its prediction, and the prediction goes away together with the blob.
+    """
+
+    __tablename__ = "prediction"
+
+    id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    content_hash: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("blob.sha256", ondelete="CASCADE"), nullable=False
+    )
+    model_name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=124), nullable=False)
+    model_version: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False)
+    label: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=124), nullable=False)
+    confidence: SQLAlchemyMapped[float] = sqlalchemy_mapped_column(sqlalchemy.Float(), nullable=False)
+    created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
+
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint("content_hash", "model_name", "model_version", name="prediction_unique"),
+        # Analysis and re-scoring work per model version
+        sqlalchemy.Index("ix_prediction_model_name_model_version", "model_name", "model_version"),
+    )
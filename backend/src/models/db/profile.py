@@ -16,7 +16,9 @@ from src.models.db.base import DBBaseTable
 class Profile(DBBaseTable):
     __tablename__ = "profile"
 
-    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
     first_name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
         sqlalchemy.String(length=64), nullable=True, default=None
     )
@@ -36,7 +38,10 @@ class Profile(DBBaseTable):
         server_onupdate=sqlalchemy.schema.FetchedValue(for_update=True),
         default=None,
     )
-    account_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.ForeignKey("account.id"), unique=True)
+    # Deleting the account orphans the profile instead of failing; the orphan garbage collector removes it
+    account_id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("account.id", ondelete="SET NULL"), nullable=True, unique=True
+    )
     account = sqlalchemy_relationship("Account", back_populates="profile")
 
     pokemon_images = sqlalchemy_relationship("PokemonImage", back_populates="profile")
@@ -0,0 +1,40 @@
+import datetime
+import uuid
+
+import pydantic
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.models.db.base import DBBaseTable
+
+
+class VerificationChallenge(DBBaseTable):
+    __tablename__ = "verification_challenge"
+
+    id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    account_id: SQLAlchemyMapped[uuid.UUID] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("account.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    email: SQLAlchemyMapped[pydantic.EmailStr] = sqlalchemy_mapped_column(
+        sqlalchemy.String(length=64), nullable=False, unique=True
+    )
+    hashed_code: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False)
+    attempts: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
+        sqlalchemy.Integer(), nullable=False, default=0, server_default="0"
+    )
+    resend_count: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
+        sqlalchemy.Integer(), nullable=False, default=0, server_default="0"
+    )
+    last_sent_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
+    expires_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, index=True
+    )
+    created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, server_default=sqlalchemy_functions.now()
+    )
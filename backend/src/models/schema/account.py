@@ -1,11 +1,10 @@
 import datetime
 import uuid
 
-import loguru
 import pydantic
-from password_strength import PasswordPolicy
 
 from src.models.schema.base import BaseSchemaModel
+from src.security.validation.account import is_password_breached, is_password_strong, is_username_long_enough
 
 
 class AccountInSignup(BaseSchemaModel):
@@ -15,21 +14,15 @@ class AccountInSignup(BaseSchemaModel):
 
     @pydantic.validator("password")
     def password_strength(cls, v):
-        loguru.logger.info("Evaluating password strength")
-        policy = PasswordPolicy.from_names(
-            length=8,
-            uppercase=1,
-            numbers=1,
-            special=1,
-        )
-        if policy.test(v) != []:
+        if not is_password_strong(password=v):
             raise ValueError("Password is not strong enough")
+        if is_password_breached(password=v):
+            raise ValueError("Password is too common or was found in a data breach")
         return v
 
     @pydantic.validator("username")
     def username_length(cls, v):
-        loguru.logger.info("Evaluating username length")
-        if len(v) < 4:
+        if not is_username_long_enough(username=v):
             raise ValueError("Username is too short")
         return v
 
@@ -44,9 +37,9 @@ class AccountInSignout(BaseSchemaModel):
 
 
 class AccountInRead(BaseSchemaModel):
-    id: uuid.UUID | None
-    username: str | None
-    email: pydantic.EmailStr | None
+    id: uuid.UUID | None = None
+    username: str | None = None
+    email: pydantic.EmailStr | None = None
 
 
 class CurrentAccountInRead(BaseSchemaModel):
@@ -108,6 +101,10 @@ class AccountInVerification(BaseSchemaModel):
     verification_code: int
 
 
+class AccountInVerificationResend(BaseSchemaModel):
+    email: pydantic.EmailStr
+
+
 class AccountOutVerification(BaseSchemaModel):
     email: pydantic.EmailStr
     is_verified: bool
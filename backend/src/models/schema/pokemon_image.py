@@ -2,14 +2,9 @@ import datetime
 import uuid
 
 import pydantic
-from fastapi import UploadFile
 
 from src.models.schema.base import BaseSchemaModel
 
-# ? Question:   How is the photo being handled?
-# ?             How do we validate it?
-# ?             How is it being send to the client?
-
 
 class PokemonImageInUpdate(BaseSchemaModel):
     nickname: str
@@ -18,12 +13,20 @@ class PokemonImageInUpdate(BaseSchemaModel):
 class PokemonImageInCreate(BaseSchemaModel):
     name: str
     nickname: str
-    # image: UploadFile | None
+
+
+class PokemonImageInCreateByHash(BaseSchemaModel):
+    name: str
+    nickname: str
+    content_hash: pydantic.constr(regex=r"^[0-9a-f]{64}$")  # type: ignore
 
 
 class PokemonImageInResponse(BaseSchemaModel):
     id: uuid.UUID
     file_name: str
+    content_hash: str | None
+    content_type: str | None
+    size: int | None
     name: str
     nickname: str
     correct_predicted: int
@@ -33,3 +36,44 @@ class PokemonImageInResponse(BaseSchemaModel):
     created_at: datetime.datetime
     updated_at: datetime.datetime | None
     profile_id: uuid.UUID | None
+
+
+class PokemonImageInDeletionResponse(BaseSchemaModel):
+    is_deleted: bool
+
+
+class PokemonImageNearDuplicate(BaseSchemaModel):
+    id: uuid.UUID
+    profile_id: uuid.UUID | None
+    distance: int
+
+
+class PokemonImageSimilar(BaseSchemaModel):
+    id: uuid.UUID
+    similarity: float
+
+
+class PokemonImageVariantInResponse(BaseSchemaModel):
+    variant: str
+    format: str
+    content_type: str
+    width: int
+    height: int
+    size: int
+    url: str
+
+
+class PokemonImagePage(BaseSchemaModel):
+    items: list[PokemonImageInResponse]
+    next_cursor: str | None
+    total_count: int | None
+
+
+class PokemonImageBulkUploadResult(BaseSchemaModel):
+    index: int
+    pokemon_image: PokemonImageInResponse | None
+    error: str | None
+
+
+class PokemonImageInBulkUploadResponse(BaseSchemaModel):
+    results: list[PokemonImageBulkUploadResult]
@@ -0,0 +1,12 @@
+import datetime
+
+from src.models.schema.base import BaseSchemaModel
+
+
+class PredictionInResponse(BaseSchemaModel):
+    content_hash: str
+    model_name: str
+    model_version: str
+    label: str
+    confidence: float
+    created_at: datetime.datetime
@@ -1,4 +1,8 @@
 from src.models.db.account import Account
 from src.models.db.base import DBBaseTable
+from src.models.db.blob import Blob
 from src.models.db.pokemon_image import PokemonImage
+from src.models.db.pokemon_image_variant import PokemonImageVariant
+from src.models.db.prediction import Prediction
 from src.models.db.profile import Profile
+from src.models.db.verification_challenge import VerificationChallenge
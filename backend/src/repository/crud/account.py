@@ -1,7 +1,6 @@
 import datetime
 import typing
 import uuid
-from random import randint
 
 import fastapi
 import loguru
@@ -18,17 +17,14 @@ from src.models.schema.account import (
     AccountInSignup,
     AccountInStateUpdate,
     AccountInUpdate,
-    AccountInVerification,
 )
 from src.repository.crud.base import BaseCRUDRepository
 from src.security.authorizations import two_factor_auth
 from src.utility.exceptions.custom import (
-    AccountIsAlreadyVerified,
     AccountIsNotVerified,
     EntityDoesNotExist,
     FailedToSaveAccount,
     PasswordDoesNotMatch,
-    VerificationCodeDoesNotMatch,
 )
 from src.utility.exceptions.database import DatabaseError
 from src.utility.exceptions.http.exc_400 import http_exc_400_credentials_bad_signup_request
@@ -41,7 +37,6 @@ class AccountCRUDRepository(BaseCRUDRepository):
         new_account.hashed_salt, new_account.hashed_password = new_account.set_password(
             password=account_signup.password
         )
-        new_account.verification_code = randint(100000, 999999)
 
         try:
             self.async_session.add(instance=new_account)
@@ -167,10 +162,9 @@ class AccountCRUDRepository(BaseCRUDRepository):
             if key == "password":
                 salt, password = db_account.set_password(password=update_data["password"])
                 update_stmt = update_stmt.values(_hashed_salt=salt, _hashed_password=password)
-                loguru.logger.debug(f"Updating {key} to {value}")
             else:
                 update_stmt = update_stmt.values(**{key: value})
-                loguru.logger.debug(f"Updating {key} to {value}")
+        loguru.logger.debug("Updating account fields {fields}", fields=sorted(update_data))
 
         try:
             await self.async_session.execute(statement=update_stmt)
@@ -268,22 +262,3 @@ class AccountCRUDRepository(BaseCRUDRepository):
             raise EntityDoesNotExist(f"Account with username `{username}` does not exist!")
 
         return db_account.is_otp_enabled
-
-    async def verify_account(self, account_in_verification: AccountInVerification) -> bool:
-        db_account = await self._read_account_by_email(email=account_in_verification.email)
-
-        if not db_account:
-            raise EntityDoesNotExist(f"Account with email does not exist!")
-
-        if db_account.is_verified:
-            raise AccountIsAlreadyVerified("Account is already verified!")
-
-        if db_account.verification_code != account_in_verification.verification_code:
-            raise VerificationCodeDoesNotMatch("Verification code does not match!")
-
-        else:
-            update_stmt = sqlalchemy.update(table=Account).where(Account.id == db_account.id).values(is_verified=True)
-            await self.async_session.execute(statement=update_stmt)
-            await self.async_session.commit()
-            await self.async_session.refresh(instance=db_account)
-            return True
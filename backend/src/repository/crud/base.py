@@ -1,10 +1,20 @@
+import inspect
+
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker as sqlalchemy_async_sessionmaker,
     AsyncSession as SQLAlchemyAsyncSession,
 )
 from sqlalchemy.pool import PoolProxiedConnection as SQLAlchemyProxiedConnection
 
+from src.repository.profiler import profile_repository_method
+
 
 class BaseCRUDRepository:
     def __init__(self, async_session: sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession]):
         self.async_session = async_session()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for method_name, method in list(vars(cls).items()):
+            if inspect.iscoroutinefunction(method):
+                setattr(cls, method_name, profile_repository_method(f"{cls.__name__}.{method_name}", method))
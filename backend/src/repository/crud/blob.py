@@ -0,0 +1,237 @@
+import asyncio
+import datetime
+import re
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.media.perceptual_hash import to_signed_bigint
+from src.models.db.blob import Blob
+from src.models.db.pokemon_image_variant import PokemonImageVariant
+from src.repository.crud.base import BaseCRUDRepository
+from src.storage.base import BaseStorage
+from src.utility.exceptions.custom import EntityDoesNotExist
+from src.utility.exceptions.database import DatabaseError
+
+SHA256_PATTERN: re.Pattern = re.compile(r"[0-9a-f]{64}")
+
+
+def get_blob_storage_key(storage_dir: str, sha256: str) -> str:
+    # Two-character fan-out keeps directories (and S3 key prefixes) small
+    return f"{storage_dir}/{sha256[:2]}/{sha256}"
+
+
+def get_blob_master_storage_key(storage_dir: str, sha256: str) -> str:
+    return f"{storage_dir}/masters/{sha256[:2]}/{sha256}.png"
+
+
+def build_blob_reference_stmt(
+    sha256: str,
+    storage_key: str,
+    content_type: str,
+    size: int,
+    perceptual_hash: int | None = None,
+    master_storage_key: str | None = None,
+    width: int | None = None,
+    height: int | None = None,
+) -> sqlalchemy.sql.dml.ReturningInsert:
+    """
+    Insert the blob or take one more reference on it; `is_inserted` tells whether this call created it
+    (`xmax = 0` only holds for a freshly inserted row version).
+    """
+    return build_blob_references_stmt(
+        blob_references=[
+            {
+                "sha256": sha256,
+                "storage_key": storage_key,
+                "content_type": content_type,
+                "size": size,
+                "perceptual_hash": perceptual_hash,
+                "master_storage_key": master_storage_key,
+                "width": width,
+                "height": height,
+                "ref_count": 1,
+            }
+        ]
+    )
+
+
+def build_blob_references_stmt(blob_references: list[dict]) -> sqlalchemy.sql.dml.ReturningInsert:
+    """
+    Multi-row form of `build_blob_reference_stmt()`: each row takes `ref_count` references in one statement.
+
+    PostgreSQL refuses to upsert the same row twice in one statement, so every `sha256` must appear only once.
+    """
+    insert_stmt = postgresql_insert(Blob).values(
+        [
+            {
+                **blob_reference,
+                "perceptual_hash": (
+                    None
+                    if blob_reference["perceptual_hash"] is None
+                    else to_signed_bigint(unsigned_hash=blob_reference["perceptual_hash"])
+                ),
+            }
+            for blob_reference in blob_references
+        ]
+    )
+    return insert_stmt.on_conflict_do_update(
+        index_elements=[Blob.sha256],
+        set_={"ref_count": Blob.ref_count + insert_stmt.excluded.ref_count, "released_at": None},
+    ).returning(
+        Blob.storage_key,
+        sqlalchemy.literal_column("(xmax = 0)").label("is_inserted"),
+        Blob.sha256,
+        Blob.master_storage_key,
+    )
+
+
+def build_blob_release_stmt(sha256: str) -> sqlalchemy.Update:
+    return (
+        sqlalchemy.update(table=Blob)
+        .where(Blob.sha256 == sha256)
+        .values(
+            ref_count=Blob.ref_count - 1,
+            released_at=sqlalchemy.case((Blob.ref_count == 1, sqlalchemy_functions.now()), else_=Blob.released_at),
+        )
+    )
+
+
+def build_blob_releases_stmt(released_references: dict[str, int]) -> sqlalchemy.sql.dml.ReturningUpdate:
+    """
+    Multi-row form of `build_blob_release_stmt()`: release `released_references[sha256]` references on each blob in
+    one statement and return `(sha256, size, ref_count)` as left behind.
+    """
+    released_blobs = sqlalchemy.values(
+        sqlalchemy.column("sha256", sqlalchemy.String),
+        sqlalchemy.column("released_references", sqlalchemy.Integer),
+        name="released_blob",
+    ).data(list(released_references.items()))
+    return (
+        sqlalchemy.update(table=Blob)
+        .where(Blob.sha256 == released_blobs.c.sha256)
+        .values(
+            ref_count=Blob.ref_count - released_blobs.c.released_references,
+            released_at=sqlalchemy.case(
+                (Blob.ref_count == released_blobs.c.released_references, sqlalchemy_functions.now()),
+                else_=Blob.released_at,
+            ),
+        )
+        .returning(Blob.sha256, Blob.size, Blob.ref_count)
+    )
+
+
+class BlobCRUDRepository(BaseCRUDRepository):
+    async def read_blob(self, sha256: str) -> Blob:
+        select_stmt = sqlalchemy.select(Blob).where(Blob.sha256 == sha256)
+        query = await self.async_session.execute(statement=select_stmt)
+        blob = query.scalar()
+
+        if not blob:
+            raise EntityDoesNotExist("No stored content has that hash! Upload the image instead.")
+
+        return blob
+
+    async def collect_released_blobs(self, storage: BaseStorage, batch_size: int, grace_period: int) -> int:
+        """
+        Delete unreferenced blobs, `batch_size` per transaction, once they were released `grace_period` seconds ago.
+
+        Stored objects are deleted while the rows are still locked and before the commit, so an upload that
+        references the same content meanwhile waits for the lock and then re-inserts the blob with its own object.
+        """
+        collected_blobs = 0
+
+        while True:
+            select_stmt = (
+                sqlalchemy.select(Blob.sha256, Blob.storage_key, Blob.master_storage_key)
+                .where(
+                    Blob.ref_count == 0,
+                    Blob.released_at <= sqlalchemy_functions.now() - datetime.timedelta(seconds=grace_period),
+                )
+                .order_by(Blob.released_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+
+            try:
+                query = await self.async_session.execute(statement=select_stmt)
+                released_blobs = query.all()
+                released_hashes = [blob.sha256 for blob in released_blobs]
+                # Variant rows cascade with the blob, their stored objects have to go explicitly
+                variant_query = await self.async_session.execute(
+                    statement=sqlalchemy.select(PokemonImageVariant.storage_key).where(
+                        PokemonImageVariant.content_hash.in_(released_hashes)
+                    )
+                )
+                released_keys = [
+                    storage_key
+                    for blob in released_blobs
+                    for storage_key in (blob.storage_key, blob.master_storage_key)
+                    if storage_key is not None
+                ] + list(variant_query.scalars().all())
+                await asyncio.gather(*(storage.delete(key=storage_key) for storage_key in released_keys))
+                await self.async_session.execute(
+                    statement=sqlalchemy.delete(table=Blob).where(Blob.sha256.in_(released_hashes))
+                )
+                await self.async_session.commit()
+
+            except Exception as e:
+                await self.async_session.rollback()
+                loguru.logger.error(e)
+                raise DatabaseError(error_msg="Failed to collect released blobs!")
+
+            collected_blobs += len(released_blobs)
+
+            if len(released_blobs) < batch_size:
+                return collected_blobs
+
+    async def read_referenced_storage_keys(self, storage_keys: typing.Collection[str]) -> set[str]:
+        """
+        Return the subset of `storage_keys` some row still points to, as an original, a master or a variant.
+
+        Every such key embeds the SHA-256 of its blob, so the lookup goes through the primary key and the variant
+        unique index rather than scanning the unindexed key columns; keys without a hash are never referenced.
+        """
+        content_hashes = {match.group() for match in map(SHA256_PATTERN.search, storage_keys) if match}
+        if not content_hashes:
+            return set()
+
+        select_stmt = sqlalchemy.union(
+            sqlalchemy.select(Blob.storage_key).where(Blob.sha256.in_(content_hashes)),
+            sqlalchemy.select(Blob.master_storage_key).where(Blob.sha256.in_(content_hashes)),
+            sqlalchemy.select(PokemonImageVariant.storage_key).where(
+                PokemonImageVariant.content_hash.in_(content_hashes)
+            ),
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        return set(query.scalars().all()).intersection(storage_keys)
+
+    async def stream_blob_sources(
+        self, after_sha256: str, batch_size: int
+    ) -> typing.AsyncIterator[typing.Sequence[sqlalchemy.Row]]:
+        """
+        Yield `(content_hash, storage_key)` of every referenced blob past `after_sha256` in hash order, `batch_size`
+        rows at a time, where `storage_key` is the master or, for blobs without one, the original.
+
+        Rows come from a server-side cursor, so memory stays bounded by one batch however large the library is; the
+        cursor keeps this repository's session in one read transaction until the iteration ends.
+        """
+        select_stmt = (
+            sqlalchemy.select(
+                Blob.sha256.label("content_hash"),
+                sqlalchemy.func.coalesce(Blob.master_storage_key, Blob.storage_key).label("storage_key"),
+            )
+            .where(Blob.sha256 > after_sha256, Blob.ref_count > 0)
+            .order_by(Blob.sha256)
+            .execution_options(yield_per=batch_size)
+        )
+
+        try:
+            query = await self.async_session.stream(statement=select_stmt)
+            async for blob_sources in query.partitions(batch_size):
+                yield blob_sources
+        finally:
+            await self.async_session.rollback()
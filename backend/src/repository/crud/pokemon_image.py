@@ -1,3 +1,6 @@
+import asyncio
+import collections
+import datetime
 import typing
 import uuid
 
@@ -5,47 +8,507 @@ import fastapi
 import loguru
 import pydantic
 import sqlalchemy
-from sqlalchemy.orm import object_session, selectinload as sqlalchemy_selectinload
+from sqlalchemy.orm import object_session
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.api.dependency.crud import get_crud
 from src.api.dependency.header import get_auth_current_user
+from src.config.setup import settings
+from src.media.upload import discard_stored_images, StoredImage
 from src.models.db.account import Account
+from src.models.db.blob import Blob
 from src.models.db.pokemon_image import PokemonImage
 from src.models.db.profile import Profile
-from src.models.schema.pokemon_image import PokemonImageInCreate, PokemonImageInResponse, PokemonImageInUpdate
+from src.models.schema.pokemon_image import (
+    PokemonImageInCreate,
+    PokemonImageInCreateByHash,
+    PokemonImageInResponse,
+    PokemonImageInUpdate,
+)
 from src.repository.crud.base import BaseCRUDRepository
+from src.repository.crud.blob import (
+    build_blob_references_stmt,
+    build_blob_release_stmt,
+    build_blob_releases_stmt,
+    get_blob_master_storage_key,
+    get_blob_storage_key,
+)
+from src.storage.base import BaseStorage
+from src.utility.cache.ttl import TTLCache
 from src.utility.exceptions.custom import EntityDoesNotExist, PasswordDoesNotMatch
+from src.utility.exceptions.database import DatabaseError
+
+
+def get_pokemon_image_count_cache() -> TTLCache[uuid.UUID, int]:
+    return TTLCache(
+        max_size=settings.POKEMON_IMAGE_COUNT_CACHE_MAX_SIZE, ttl=settings.POKEMON_IMAGE_COUNT_CACHE_TTL_SEC
+    )
+
+
+pokemon_image_count_cache: TTLCache[uuid.UUID, int] = get_pokemon_image_count_cache()
+
+
+def build_stored_image_blob_reference(stored_image: StoredImage) -> dict:
+    return {
+        "sha256": stored_image.content_hash,
+        "storage_key": get_blob_storage_key(
+            storage_dir=settings.POKEMON_IMAGE_STORAGE_DIR, sha256=stored_image.content_hash
+        ),
+        "content_type": stored_image.content_type,
+        "size": stored_image.size,
+        "perceptual_hash": stored_image.perceptual_hash,
+        "master_storage_key": (
+            None
+            if stored_image.master_storage_key is None
+            else get_blob_master_storage_key(
+                storage_dir=settings.POKEMON_IMAGE_STORAGE_DIR, sha256=stored_image.content_hash
+            )
+        ),
+        "width": stored_image.width,
+        "height": stored_image.height,
+        "ref_count": 1,
+    }
+
+
+async def move_stored_image_to_blob(storage: BaseStorage, stored_image: StoredImage, blob: sqlalchemy.Row) -> None:
+    """
+    Move the incoming original, and its master if one was made, to the content-addressed keys of a new blob.
+    """
+    moves = [storage.move(source_key=stored_image.storage_key, destination_key=blob.storage_key)]
+    if stored_image.master_storage_key is not None and blob.master_storage_key is not None:
+        moves.append(storage.move(source_key=stored_image.master_storage_key, destination_key=blob.master_storage_key))
+    await asyncio.gather(*moves)
 
 
 class PokemonImageCRUDRepository(BaseCRUDRepository):
     async def create_pokemon_image(
-        self, pokemon_image_create: PokemonImageInCreate, current_profile: Profile
+        self,
+        pokemon_image_create: PokemonImageInCreate,
+        current_profile: Profile,
+        stored_image: StoredImage,
+        storage: BaseStorage,
     ) -> PokemonImage:
+        """
+        Reference the blob of the uploaded content and create the image in one transaction.
+
+        The first upload of a content moves the incoming object to its content-addressed key before the commit;
+        every later upload of the same content only bumps `Blob.ref_count` and drops its incoming copy.
+        """
+        reference_stmt = build_blob_references_stmt(
+            blob_references=[build_stored_image_blob_reference(stored_image=stored_image)]
+        )
+
         try:
-            new_pokemon_image = PokemonImage(**pokemon_image_create.dict(exclude={"image"}))
-            new_pokemon_image.file_name = await self._generate_file_name()
-            new_pokemon_image.profile = current_profile
-            # await self._save_image_on_S3(pokemon_image_create.image)
-            self.async_session.add(instance=new_pokemon_image)
+            query = await self.async_session.execute(statement=reference_stmt)
+            blob = query.one()
+            if blob.is_inserted:
+                await move_stored_image_to_blob(storage=storage, stored_image=stored_image, blob=blob)
+            new_pokemon_image = await self._add_pokemon_image(
+                pokemon_image_create=pokemon_image_create,
+                current_profile=current_profile,
+                content_hash=stored_image.content_hash,
+                content_type=stored_image.content_type,
+                size=stored_image.size,
+            )
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to create pokemon image!")
+
+        await discard_stored_images(storage=storage, stored_images=[stored_image])
+        return new_pokemon_image
+
+    async def create_pokemon_images(
+        self,
+        pokemon_image_uploads: list[tuple[PokemonImageInCreate, StoredImage]],
+        current_profile: Profile,
+        storage: BaseStorage,
+    ) -> list[PokemonImage]:
+        """
+        Bulk form of `create_pokemon_image()`: one upsert references every distinct blob, one `INSERT ... RETURNING`
+        creates every image and a single commit covers both, whatever the number of images.
+        """
+        blob_references: dict[str, dict] = dict()
+        incoming_images: dict[str, StoredImage] = dict()
+        for _, stored_image in pokemon_image_uploads:
+            if stored_image.content_hash in blob_references:
+                blob_references[stored_image.content_hash]["ref_count"] += 1
+                continue
+            blob_references[stored_image.content_hash] = build_stored_image_blob_reference(stored_image=stored_image)
+            incoming_images[stored_image.content_hash] = stored_image
+
+        # Ids are assigned here so the returned rows can be put back into request order
+        pokemon_image_rows = [
+            {
+                **pokemon_image_create.dict(),
+                "id": uuid.uuid4(),
+                "file_name": stored_image.content_hash,
+                "content_hash": stored_image.content_hash,
+                "content_type": stored_image.content_type,
+                "size": stored_image.size,
+                "profile_id": current_profile.id,
+            }
+            for pokemon_image_create, stored_image in pokemon_image_uploads
+        ]
+
+        try:
+            query = await self.async_session.execute(
+                statement=build_blob_references_stmt(blob_references=list(blob_references.values()))
+            )
+            await asyncio.gather(
+                *(
+                    move_stored_image_to_blob(storage=storage, stored_image=incoming_images[blob.sha256], blob=blob)
+                    for blob in query.all()
+                    if blob.is_inserted
+                )
+            )
+            query = await self.async_session.execute(
+                statement=sqlalchemy.insert(PokemonImage).returning(PokemonImage), params=pokemon_image_rows
+            )
+            new_pokemon_images = {new_pokemon_image.id: new_pokemon_image for new_pokemon_image in query.scalars()}
             await self.async_session.commit()
-            await self.async_session.refresh(instance=new_pokemon_image)
-            await self.async_session.close()
 
-        except:
-            loguru.logger.error("Error in create_pokemon_image()")
-            raise Exception("Error in create_pokemon_image()")
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to create pokemon images!")
+
+        await discard_stored_images(
+            storage=storage, stored_images=[stored_image for _, stored_image in pokemon_image_uploads]
+        )
+        pokemon_image_count_cache.invalidate(key=current_profile.id)
+        return [new_pokemon_images[pokemon_image_row["id"]] for pokemon_image_row in pokemon_image_rows]
 
+    async def create_pokemon_image_by_hash(
+        self, pokemon_image_create: PokemonImageInCreateByHash, current_profile: Profile
+    ) -> PokemonImage:
+        """
+        Create an image from content the server already stores, so the client can skip the upload entirely.
+        """
+        reference_stmt = (
+            sqlalchemy.update(table=Blob)
+            .where(Blob.sha256 == pokemon_image_create.content_hash)
+            .values(ref_count=Blob.ref_count + 1, released_at=None)
+            .returning(Blob.content_type, Blob.size)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=reference_stmt)
+            referenced_blob = query.first()
+            if not referenced_blob:
+                await self.async_session.rollback()
+                raise EntityDoesNotExist("No stored content has that hash! Upload the image instead.")
+
+            new_pokemon_image = await self._add_pokemon_image(
+                pokemon_image_create=PokemonImageInCreate(**pokemon_image_create.dict(exclude={"content_hash"})),
+                current_profile=current_profile,
+                content_hash=pokemon_image_create.content_hash,
+                content_type=referenced_blob.content_type,
+                size=referenced_blob.size,
+            )
+
+        except EntityDoesNotExist:
+            raise
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to create pokemon image!")
+
+        return new_pokemon_image
+
+    async def _add_pokemon_image(
+        self,
+        pokemon_image_create: PokemonImageInCreate,
+        current_profile: Profile,
+        content_hash: str,
+        content_type: str,
+        size: int,
+    ) -> PokemonImage:
+        new_pokemon_image = PokemonImage(
+            **pokemon_image_create.dict(),
+            file_name=content_hash,
+            content_hash=content_hash,
+            content_type=content_type,
+            size=size,
+        )
+        new_pokemon_image.profile = current_profile
+        self.async_session.add(instance=new_pokemon_image)
+        await self.async_session.commit()
+        await self.async_session.refresh(instance=new_pokemon_image)
+        await self.async_session.close()
+        pokemon_image_count_cache.invalidate(key=current_profile.id)
         return new_pokemon_image
 
-    async def _generate_file_name(self) -> str:
-        file_name = str(uuid.uuid4())
-        return file_name
+    async def delete_pokemon_image(self, id: uuid.UUID, profile_id: uuid.UUID) -> None:
+        """
+        Delete an image of the profile and release its reference on the blob; the garbage collector deletes the
+        stored object once no image references it anymore.
+        """
+        delete_stmt = (
+            sqlalchemy.delete(table=PokemonImage)
+            .where(PokemonImage.id == id, PokemonImage.profile_id == profile_id)
+            .returning(PokemonImage.content_hash)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=delete_stmt)
+            deleted_image = query.first()
+            if deleted_image and deleted_image.content_hash:
+                await self.async_session.execute(statement=build_blob_release_stmt(sha256=deleted_image.content_hash))
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to delete pokemon image!")
+
+        if not deleted_image:
+            raise EntityDoesNotExist(f"Pokemon image with id `{id}` does not exist!")
+
+        pokemon_image_count_cache.invalidate(key=profile_id)
+
+    async def read_orphaned_pokemon_image_summary(self) -> sqlalchemy.Row:
+        """
+        Return `(pokemon_images, reclaimable_bytes)` for a dry run: the images without a profile, counting those of
+        orphaned profiles too, and the stored bytes of the blobs that only they reference.
+        """
+        orphaned_references = (
+            sqlalchemy.select(PokemonImage.content_hash, sqlalchemy_functions.count().label("orphaned_references"))
+            .where(
+                sqlalchemy.or_(
+                    PokemonImage.profile_id.is_(None),
+                    PokemonImage.profile_id.in_(sqlalchemy.select(Profile.id).where(Profile.account_id.is_(None))),
+                )
+            )
+            .group_by(PokemonImage.content_hash)
+            .subquery()
+        )
+        select_stmt: sqlalchemy.Select = sqlalchemy.select(
+            sqlalchemy_functions.coalesce(
+                sqlalchemy_functions.sum(orphaned_references.c.orphaned_references), 0
+            ).label("pokemon_images"),
+            sqlalchemy_functions.coalesce(
+                sqlalchemy_functions.sum(
+                    sqlalchemy.case((Blob.ref_count <= orphaned_references.c.orphaned_references, Blob.size), else_=0)
+                ),
+                0,
+            ).label("reclaimable_bytes"),
+        ).select_from(orphaned_references.outerjoin(Blob, Blob.sha256 == orphaned_references.c.content_hash))
+        query = await self.async_session.execute(statement=select_stmt)
+        return query.one()
+
+    async def delete_orphaned_pokemon_images(self, batch_size: int) -> tuple[list[uuid.UUID], int]:
+        """
+        Delete up to `batch_size` images whose profile was deleted and release their blob references in the same
+        transaction. Returns the deleted ids and the bytes of the blobs left without any reference, which the blob
+        garbage collector deletes after its grace period.
+        """
+        orphaned_ids = (
+            sqlalchemy.select(PokemonImage.id)
+            .where(PokemonImage.profile_id.is_(None))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        delete_stmt = (
+            sqlalchemy.delete(table=PokemonImage)
+            .where(PokemonImage.id.in_(orphaned_ids.scalar_subquery()))
+            .returning(PokemonImage.id, PokemonImage.content_hash)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=delete_stmt)
+            deleted_images = query.all()
+            released_references = collections.Counter(
+                deleted_image.content_hash for deleted_image in deleted_images if deleted_image.content_hash
+            )
+            released_bytes = 0
+            if released_references:
+                query = await self.async_session.execute(
+                    statement=build_blob_releases_stmt(released_references=dict(released_references))
+                )
+                released_bytes = sum(blob.size for blob in query.all() if blob.ref_count == 0)
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to delete orphaned pokemon images!")
+
+        return [deleted_image.id for deleted_image in deleted_images], released_bytes
+
+    async def read_perceptual_hash_entries(
+        self, created_after: datetime.datetime | None, id_after: uuid.UUID | None, limit: int
+    ) -> list[sqlalchemy.Row]:
+        """
+        Page through `(id, profile_id, created_at, perceptual_hash)` of hashed images in `(created_at, id)` order.
+        """
+        select_stmt = (
+            sqlalchemy.select(PokemonImage.id, PokemonImage.profile_id, PokemonImage.created_at, Blob.perceptual_hash)
+            .join(Blob, Blob.sha256 == PokemonImage.content_hash)
+            .where(Blob.perceptual_hash.is_not(None))
+            .order_by(PokemonImage.created_at, PokemonImage.id)
+            .limit(limit)
+        )
+        if created_after is not None:
+            select_stmt = select_stmt.where(
+                sqlalchemy.tuple_(PokemonImage.created_at, PokemonImage.id)
+                > (created_after, id_after or uuid.UUID(int=0))
+            )
+
+        query = await self.async_session.execute(statement=select_stmt)
+        return list(query.all())
+
+    async def read_profile_perceptual_hashes(self, profile_id: uuid.UUID) -> list[int]:
+        """
+        Return the signed `BIGINT` perceptual hash of every hashed image the profile owns.
+        """
+        select_stmt = (
+            sqlalchemy.select(Blob.perceptual_hash)
+            .join(PokemonImage, PokemonImage.content_hash == Blob.sha256)
+            .where(PokemonImage.profile_id == profile_id, Blob.perceptual_hash.is_not(None))
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        return list(query.scalars().all())
+
+    async def read_pokemon_image_perceptual_hash(self, id: uuid.UUID) -> sqlalchemy.Row:
+        select_stmt = (
+            sqlalchemy.select(PokemonImage.id, PokemonImage.profile_id, Blob.perceptual_hash)
+            .join(Blob, Blob.sha256 == PokemonImage.content_hash)
+            .where(PokemonImage.id == id, Blob.perceptual_hash.is_not(None))
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        pokemon_image = query.first()
+
+        if not pokemon_image:
+            raise EntityDoesNotExist(f"Pokemon image with id `{id}` does not exist or has no perceptual hash!")
+
+        return pokemon_image
+
+    async def read_pokemon_image_content(self, id: uuid.UUID) -> sqlalchemy.Row:
+        """
+        Return what serving the image bytes needs: where they are stored, their hash, type and size, and the
+        `updated_at`/`created_at` timestamps for `Last-Modified`.
+        """
+        select_stmt = (
+            sqlalchemy.select(
+                Blob.sha256.label("content_hash"),
+                Blob.storage_key,
+                Blob.content_type,
+                Blob.size,
+                PokemonImage.created_at,
+                PokemonImage.updated_at,
+            )
+            .join(Blob, Blob.sha256 == PokemonImage.content_hash)
+            .where(PokemonImage.id == id)
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        pokemon_image_content = query.first()
+
+        if not pokemon_image_content:
+            raise EntityDoesNotExist(f"Pokemon image with id `{id}` does not exist or has no stored content!")
+
+        return pokemon_image_content
+
+    async def read_existing_pokemon_image_ids(self, ids: typing.Collection[uuid.UUID]) -> set[uuid.UUID]:
+        if not ids:
+            return set()
+
+        select_stmt = sqlalchemy.select(PokemonImage.id).where(PokemonImage.id.in_(ids))
+        query = await self.async_session.execute(statement=select_stmt)
+        return set(query.scalars().all())
+
+    async def read_pokemon_image_names(self, ids: typing.Collection[uuid.UUID]) -> dict[uuid.UUID, str]:
+        if not ids:
+            return dict()
+
+        select_stmt = sqlalchemy.select(PokemonImage.id, PokemonImage.name).where(PokemonImage.id.in_(ids))
+        query = await self.async_session.execute(statement=select_stmt)
+        return {pokemon_image.id: pokemon_image.name for pokemon_image in query.all()}
+
+    async def stream_labelled_examples(
+        self, after_changed_at: datetime.datetime | None, after_id: uuid.UUID | None, batch_size: int
+    ) -> typing.AsyncIterator[typing.Sequence[sqlalchemy.Row]]:
+        """
+        Yield the pokemon images uploaded or updated after `(after_changed_at, after_id)`, or all of them, as training
+        examples, oldest change first and `batch_size` at a time:
+        `(id, changed_at, content_hash, storage_key, name, wrong_predicted)`, where the name players gave the image is
+        its label and `storage_key` is the master or, without one, the original.
+
+        Rows come from a server-side cursor like `BlobCRUDRepository.stream_blob_sources()`, so this repository's
+        session stays in one read transaction until the iteration ends.
+        """
+        changed_at = sqlalchemy.func.coalesce(PokemonImage.updated_at, PokemonImage.created_at)
+        select_stmt = (
+            sqlalchemy.select(
+                PokemonImage.id,
+                changed_at.label("changed_at"),
+                PokemonImage.content_hash,
+                sqlalchemy.func.coalesce(Blob.master_storage_key, Blob.storage_key).label("storage_key"),
+                PokemonImage.name,
+                PokemonImage.wrong_predicted,
+            )
+            .join(Blob, Blob.sha256 == PokemonImage.content_hash)
+            .order_by(changed_at, PokemonImage.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if after_changed_at is not None:
+            select_stmt = select_stmt.where(
+                sqlalchemy.tuple_(changed_at, PokemonImage.id) > (after_changed_at, after_id or uuid.UUID(int=0))
+            )
+
+        try:
+            query = await self.async_session.stream(statement=select_stmt)
+            async for labelled_examples in query.partitions(batch_size):
+                yield labelled_examples
+        finally:
+            await self.async_session.rollback()
+
+    async def read_pokemon_images_by_profile(
+        self,
+        profile_id: uuid.UUID,
+        limit: int,
+        created_before: datetime.datetime | None = None,
+        id_before: uuid.UUID | None = None,
+    ) -> list[PokemonImage]:
+        """
+        Return one page of the profile's images, newest first, starting after the `(created_at, id)` cursor.
+
+        The row comparison walks `ix_pokemon_image_profile_id_created_at_id` backwards, so every page costs the same
+        no matter how deep the client paginated.
+        """
+        select_stmt = (
+            sqlalchemy.select(PokemonImage)
+            .where(PokemonImage.profile_id == profile_id)
+            .order_by(PokemonImage.created_at.desc(), PokemonImage.id.desc())
+            .limit(limit)
+        )
+        if created_before is not None and id_before is not None:
+            select_stmt = select_stmt.where(
+                sqlalchemy.tuple_(PokemonImage.created_at, PokemonImage.id) < (created_before, id_before)
+            )
+
+        query = await self.async_session.execute(statement=select_stmt)
+        return list(query.scalars().all())
+
+    async def count_pokemon_images_by_profile(self, profile_id: uuid.UUID) -> int:
+        """
+        Count the profile's images, served from `pokemon_image_count_cache` for `POKEMON_IMAGE_COUNT_CACHE_TTL_SEC`.
+        """
+        pokemon_image_count = pokemon_image_count_cache.get(key=profile_id)
+        if pokemon_image_count is not None:
+            return pokemon_image_count
+
+        select_stmt = sqlalchemy.select(sqlalchemy_functions.count()).where(PokemonImage.profile_id == profile_id)
+        query = await self.async_session.execute(statement=select_stmt)
+        pokemon_image_count = query.scalar_one()
 
-    # async def _save_image_on_S3(self, image: fastapi.UploadFile) -> bool:
-    #     return True
+        pokemon_image_count_cache.set(key=profile_id, value=pokemon_image_count)
+        return pokemon_image_count
 
     async def read_all_pokemon_images(self) -> list[PokemonImageInResponse]:
-        select_stmt = sqlalchemy.select(PokemonImage).options(sqlalchemy_selectinload("*"))
+        # The response only carries `profile_id`, eager loading every relationship fetched each profile for nothing
+        select_stmt = sqlalchemy.select(PokemonImage)
         query = await self.async_session.execute(statement=select_stmt)
         return query.scalars().all()
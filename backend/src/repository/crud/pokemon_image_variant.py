@@ -0,0 +1,105 @@
+import uuid
+
+import loguru
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+from src.media.variants import GeneratedVariant
+from src.models.db.blob import Blob
+from src.models.db.pokemon_image import PokemonImage
+from src.models.db.pokemon_image_variant import PokemonImageVariant
+from src.repository.crud.base import BaseCRUDRepository
+from src.utility.enums.image_format import ImageVariantFormats
+from src.utility.exceptions.custom import EntityDoesNotExist
+from src.utility.exceptions.database import DatabaseError
+
+
+class PokemonImageVariantCRUDRepository(BaseCRUDRepository):
+    async def read_variant_source(self, pokemon_image_id: uuid.UUID) -> sqlalchemy.Row:
+        """
+        Return `(content_hash, storage_key)` of the image variants are made from: the normalized master, or the
+        original for blobs stored before masters existed.
+        """
+        select_stmt = (
+            sqlalchemy.select(
+                Blob.sha256.label("content_hash"),
+                sqlalchemy.func.coalesce(Blob.master_storage_key, Blob.storage_key).label("storage_key"),
+            )
+            .join(PokemonImage, PokemonImage.content_hash == Blob.sha256)
+            .where(PokemonImage.id == pokemon_image_id)
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        variant_source = query.first()
+
+        if not variant_source:
+            raise EntityDoesNotExist(f"Pokemon image with id `{pokemon_image_id}` does not exist!")
+
+        return variant_source
+
+    async def read_variant(
+        self, content_hash: str, variant: str, image_format: ImageVariantFormats
+    ) -> PokemonImageVariant:
+        select_stmt = sqlalchemy.select(PokemonImageVariant).where(
+            PokemonImageVariant.content_hash == content_hash,
+            PokemonImageVariant.variant == variant,
+            PokemonImageVariant.format == image_format.value,
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        pokemon_image_variant = query.scalar()
+
+        if not pokemon_image_variant:
+            raise EntityDoesNotExist(f"Variant `{variant}.{image_format.value}` has not been generated yet!")
+
+        return pokemon_image_variant
+
+    async def read_variants(self, content_hash: str) -> list[PokemonImageVariant]:
+        select_stmt = (
+            sqlalchemy.select(PokemonImageVariant)
+            .where(PokemonImageVariant.content_hash == content_hash)
+            .order_by(PokemonImageVariant.width, PokemonImageVariant.format)
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        return list(query.scalars().all())
+
+    async def create_variant(
+        self, content_hash: str, variant: str, image_format: ImageVariantFormats, generated_variant: GeneratedVariant
+    ) -> PokemonImageVariant:
+        """
+        Record a generated variant. Workers racing on the same variant wrote the same bytes to the same key, so the
+        conflict just refreshes the row and every caller gets it back.
+        """
+        insert_stmt = postgresql_insert(PokemonImageVariant).values(
+            content_hash=content_hash,
+            variant=variant,
+            format=image_format.value,
+            storage_key=generated_variant.storage_key,
+            content_type=generated_variant.content_type,
+            width=generated_variant.width,
+            height=generated_variant.height,
+            size=generated_variant.size,
+        )
+        upsert_stmt = (
+            insert_stmt.on_conflict_do_update(
+                constraint="pokemon_image_variant_unique",
+                set_={
+                    "storage_key": insert_stmt.excluded.storage_key,
+                    "width": insert_stmt.excluded.width,
+                    "height": insert_stmt.excluded.height,
+                    "size": insert_stmt.excluded.size,
+                },
+            )
+            .returning(PokemonImageVariant)
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=upsert_stmt)
+            pokemon_image_variant = query.scalar_one()
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to record pokemon image variant!")
+
+        return pokemon_image_variant
@@ -0,0 +1,133 @@
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+from src.models.db.pokemon_image import PokemonImage
+from src.models.db.prediction import Prediction
+from src.repository.crud.base import BaseCRUDRepository
+from src.utility.exceptions.custom import EntityDoesNotExist
+from src.utility.exceptions.database import DatabaseError
+
+
+class PredictionCRUDRepository(BaseCRUDRepository):
+    async def read_prediction(self, content_hash: str, model_name: str, model_version: str) -> Prediction:
+        select_stmt = sqlalchemy.select(Prediction).where(
+            Prediction.content_hash == content_hash,
+            Prediction.model_name == model_name,
+            Prediction.model_version == model_version,
+        )
+        query = await self.async_session.execute(statement=select_stmt)
+        prediction = query.scalar()
+
+        if not prediction:
+            raise EntityDoesNotExist(f"Model `{model_name}:{model_version}` has not scored `{content_hash}` yet!")
+
+        return prediction
+
+    async def create_prediction(
+        self, content_hash: str, model_name: str, model_version: str, label: str, confidence: float
+    ) -> Prediction:
+        """
+        Record a prediction. A model version is deterministic, so workers racing on the same content computed the
+        same result and the conflict just hands every caller the stored row.
+        """
+        insert_stmt = postgresql_insert(Prediction).values(
+            content_hash=content_hash,
+            model_name=model_name,
+            model_version=model_version,
+            label=label,
+            confidence=confidence,
+        )
+        upsert_stmt = (
+            insert_stmt.on_conflict_do_update(
+                constraint="prediction_unique",
+                set_={"label": insert_stmt.excluded.label, "confidence": insert_stmt.excluded.confidence},
+            )
+            .returning(Prediction)
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=upsert_stmt)
+            prediction = query.scalar_one()
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to record prediction!")
+
+        return prediction
+
+    async def copy_predictions(
+        self, model_name: str, model_version: str, predictions: typing.Sequence[tuple[str, str, float]]
+    ) -> int:
+        """
+        Store `(content_hash, label, confidence)` rows of one model version in bulk and refresh the prediction
+        statistics of every pokemon image showing one of those contents, all in one transaction.
+
+        The rows are `COPY`ed into a temporary staging table and merged from there, so a batch costs a handful of
+        round trips however large it is, and re-scoring a content (e.g. after resuming) overwrites its row.
+        `correct_predicted` and `wrong_predicted` count the versions of `model_name` whose label matched the
+        image's name or did not.
+        """
+        try:
+            connection = await self.async_session.connection()
+            await connection.execute(
+                sqlalchemy.text(
+                    "CREATE TEMPORARY TABLE prediction_staging"
+                    " (content_hash VARCHAR(64), label VARCHAR(124), confidence DOUBLE PRECISION) ON COMMIT DROP"
+                )
+            )
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+                "prediction_staging", records=predictions, columns=("content_hash", "label", "confidence")
+            )
+            await connection.execute(
+                sqlalchemy.text(
+                    "INSERT INTO prediction (id, content_hash, model_name, model_version, label, confidence)"
+                    " SELECT gen_random_uuid(), content_hash, :model_name, :model_version, label, confidence"
+                    " FROM prediction_staging"
+                    " ON CONFLICT ON CONSTRAINT prediction_unique"
+                    " DO UPDATE SET label = EXCLUDED.label, confidence = EXCLUDED.confidence"
+                ),
+                parameters={"model_name": model_name, "model_version": model_version},
+            )
+
+            is_correct = sqlalchemy.func.lower(Prediction.label) == sqlalchemy.func.lower(PokemonImage.name)
+            statistics = (
+                sqlalchemy.select(
+                    PokemonImage.id.label("pokemon_image_id"),
+                    sqlalchemy.func.count().filter(is_correct).label("correct_predicted"),
+                    sqlalchemy.func.count().filter(sqlalchemy.not_(is_correct)).label("wrong_predicted"),
+                )
+                .join(Prediction, Prediction.content_hash == PokemonImage.content_hash)
+                .where(
+                    PokemonImage.content_hash.in_(
+                        sqlalchemy.select(sqlalchemy.column("content_hash")).select_from(
+                            sqlalchemy.table("prediction_staging")
+                        )
+                    ),
+                    Prediction.model_name == model_name,
+                )
+                .group_by(PokemonImage.id)
+                .subquery()
+            )
+            await connection.execute(
+                sqlalchemy.update(PokemonImage)
+                .where(PokemonImage.id == statistics.c.pokemon_image_id)
+                .values(
+                    correct_predicted=statistics.c.correct_predicted,
+                    wrong_predicted=statistics.c.wrong_predicted,
+                )
+            )
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to copy predictions!")
+
+        return len(predictions)
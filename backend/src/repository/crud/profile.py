@@ -46,7 +46,7 @@ class ProfileCRUDRepository(BaseCRUDRepository):
             loguru.logger.error(e)
             raise DatabaseError(error_msg="Failed to read profile by id")
 
-    async def read_profile_by_account_id(self, account_id: int) -> Profile:
+    async def read_profile_by_account_id(self, account_id: uuid.UUID) -> Profile:
         try:
             stmt = sqlalchemy.select(Profile).where(Profile.account_id == account_id)
             query = await self.async_session.execute(statement=stmt)
@@ -54,9 +54,9 @@ class ProfileCRUDRepository(BaseCRUDRepository):
             if not query:
                 raise EntityDoesNotExist(error_msg=f"Profile related to that account ID does not exist")
 
-            loguru.logger.info(f"Closing db session of profile...")
+            loguru.logger.debug("Closing db session of profile...")
             await self.async_session.close()
-            loguru.logger.info(f"Closed db session of profile")
+            loguru.logger.debug("Closed db session of profile")
 
             return query.scalar()
 
@@ -142,3 +142,32 @@ class ProfileCRUDRepository(BaseCRUDRepository):
         except Exception as e:
             loguru.logger.error(e)
             raise DatabaseError(error_msg="Failed to delete profile by id")
+
+    async def read_orphaned_profile_count(self) -> int:
+        select_stmt = sqlalchemy.select(sqlalchemy_functions.count()).where(Profile.account_id.is_(None))
+        query = await self.async_session.execute(statement=select_stmt)
+        return query.scalar_one()
+
+    async def delete_orphaned_profiles(self, batch_size: int) -> int:
+        """
+        Delete up to `batch_size` profiles whose account was deleted; their images lose the profile and are collected
+        by `PokemonImageCRUDRepository.delete_orphaned_pokemon_images()`.
+        """
+        orphaned_ids = (
+            sqlalchemy.select(Profile.id)
+            .where(Profile.account_id.is_(None))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        delete_stmt = sqlalchemy.delete(Profile).where(Profile.id.in_(orphaned_ids.scalar_subquery()))
+
+        try:
+            query = typing.cast(sqlalchemy.CursorResult, await self.async_session.execute(statement=delete_stmt))
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to delete orphaned profiles!")
+
+        return query.rowcount
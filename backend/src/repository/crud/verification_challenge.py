@@ -0,0 +1,172 @@
+import datetime
+import typing
+
+import loguru
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.config.setup import settings
+from src.models.db.account import Account
+from src.models.db.verification_challenge import VerificationChallenge
+from src.models.schema.account import AccountInVerification
+from src.repository.crud.base import BaseCRUDRepository
+from src.security.authentication.verification_code import generate_verification_code, hash_verification_code
+from src.utility.exceptions.custom import (
+    VerificationAttemptsExceeded,
+    VerificationChallengeDoesNotExist,
+    VerificationChallengeExpired,
+    VerificationCodeDoesNotMatch,
+    VerificationResendThrottled,
+)
+from src.utility.exceptions.database import DatabaseError
+
+
+class VerificationChallengeCRUDRepository(BaseCRUDRepository):
+    async def issue_challenge(self, account: Account) -> int:
+        """
+        Create (or replace) the verification challenge of an account and return the plain code to be emailed.
+
+        A single upsert covers both the first issue and every resend; the resend is refused while the last code
+        is younger than `VERIFICATION_CODE_RESEND_INTERVAL_SEC`.
+        """
+        verification_code = generate_verification_code()
+
+        insert_stmt = postgresql_insert(VerificationChallenge).values(
+            account_id=account.id,
+            email=account.email,
+            hashed_code=hash_verification_code(verification_code=verification_code),
+            expires_at=sqlalchemy_functions.now() + datetime.timedelta(minutes=settings.VERIFICATION_CODE_TTL_MIN),
+        )
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[VerificationChallenge.account_id],
+            set_={
+                "email": insert_stmt.excluded.email,
+                "hashed_code": insert_stmt.excluded.hashed_code,
+                "expires_at": insert_stmt.excluded.expires_at,
+                "attempts": 0,
+                "resend_count": VerificationChallenge.resend_count + 1,
+                "last_sent_at": sqlalchemy_functions.now(),
+            },
+            where=VerificationChallenge.last_sent_at
+            <= sqlalchemy_functions.now() - datetime.timedelta(seconds=settings.VERIFICATION_CODE_RESEND_INTERVAL_SEC),
+        ).returning(VerificationChallenge.id)
+
+        try:
+            query = await self.async_session.execute(statement=upsert_stmt)
+            challenge_id = query.scalar()
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to issue verification challenge!")
+
+        if not challenge_id:
+            raise VerificationResendThrottled("Verification code was sent recently! Please wait before retrying.")
+
+        return verification_code
+
+    async def verify_challenge(self, account_in_verification: AccountInVerification) -> bool:
+        """
+        Consume the challenge and flag the account as verified in one `DELETE ... RETURNING` round trip.
+
+        Only a failed attempt pays for a second statement, which bumps the attempt counter and tells why it failed.
+        """
+        # The ORM `delete()` refuses to compile inside a CTE, hence the Core table
+        challenge_table = typing.cast(sqlalchemy.Table, VerificationChallenge.__table__)
+        consumed_challenge = (
+            sqlalchemy.delete(table=challenge_table)
+            .where(
+                challenge_table.c.email == account_in_verification.email,
+                challenge_table.c.hashed_code
+                == hash_verification_code(verification_code=account_in_verification.verification_code),
+                challenge_table.c.expires_at > sqlalchemy_functions.now(),
+                challenge_table.c.attempts < settings.VERIFICATION_CODE_MAX_ATTEMPTS,
+            )
+            .returning(challenge_table.c.account_id)
+            .cte(name="consumed_challenge")
+        )
+        verify_stmt = (
+            sqlalchemy.update(table=Account)
+            .where(Account.id == consumed_challenge.c.account_id)
+            .values(is_verified=True, updated_at=sqlalchemy_functions.now())
+            .returning(Account.id)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=verify_stmt)
+            verified_account_id = query.scalar()
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to verify account!")
+
+        if verified_account_id:
+            return True
+
+        await self._register_failed_attempt(email=account_in_verification.email)
+        return False
+
+    async def _register_failed_attempt(self, email: str) -> None:
+        update_stmt = (
+            sqlalchemy.update(table=VerificationChallenge)
+            .where(VerificationChallenge.email == email)
+            .values(attempts=VerificationChallenge.attempts + 1)
+            .returning(VerificationChallenge.attempts, VerificationChallenge.expires_at)
+        )
+
+        try:
+            query = await self.async_session.execute(statement=update_stmt)
+            failed_challenge = query.first()
+            await self.async_session.commit()
+
+        except Exception as e:
+            await self.async_session.rollback()
+            loguru.logger.error(e)
+            raise DatabaseError(error_msg="Failed to register verification attempt!")
+
+        if not failed_challenge:
+            raise VerificationChallengeDoesNotExist("No pending verification for this email! Request a new code.")
+
+        if failed_challenge.expires_at <= datetime.datetime.now(tz=datetime.timezone.utc):
+            raise VerificationChallengeExpired("Verification code has expired! Request a new code.")
+
+        if failed_challenge.attempts > settings.VERIFICATION_CODE_MAX_ATTEMPTS:
+            raise VerificationAttemptsExceeded("Too many wrong verification codes! Request a new code.")
+
+        raise VerificationCodeDoesNotMatch("Verification code does not match!")
+
+    async def purge_expired_challenges(self, batch_size: int) -> int:
+        """
+        Delete expired challenges in batches of `batch_size` so a large backlog never holds one long lock.
+        """
+        purged_challenges = 0
+
+        while True:
+            expired_challenge_ids = (
+                sqlalchemy.select(VerificationChallenge.id)
+                .where(VerificationChallenge.expires_at <= sqlalchemy_functions.now())
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            delete_stmt = sqlalchemy.delete(table=VerificationChallenge).where(
+                VerificationChallenge.id.in_(expired_challenge_ids)
+            )
+
+            try:
+                query = typing.cast(sqlalchemy.CursorResult, await self.async_session.execute(statement=delete_stmt))
+                await self.async_session.commit()
+
+            except Exception as e:
+                await self.async_session.rollback()
+                loguru.logger.error(e)
+                raise DatabaseError(error_msg="Failed to purge expired verification challenges!")
+
+            purged_challenges += query.rowcount
+
+            if query.rowcount < batch_size:
+                return purged_challenges
@@ -1,4 +1,5 @@
 import ssl
+import time
 from functools import lru_cache
 
 import loguru
@@ -9,9 +10,26 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession as SQLAlchemyAsyncSession,
     create_async_engine as create_sqlalchemy_async_engine,
 )
-from sqlalchemy.pool import QueuePool as SQLAlchemyQueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool as SQLAlchemyAsyncAdaptedQueuePool
 
 from src.config.setup import settings
+from src.utility.metrics.definitions import db_pool_wait_seconds
+from src.utility.metrics.request import record_pool_wait
+
+
+class TimedAsyncAdaptedQueuePool(SQLAlchemyAsyncAdaptedQueuePool):
+    """
+    Queue pool that measures how long every checkout waits for a free connection.
+    """
+
+    def _do_get(self):
+        checkout_started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_duration = time.perf_counter() - checkout_started_at
+            db_pool_wait_seconds.observe(pool_wait_duration)
+            record_pool_wait(duration=pool_wait_duration)
 
 
 class Database:
@@ -71,7 +89,7 @@ class Database:
             echo=settings.IS_DB_ECHO_LOG,
             pool_size=settings.DB_POOL_SIZE,
             max_overflow=settings.DB_POOL_OVERFLOW,
-            poolclass=SQLAlchemyQueuePool,
+            poolclass=TimedAsyncAdaptedQueuePool,
             connect_args={"ssl": ssl_context},
         )
 
@@ -1,12 +1,19 @@
+import time
+import typing
+
 import fastapi
 import loguru
 from sqlalchemy import event
 from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_connection as AsyncPGConnection
+from sqlalchemy.engine import Connection as SQLAlchemyConnection, ExecutionContext as SQLAlchemyExecutionContext
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.pool.base import _ConnectionRecord as ConnectionRecord
 
 from src.repository.base import DBBaseTable
 from src.repository.database import db
+from src.repository.profiler import query_profiler
+from src.utility.metrics.definitions import db_statement_duration_seconds
+from src.utility.metrics.request import record_statement
 
 
 @event.listens_for(target=db.async_engine.sync_engine, identifier="connect")
@@ -21,6 +28,35 @@ def inspect_db_server_on_close(db_api_connection: AsyncPGConnection, connection_
     loguru.logger.info(f"Closed Connection Record ---\n {connection_record}")
 
 
+@event.listens_for(target=db.async_engine.sync_engine, identifier="before_cursor_execute")
+def start_statement_timer(
+    connection: SQLAlchemyConnection,
+    cursor: typing.Any,
+    statement: str,
+    parameters: typing.Any,
+    context: SQLAlchemyExecutionContext,
+    executemany: bool,
+) -> None:
+    context._statement_started_at = time.perf_counter()  # type: ignore
+
+
+@event.listens_for(target=db.async_engine.sync_engine, identifier="after_cursor_execute")
+def stop_statement_timer(
+    connection: SQLAlchemyConnection,
+    cursor: typing.Any,
+    statement: str,
+    parameters: typing.Any,
+    context: SQLAlchemyExecutionContext,
+    executemany: bool,
+) -> None:
+    statement_duration = time.perf_counter() - context._statement_started_at  # type: ignore
+    db_statement_duration_seconds.observe(statement_duration)
+    record_statement(duration=statement_duration)
+    query_profiler.inspect_statement(
+        statement=statement, parameters=parameters, duration=statement_duration, executemany=executemany
+    )
+
+
 async def initialize_db_tables(connection: AsyncConnection) -> None:
     loguru.logger.info("Database Table Creation --- Initializing . . .")
 
@@ -0,0 +1,84 @@
+"""Create account, profile and pokemon_image
+
+Revision ID: 2a7e4c9d1b08
+Revises:
+Create Date: 2026-10-19 09:02:15.407316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2a7e4c9d1b08"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The tables as they were before any revision existed. Databases whose tables were created by
+    # `metadata.create_all` already have them, hence `if_not_exists`; later revisions bring them up to date.
+    op.create_table(
+        "account",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("username", sa.String(length=64), nullable=False),
+        sa.Column("email", sa.String(length=64), nullable=False),
+        sa.Column("_hashed_password", sa.String(length=1024), nullable=False),
+        sa.Column("_hashed_salt", sa.String(length=1024), nullable=False),
+        sa.Column("is_admin", sa.Boolean(), nullable=True),
+        sa.Column("is_logged_in", sa.Boolean(), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=True),
+        sa.Column("verification_code", sa.Integer(), nullable=False),
+        sa.Column("is_otp_enabled", sa.Boolean(), nullable=True),
+        sa.Column("is_otp_verified", sa.Boolean(), nullable=True),
+        sa.Column("otp_secret", sa.String(length=64), nullable=True),
+        sa.Column("otp_auth_url", sa.String(length=256), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("credentials_validated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+        sa.UniqueConstraint("username"),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "profile",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("first_name", sa.String(length=64), nullable=True),
+        sa.Column("last_name", sa.String(length=64), nullable=True),
+        sa.Column("photo", sa.String(length=248), nullable=True),
+        sa.Column("win", sa.Integer(), nullable=False),
+        sa.Column("loss", sa.Integer(), nullable=False),
+        sa.Column("mmr", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["account_id"], ["account.id"], name="profile_account_id_fkey"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("account_id"),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "pokemon_image",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("file_name", sa.String(length=124), nullable=False),
+        sa.Column("name", sa.String(length=124), nullable=False),
+        sa.Column("nickname", sa.String(length=124), nullable=False),
+        sa.Column("correct_predicted", sa.Integer(), nullable=False),
+        sa.Column("wrong_predicted", sa.Integer(), nullable=False),
+        sa.Column("loss", sa.Integer(), nullable=False),
+        sa.Column("win", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("profile_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["profile_id"], ["profile.id"], name="pokemon_image_profile_id_fkey"),
+        sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("pokemon_image")
+    op.drop_table("profile")
+    op.drop_table("account")
@@ -0,0 +1,49 @@
+"""Add verification_challenge
+
+Revision ID: 4d8c1f6a9e25
+Revises: 2a7e4c9d1b08
+Create Date: 2026-10-19 09:31:48.220953
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4d8c1f6a9e25"
+down_revision = "2a7e4c9d1b08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "verification_challenge",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(length=64), nullable=False),
+        sa.Column("hashed_code", sa.String(length=64), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("resend_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_sent_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["account_id"], ["account.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("account_id"),
+        sa.UniqueConstraint("email"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_verification_challenge_expires_at", "verification_challenge", ["expires_at"], if_not_exists=True
+    )
+    # Pending codes are not carried over: their accounts simply request a new one. `metadata.create_all` never
+    # alters `account`, so the column has to go here or every signup fails on its `NOT NULL`.
+    op.drop_column("account", "verification_code", if_exists=True)
+
+
+def downgrade() -> None:
+    op.add_column("account", sa.Column("verification_code", sa.Integer(), server_default="0", nullable=False))
+    op.alter_column("account", "verification_code", server_default=None)
+    op.drop_index("ix_verification_challenge_expires_at", table_name="verification_challenge")
+    op.drop_table("verification_challenge")
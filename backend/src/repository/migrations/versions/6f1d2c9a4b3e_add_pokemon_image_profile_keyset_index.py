@@ -0,0 +1,40 @@
+"""Add pokemon_image profile keyset index
+
+Revision ID: 6f1d2c9a4b3e
+Revises: b6e0f3a8d472
+Create Date: 2026-10-19 10:12:44.518230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6f1d2c9a4b3e"
+down_revision = "b6e0f3a8d472"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # `CONCURRENTLY` cannot run inside a transaction; it builds the index without blocking uploads on a live table.
+    # Databases whose tables were created by `metadata.create_all` already have it, hence `if_not_exists`.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pokemon_image_profile_id_created_at_id",
+            "pokemon_image",
+            ["profile_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_pokemon_image_profile_id_created_at_id",
+            table_name="pokemon_image",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,29 @@
+"""Add pokemon_image content
+
+Revision ID: 7e3b5a0c2f94
+Revises: 4d8c1f6a9e25
+Create Date: 2026-10-19 11:40:26.715089
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7e3b5a0c2f94"
+down_revision = "4d8c1f6a9e25"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable, so images stored before streamed uploads keep working without their bytes being hashed
+    op.add_column("pokemon_image", sa.Column("content_hash", sa.String(length=64), nullable=True), if_not_exists=True)
+    op.add_column("pokemon_image", sa.Column("content_type", sa.String(length=32), nullable=True), if_not_exists=True)
+    op.add_column("pokemon_image", sa.Column("size", sa.BigInteger(), nullable=True), if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_column("pokemon_image", "size")
+    op.drop_column("pokemon_image", "content_type")
+    op.drop_column("pokemon_image", "content_hash")
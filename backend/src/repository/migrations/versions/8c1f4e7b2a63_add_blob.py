@@ -0,0 +1,68 @@
+"""Add blob
+
+Revision ID: 8c1f4e7b2a63
+Revises: 7e3b5a0c2f94
+Create Date: 2026-10-19 12:08:53.391264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.config.setup import settings
+
+
+# revision identifiers, used by Alembic.
+revision = "8c1f4e7b2a63"
+down_revision = "7e3b5a0c2f94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "blob",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("storage_key", sa.String(length=256), nullable=False),
+        sa.Column("content_type", sa.String(length=32), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("released_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("ref_count >= 0", name="blob_ref_count_non_negative"),
+        sa.PrimaryKeyConstraint("sha256"),
+        if_not_exists=True,
+    )
+    op.create_index("ix_blob_released_at", "blob", ["released_at"], if_not_exists=True)
+
+    # Images uploaded before blobs existed were stored under their own file name; the first one of every content
+    # becomes its blob, referenced by all of them, so the foreign key below holds
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO blob (sha256, storage_key, content_type, size, ref_count)
+            SELECT content_hash, :storage_dir || '/' || min(file_name), min(content_type), min(size), count(*)
+            FROM pokemon_image
+            WHERE content_hash IS NOT NULL
+            GROUP BY content_hash
+            ON CONFLICT (sha256) DO NOTHING
+            """
+        ).bindparams(storage_dir=settings.POKEMON_IMAGE_STORAGE_DIR)
+    )
+    op.create_index("ix_pokemon_image_content_hash", "pokemon_image", ["content_hash"], if_not_exists=True)
+    # `ADD CONSTRAINT` has no `IF NOT EXISTS`; databases created by `metadata.create_all` already have the key
+    op.execute(
+        """
+        DO $$ BEGIN
+            ALTER TABLE pokemon_image ADD CONSTRAINT pokemon_image_content_hash_fkey
+                FOREIGN KEY (content_hash) REFERENCES blob (sha256);
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("pokemon_image_content_hash_fkey", "pokemon_image", type_="foreignkey")
+    op.drop_index("ix_pokemon_image_content_hash", table_name="pokemon_image")
+    op.drop_index("ix_blob_released_at", table_name="blob")
+    op.drop_table("blob")
@@ -0,0 +1,30 @@
+"""Add blob master
+
+Revision ID: 9b4e7a1c2d5f
+Revises: 6f1d2c9a4b3e
+Create Date: 2026-10-19 13:41:07.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9b4e7a1c2d5f"
+down_revision = "6f1d2c9a4b3e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable without a default, so adding them is a catalog-only change; existing blobs keep serving the original.
+    # Databases whose tables were created by `metadata.create_all` already have them, hence `if_not_exists`.
+    op.add_column("blob", sa.Column("master_storage_key", sa.String(length=256), nullable=True), if_not_exists=True)
+    op.add_column("blob", sa.Column("width", sa.Integer(), nullable=True), if_not_exists=True)
+    op.add_column("blob", sa.Column("height", sa.Integer(), nullable=True), if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_column("blob", "height")
+    op.drop_column("blob", "width")
+    op.drop_column("blob", "master_storage_key")
@@ -0,0 +1,25 @@
+"""Add blob perceptual_hash
+
+Revision ID: a4d9e2c6b105
+Revises: 8c1f4e7b2a63
+Create Date: 2026-10-19 12:37:10.582417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a4d9e2c6b105"
+down_revision = "8c1f4e7b2a63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Blobs stored before it existed stay without one and are simply not found as near-duplicates
+    op.add_column("blob", sa.Column("perceptual_hash", sa.BigInteger(), nullable=True), if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_column("blob", "perceptual_hash")
@@ -0,0 +1,41 @@
+"""Add pokemon_image_variant
+
+Revision ID: b6e0f3a8d472
+Revises: a4d9e2c6b105
+Create Date: 2026-10-19 13:05:32.864150
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b6e0f3a8d472"
+down_revision = "a4d9e2c6b105"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pokemon_image_variant",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("variant", sa.String(length=32), nullable=False),
+        sa.Column("format", sa.String(length=8), nullable=False),
+        sa.Column("storage_key", sa.String(length=256), nullable=False),
+        sa.Column("content_type", sa.String(length=32), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=False),
+        sa.Column("height", sa.Integer(), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["content_hash"], ["blob.sha256"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        # `create_variant()` upserts on it
+        sa.UniqueConstraint("content_hash", "variant", "format", name="pokemon_image_variant_unique"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("pokemon_image_variant")
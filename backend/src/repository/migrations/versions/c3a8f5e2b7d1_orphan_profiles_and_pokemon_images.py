@@ -0,0 +1,39 @@
+"""Orphan profiles and pokemon images on delete
+
+Revision ID: c3a8f5e2b7d1
+Revises: 9b4e7a1c2d5f
+Create Date: 2026-10-19 15:02:36.118472
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c3a8f5e2b7d1"
+down_revision = "9b4e7a1c2d5f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("profile", "account_id", existing_type=sa.UUID(), nullable=True)
+    op.drop_constraint("profile_account_id_fkey", "profile", type_="foreignkey")
+    op.create_foreign_key("profile_account_id_fkey", "profile", "account", ["account_id"], ["id"], ondelete="SET NULL")
+
+    op.alter_column("pokemon_image", "profile_id", existing_type=sa.UUID(), nullable=True)
+    op.drop_constraint("pokemon_image_profile_id_fkey", "pokemon_image", type_="foreignkey")
+    op.create_foreign_key(
+        "pokemon_image_profile_id_fkey", "pokemon_image", "profile", ["profile_id"], ["id"], ondelete="SET NULL"
+    )
+
+
+def downgrade() -> None:
+    # Orphans have to be collected first, the columns cannot become `NOT NULL` while they hold `NULL`
+    op.drop_constraint("pokemon_image_profile_id_fkey", "pokemon_image", type_="foreignkey")
+    op.create_foreign_key("pokemon_image_profile_id_fkey", "pokemon_image", "profile", ["profile_id"], ["id"])
+    op.alter_column("pokemon_image", "profile_id", existing_type=sa.UUID(), nullable=False)
+
+    op.drop_constraint("profile_account_id_fkey", "profile", type_="foreignkey")
+    op.create_foreign_key("profile_account_id_fkey", "profile", "account", ["account_id"], ["id"])
+    op.alter_column("profile", "account_id", existing_type=sa.UUID(), nullable=False)
@@ -0,0 +1,42 @@
+"""Add prediction
+
+Revision ID: e5b1d8a3c7f2
+Revises: c3a8f5e2b7d1
+Create Date: 2026-10-19 17:24:51.630918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5b1d8a3c7f2"
+down_revision = "c3a8f5e2b7d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The app creates missing tables at startup, so it may already exist
+    op.create_table(
+        "prediction",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("model_name", sa.String(length=124), nullable=False),
+        sa.Column("model_version", sa.String(length=64), nullable=False),
+        sa.Column("label", sa.String(length=124), nullable=False),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["content_hash"], ["blob.sha256"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("content_hash", "model_name", "model_version", name="prediction_unique"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_prediction_model_name_model_version", "prediction", ["model_name", "model_version"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_prediction_model_name_model_version", table_name="prediction")
+    op.drop_table("prediction")
@@ -0,0 +1,103 @@
+import contextvars
+import functools
+import typing
+
+import loguru
+
+from src.config.setup import settings
+from src.utility.metrics.request import current_request_stats
+
+current_repository_method: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_repository_method", default=None
+)
+
+RequestObserver = typing.Callable[[str, str, int], None]
+
+
+def profile_repository_method(method_name: str, method: typing.Callable) -> typing.Callable:
+    """
+    Tag every SQL statement issued while `method` runs with its `Repository.method` name.
+
+    SQLAlchemy runs the cursor in a greenlet that has no Python frames of the calling coroutine, so the caller cannot
+    be found by walking the stack; the `ContextVar` however is copied into the greenlet.
+    """
+
+    @functools.wraps(method)
+    async def _profiled_method(*args, **kwargs):
+        method_token = current_repository_method.set(method_name)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            current_repository_method.reset(method_token)
+
+    return _profiled_method
+
+
+def get_parameter_shape(parameters: typing.Any, executemany: bool = False) -> str:
+    """
+    Describe bound parameters by their types only, so the log shows the query shape without leaking values.
+    """
+    if executemany and isinstance(parameters, (list, tuple)) and parameters:
+        return f"{len(parameters)} x {get_parameter_shape(parameters=parameters[0])}"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+class QueryProfiler:
+    def __init__(self, slow_query_threshold: float, n_plus_one_threshold: int, is_enabled: bool = True) -> None:
+        self.slow_query_threshold = slow_query_threshold
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.is_enabled = is_enabled
+        self._request_observers: list[RequestObserver] = list()
+
+    def inspect_statement(self, statement: str, parameters: typing.Any, duration: float, executemany: bool) -> None:
+        if not self.is_enabled:
+            return
+
+        if duration >= self.slow_query_threshold:
+            loguru.logger.warning(
+                "Slow Query --- {duration:.1f} ms in {method} | params {shape} | {statement}",
+                duration=duration * 1000,
+                method=current_repository_method.get() or "<outside repository>",
+                shape=get_parameter_shape(parameters=parameters, executemany=executemany),
+                statement=" ".join(statement.split())[:1000],
+            )
+
+        request_stats = current_request_stats.get()
+        if request_stats is None:
+            return
+
+        statement_count = request_stats.statement_counts.get(statement, 0) + 1
+        request_stats.statement_counts[statement] = statement_count
+        if statement_count == self.n_plus_one_threshold:
+            loguru.logger.warning(
+                "N+1 Query Suspected --- same statement executed {count} times in {route} from {method} | {statement}",
+                count=statement_count,
+                route=request_stats.route,
+                method=current_repository_method.get() or "<outside repository>",
+                statement=" ".join(statement.split())[:1000],
+            )
+
+    def add_request_observer(self, observer: RequestObserver) -> None:
+        self._request_observers.append(observer)
+
+    def remove_request_observer(self, observer: RequestObserver) -> None:
+        self._request_observers.remove(observer)
+
+    def notify_request_completed(self, method: str, route: str, statement_count: int) -> None:
+        for observer in self._request_observers:
+            observer(method, route, statement_count)
+
+
+def get_query_profiler() -> QueryProfiler:
+    return QueryProfiler(
+        slow_query_threshold=settings.DB_SLOW_QUERY_THRESHOLD_MS / 1000,
+        n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD,
+        is_enabled=settings.IS_DB_QUERY_PROFILER_ENABLED,
+    )
+
+
+query_profiler: QueryProfiler = get_query_profiler()
@@ -0,0 +1,17 @@
+import hashlib
+import hmac
+import secrets
+
+from src.config.setup import settings
+
+
+def generate_verification_code() -> int:
+    return secrets.randbelow(900000) + 100000
+
+
+def hash_verification_code(verification_code: int) -> str:
+    return hmac.new(
+        key=settings.JWT_SECRET_KEY.get_secret_value().encode(),
+        msg=str(verification_code).encode(),
+        digestmod=hashlib.sha256,
+    ).hexdigest()
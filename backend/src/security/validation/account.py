@@ -0,0 +1,41 @@
+import loguru
+from password_strength import PasswordPolicy
+
+from src.config.setup import settings
+from src.security.validation.bloom_filter import BloomFilter, normalize_password
+
+MIN_USERNAME_LENGTH: int = 4
+
+PASSWORD_POLICY: PasswordPolicy = PasswordPolicy.from_names(
+    length=8,
+    uppercase=1,
+    numbers=1,
+    special=1,
+)
+
+
+def get_breached_password_filter() -> BloomFilter | None:
+    if not settings.IS_BREACHED_PASSWORD_CHECK_ENABLED:
+        return None
+
+    try:
+        return BloomFilter.load(path=settings.BREACHED_PASSWORD_FILTER_PATH)
+
+    except (OSError, ValueError) as e:
+        loguru.logger.error(f"Breached Password Filter --- Not Loaded! Check disabled: {e}")
+        return None
+
+
+breached_password_filter: BloomFilter | None = get_breached_password_filter()
+
+
+def is_password_strong(password: str) -> bool:
+    return not PASSWORD_POLICY.test(password)
+
+
+def is_password_breached(password: str) -> bool:
+    return breached_password_filter is not None and normalize_password(password=password) in breached_password_filter
+
+
+def is_username_long_enough(username: str) -> bool:
+    return len(username) >= MIN_USERNAME_LENGTH
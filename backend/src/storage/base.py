@@ -0,0 +1,99 @@
+import datetime
+import pathlib
+import typing
+
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+
+async def iterate_content(content: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> typing.AsyncIterator[bytes]:
+    """
+    Feed bytes that are already in memory to `BaseStorage.put()`.
+    """
+    for offset in range(0, len(content), chunk_size):
+        yield content[offset : offset + chunk_size]
+
+
+class StoredObject:
+    __slots__ = ("key", "size", "content_type", "last_modified")
+
+    def __init__(
+        self, key: str, size: int, content_type: str | None, last_modified: datetime.datetime | None = None
+    ) -> None:
+        self.key = key
+        self.size = size
+        self.content_type = content_type
+        self.last_modified = last_modified
+
+
+class BaseStorage:
+    """
+    Object storage interface; keys are `/` separated paths relative to the storage root.
+
+    Every backend streams: `put()` consumes an async iterator of chunks and `get()` yields chunks, so neither side
+    holds a whole object in memory. Missing objects raise `StorageObjectDoesNotExist`.
+    """
+
+    async def put(self, key: str, chunks: typing.AsyncIterable[bytes], content_type: str | None = None) -> int:
+        """
+        Stream `chunks` into `key` and return the number of bytes written. The object only becomes visible once
+        every chunk was written, so a failed upload never leaves a partial object behind.
+        """
+        raise NotImplementedError
+
+    def get(self, key: str, start: int = 0, end: int | None = None) -> typing.AsyncIterator[bytes]:
+        """
+        Yield the bytes of `key` in `[start, end]` (inclusive, like an HTTP `Range`); `end=None` reads to the end.
+        """
+        raise NotImplementedError
+
+    async def stat(self, key: str) -> StoredObject:
+        raise NotImplementedError
+
+    def list_objects(self, prefix: str) -> typing.AsyncIterator[StoredObject]:
+        """
+        Yield every object whose key starts with `prefix`, in no particular order; the listing is paged, so it never
+        sits in memory as a whole.
+        """
+        raise NotImplementedError
+
+    async def move(self, source_key: str, destination_key: str) -> None:
+        """
+        Rename `source_key` to `destination_key`, replacing any object already stored there.
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """
+        Delete `key`; deleting a missing object is not an error.
+        """
+        raise NotImplementedError
+
+    async def presigned_url(self, key: str, expires_in: int, method: str = "GET") -> str:
+        """
+        Return a URL granting `method` on `key` without credentials for `expires_in` seconds.
+        """
+        raise NotImplementedError
+
+    def get_local_path(self, key: str) -> pathlib.Path | None:
+        """
+        Return the filesystem path of `key` when the backend keeps objects on a local disk, which lets responses use
+        zero-copy `sendfile`; remote backends return `None`.
+        """
+        return None
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await self.stat(key=key)
+        except StorageObjectDoesNotExist:
+            return False
+        return True
+
+    async def read(self, key: str) -> bytes:
+        return b"".join([chunk async for chunk in self.get(key=key)])
+
+    async def close(self) -> None:
+        """
+        Release pooled connections, called once at shutdown.
+        """
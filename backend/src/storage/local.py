@@ -0,0 +1,158 @@
+import asyncio
+import datetime
+import hashlib
+import hmac
+import os
+import pathlib
+import time
+import typing
+import urllib.parse
+import uuid
+
+from src.config.setup import settings
+from src.storage.base import BaseStorage, DEFAULT_CHUNK_SIZE, StoredObject
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+
+
+class LocalStorage(BaseStorage):
+    """
+    Filesystem backend. Chunks are written to a temporary sibling file off the event loop and renamed into place.
+
+    The filesystem keeps no content type, so `stat()` reports `None`; callers keep the type next to the key.
+    Presigned URLs are HMAC-signed paths under `base_url`, checked with `verify_presigned_url()`.
+    """
+
+    def __init__(
+        self, root_dir: pathlib.Path | str, base_url: str, signing_key: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        self.root_dir = pathlib.Path(root_dir).resolve()
+        self.base_url = base_url.rstrip("/")
+        self.chunk_size = chunk_size
+        self._signing_key = signing_key
+
+    def _resolve_path(self, key: str) -> pathlib.Path:
+        path = (self.root_dir / key).resolve()
+        if not path.is_relative_to(self.root_dir):
+            raise ValueError(f"Storage key `{key}` escapes the storage root!")
+        return path
+
+    def get_local_path(self, key: str) -> pathlib.Path | None:
+        return self._resolve_path(key=key)
+
+    async def put(self, key: str, chunks: typing.AsyncIterable[bytes], content_type: str | None = None) -> int:
+        path = self._resolve_path(key=key)
+        temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+
+        written_bytes = 0
+        storage_file = await asyncio.to_thread(open, temporary_path, "wb")
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(storage_file.write, chunk)
+                written_bytes += len(chunk)
+            await asyncio.to_thread(storage_file.close)
+            await asyncio.to_thread(os.replace, temporary_path, path)
+
+        except BaseException:
+            await asyncio.to_thread(storage_file.close)
+            await asyncio.to_thread(temporary_path.unlink, missing_ok=True)
+            raise
+
+        return written_bytes
+
+    async def get(self, key: str, start: int = 0, end: int | None = None) -> typing.AsyncIterator[bytes]:
+        try:
+            storage_file = await asyncio.to_thread(open, self._resolve_path(key=key), "rb")
+        except FileNotFoundError as e:
+            raise StorageObjectDoesNotExist(f"Storage object `{key}` does not exist!") from e
+
+        try:
+            await asyncio.to_thread(storage_file.seek, start)
+            remaining_bytes = None if end is None else end - start + 1
+            while remaining_bytes is None or remaining_bytes > 0:
+                read_size = self.chunk_size if remaining_bytes is None else min(self.chunk_size, remaining_bytes)
+                chunk = await asyncio.to_thread(storage_file.read, read_size)
+                if not chunk:
+                    return
+                if remaining_bytes is not None:
+                    remaining_bytes -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(storage_file.close)
+
+    async def stat(self, key: str) -> StoredObject:
+        try:
+            file_stat = await asyncio.to_thread(os.stat, self._resolve_path(key=key))
+        except FileNotFoundError as e:
+            raise StorageObjectDoesNotExist(f"Storage object `{key}` does not exist!") from e
+
+        return StoredObject(
+            key=key,
+            size=file_stat.st_size,
+            content_type=None,
+            last_modified=datetime.datetime.fromtimestamp(file_stat.st_mtime, tz=datetime.timezone.utc),
+        )
+
+    @staticmethod
+    def _scan_directory(path: pathlib.Path) -> list[tuple[str, os.stat_result | None]]:
+        """
+        Return `(path, stat)` of every file below `path`, or `(path, None)` for its subdirectories.
+        """
+        try:
+            with os.scandir(path) as entries:
+                return [
+                    (entry.path, None if entry.is_dir(follow_symlinks=False) else entry.stat(follow_symlinks=False))
+                    for entry in entries
+                    # Temporary files of puts still in flight
+                    if not (entry.name.startswith(".") and entry.name.endswith(".part"))
+                ]
+        except FileNotFoundError:
+            return []
+
+    async def list_objects(self, prefix: str) -> typing.AsyncIterator[StoredObject]:
+        pending_directories = [self._resolve_path(key=prefix.rpartition("/")[0])]
+        while pending_directories:
+            for path, file_stat in await asyncio.to_thread(self._scan_directory, pending_directories.pop()):
+                if file_stat is None:
+                    pending_directories.append(pathlib.Path(path))
+                    continue
+                key = pathlib.Path(path).relative_to(self.root_dir).as_posix()
+                if key.startswith(prefix):
+                    yield StoredObject(
+                        key=key,
+                        size=file_stat.st_size,
+                        content_type=None,
+                        last_modified=datetime.datetime.fromtimestamp(file_stat.st_mtime, tz=datetime.timezone.utc),
+                    )
+
+    async def move(self, source_key: str, destination_key: str) -> None:
+        destination_path = self._resolve_path(key=destination_key)
+        await asyncio.to_thread(destination_path.parent.mkdir, parents=True, exist_ok=True)
+        try:
+            await asyncio.to_thread(os.replace, self._resolve_path(key=source_key), destination_path)
+        except FileNotFoundError as e:
+            raise StorageObjectDoesNotExist(f"Storage object `{source_key}` does not exist!") from e
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._resolve_path(key=key).unlink, missing_ok=True)
+
+    def _sign(self, key: str, method: str, expires_at: int) -> str:
+        return hmac.new(
+            key=self._signing_key, msg=f"{method}\n{key}\n{expires_at}".encode(), digestmod=hashlib.sha256
+        ).hexdigest()
+
+    async def presigned_url(self, key: str, expires_in: int, method: str = "GET") -> str:
+        expires_at = int(time.time()) + expires_in
+        query = urllib.parse.urlencode(
+            {
+                "method": method,
+                "expires": expires_at,
+                "signature": self._sign(key=key, method=method, expires_at=expires_at),
+            }
+        )
+        return f"{self.base_url}/{urllib.parse.quote(key)}?{query}"
+
+    def verify_presigned_url(self, key: str, method: str, expires_at: int, signature: str) -> bool:
+        if expires_at < time.time():
+            return False
+        return hmac.compare_digest(self._sign(key=key, method=method, expires_at=expires_at), signature)
@@ -0,0 +1,62 @@
+import datetime
+import typing
+
+from src.storage.base import BaseStorage, DEFAULT_CHUNK_SIZE, StoredObject
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+
+
+class MemoryStorage(BaseStorage):
+    """
+    In-process backend for tests; objects live in a dict and presigned URLs use the `memory://` scheme.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self.objects: dict[str, tuple[bytes, StoredObject]] = dict()
+
+    async def put(self, key: str, chunks: typing.AsyncIterable[bytes], content_type: str | None = None) -> int:
+        data = bytearray()
+        async for chunk in chunks:
+            data.extend(chunk)
+        self.objects[key] = (
+            bytes(data),
+            StoredObject(
+                key=key,
+                size=len(data),
+                content_type=content_type,
+                last_modified=datetime.datetime.now(tz=datetime.timezone.utc),
+            ),
+        )
+        return len(data)
+
+    async def get(self, key: str, start: int = 0, end: int | None = None) -> typing.AsyncIterator[bytes]:
+        if key not in self.objects:
+            raise StorageObjectDoesNotExist(f"Storage object `{key}` does not exist!")
+
+        data = memoryview(self.objects[key][0])[start : None if end is None else end + 1]
+        for offset in range(0, len(data), self.chunk_size):
+            yield bytes(data[offset : offset + self.chunk_size])
+
+    async def stat(self, key: str) -> StoredObject:
+        if key not in self.objects:
+            raise StorageObjectDoesNotExist(f"Storage object `{key}` does not exist!")
+        return self.objects[key][1]
+
+    async def list_objects(self, prefix: str) -> typing.AsyncIterator[StoredObject]:
+        for key, (_, stored_object) in list(self.objects.items()):
+            if key.startswith(prefix):
+                yield stored_object
+
+    async def move(self, source_key: str, destination_key: str) -> None:
+        if source_key not in self.objects:
+            raise StorageObjectDoesNotExist(f"Storage object `{source_key}` does not exist!")
+
+        data, stored_object = self.objects.pop(source_key)
+        stored_object.key = destination_key
+        self.objects[destination_key] = (data, stored_object)
+
+    async def delete(self, key: str) -> None:
+        self.objects.pop(key, None)
+
+    async def presigned_url(self, key: str, expires_in: int, method: str = "GET") -> str:
+        return f"memory://{key}?method={method}&expires_in={expires_in}"
@@ -0,0 +1,218 @@
+import asyncio
+import typing
+
+import boto3
+import botocore.config
+import botocore.exceptions
+
+from src.storage.base import BaseStorage, DEFAULT_CHUNK_SIZE, StoredObject
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+
+MIN_MULTIPART_PART_SIZE: int = 5 * 1024 * 1024
+MISSING_OBJECT_ERROR_CODES: frozenset[str] = frozenset({"404", "NoSuchKey", "NotFound"})
+PRESIGNED_CLIENT_METHODS: dict[str, str] = {"GET": "get_object", "PUT": "put_object", "DELETE": "delete_object"}
+
+
+class S3Storage(BaseStorage):
+    """
+    S3 backend over one shared, thread-safe boto3 client whose urllib3 pool keeps up to `max_pool_connections`
+    connections alive across requests. Blocking calls run in the default executor via `asyncio.to_thread()`.
+
+    Uploads up to `part_size` go out as a single `PutObject`. Larger ones become a multipart upload with up to
+    `max_concurrency` parts in flight, so memory per upload is bounded by `(max_concurrency + 1) * part_size`
+    regardless of the object size.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        region_name: str,
+        access_key: str,
+        secret_access_key: str,
+        endpoint_url: str | None = None,
+        max_pool_connections: int = 32,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.bucket = bucket
+        self.part_size = max(part_size, MIN_MULTIPART_PART_SIZE)
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self._client = boto3.session.Session().client(
+            "s3",
+            region_name=region_name,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_access_key,
+            endpoint_url=endpoint_url or None,
+            config=botocore.config.Config(max_pool_connections=max_pool_connections, retries={"mode": "standard"}),
+        )
+
+    @staticmethod
+    def _is_missing_object(error: botocore.exceptions.ClientError) -> bool:
+        return error.response.get("Error", {}).get("Code") in MISSING_OBJECT_ERROR_CODES
+
+    async def _upload_part(
+        self, key: str, upload_id: str, part_number: int, body: bytes, in_flight: asyncio.Semaphore
+    ) -> dict:
+        try:
+            response = await asyncio.to_thread(
+                self._client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+        finally:
+            in_flight.release()
+
+    async def put(self, key: str, chunks: typing.AsyncIterable[bytes], content_type: str | None = None) -> int:
+        extra_arguments = {"ContentType": content_type} if content_type else {}
+        buffer = bytearray()
+        written_bytes = 0
+        upload_id: str | None = None
+        part_uploads: list[asyncio.Task] = list()
+        in_flight = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                written_bytes += len(chunk)
+                if len(buffer) < self.part_size:
+                    continue
+
+                if upload_id is None:
+                    multipart_upload = await asyncio.to_thread(
+                        self._client.create_multipart_upload, Bucket=self.bucket, Key=key, **extra_arguments
+                    )
+                    upload_id = multipart_upload["UploadId"]
+                await in_flight.acquire()
+                part_uploads.append(
+                    asyncio.create_task(
+                        self._upload_part(
+                            key=key,
+                            upload_id=upload_id,  # type: ignore
+                            part_number=len(part_uploads) + 1,
+                            body=bytes(buffer),
+                            in_flight=in_flight,
+                        )
+                    )
+                )
+                buffer = bytearray()
+
+            if upload_id is None:
+                await asyncio.to_thread(
+                    self._client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer), **extra_arguments
+                )
+                return written_bytes
+
+            if buffer:
+                await in_flight.acquire()
+                part_uploads.append(
+                    asyncio.create_task(
+                        self._upload_part(
+                            key=key,
+                            upload_id=upload_id,
+                            part_number=len(part_uploads) + 1,
+                            body=bytes(buffer),
+                            in_flight=in_flight,
+                        )
+                    )
+                )
+            parts = await asyncio.gather(*part_uploads)
+            await asyncio.to_thread(
+                self._client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+
+        except BaseException:
+            for part_upload in part_uploads:
+                part_upload.cancel()
+            await asyncio.gather(*part_uploads, return_exceptions=True)
+            if upload_id is not None:
+                await asyncio.to_thread(
+                    self._client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
+            raise
+
+        return written_bytes
+
+    async def get(self, key: str, start: int = 0, end: int | None = None) -> typing.AsyncIterator[bytes]:
+        range_argument = {"Range": f"bytes={start}-{'' if end is None else end}"} if start or end is not None else {}
+        try:
+            response = await asyncio.to_thread(self._client.get_object, Bucket=self.bucket, Key=key, **range_argument)
+        except botocore.exceptions.ClientError as e:
+            if self._is_missing_object(error=e):
+                raise StorageObjectDoesNotExist(f"Storage object `{key}` does not exist!") from e
+            raise
+
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, self.chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def stat(self, key: str) -> StoredObject:
+        try:
+            response = await asyncio.to_thread(self._client.head_object, Bucket=self.bucket, Key=key)
+        except botocore.exceptions.ClientError as e:
+            if self._is_missing_object(error=e):
+                raise StorageObjectDoesNotExist(f"Storage object `{key}` does not exist!") from e
+            raise
+
+        return StoredObject(
+            key=key,
+            size=response["ContentLength"],
+            content_type=response.get("ContentType"),
+            last_modified=response.get("LastModified"),
+        )
+
+    async def list_objects(self, prefix: str) -> typing.AsyncIterator[StoredObject]:
+        list_arguments: dict = {"Bucket": self.bucket, "Prefix": prefix}
+        while True:
+            response = await asyncio.to_thread(self._client.list_objects_v2, **list_arguments)
+            for listed_object in response.get("Contents", []):
+                yield StoredObject(
+                    key=listed_object["Key"],
+                    size=listed_object["Size"],
+                    content_type=None,
+                    last_modified=listed_object.get("LastModified"),
+                )
+            if not response.get("IsTruncated"):
+                return
+            list_arguments["ContinuationToken"] = response["NextContinuationToken"]
+
+    async def move(self, source_key: str, destination_key: str) -> None:
+        # S3 has no rename; the server-side copy never sends the bytes through this process
+        try:
+            await asyncio.to_thread(
+                self._client.copy_object,
+                Bucket=self.bucket,
+                Key=destination_key,
+                CopySource={"Bucket": self.bucket, "Key": source_key},
+            )
+        except botocore.exceptions.ClientError as e:
+            if self._is_missing_object(error=e):
+                raise StorageObjectDoesNotExist(f"Storage object `{source_key}` does not exist!") from e
+            raise
+        await self.delete(key=source_key)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._client.delete_object, Bucket=self.bucket, Key=key)
+
+    async def presigned_url(self, key: str, expires_in: int, method: str = "GET") -> str:
+        # Signing is local computation, no request is sent
+        return self._client.generate_presigned_url(
+            ClientMethod=PRESIGNED_CLIENT_METHODS[method],
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=expires_in,
+        )
+
+    async def close(self) -> None:
+        self._client.close()
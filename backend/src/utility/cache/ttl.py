@@ -0,0 +1,64 @@
+import collections
+import threading
+import time
+import typing
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class TTLCache(typing.Generic[K, V]):
+    """
+    Bounded in-process cache whose entries expire `ttl` seconds after they were set; the least recently used entry
+    is evicted once `max_size` is reached.
+
+    Every worker holds its own copy, so writers invalidate what they change locally and the TTL bounds how long
+    other workers may serve a stale value.
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: typing.Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: collections.OrderedDict[K, tuple[float, V]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: typing.Callable[[K], bool]) -> int:
+        """
+        Drop every entry whose key matches `predicate`; scans the whole cache, so meant for rare bulk invalidations.
+        """
+        with self._lock:
+            stale_keys = [key for key in self._entries if predicate(key)]
+            for key in stale_keys:
+                del self._entries[key]
+        return len(stale_keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,50 @@
+import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+import typing
+
+import loguru
+
+from src.config.setup import settings
+
+T = typing.TypeVar("T")
+
+
+class ProcessPool:
+    """
+    Lazily started process pool for CPU-bound work (image decoding and encoding) that would otherwise hold the GIL
+    and stall the event loop. Workers are spawned rather than forked so they never inherit the event loop, open
+    sockets or the database pool of the server process.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            loguru.logger.info(f"Process Pool --- Started with {self.max_workers} workers")
+        return self._executor
+
+    async def run(self, func: typing.Callable[..., T], *args: typing.Any, **kwargs: typing.Any) -> T:
+        """
+        Run `func(*args, **kwargs)` in a worker process; `func` and its arguments must be picklable.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def get_process_pool() -> ProcessPool:
+    return ProcessPool(max_workers=settings.MEDIA_PROCESS_POOL_WORKERS)
+
+
+process_pool: ProcessPool = get_process_pool()
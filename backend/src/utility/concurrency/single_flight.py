@@ -0,0 +1,34 @@
+import asyncio
+import typing
+
+T = typing.TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls sharing a key into one: the first caller starts the work, later callers await the same
+    task and get its result or exception. The key is forgotten as soon as the task finishes, so nothing is cached.
+
+    Waiters are shielded from each other; a cancelled waiter (e.g. a disconnected client) does not cancel the work
+    the others are waiting for.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[typing.Hashable, asyncio.Task] = dict()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, key: typing.Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every waiter was cancelled before it was raised
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: typing.Hashable, func: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda finished_task: self._forget(key=key, task=finished_task))
+        return await asyncio.shield(task)
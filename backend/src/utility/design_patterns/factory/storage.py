@@ -0,0 +1,38 @@
+from functools import lru_cache
+
+from src.config.setup import settings
+from src.storage.base import BaseStorage
+from src.storage.local import LocalStorage
+from src.storage.memory import MemoryStorage
+from src.storage.s3 import S3Storage
+from src.utility.enums.storage import StorageBackends
+
+
+class StorageFactory:
+    @staticmethod
+    def initialize_storage(backend: str) -> BaseStorage:
+        if backend == StorageBackends.S3:
+            return S3Storage(
+                bucket=settings.AWS_S3_BUCKET,
+                region_name=settings.AWS_SERVICE_REGION,
+                access_key=settings.AWS_ACCESS_KEY,
+                secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                endpoint_url=settings.STORAGE_S3_ENDPOINT_URL,
+                max_pool_connections=settings.STORAGE_S3_MAX_POOL_CONNECTIONS,
+                part_size=settings.STORAGE_S3_PART_SIZE_BYTES,
+                max_concurrency=settings.STORAGE_S3_MAX_CONCURRENCY,
+            )
+        elif backend == StorageBackends.LOCAL:
+            return LocalStorage(
+                root_dir=settings.STORAGE_LOCAL_DIR,
+                base_url=settings.STORAGE_LOCAL_BASE_URL,
+                signing_key=settings.JWT_SECRET_KEY.get_secret_value().encode(),
+            )
+        elif backend == StorageBackends.MEMORY:
+            return MemoryStorage()
+        raise Exception("Storage backend is not registered!")
+
+
+@lru_cache()
+def get_storage_backend(backend: str) -> BaseStorage:
+    return StorageFactory.initialize_storage(backend=backend)
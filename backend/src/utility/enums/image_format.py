@@ -0,0 +1,6 @@
+import enum
+
+
+class ImageVariantFormats(str, enum.Enum):
+    WEBP = "webp"
+    AVIF = "avif"
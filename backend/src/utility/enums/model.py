@@ -0,0 +1,7 @@
+import enum
+
+
+class ModelFrameworks(str, enum.Enum):
+    SKLEARN = "sklearn"
+    TF = "tf"
+    PT = "pt"
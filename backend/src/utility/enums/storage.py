@@ -0,0 +1,7 @@
+import enum
+
+
+class StorageBackends(str, enum.Enum):
+    S3 = "s3"
+    LOCAL = "local"
+    MEMORY = "memory"
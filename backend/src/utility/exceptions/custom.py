@@ -53,3 +53,87 @@ class FailedToSaveAccount(BaseException):
     """
     Throw an error if an error accured while saving the Account
     """
+
+
+class VerificationChallengeDoesNotExist(BaseException):
+    """
+    Throw an error if there is no pending verification challenge for the Account.
+    """
+
+
+class VerificationChallengeExpired(BaseException):
+    """
+    Throw an error if the verification challenge of the Account has expired.
+    """
+
+
+class VerificationAttemptsExceeded(BaseException):
+    """
+    Throw an error if the Account used up all attempts of its verification challenge.
+    """
+
+
+class VerificationResendThrottled(BaseException):
+    """
+    Throw an error if a new verification code is requested too soon after the last one.
+    """
+
+
+class MalformedMultipartRequest(BaseException):
+    """
+    Throw an error if a multipart/form-data request body cannot be parsed.
+    """
+
+
+class ImageTooLarge(BaseException):
+    """
+    Throw an error if an uploaded image exceeds the maximum allowed size.
+    """
+
+
+class UnsupportedImageType(BaseException):
+    """
+    Throw an error if an uploaded file is not one of the accepted image formats.
+    """
+
+
+class StorageObjectDoesNotExist(BaseException):
+    """
+    Throw an error if the requested object does not exist in the storage backend.
+    """
+
+
+class NearDuplicateImage(BaseException):
+    """
+    Throw an error if a profile uploads an image (nearly) identical to one it already owns.
+    """
+
+
+class RangeNotSatisfiable(BaseException):
+    """
+    Throw an error if a requested byte range lies outside the content.
+    """
+
+
+class InvalidPaginationCursor(BaseException):
+    """
+    Throw an error if a keyset pagination cursor cannot be decoded.
+    """
+
+
+class ModelDoesNotExist(BaseException):
+    """
+    Throw an error if no model artifact with the requested name and version was discovered.
+    """
+
+
+class InvalidModelArtifact(BaseException):
+    """
+    Throw an error if a model artifact fails its checksum or cannot be loaded.
+    """
+
+
+class ModelNotTrainable(BaseException):
+    """
+    Throw an error if a model cannot be updated incrementally (it is no scikit-learn estimator with `partial_fit`).
+    """
@@ -46,3 +46,64 @@ async def http_exc_404_resource_not_found(error_msg: str = "Requested resource c
         status_code=fastapi.status.HTTP_404_NOT_FOUND,
         detail=error_msg,
     )
+
+
+async def http_exc_409_conflict(
+    error_msg: str = "Request conflicts with the current state of the resource!",
+) -> Exception:
+    """
+    The HTTP 409 Conflict response status code indicates a request conflict with the current state of the target resource.
+    """
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_409_CONFLICT,
+        detail=error_msg,
+    )
+
+
+async def http_exc_413_payload_too_large(
+    error_msg: str = "Request payload is larger than the server allows!",
+) -> Exception:
+    """
+    The HTTP 413 Content Too Large response status code indicates that the request entity is larger than limits defined by server.
+    """
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=error_msg,
+    )
+
+
+async def http_exc_415_unsupported_media_type(
+    error_msg: str = "Media type of the payload is not supported!",
+) -> Exception:
+    """
+    The HTTP 415 Unsupported Media Type response status code indicates that the server refuses to accept the request because the payload format is in an unsupported format.
+    """
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=error_msg,
+    )
+
+
+async def http_exc_416_range_not_satisfiable(
+    error_msg: str = "Requested range lies outside the content!", size: int = 0
+) -> Exception:
+    """
+    The HTTP 416 Range Not Satisfiable response status code indicates that a server cannot serve the requested ranges.
+    """
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+        detail=error_msg,
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+
+
+async def http_exc_429_too_many_requests(
+    error_msg: str = "Too many requests, slow down and retry later!",
+) -> Exception:
+    """
+    The HTTP 429 Too Many Requests response status code indicates the user has sent too many requests in a given amount of time.
+    """
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=error_msg,
+    )
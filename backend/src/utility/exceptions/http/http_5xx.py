@@ -11,3 +11,14 @@ async def http_exc_500_internal_server_error(error_msg: str) -> Exception:
         status_code=fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail=error_msg,
     )
+
+
+async def http_exc_503_service_unavailable(error_msg: str = "Service is temporarily unavailable!") -> Exception:
+    """
+    The HyperText Transfer Protocol (HTTP) 503 Service Unavailable response status code indicates that the server
+    is not ready to handle the request, e.g. because a resource it depends on failed to load.
+    """
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=error_msg,
+    )
@@ -0,0 +1,22 @@
+import base64
+import binascii
+import datetime
+import uuid
+
+from src.utility.exceptions.custom import InvalidPaginationCursor
+
+
+def encode_keyset_cursor(created_at: datetime.datetime, id: uuid.UUID) -> str:
+    """
+    Encode the `(created_at, id)` of the last row of a page into an opaque, URL-safe cursor.
+    """
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime.datetime, uuid.UUID]:
+    try:
+        decoded_cursor = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, _, id = decoded_cursor.partition("|")
+        return datetime.datetime.fromisoformat(created_at), uuid.UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidPaginationCursor("Pagination cursor is malformed!") from e
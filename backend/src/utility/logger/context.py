@@ -0,0 +1,10 @@
+import contextvars
+
+current_request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("current_request_id", default=None)
+
+
+def bind_request_id(record: dict) -> None:
+    """
+    Loguru patcher, runs on the calling thread where the request `ContextVar` is still visible.
+    """
+    record["extra"]["request_id"] = current_request_id.get()
@@ -0,0 +1,32 @@
+import re
+import typing
+
+REDACTED: str = "***"
+SECRET_FIELD_PATTERN: re.Pattern = re.compile(
+    r"pass(word)?|secret|token|otp|salt|hashed|verification_code|authorization|api_key|credential", re.IGNORECASE
+)
+SECRET_ASSIGNMENT_PATTERN: re.Pattern = re.compile(
+    r"(?P<key>\b\w*(?:pass(?:word)?|secret|token|salt|verification_code|authorization)\w*\b)(?P<sep>\s*(?:=|:|\bto\b)\s*)\S+",
+    re.IGNORECASE,
+)
+
+
+def is_secret_field(field_name: str) -> bool:
+    return SECRET_FIELD_PATTERN.search(field_name) is not None
+
+
+def redact_value(field_name: str, value: typing.Any) -> typing.Any:
+    if is_secret_field(field_name=field_name):
+        return REDACTED
+    if isinstance(value, dict):
+        return {key: redact_value(field_name=str(key), value=nested_value) for key, nested_value in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact_value(field_name="", value=nested_value) for nested_value in value]
+    return value
+
+
+def redact_message(message: str) -> str:
+    """
+    Mask `key=value`, `key: value` and `key to value` fragments whose key looks like a secret.
+    """
+    return SECRET_ASSIGNMENT_PATTERN.sub(lambda match: f"{match['key']}{match['sep']}{REDACTED}", message)
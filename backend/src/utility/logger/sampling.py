@@ -0,0 +1,83 @@
+import random
+import threading
+import time
+import typing
+
+NEVER_DROPPED_LEVEL_NO: int = 30  # WARNING and above always pass
+
+
+def parse_logger_rates(rates: str) -> dict[str, float]:
+    """
+    Parse `"src.api.dependency.header=0.01,src.repository=0.5"` into `{logger_name: rate}`.
+    """
+    parsed_rates: dict[str, float] = dict()
+    for rate in filter(None, (rate.strip() for rate in rates.split(","))):
+        logger_name, _, value = rate.partition("=")
+        parsed_rates[logger_name.strip()] = float(value)
+    return parsed_rates
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated_at", "_lock")
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+            return True
+
+
+class LogSampler:
+    """
+    Loguru filter dropping records below WARNING by per-logger sample rate and per-logger rate limit (records/s).
+
+    Logger names are matched by longest dotted prefix and the outcome is cached per module, so a record costs one
+    dict lookup, one `random()` and possibly one token-bucket update on the calling thread.
+    """
+
+    def __init__(self, sampling_rates: dict[str, float], rate_limits: dict[str, float]) -> None:
+        self.sampling_rates = sampling_rates
+        self.rate_limits = rate_limits
+        self._resolved: dict[str, tuple[float, TokenBucket | None]] = dict()
+
+    def _resolve_prefix(self, logger_name: str, configuration: dict[str, float]) -> float | None:
+        candidate = logger_name
+        while True:
+            if candidate in configuration:
+                return configuration[candidate]
+            if "." not in candidate:
+                return configuration.get("")
+            candidate = candidate.rpartition(".")[0]
+
+    def _resolve(self, logger_name: str) -> tuple[float, TokenBucket | None]:
+        resolved = self._resolved.get(logger_name)
+        if resolved is None:
+            sampling_rate = self._resolve_prefix(logger_name=logger_name, configuration=self.sampling_rates)
+            rate_limit = self._resolve_prefix(logger_name=logger_name, configuration=self.rate_limits)
+            resolved = self._resolved[logger_name] = (
+                1.0 if sampling_rate is None else sampling_rate,
+                None if rate_limit is None else TokenBucket(rate=rate_limit),
+            )
+        return resolved
+
+    def __call__(self, record: typing.Any) -> bool:
+        if record["level"].no >= NEVER_DROPPED_LEVEL_NO:
+            return True
+
+        sampling_rate, token_bucket = self._resolve(logger_name=record["name"] or "")
+        if sampling_rate < 1.0 and random.random() >= sampling_rate:
+            return False
+        if token_bucket is not None and not token_bucket.consume():
+            return False
+        return True
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import sys
+import typing
+
+import loguru
+
+from src.config.setup import settings
+from src.utility.logger.context import bind_request_id
+from src.utility.logger.sampling import LogSampler, parse_logger_rates
+from src.utility.logger.sink import QueuedSink, render_json, render_text
+
+TEXT_FORMAT: str = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | {extra[request_id]} | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+
+log_sink: QueuedSink | None = None
+
+
+class InterceptHandler(logging.Handler):
+    """
+    Route standard `logging` records (uvicorn, SQLAlchemy) through the same loguru pipeline.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level: str | int = loguru.logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        loguru.logger.opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
+
+
+def configure_logger(
+    level: int | str,
+    is_json: bool,
+    sampling_rates: dict[str, float],
+    rate_limits: dict[str, float],
+    stream: typing.TextIO = sys.stderr,
+    intercepted_loggers: typing.Iterable[str] = (),
+) -> QueuedSink:
+    """
+    Replace loguru's default synchronous stderr sink with a single queued sink.
+
+    Sampling and rate limiting run as the handler filter on the calling thread, before loguru formats anything;
+    JSON rendering, redaction and I/O run on the sink's writer thread.
+    """
+    dispose_sink()
+    loguru.logger.remove()
+    loguru.logger.configure(patcher=bind_request_id, extra={"request_id": None})  # type: ignore
+
+    global log_sink
+    log_sink = QueuedSink(stream=stream, render=render_json if is_json else render_text)
+    loguru.logger.add(
+        sink=log_sink,
+        level=level,
+        format="{message}" if is_json else TEXT_FORMAT,
+        filter=LogSampler(sampling_rates=sampling_rates, rate_limits=rate_limits),
+        colorize=False if is_json else None,
+        catch=True,
+    )
+
+    for logger_name in intercepted_loggers:
+        logging.getLogger(logger_name).handlers = [InterceptHandler()]
+    return log_sink
+
+
+def dispose_sink() -> None:
+    global log_sink
+    if log_sink is not None:
+        log_sink.close()
+        log_sink = None
+
+
+def initialize_logger() -> QueuedSink:
+    return configure_logger(
+        level=settings.LOGGING_LEVEL,
+        is_json=settings.IS_LOGGING_JSON,
+        sampling_rates=parse_logger_rates(rates=settings.LOGGING_SAMPLING_RATES),
+        rate_limits=parse_logger_rates(rates=settings.LOGGING_RATE_LIMITS),
+        intercepted_loggers=settings.LOGGERS,
+    )
+
+
+async def dispose_logger() -> None:
+    """
+    Drain the queue so records emitted during shutdown are not lost.
+    """
+    if log_sink is not None:
+        await asyncio.to_thread(log_sink.flush)
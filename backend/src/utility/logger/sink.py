@@ -0,0 +1,117 @@
+import datetime
+import json
+import queue
+import sys
+import threading
+import traceback
+import typing
+
+from src.utility.logger.redaction import redact_message, redact_value
+
+
+def serialize_record(record: dict) -> str:
+    """
+    Render a loguru record as one JSON line with secret fields and `key=value` secrets masked; an exception comes
+    with its formatted traceback, masked the same way.
+    """
+    extra = dict(record["extra"])
+    request_id = extra.pop("request_id", None)
+    payload: dict[str, typing.Any] = {
+        "timestamp": record["time"].astimezone(datetime.timezone.utc).isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": redact_message(message=record["message"]),
+        "request_id": request_id,
+    }
+    if extra:
+        payload["extra"] = redact_value(field_name="", value=extra)
+    if record["exception"] is not None:
+        exception_type, exception_value, exception_traceback = record["exception"]
+        payload["exception"] = {
+            "type": getattr(exception_type, "__name__", None),
+            "value": redact_message(message=str(exception_value)),
+            "traceback": redact_message(
+                message="".join(traceback.format_exception(exception_type, exception_value, exception_traceback))
+            ),
+        }
+    return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def render_json(message: typing.Any) -> str:
+    return serialize_record(record=message.record)
+
+
+def render_text(message: typing.Any) -> str:
+    return str(message).rstrip("\n")
+
+
+class QueuedSink:
+    """
+    Loguru sink that hands records to a writer thread through an in-process `SimpleQueue`.
+
+    Loguru's own `enqueue=True` pickles every message through a multiprocessing pipe, which costs more than the
+    write it saves. Here the calling thread only pays an `O(1)` `put()`; rendering (JSON encoding and redaction) and
+    the blocking `write()` happen in batches on the writer thread. Once `max_queue_size` records are pending, new
+    records are dropped and counted rather than blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        stream: typing.TextIO = sys.stderr,
+        render: typing.Callable[[typing.Any], str] = render_json,
+        max_queue_size: int = 100_000,
+        batch_size: int = 512,
+    ) -> None:
+        self.stream = stream
+        self.render = render
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.dropped_records = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def __call__(self, message: typing.Any) -> None:
+        if self._queue.qsize() >= self.max_queue_size:
+            self.dropped_records += 1
+            return
+        self._queue.put(message)
+
+    def _write_batch(self, batch: list[typing.Any]) -> None:
+        lines: list[str] = list()
+        for message in batch:
+            try:
+                lines.append(self.render(message))
+            except Exception as e:  # a broken record must never kill the writer thread
+                lines.append(f"Log Record Rendering Failed --- {type(e).__name__}: {e}")
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+
+    def _drain(self) -> None:
+        while True:
+            batch: list[typing.Any] = [self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            markers = [item for item in batch if isinstance(item, threading.Event) or item is None]
+            messages = [item for item in batch if not (isinstance(item, threading.Event) or item is None)]
+            if messages:
+                self._write_batch(batch=messages)
+            for marker in markers:
+                if marker is None:
+                    return
+                marker.set()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        Block until every record queued before the call has been written.
+        """
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait(timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        self._queue.put(None)
+        self._writer.join(timeout=timeout)
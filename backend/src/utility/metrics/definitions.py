@@ -0,0 +1,47 @@
+from src.utility.metrics.prometheus import DEFAULT_COUNT_BUCKETS, metrics_registry
+
+http_request_duration_seconds = metrics_registry.histogram(
+    name="http_request_duration_seconds",
+    documentation="Latency of HTTP requests per route.",
+    label_names=("method", "route", "status"),
+)
+http_request_db_duration_seconds = metrics_registry.histogram(
+    name="http_request_db_duration_seconds",
+    documentation="Time spent executing SQL statements per HTTP request.",
+    label_names=("method", "route"),
+)
+http_request_db_statements = metrics_registry.histogram(
+    name="http_request_db_statements",
+    documentation="Number of SQL statements issued per HTTP request.",
+    label_names=("method", "route"),
+    buckets=DEFAULT_COUNT_BUCKETS,
+)
+http_request_db_pool_wait_seconds = metrics_registry.histogram(
+    name="http_request_db_pool_wait_seconds",
+    documentation="Time spent waiting for a pooled DB connection per HTTP request.",
+    label_names=("method", "route"),
+)
+db_statement_duration_seconds = metrics_registry.histogram(
+    name="db_statement_duration_seconds",
+    documentation="Latency of single SQL statements.",
+)
+db_pool_wait_seconds = metrics_registry.histogram(
+    name="db_pool_wait_seconds",
+    documentation="Latency of DB connection checkouts from the pool.",
+)
+inference_request_duration_seconds = metrics_registry.histogram(
+    name="inference_request_duration_seconds",
+    documentation="Latency of single predictions per model, from enqueueing until the result is resolved.",
+    label_names=("model",),
+)
+inference_batch_size = metrics_registry.histogram(
+    name="inference_batch_size",
+    documentation="Number of predictions evaluated together per model call.",
+    label_names=("model",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+inference_batch_duration_seconds = metrics_registry.histogram(
+    name="inference_batch_duration_seconds",
+    documentation="Latency of one batched model call.",
+    label_names=("model",),
+)
@@ -0,0 +1,214 @@
+import bisect
+import math
+import threading
+import typing
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...], **extra_labels: str) -> str:
+    pairs = list(zip(label_names, label_values)) + list(extra_labels.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(str(value))}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    metric_type: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: typing.Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names: tuple[str, ...] = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _validate_label_values(self, label_values: tuple[str, ...]) -> None:
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"Metric `{self.name}` expects labels {self.label_names}, got {label_values}!")
+
+    def collect(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self.collect())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    metric_type: str = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: typing.Iterable[str] = ()):
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self._values: dict[tuple[str, ...], float] = dict()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._validate_label_values(label_values=label_values)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+            for label_values, value in values
+        ]
+
+
+class Gauge(Counter):
+    metric_type: str = "gauge"
+
+    def set(self, *label_values: str, value: float) -> None:
+        self._validate_label_values(label_values=label_values)
+        with self._lock:
+            self._values[label_values] = value
+
+
+class Histogram(Metric):
+    """
+    Cumulative histogram in the Prometheus exposition format.
+
+    Each label combination keeps one count per bucket plus the sum, so `observe()` is a bisect and two additions.
+    """
+
+    metric_type: str = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: typing.Iterable[str] = (),
+        buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self._counts: dict[tuple[str, ...], list[int]] = dict()
+        self._sums: dict[tuple[str, ...], float] = dict()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        self._validate_label_values(label_values=label_values)
+        bucket_index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(label_values)
+            if counts is None:
+                counts = self._counts[label_values] = [0] * (len(self.buckets) + 1)
+                self._sums[label_values] = 0.0
+            counts[bucket_index] += 1
+            self._sums[label_values] += value
+
+    def count(self, *label_values: str) -> int:
+        return sum(self._counts.get(label_values, ()))
+
+    def sum(self, *label_values: str) -> float:
+        return self._sums.get(label_values, 0.0)
+
+    def quantile(self, q: float, *label_values: str) -> float:
+        """
+        Estimate a quantile the way PromQL `histogram_quantile()` does, by linear interpolation inside a bucket.
+        """
+        with self._lock:
+            counts = list(self._counts.get(label_values, ()))
+        total = sum(counts)
+        if not total:
+            return math.nan
+
+        rank = q * total
+        cumulative = 0
+        for bucket_index, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if bucket_index == len(self.buckets):
+                    return self.buckets[-1]
+                lower_bound = self.buckets[bucket_index - 1] if bucket_index else 0.0
+                upper_bound = self.buckets[bucket_index]
+                return lower_bound + (upper_bound - lower_bound) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            series = [
+                (label_values, list(counts), self._sums[label_values]) for label_values, counts in self._counts.items()
+            ]
+
+        lines: list[str] = list()
+        for label_values, counts, total_sum in series:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(self.label_names, label_values, le=_format_value(upper_bound))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            series_labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{series_labels} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{series_labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = dict()
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric `{metric.name}` is already registered!")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: typing.Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name=name, documentation=documentation, label_names=label_names))  # type: ignore
+
+    def gauge(self, name: str, documentation: str, label_names: typing.Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name=name, documentation=documentation, label_names=label_names))  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: typing.Iterable[str] = (),
+        buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(
+            Histogram(name=name, documentation=documentation, label_names=label_names, buckets=buckets)
+        )  # type: ignore
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+metrics_registry: MetricsRegistry = get_metrics_registry()
@@ -0,0 +1,46 @@
+import contextvars
+
+
+class RequestStats:
+    """
+    Mutable per-request accumulator shared through a `ContextVar`.
+
+    The middleware binds a fresh instance per request and the SQLAlchemy/pool hooks mutate it in place, which also
+    reaches SQLAlchemy's greenlets because they run inside a copy of the request context.
+    """
+
+    __slots__ = ("route", "db_duration", "statement_count", "statement_counts", "pool_wait_duration")
+
+    def __init__(self, route: str = "") -> None:
+        self.route = route
+        self.db_duration: float = 0.0
+        self.statement_count: int = 0
+        self.statement_counts: dict[str, int] = dict()
+        self.pool_wait_duration: float = 0.0
+
+    def as_server_timing(self, app_duration: float) -> str:
+        return ", ".join(
+            (
+                f"app;dur={app_duration * 1000:.2f}",
+                f'db;dur={self.db_duration * 1000:.2f};desc="{self.statement_count} statements"',
+                f"pool;dur={self.pool_wait_duration * 1000:.2f}",
+            )
+        )
+
+
+current_request_stats: contextvars.ContextVar[RequestStats | None] = contextvars.ContextVar(
+    "current_request_stats", default=None
+)
+
+
+def record_statement(duration: float) -> None:
+    request_stats = current_request_stats.get()
+    if request_stats is not None:
+        request_stats.statement_count += 1
+        request_stats.db_duration += duration
+
+
+def record_pool_wait(duration: float) -> None:
+    request_stats = current_request_stats.get()
+    if request_stats is not None:
+        request_stats.pool_wait_duration += duration
@@ -11,6 +11,8 @@ from src.main import initialize_application
 from src.models.db.account import Account
 from src.security.authorizations.jwt import jwt_manager
 
+pytest_plugins = ["tests.plugins.statement_budget"]
+
 
 @pytest.fixture(name="test_app")
 def test_app() -> fastapi.FastAPI:
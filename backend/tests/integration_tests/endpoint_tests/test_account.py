@@ -1,10 +1,13 @@
 # automated tests for the endpoints of the account router
 import loguru
+import pytest
 
 
+# Accounts are read with their profiles in one `selectinload`, whatever their number
+@pytest.mark.statement_budget({"GET /api/v1/account/all": 2})
 async def test_read_accounts(async_client):
     # arrange & act
-    response = await async_client.get("api/v1/accounts")
+    response = await async_client.get("api/v1/account/all")
     # assert
     loguru.logger.debug(response)
     assert response.status_code == 200
@@ -1,7 +1,9 @@
 # automated tests for the endpoints of the authentication router
 import loguru
+import pytest
 
 
+@pytest.mark.statement_budget({"POST /api/v1/auth/signup": 10})
 async def test_signup_success(async_client):
     # arrange & act
     x = await async_client.get("api/v1/accounts")
@@ -61,6 +63,7 @@ async def test_signup_failure_weak_password(async_client):
     assert response.status_code != 201
 
 
+@pytest.mark.statement_budget({"POST /api/v1/auth/signup": 10, "POST /api/v1/auth/signin": 3})
 async def test_signin_success(async_client):
     # arrange
     user_object = {
@@ -0,0 +1,53 @@
+"""
+Pytest plugin that fails a test when one of its requests issues more SQL statements than its declared budget.
+
+    @pytest.mark.statement_budget(5)                                 # every request of the test
+    @pytest.mark.statement_budget({"POST /api/v1/auth/signin": 5})   # per endpoint (method + route template)
+"""
+
+import typing
+
+import pytest
+
+from src.repository.profiler import query_profiler
+
+StatementBudget = int | dict[str, int]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "statement_budget(budget): fail if a request issues more SQL statements than `budget` (int or per-endpoint dict)",
+    )
+
+
+def find_budget_violations(budget: StatementBudget, observed_requests: list[tuple[str, int]]) -> list[str]:
+    violations: list[str] = list()
+    for endpoint, statement_count in observed_requests:
+        endpoint_budget = budget if isinstance(budget, int) else budget.get(endpoint)
+        if endpoint_budget is not None and statement_count > endpoint_budget:
+            violations.append(f"{endpoint} issued {statement_count} statements (budget: {endpoint_budget})")
+    return violations
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> typing.Generator[None, typing.Any, typing.Any]:
+    marker = item.get_closest_marker("statement_budget")
+    if marker is None:
+        return (yield)
+
+    observed_requests: list[tuple[str, int]] = list()
+
+    def observe_request(method: str, route: str, statement_count: int) -> None:
+        observed_requests.append((f"{method} {route}", statement_count))
+
+    query_profiler.add_request_observer(observe_request)
+    try:
+        result = yield
+    finally:
+        query_profiler.remove_request_observer(observe_request)
+
+    violations = find_budget_violations(budget=marker.args[0], observed_requests=observed_requests)
+    if violations:
+        pytest.fail("Statement budget exceeded:\n" + "\n".join(violations), pytrace=False)
+    return result
@@ -0,0 +1,59 @@
+import pathlib
+import tempfile
+import types
+import unittest
+
+import numpy
+from sklearn.linear_model import LogisticRegression
+
+from src.jobs.batch_scoring import classify_batch, extract_batch_features, ScoringCheckpoint
+from src.ml.registry import ModelHandle
+from src.storage.memory import MemoryStorage
+from src.utility.enums.model import ModelFrameworks
+
+
+class FakeFeatureStore:
+    def __init__(self) -> None:
+        self.loaded_batches: list[list[str]] = list()
+
+    async def load(self, storage: MemoryStorage, images: list[tuple[str, str]]) -> numpy.ndarray:
+        self.loaded_batches.append([content_hash for content_hash, _ in images])
+        return numpy.array([[int(content_hash)] for content_hash, _ in images], dtype=numpy.float32)
+
+
+class TestBatchScoring(unittest.IsolatedAsyncioTestCase):
+    def test_checkpoint_resumes_only_the_same_model_version(self) -> None:
+        with tempfile.TemporaryDirectory() as root_dir:
+            path = pathlib.Path(root_dir) / "checkpoints" / "scoring.json"
+            checkpoint = ScoringCheckpoint.load(path=path, model_name="classifier", model_version="v1")
+            assert (checkpoint.last_content_hash, checkpoint.scored, checkpoint.is_complete) == ("", 0, False)
+
+            checkpoint.last_content_hash, checkpoint.scored = "ab" * 32, 1000
+            checkpoint.save()
+
+            resumed_checkpoint = ScoringCheckpoint.load(path=path, model_name="classifier", model_version="v1")
+            assert (resumed_checkpoint.last_content_hash, resumed_checkpoint.scored) == ("ab" * 32, 1000)
+            assert ScoringCheckpoint.load(path=path, model_name="classifier", model_version="v2").scored == 0
+            assert [file.name for file in path.parent.iterdir()] == ["scoring.json"]
+
+    async def test_batch_features_are_split_across_workers(self) -> None:
+        feature_store = FakeFeatureStore()
+        blob_sources = [types.SimpleNamespace(content_hash=str(index), storage_key=f"k/{index}") for index in range(7)]
+
+        features = await extract_batch_features(
+            feature_store=feature_store, storage=MemoryStorage(), blob_sources=blob_sources, workers=3  # type: ignore
+        )
+
+        assert [len(loaded_batch) for loaded_batch in feature_store.loaded_batches] == [3, 3, 1]
+        assert features[:, 0].tolist() == list(range(7))
+
+    def test_most_probable_label_is_picked(self) -> None:
+        model = LogisticRegression().fit([[0.0], [1.0], [10.0], [11.0]], ["pikachu", "pikachu", "eevee", "eevee"])
+        handle = ModelHandle(
+            framework=ModelFrameworks.SKLEARN, name="classifier", version="v1", sha256="", model=model
+        )
+
+        labels, confidences = classify_batch(handle=handle, features=numpy.array([[0.5], [10.5]]))
+
+        assert labels.tolist() == ["pikachu", "eevee"]
+        assert all(0.5 < confidence <= 1 for confidence in confidences)
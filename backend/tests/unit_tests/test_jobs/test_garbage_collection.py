@@ -0,0 +1,82 @@
+import datetime
+import typing
+import unittest
+
+from src.jobs.garbage_collection import collect_orphaned_storage_objects, OrphanCollectionReport
+from src.repository.crud.blob import get_blob_master_storage_key, get_blob_storage_key
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+
+SHA256: str = "ab" + "0" * 62
+ORPHANED_SHA256: str = "cd" + "0" * 62
+
+
+class FakeBlobCRUDRepository:
+    def __init__(self, referenced_keys: set[str]) -> None:
+        self.referenced_keys = referenced_keys
+        self.looked_up_batches: list[int] = list()
+
+    async def read_referenced_storage_keys(self, storage_keys: typing.Collection[str]) -> set[str]:
+        self.looked_up_batches.append(len(storage_keys))
+        return self.referenced_keys.intersection(storage_keys)
+
+
+class TestOrphanedStorageCollection(unittest.IsolatedAsyncioTestCase):
+    async def _put_aged_objects(self, storage: MemoryStorage, keys: list[str], age: datetime.timedelta) -> None:
+        for key in keys:
+            await storage.put(key=key, chunks=iterate_content(content=b"12345"))
+            storage.objects[key][1].last_modified -= age
+
+    async def _collect(
+        self, storage: MemoryStorage, blob_crud: FakeBlobCRUDRepository, is_dry_run: bool
+    ) -> OrphanCollectionReport:
+        report = OrphanCollectionReport(is_dry_run=is_dry_run)
+        await collect_orphaned_storage_objects(
+            blob_crud=blob_crud,  # type: ignore
+            storage=storage,
+            prefix="pokemon_images/",
+            batch_size=2,
+            batch_pause=0,
+            grace_period=3600,
+            report=report,
+        )
+        return report
+
+    async def test_unreferenced_objects_are_deleted_in_batches(self) -> None:
+        referenced_keys = [
+            get_blob_storage_key(storage_dir="pokemon_images", sha256=SHA256),
+            get_blob_master_storage_key(storage_dir="pokemon_images", sha256=SHA256),
+        ]
+        orphaned_keys = [
+            get_blob_storage_key(storage_dir="pokemon_images", sha256=ORPHANED_SHA256),
+            "pokemon_images/incoming/abandoned-upload",
+            "pokemon_images/incoming/abandoned-upload.master",
+        ]
+        storage = MemoryStorage()
+        await self._put_aged_objects(
+            storage=storage, keys=referenced_keys + orphaned_keys, age=datetime.timedelta(days=2)
+        )
+        await storage.put(key="pokemon_images/incoming/upload-in-flight", chunks=iterate_content(content=b"1"))
+        blob_crud = FakeBlobCRUDRepository(referenced_keys=set(referenced_keys))
+
+        report = await self._collect(storage=storage, blob_crud=blob_crud, is_dry_run=False)
+
+        assert (report.storage_objects, report.reclaimable_bytes) == (3, 15)
+        assert sorted(storage.objects) == sorted(referenced_keys + ["pokemon_images/incoming/upload-in-flight"])
+        assert blob_crud.looked_up_batches == [2, 2, 1]
+
+    async def test_dry_run_only_reports(self) -> None:
+        storage = MemoryStorage()
+        await self._put_aged_objects(
+            storage=storage,
+            keys=[get_blob_storage_key(storage_dir="pokemon_images", sha256=ORPHANED_SHA256)],
+            age=datetime.timedelta(days=2),
+        )
+
+        report = await self._collect(
+            storage=storage, blob_crud=FakeBlobCRUDRepository(referenced_keys=set()), is_dry_run=True
+        )
+
+        assert (report.storage_objects, report.reclaimable_bytes) == (1, 5)
+        assert len(storage.objects) == 1
+        assert str(report).startswith("Reclaimable: 0 profiles, 0 pokemon images, 1 storage objects, 5 bytes")
@@ -0,0 +1,57 @@
+import datetime
+import io
+import tempfile
+import unittest
+import uuid
+
+import joblib
+from sklearn.linear_model import SGDClassifier
+
+from src.jobs.online_learning import publish_model_version, TrainingState
+from src.ml.registry import ModelRegistry
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+from src.utility.enums.model import ModelFrameworks
+
+
+class TestOnlineLearning(unittest.IsolatedAsyncioTestCase):
+    async def test_published_version_is_discovered_with_its_training_state(self) -> None:
+        storage = MemoryStorage()
+        await storage.put(key="models/sklearn/classifier/3/model.joblib", chunks=iterate_content(content=b"x"))
+        model = SGDClassifier().fit([[0.0], [1.0]], ["pikachu", "eevee"])
+        buffer = io.BytesIO()
+        joblib.dump(model, buffer)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            registry = ModelRegistry(
+                model_dirs={ModelFrameworks.SKLEARN: "models/sklearn"},
+                model_extensions={ModelFrameworks.SKLEARN: (".joblib",)},
+                cache_dir=cache_dir,
+            )
+            await registry.discover(storage=storage)
+            base_artifact = registry.get_artifact(name="classifier")
+            assert (await TrainingState.load(storage=storage, artifact=base_artifact)).trained == 0
+
+            last_id = uuid.uuid4()
+            storage_key = await publish_model_version(
+                storage=storage,
+                artifact=base_artifact,
+                version="3+online.1",
+                model=buffer.getvalue(),
+                training_state=TrainingState(
+                    last_changed_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+                    last_id=last_id,
+                    trained=2,
+                ),
+            )
+            await registry.discover(storage=storage)
+            handle = await registry.load(storage=storage, name="classifier")
+            training_state = await TrainingState.load(
+                storage=storage, artifact=registry.get_artifact(name="classifier")
+            )
+
+        assert storage_key == "models/sklearn/classifier/3+online.1/model.joblib"
+        assert handle.version == "3+online.1"
+        assert handle.model.predict([[1.0]]).tolist() == model.predict([[1.0]]).tolist()
+        assert (training_state.last_id, training_state.trained) == (last_id, 2)
+        assert training_state.last_changed_at.year == 2024
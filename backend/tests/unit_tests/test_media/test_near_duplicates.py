@@ -0,0 +1,142 @@
+import random
+import unittest
+import uuid
+
+from PIL import Image, ImageDraw
+
+from src.media.bk_tree import BKTree
+from src.media.near_duplicates import ensure_not_near_duplicate, PerceptualHashIndex
+from src.media.perceptual_hash import compute_dhash, hamming_distance, to_signed_bigint, to_unsigned_hash
+from src.utility.exceptions.custom import NearDuplicateImage
+from tests.utility import encode_image
+
+
+def _draw_image(seed: int) -> Image.Image:
+    image_generator = random.Random(seed)
+    image = Image.new("RGB", (256, 256), color=(255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x, y = image_generator.randrange(0, 200), image_generator.randrange(0, 200)
+        draw.ellipse(
+            (x, y, x + image_generator.randrange(20, 56), y + image_generator.randrange(20, 56)),
+            fill=tuple(image_generator.randrange(0, 256) for _ in range(3)),
+        )
+    return image
+
+
+class TestPerceptualHash(unittest.TestCase):
+    def setUp(self) -> None:
+        self.image = _draw_image(seed=7)
+        self.image_hash = compute_dhash(image_bytes=encode_image(image=self.image, image_format="PNG"))
+
+    def test_dhash_survives_resizing_and_reencoding(self) -> None:
+        resized_jpeg = encode_image(image=self.image.resize((97, 97)), image_format="JPEG", quality=60)
+
+        assert hamming_distance(first_hash=self.image_hash, second_hash=compute_dhash(image_bytes=resized_jpeg)) <= 6
+
+    def test_dhash_separates_different_images(self) -> None:
+        other_hash = compute_dhash(image_bytes=encode_image(image=_draw_image(seed=8), image_format="PNG"))
+
+        assert hamming_distance(first_hash=self.image_hash, second_hash=other_hash) > 6
+
+    def test_signed_bigint_round_trip(self) -> None:
+        for unsigned_hash in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1, self.image_hash):
+            signed_bigint = to_signed_bigint(unsigned_hash=unsigned_hash)
+
+            assert -(1 << 63) <= signed_bigint < 1 << 63
+            assert to_unsigned_hash(signed_bigint=signed_bigint) == unsigned_hash
+
+
+class TestBKTree(unittest.TestCase):
+    def setUp(self) -> None:
+        hash_generator = random.Random(42)
+        self.hashes = {item: hash_generator.getrandbits(64) for item in range(2000)}
+        # Plant near copies so the small radii have something to find
+        for item in range(2000, 2100):
+            self.hashes[item] = self.hashes[item - 2000] ^ (1 << hash_generator.randrange(64))
+        self.tree = BKTree()
+        for item, image_hash in self.hashes.items():
+            self.tree.add(item=item, image_hash=image_hash, value=f"value-{item}")
+
+    def test_search_matches_brute_force(self) -> None:
+        for query_hash in (self.hashes[0], self.hashes[50], random.Random(1).getrandbits(64)):
+            for max_distance in (0, 3, 12):
+                expected_items = {
+                    item
+                    for item, image_hash in self.hashes.items()
+                    if hamming_distance(first_hash=query_hash, second_hash=image_hash) <= max_distance
+                }
+                matches = self.tree.search(image_hash=query_hash, max_distance=max_distance)
+
+                assert {item for item, _, _ in matches} == expected_items
+                assert [distance for _, _, distance in matches] == sorted(distance for _, _, distance in matches)
+
+    def test_search_returns_values(self) -> None:
+        assert (0, "value-0", 0) in self.tree.search(image_hash=self.hashes[0], max_distance=0)
+
+    def test_removed_item_is_not_found_but_keeps_routing(self) -> None:
+        self.tree.remove(item=0)
+
+        assert 0 not in self.tree
+        assert 0 not in {item for item, _, _ in self.tree.search(image_hash=self.hashes[0], max_distance=1)}
+        assert 2000 in {item for item, _, _ in self.tree.search(image_hash=self.hashes[2000], max_distance=0)}
+
+    def test_re_adding_item_moves_it(self) -> None:
+        self.tree.add(item=1, image_hash=self.hashes[2], value="moved")
+
+        assert len(self.tree) == len(self.hashes)
+        assert 1 not in {item for item, _, _ in self.tree.search(image_hash=self.hashes[1], max_distance=0)}
+        assert (1, "moved", 0) in self.tree.search(image_hash=self.hashes[2], max_distance=0)
+
+
+class TestPerceptualHashIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = PerceptualHashIndex()
+        self.image_id, self.profile_id = uuid.uuid4(), uuid.uuid4()
+        self.index.add(image_id=self.image_id, profile_id=self.profile_id, perceptual_hash=0b1011)
+
+    def test_find_near_duplicates_returns_owner_and_distance(self) -> None:
+        assert self.index.find_near_duplicates(perceptual_hash=0b1000, max_distance=2) == [
+            (self.image_id, self.profile_id, 2)
+        ]
+        assert self.index.find_near_duplicates(perceptual_hash=0b1000, max_distance=1) == []
+
+    def test_removed_image_is_forgotten(self) -> None:
+        self.index.remove(image_id=self.image_id)
+
+        assert len(self.index) == 0
+        assert self.index.find_near_duplicates(perceptual_hash=0b1011, max_distance=0) == []
+
+
+class FakePokemonImageCRUDRepository:
+    def __init__(self, perceptual_hashes: dict[uuid.UUID, list[int]]) -> None:
+        self.perceptual_hashes = perceptual_hashes
+
+    async def read_profile_perceptual_hashes(self, profile_id: uuid.UUID) -> list[int]:
+        return self.perceptual_hashes.get(profile_id, [])
+
+
+class TestEnsureNotNearDuplicate(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.profile_id, self.other_profile_id = uuid.uuid4(), uuid.uuid4()
+        self.owned_hash = (1 << 63) | 0b1011
+        # Stored hashes come back as signed `BIGINT`s and are unknown to this worker's index
+        self.pokemon_image_repo = FakePokemonImageCRUDRepository(
+            perceptual_hashes={self.profile_id: [to_signed_bigint(unsigned_hash=self.owned_hash)]}
+        )
+
+    async def _ensure_not_near_duplicate(self, perceptual_hash: int, profile_id: uuid.UUID) -> None:
+        await ensure_not_near_duplicate(
+            perceptual_hash=perceptual_hash,
+            profile_id=profile_id,
+            pokemon_image_repo=self.pokemon_image_repo,  # type: ignore
+            max_distance=2,
+        )
+
+    async def test_near_copy_of_an_owned_image_is_refused(self) -> None:
+        with self.assertRaises(NearDuplicateImage):
+            await self._ensure_not_near_duplicate(perceptual_hash=self.owned_hash ^ 0b11, profile_id=self.profile_id)
+
+    async def test_distant_images_and_other_profiles_are_accepted(self) -> None:
+        await self._ensure_not_near_duplicate(perceptual_hash=self.owned_hash ^ 0b111, profile_id=self.profile_id)
+        await self._ensure_not_near_duplicate(perceptual_hash=self.owned_hash, profile_id=self.other_profile_id)
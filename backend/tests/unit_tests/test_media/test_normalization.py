@@ -0,0 +1,105 @@
+import io
+import unittest
+
+from PIL import Image
+
+from src.media.image_encoding import normalize_image
+from src.media.normalization import normalize_stored_image
+from src.media.perceptual_hash import compute_dhash
+from src.media.upload import StoredImage
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+from src.utility.concurrency.process_pool import process_pool
+from src.utility.exceptions.custom import ImageTooLarge, UnsupportedImageType
+
+
+def _encode_rotated_jpeg(width: int, height: int) -> bytes:
+    """
+    A landscape JPEG whose EXIF tells viewers to rotate it by 90 degrees.
+    """
+    image = Image.new("RGB", (width, height), color=(30, 90, 200))
+    exif = image.getexif()
+    exif[0x0112] = 6
+    exif[0x010F] = "Camera Maker"
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+class TestNormalizeImage(unittest.TestCase):
+    def test_orientation_is_applied_and_metadata_stripped(self) -> None:
+        content, width, height, perceptual_hash = normalize_image(
+            image_bytes=_encode_rotated_jpeg(width=400, height=200), max_dimension=100, max_pixels=1_000_000
+        )
+
+        assert (width, height) == (50, 100)
+        with Image.open(io.BytesIO(content)) as master:
+            assert master.format == "PNG" and master.mode == "RGB" and master.size == (50, 100)
+            assert not master.getexif() and "icc_profile" not in master.info
+        assert perceptual_hash == compute_dhash(image_bytes=content)
+
+    def test_modes_are_converted_to_canonical_mode(self) -> None:
+        for mode, expected_mode in (("CMYK", "RGB"), ("L", "RGB"), ("P", "RGB"), ("LA", "RGBA")):
+            with self.subTest(mode=mode):
+                buffer = io.BytesIO()
+                Image.new(mode, (32, 32)).save(buffer, format="TIFF" if mode == "CMYK" else "PNG")
+
+                content, *_ = normalize_image(image_bytes=buffer.getvalue(), max_dimension=64, max_pixels=1_000_000)
+
+                with Image.open(io.BytesIO(content)) as master:
+                    assert master.mode == expected_mode and master.size == (32, 32)
+
+    def test_decompression_bombs_are_refused_before_decoding(self) -> None:
+        buffer = io.BytesIO()
+        Image.new("L", (4000, 4000)).save(buffer, format="PNG", optimize=True)
+
+        assert len(buffer.getvalue()) < 100_000
+        with self.assertRaises(Image.DecompressionBombError):
+            normalize_image(image_bytes=buffer.getvalue(), max_dimension=64, max_pixels=1_000_000)
+
+
+class TestNormalizeStoredImage(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.storage = MemoryStorage()
+        await self.storage.put(key="incoming/upload", chunks=iterate_content(content=_encode_rotated_jpeg(300, 100)))
+        await self.storage.put(key="incoming/bomb", chunks=iterate_content(content=_encode_rotated_jpeg(300, 100)))
+        await self.storage.put(key="incoming/garbage", chunks=iterate_content(content=b"\xff\xd8\xff" + b"\x00" * 64))
+
+    async def test_master_is_stored_next_to_original(self) -> None:
+        stored_image = StoredImage(
+            file_name="upload", storage_key="incoming/upload", content_hash="0" * 64, content_type="image/jpeg", size=1
+        )
+
+        await normalize_stored_image(
+            storage=self.storage, stored_image=stored_image, max_dimension=60, max_pixels=40_000
+        )
+
+        assert stored_image.storage_keys == ["incoming/upload", "incoming/upload.master"]
+        assert (stored_image.width, stored_image.height) == (20, 60)
+        assert stored_image.perceptual_hash is not None
+        assert await self.storage.exists(key="incoming/upload.master")
+
+    async def test_oversized_and_undecodable_images_are_rejected(self) -> None:
+        with self.assertRaises(ImageTooLarge):
+            await normalize_stored_image(
+                storage=self.storage,
+                stored_image=StoredImage(
+                    file_name="bomb", storage_key="incoming/bomb", content_hash="1" * 64, content_type="", size=1
+                ),
+                max_dimension=60,
+                max_pixels=100,
+            )
+        with self.assertRaises(UnsupportedImageType):
+            await normalize_stored_image(
+                storage=self.storage,
+                stored_image=StoredImage(
+                    file_name="garbage", storage_key="incoming/garbage", content_hash="2" * 64, content_type="", size=1
+                ),
+                max_dimension=60,
+                max_pixels=40_000,
+            )
+
+        assert not await self.storage.exists(key="incoming/bomb.master")
+
+    def tearDown(self) -> None:
+        process_pool.shutdown()
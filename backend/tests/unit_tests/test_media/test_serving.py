@@ -0,0 +1,124 @@
+import datetime
+import tempfile
+import unittest
+
+from starlette.types import Message
+
+from src.media.serving import (
+    format_etag,
+    format_http_date,
+    is_not_modified,
+    is_range_applicable,
+    parse_byte_range,
+    StorageObjectResponse,
+    ZERO_COPY_SEND_EXTENSION,
+)
+from src.storage.base import iterate_content
+from src.storage.local import LocalStorage
+from src.storage.memory import MemoryStorage
+from src.utility.exceptions.custom import RangeNotSatisfiable
+
+CONTENT: bytes = bytes(range(256)) * 8
+ETAG: str = format_etag(content_hash="ab" * 32)
+LAST_MODIFIED: datetime.datetime = datetime.datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+
+
+async def run_response(response: StorageObjectResponse, scope: dict) -> list[Message]:
+    messages: list[Message] = list()
+
+    async def _receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message: Message) -> None:
+        messages.append(message)
+
+    await response({"type": "http", "method": "GET", **scope}, _receive, _send)
+    return messages
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def test_byte_range_is_resolved_to_inclusive_offsets(self) -> None:
+        for range_header, expected_range in (
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 2047)),
+            ("bytes=-10", (2038, 2047)),
+            ("bytes=-5000", (0, 2047)),
+            ("bytes=2000-9999", (2000, 2047)),
+            ("bytes=10-5", None),
+            ("bytes=0-1,5-9", None),
+            ("items=0-1", None),
+            ("bytes=-", None),
+        ):
+            with self.subTest(range_header=range_header):
+                assert parse_byte_range(range_header=range_header, size=len(CONTENT)) == expected_range
+
+    def test_byte_range_outside_content_is_not_satisfiable(self) -> None:
+        for range_header in ("bytes=2048-", "bytes=-0"):
+            with self.subTest(range_header=range_header), self.assertRaises(RangeNotSatisfiable):
+                parse_byte_range(range_header=range_header, size=len(CONTENT))
+
+    def test_conditional_get_prefers_etag_over_date(self) -> None:
+        last_modified_header = format_http_date(moment=LAST_MODIFIED)
+
+        assert last_modified_header == "Mon, 01 May 2023 12:30:15 GMT"
+        assert is_not_modified(headers={"if-none-match": f'"other", W/{ETAG}'}, etag=ETAG, last_modified=LAST_MODIFIED)
+        assert is_not_modified(headers={"if-none-match": "*"}, etag=ETAG, last_modified=LAST_MODIFIED)
+        assert not is_not_modified(
+            headers={"if-none-match": '"other"', "if-modified-since": last_modified_header},
+            etag=ETAG,
+            last_modified=LAST_MODIFIED,
+        )
+        assert is_not_modified(
+            headers={"if-modified-since": last_modified_header}, etag=ETAG, last_modified=LAST_MODIFIED
+        )
+        assert not is_not_modified(headers={"if-modified-since": "garbage"}, etag=ETAG, last_modified=LAST_MODIFIED)
+
+    def test_if_range_requires_strong_match(self) -> None:
+        assert is_range_applicable(if_range=None, etag=ETAG, last_modified=LAST_MODIFIED)
+        assert is_range_applicable(if_range=ETAG, etag=ETAG, last_modified=LAST_MODIFIED)
+        assert not is_range_applicable(if_range=f"W/{ETAG}", etag=ETAG, last_modified=LAST_MODIFIED)
+        assert is_range_applicable(
+            if_range=format_http_date(moment=LAST_MODIFIED), etag=ETAG, last_modified=LAST_MODIFIED
+        )
+
+
+class TestStorageObjectResponse(unittest.IsolatedAsyncioTestCase):
+    async def test_range_is_streamed(self) -> None:
+        storage = MemoryStorage(chunk_size=100)
+        await storage.put(key="images/a", chunks=iterate_content(content=CONTENT))
+
+        messages = await run_response(
+            response=StorageObjectResponse(storage=storage, key="images/a", start=10, end=509, status_code=206),
+            scope={},
+        )
+
+        assert messages[0]["status"] == 206
+        assert (b"content-length", b"500") in messages[0]["headers"]
+        assert b"".join(message.get("body", b"") for message in messages[1:]) == CONTENT[10:510]
+        assert messages[-1]["more_body"] is False
+
+    async def test_body_is_skipped_for_head(self) -> None:
+        storage = MemoryStorage()
+        await storage.put(key="images/a", chunks=iterate_content(content=CONTENT))
+
+        messages = await run_response(
+            response=StorageObjectResponse(storage=storage, key="images/a", start=0, end=len(CONTENT) - 1),
+            scope={"method": "HEAD"},
+        )
+
+        assert (b"content-length", str(len(CONTENT)).encode()) in messages[0]["headers"]
+        assert [message.get("body") for message in messages[1:]] == [b""]
+
+    async def test_local_files_use_zero_copy_send(self) -> None:
+        with tempfile.TemporaryDirectory() as root_dir:
+            storage = LocalStorage(root_dir=root_dir, base_url="/storage", signing_key=b"secret")
+            await storage.put(key="images/a", chunks=iterate_content(content=CONTENT))
+
+            messages = await run_response(
+                response=StorageObjectResponse(storage=storage, key="images/a", start=5, end=104),
+                scope={"extensions": {ZERO_COPY_SEND_EXTENSION: {}}},
+            )
+
+        assert messages[1]["type"] == ZERO_COPY_SEND_EXTENSION
+        assert (messages[1]["offset"], messages[1]["count"]) == (5, 100)
+        assert messages[1]["file"].closed
@@ -0,0 +1,180 @@
+import asyncio
+import pathlib
+import tempfile
+import typing
+import unittest
+
+from src.media.multipart import StreamingMultipartReader
+from src.media.upload import receive_bulk_image_upload, receive_image_upload, StoredImage
+from src.media.validation import ImageStreamInspector, sniff_image_content_type
+from src.storage.base import iterate_content
+from src.storage.local import LocalStorage
+from src.storage.memory import MemoryStorage
+from src.utility.exceptions.custom import ImageTooLarge, MalformedMultipartRequest, UnsupportedImageType
+
+BOUNDARY: str = "ggea-test-boundary"
+CONTENT_TYPE: str = f"multipart/form-data; boundary={BOUNDARY}"
+PNG_BYTES: bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+
+
+def _encode_multipart_body(fields: dict[str, str], files: dict[str, bytes]) -> bytes:
+    body = bytearray()
+    for name, value in fields.items():
+        body.extend(f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, content in files.items():
+        body.extend(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; filename="{name}.bin"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n".encode()
+        )
+        body.extend(content + b"\r\n")
+    body.extend(f"--{BOUNDARY}--\r\n".encode())
+    return bytes(body)
+
+
+def _encode_bulk_multipart_body(images: list[bytes]) -> bytes:
+    body = bytearray(_encode_multipart_body(fields={"items": "[]"}, files={})[: -len(f"--{BOUNDARY}--\r\n")])
+    for content in images:
+        body.extend(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="images"; filename="image.bin"\r\n\r\n'.encode()
+        )
+        body.extend(content + b"\r\n")
+    body.extend(f"--{BOUNDARY}--\r\n".encode())
+    return bytes(body)
+
+
+class ConcurrencyTrackingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.active_puts = 0
+        self.max_active_puts = 0
+
+    async def put(self, key: str, chunks: typing.AsyncIterable[bytes], content_type: str | None = None) -> int:
+        self.active_puts += 1
+        self.max_active_puts = max(self.max_active_puts, self.active_puts)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().put(key=key, chunks=chunks, content_type=content_type)
+        finally:
+            self.active_puts -= 1
+
+
+class TestImageValidation(unittest.TestCase):
+    def test_content_type_is_sniffed_from_magic_bytes(self) -> None:
+        assert sniff_image_content_type(header=b"\xff\xd8\xff\xe0" + b"\x00" * 8) == "image/jpeg"
+        assert sniff_image_content_type(header=b"RIFF\x00\x00\x00\x00WEBP") == "image/webp"
+        assert sniff_image_content_type(header=b"%PDF-1.7 xxxx") is None
+
+    def test_inspector_rejects_oversized_and_unknown_streams(self) -> None:
+        with self.assertRaises(ImageTooLarge):
+            ImageStreamInspector(max_size=10).inspect(chunk=PNG_BYTES)
+
+        with self.assertRaises(UnsupportedImageType):
+            ImageStreamInspector(max_size=1024).inspect(chunk=b"<html><body>not an image</body></html>")
+
+
+class TestImageUpload(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.storage_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorage(root_dir=self.storage_dir.name, base_url="/storage", signing_key=b"secret")
+
+    async def test_multipart_reader_yields_fields_and_file_chunks(self) -> None:
+        body = _encode_multipart_body(fields={"name": "pikachu"}, files={"image": PNG_BYTES})
+        reader = StreamingMultipartReader(
+            content_type=CONTENT_TYPE, stream=iterate_content(content=body, chunk_size=7)
+        )
+        parts: dict[str, bytes] = dict()
+
+        async for part in reader:
+            chunks = [chunk async for chunk in part.iter_chunks()]
+            assert all(len(chunk) <= 7 for chunk in chunks)
+            parts[part.name] = b"".join(chunks)
+
+        assert parts == {"name": b"pikachu", "image": PNG_BYTES}
+
+    async def test_image_and_hash_are_stored(self) -> None:
+        body = _encode_multipart_body(fields={"name": "pikachu", "nickname": "pika"}, files={"image": PNG_BYTES})
+
+        form_fields, stored_image = await receive_image_upload(
+            content_type=CONTENT_TYPE,
+            stream=iterate_content(content=body, chunk_size=1024),
+            storage=self.storage,
+            storage_dir="pokemon_images",
+            max_image_size=1024 * 1024,
+        )
+
+        assert form_fields == {"name": "pikachu", "nickname": "pika"}
+        assert stored_image.content_type == "image/png"
+        assert stored_image.size == len(PNG_BYTES)
+        assert (pathlib.Path(self.storage_dir.name) / stored_image.storage_key).read_bytes() == PNG_BYTES
+        assert len(stored_image.content_hash) == 64
+
+    async def test_nothing_is_left_behind_on_failure(self) -> None:
+        with self.assertRaises(ImageTooLarge):
+            await receive_image_upload(
+                content_type=CONTENT_TYPE,
+                stream=iterate_content(
+                    content=_encode_multipart_body(fields={}, files={"image": PNG_BYTES}), chunk_size=7
+                ),
+                storage=self.storage,
+                storage_dir="pokemon_images",
+                max_image_size=1024,
+            )
+
+        with self.assertRaises(MalformedMultipartRequest):
+            await receive_image_upload(
+                content_type=CONTENT_TYPE,
+                stream=iterate_content(
+                    content=_encode_multipart_body(fields={"name": "pikachu"}, files={}), chunk_size=7
+                ),
+                storage=self.storage,
+                storage_dir="pokemon_images",
+                max_image_size=1024,
+            )
+
+        assert not any(path.is_file() for path in pathlib.Path(self.storage_dir.name).rglob("*"))
+
+    def tearDown(self) -> None:
+        self.storage_dir.cleanup()
+
+
+class TestBulkImageUpload(unittest.IsolatedAsyncioTestCase):
+    async def test_each_image_is_reported_and_concurrency_bounded(self) -> None:
+        storage = ConcurrencyTrackingStorage()
+        images = [PNG_BYTES + bytes([index]) for index in range(6)]
+        images[2] = b"<html>not an image</html>"
+        images[4] = PNG_BYTES * 4
+
+        form_fields, upload_results = await receive_bulk_image_upload(
+            content_type=CONTENT_TYPE,
+            stream=iterate_content(content=_encode_bulk_multipart_body(images=images), chunk_size=1024),
+            storage=storage,
+            storage_dir="incoming",
+            max_image_size=len(PNG_BYTES) * 2,
+            max_images=10,
+            max_concurrency=2,
+        )
+
+        assert form_fields == {"items": "[]"}
+        assert isinstance(upload_results[2], UnsupportedImageType)
+        assert isinstance(upload_results[4], ImageTooLarge)
+        stored_images = [upload_result for upload_result in upload_results if isinstance(upload_result, StoredImage)]
+        assert len(stored_images) == 4
+        stored_contents = [await storage.read(key=stored_image.storage_key) for stored_image in stored_images]
+        assert stored_contents == [images[index] for index in (0, 1, 3, 5)]
+        assert 1 < storage.max_active_puts <= 2
+
+    async def test_stored_images_are_discarded_on_failure(self) -> None:
+        storage = MemoryStorage()
+
+        with self.assertRaises(MalformedMultipartRequest):
+            await receive_bulk_image_upload(
+                content_type=CONTENT_TYPE,
+                stream=iterate_content(content=_encode_bulk_multipart_body(images=[PNG_BYTES] * 3), chunk_size=7),
+                storage=storage,
+                storage_dir="incoming",
+                max_image_size=len(PNG_BYTES),
+                max_images=2,
+                max_concurrency=2,
+            )
+
+        assert storage.objects == {}
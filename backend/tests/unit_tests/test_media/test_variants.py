@@ -0,0 +1,118 @@
+import asyncio
+import io
+import unittest
+
+from PIL import Image
+
+from src.media.image_encoding import encode_image_variant
+from src.media.variants import get_variant_storage_key, parse_variant_formats, parse_variant_sizes, VariantGenerator
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+from src.utility.concurrency.process_pool import ProcessPool
+from src.utility.concurrency.single_flight import SingleFlight
+from src.utility.enums.image_format import ImageVariantFormats
+from tests.utility import encode_image
+
+SHA256: str = "cd" + "0" * 62
+
+
+class TestImageVariantEncoding(unittest.TestCase):
+    def test_variant_settings_are_parsed(self) -> None:
+        assert parse_variant_sizes(variant_sizes="thumbnail=128, small=320,") == {"thumbnail": 128, "small": 320}
+        assert parse_variant_formats(variant_formats="WebP") == (ImageVariantFormats.WEBP,)
+
+    def test_longest_side_is_fitted_without_upscaling(self) -> None:
+        content, width, height = encode_image_variant(
+            image_bytes=encode_image(Image.new("RGB", (400, 200), color=(200, 30, 30))),
+            max_dimension=100,
+            image_format="webp",
+            quality=80,
+        )
+
+        assert (width, height) == (100, 50)
+        with Image.open(io.BytesIO(content)) as image:
+            assert image.format == "WEBP" and image.size == (100, 50)
+
+        _, width, height = encode_image_variant(
+            image_bytes=encode_image(Image.new("RGB", (40, 20), color=(200, 30, 30))),
+            max_dimension=100,
+            image_format="webp",
+            quality=80,
+        )
+
+        assert (width, height) == (40, 20)
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.single_flight = SingleFlight()
+
+    async def test_concurrent_calls_are_collapsed(self) -> None:
+        calls: list[int] = list()
+
+        async def _work() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        assert await asyncio.gather(*(self.single_flight.do(key="a", func=_work) for _ in range(5))) == [42] * 5
+        assert len(calls) == 1
+        assert len(self.single_flight) == 0
+
+        assert await self.single_flight.do(key="a", func=_work) == 42
+        assert len(calls) == 2
+
+    async def test_cancelled_waiter_does_not_cancel_the_call(self) -> None:
+        async def _work() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first_waiter = asyncio.ensure_future(self.single_flight.do(key="a", func=_work))
+        second_waiter = asyncio.ensure_future(self.single_flight.do(key="a", func=_work))
+        await asyncio.sleep(0)
+        first_waiter.cancel()
+
+        assert await second_waiter == "done"
+
+
+class TestVariantGenerator(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.storage = MemoryStorage()
+        await self.storage.put(
+            key=f"pokemon_images/cd/{SHA256}",
+            chunks=iterate_content(content=encode_image(Image.new("RGB", (640, 480), color=(200, 30, 30)))),
+        )
+        self.process_pool = ProcessPool(max_workers=1)
+        self.generator = VariantGenerator(
+            storage_dir="pokemon_images",
+            variant_sizes={"thumbnail": 64},
+            variant_formats=(ImageVariantFormats.WEBP,),
+            quality=70,
+            process_pool=self.process_pool,
+        )
+
+    async def test_variant_is_encoded_once_and_stored_next_to_original(self) -> None:
+        generated_variants = await asyncio.gather(
+            *(
+                self.generator.generate(
+                    storage=self.storage,
+                    source_key=f"pokemon_images/cd/{SHA256}",
+                    sha256=SHA256,
+                    variant="thumbnail",
+                    image_format=ImageVariantFormats.WEBP,
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert generated_variants[0] is generated_variants[1] is generated_variants[2]
+        assert generated_variants[0].storage_key == get_variant_storage_key(
+            storage_dir="pokemon_images", sha256=SHA256, variant="thumbnail", image_format=ImageVariantFormats.WEBP
+        )
+        assert (generated_variants[0].width, generated_variants[0].height) == (64, 48)
+        assert generated_variants[0].content_type == "image/webp"
+        assert await self.storage.exists(key=generated_variants[0].storage_key)
+        assert not self.generator.is_supported(variant="thumbnail", image_format=ImageVariantFormats.AVIF)
+
+    def tearDown(self) -> None:
+        self.process_pool.shutdown()
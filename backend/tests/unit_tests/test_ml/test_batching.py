@@ -0,0 +1,127 @@
+import asyncio
+import unittest
+
+import numpy
+
+from src.ml.batching import MicroBatcher
+from src.ml.inference import InferenceEngine
+from src.ml.registry import ModelHandle
+from src.utility.enums.model import ModelFrameworks
+from src.utility.metrics.definitions import inference_batch_size, inference_request_duration_seconds
+
+
+class RecordingModel:
+    def __init__(self, is_failing: bool = False) -> None:
+        self.is_failing = is_failing
+        self.batch_sizes: list[int] = list()
+
+    def predict_proba(self, features: numpy.ndarray) -> numpy.ndarray:
+        self.batch_sizes.append(len(features))
+        if self.is_failing:
+            raise RuntimeError("model failed")
+        return numpy.column_stack([features[:, 0], 1 - features[:, 0]])
+
+
+class TestMicroBatching(unittest.IsolatedAsyncioTestCase):
+    async def test_micro_batcher_groups_concurrent_predictions(self) -> None:
+        model = RecordingModel()
+        batcher = MicroBatcher(
+            name="test-grouping", predict_batch=model.predict_proba, max_batch_size=4, max_wait_ms=50
+        )
+
+        results = await asyncio.gather(
+            *(batcher.predict(features=numpy.array([value / 10], dtype=numpy.float32)) for value in range(10))
+        )
+
+        assert model.batch_sizes == [4, 4, 2]
+        assert [round(float(result[0]), 2) for result in results] == [value / 10 for value in range(10)]
+        assert inference_batch_size.count("test-grouping") == 3
+        assert inference_request_duration_seconds.count("test-grouping") == 10
+        await batcher.close()
+
+    async def test_micro_batcher_dispatches_partial_batch_after_max_wait(self) -> None:
+        model = RecordingModel()
+        batcher = MicroBatcher(name="test-wait", predict_batch=model.predict_proba, max_batch_size=64, max_wait_ms=1)
+
+        result = await asyncio.wait_for(batcher.predict(features=numpy.array([0.25])), timeout=1)
+
+        assert result.tolist() == [0.25, 0.75]
+        assert model.batch_sizes == [1]
+        await batcher.close()
+
+    async def test_micro_batcher_fails_every_prediction_of_failed_batch(self) -> None:
+        batcher = MicroBatcher(
+            name="test-failure",
+            predict_batch=RecordingModel(is_failing=True).predict_proba,
+            max_batch_size=8,
+            max_wait_ms=5,
+        )
+
+        results = await asyncio.gather(
+            *(batcher.predict(features=numpy.array([0.5])) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        # The batcher keeps serving after a failed batch
+        batcher.predict_batch = RecordingModel().predict_proba
+        assert (await batcher.predict(features=numpy.array([0.5]))).tolist() == [0.5, 0.5]
+        await batcher.close()
+
+    async def test_micro_batcher_skips_cancelled_predictions(self) -> None:
+        model = RecordingModel()
+        batcher = MicroBatcher(name="test-cancel", predict_batch=model.predict_proba, max_batch_size=8, max_wait_ms=20)
+
+        cancelled_prediction = asyncio.create_task(batcher.predict(features=numpy.array([0.1])))
+        await asyncio.sleep(0)
+        cancelled_prediction.cancel()
+        result = await batcher.predict(features=numpy.array([0.2]))
+
+        assert numpy.allclose(result, [0.2, 0.8])
+        assert model.batch_sizes == [1]
+        await batcher.close()
+
+    async def test_inference_engine_batches_per_model_version(self) -> None:
+        engine = InferenceEngine(max_batch_size=16, max_wait_ms=20, max_workers=2)
+        models = {version: RecordingModel() for version in ("v1", "v2")}
+        handles = {
+            version: ModelHandle(
+                framework=ModelFrameworks.SKLEARN, name="test-engine", version=version, sha256="0" * 64, model=model
+            )
+            for version, model in models.items()
+        }
+
+        await asyncio.gather(
+            *(
+                engine.predict_proba(handle=handles[version], features=numpy.array([0.5]))
+                for version in ("v1", "v2", "v1", "v2", "v1")
+            )
+        )
+
+        assert models["v1"].batch_sizes == [3]
+        assert models["v2"].batch_sizes == [2]
+        await engine.close()
+
+    async def test_inference_engine_retires_superseded_versions(self) -> None:
+        engine = InferenceEngine(max_batch_size=16, max_wait_ms=20, max_workers=2)
+        models = {"v1": RecordingModel(), "v2": RecordingModel()}
+        handles = {
+            version: ModelHandle(
+                framework=ModelFrameworks.SKLEARN, name="classifier", version=version, sha256="0" * 64, model=model
+            )
+            for version, model in models.items()
+        }
+        await engine.predict_proba(handle=handles["v2"], features=numpy.array([0.5]))
+        superseded_batcher = engine._get_batcher(handle=handles["v1"])
+        queued_prediction = asyncio.create_task(
+            engine.predict_proba(handle=handles["v1"], features=numpy.array([0.25]))
+        )
+        await asyncio.sleep(0)
+
+        engine.retire_model(model_name="classifier", model_version="v2")
+
+        assert list(engine._batchers) == [("classifier", "v2")]
+        # The prediction queued before the promotion is still answered by the superseded version
+        assert numpy.allclose(await queued_prediction, [0.25, 0.75])
+        await asyncio.gather(*engine._retiring_tasks)
+        assert superseded_batcher._worker is None
+        await engine.close()
@@ -0,0 +1,85 @@
+import datetime
+import pathlib
+import tempfile
+import unittest
+import uuid
+
+import numpy
+
+from src.ml.dataset import DatasetManifest, DatasetWriter, read_dataset
+
+IDS: list[uuid.UUID] = [uuid.UUID(int=index) for index in range(10)]
+
+
+def _load_manifest(dataset_dir: pathlib.Path) -> DatasetManifest:
+    return DatasetManifest.load(dataset_dir=dataset_dir, feature_version="v1", dimension=2, shard_size=4)
+
+
+def _encode_features(values: list[int]) -> numpy.ndarray:
+    return numpy.array([[value, -value] for value in values], dtype=numpy.float32)
+
+
+class TestDatasetWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.dataset_dir = pathlib.Path(self.root_dir.name) / "v1"
+
+    def test_fixed_size_shards_are_filled_across_exports(self) -> None:
+        changed_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        writer = DatasetWriter(manifest=_load_manifest(dataset_dir=self.dataset_dir))
+        writer.append(features=_encode_features(values=[0, 1, 2]), labels=["a", "b", "c"], ids=IDS[:3])
+        writer.append(features=_encode_features(values=[3, 4, 5]), labels=["d", "e", "f"], ids=IDS[3:6])
+        writer.flush(last_changed_at=changed_at, last_id=IDS[5])
+
+        manifest = _load_manifest(dataset_dir=self.dataset_dir)
+        assert [shard.rows for shard in manifest.shards] == [4, 2]
+        assert (manifest.last_changed_at, manifest.last_id) == (changed_at, IDS[5])
+
+        # The image `IDS[1]` was renamed since the first export
+        writer = DatasetWriter(manifest=manifest)
+        writer.append(features=_encode_features(values=[6, 7, 1]), labels=["g", "h", "bb"], ids=IDS[6:8] + [IDS[1]])
+        writer.flush(last_changed_at=changed_at, last_id=IDS[1])
+
+        assert [shard.rows for shard in _load_manifest(dataset_dir=self.dataset_dir).shards] == [4, 4, 1]
+        assert not any(path.name.startswith(".") for path in self.dataset_dir.iterdir())
+
+        dataset = read_dataset(dataset_dir=self.dataset_dir)
+        features = numpy.concatenate([shard_features[is_current] for shard_features, _, is_current in dataset])
+        labels = numpy.concatenate([shard_labels[is_current] for _, shard_labels, is_current in dataset])
+
+        assert isinstance(dataset[0][0], numpy.memmap)
+        assert features[:, 0].tolist() == [0, 2, 3, 4, 5, 6, 7, 1]
+        assert labels.tolist() == ["a", "c", "d", "e", "f", "g", "h", "bb"]
+
+    def test_untouched_short_shard_is_kept(self) -> None:
+        writer = DatasetWriter(manifest=_load_manifest(dataset_dir=self.dataset_dir))
+        writer.append(features=_encode_features(values=[0]), labels=["a"], ids=IDS[:1])
+        writer.flush(last_changed_at=None, last_id=None)
+
+        DatasetWriter(manifest=_load_manifest(dataset_dir=self.dataset_dir)).flush(last_changed_at=None, last_id=None)
+
+        assert [shard.rows for shard in _load_manifest(dataset_dir=self.dataset_dir).shards] == [1]
+        assert read_dataset(dataset_dir=self.dataset_dir)[0][1].tolist() == ["a"]
+
+    def test_deleted_images_are_masked_out(self) -> None:
+        writer = DatasetWriter(manifest=_load_manifest(dataset_dir=self.dataset_dir))
+        writer.append(features=_encode_features(values=[0, 1, 2, 3, 4]), labels=list("abcde"), ids=IDS[:5])
+        writer.flush(last_changed_at=None, last_id=None)
+
+        manifest = _load_manifest(dataset_dir=self.dataset_dir)
+        assert manifest.read_ids() == IDS[:5]
+        writer = DatasetWriter(manifest=manifest)
+        writer.delete(ids=[IDS[1], IDS[4]])
+        writer.flush(last_changed_at=None, last_id=None)
+
+        manifest = _load_manifest(dataset_dir=self.dataset_dir)
+        assert manifest.deleted_ids == {IDS[1], IDS[4]}
+        assert manifest.read_ids() == [IDS[0], IDS[2], IDS[3]]
+        assert [shard.rows for shard in manifest.shards] == [4, 1]
+        labels = numpy.concatenate(
+            [shard_labels[is_current] for _, shard_labels, is_current in read_dataset(dataset_dir=self.dataset_dir)]
+        )
+        assert labels.tolist() == ["a", "c", "d"]
+
+    def tearDown(self) -> None:
+        self.root_dir.cleanup()
@@ -0,0 +1,113 @@
+import pathlib
+import tempfile
+import unittest
+import uuid
+
+import numpy
+
+from src.ml.embedding_index import EmbeddingIndex, EmbeddingProjection, normalize_rows
+
+IDS: list[uuid.UUID] = [uuid.UUID(int=index) for index in range(2000)]
+
+
+def _sample_clustered_vectors(count: int, dimension: int = 16, clusters: int = 8) -> numpy.ndarray:
+    generator = numpy.random.default_rng(1)
+    centers = generator.standard_normal((clusters, dimension))
+    return (centers[numpy.arange(count) % clusters] + 0.1 * generator.standard_normal((count, dimension))).astype(
+        numpy.float32
+    )
+
+
+def _exact_top_k(vectors: numpy.ndarray, query: numpy.ndarray, k: int) -> list[uuid.UUID]:
+    scores = normalize_rows(vectors) @ normalize_rows(query[None])[0]
+    return [IDS[row] for row in numpy.argsort(-scores, kind="stable")[:k]]
+
+
+class TestEmbeddingIndex(unittest.TestCase):
+    def test_exhaustive_search_matches_cosine_ranking(self) -> None:
+        vectors = _sample_clustered_vectors(count=300)
+        index = EmbeddingIndex(dimension=16, initial_capacity=4)
+        index.add_many(image_ids=IDS[:100], vectors=vectors[:100])
+        index.add_many(image_ids=IDS[100:300], vectors=vectors[100:300])
+
+        results = index.search(queries=vectors[:2] * 3, k=5)
+
+        assert [[image_id for image_id, _ in result] for result in results] == [
+            _exact_top_k(vectors=vectors, query=vectors[0], k=5),
+            _exact_top_k(vectors=vectors, query=vectors[1], k=5),
+        ]
+        assert abs(results[0][0][1] - 1.0) < 1e-5
+        assert len(index.search(queries=vectors[0], k=1000)[0]) == 300
+
+    def test_tombstones_and_replacements_are_never_returned(self) -> None:
+        vectors = _sample_clustered_vectors(count=100)
+        index = EmbeddingIndex(dimension=16)
+        index.add_many(image_ids=IDS[:100], vectors=vectors)
+
+        index.remove(image_id=IDS[0])
+        index.add_many(image_ids=[IDS[1]], vectors=-vectors[1:2])
+
+        (result,) = index.search(queries=vectors[0], k=100)
+        assert IDS[0] not in [image_id for image_id, _ in result]
+        assert numpy.allclose(index.get(image_id=IDS[1]), normalize_rows(-vectors[1:2])[0])
+        assert len(result) == len(index) == 99
+
+        index.remove_many(image_ids=IDS[2:80])
+
+        assert len(index) == 21
+        assert len(index._ids) <= 2 * len(index)
+        assert index.get(image_id=IDS[1]) is not None and index.get(image_id=IDS[2]) is None
+
+    def test_ivf_search_finds_neighbours_in_probed_lists(self) -> None:
+        vectors = _sample_clustered_vectors(count=2000)
+        index = EmbeddingIndex(dimension=16, list_count=8, probe_count=2)
+        index.add_many(image_ids=IDS[:1000], vectors=vectors[:1000])
+
+        assert not index.is_training_due(min_rows_per_list=200)
+        assert index.is_training_due(min_rows_per_list=100)
+        index.train(sample_size=800)
+        assert not index.is_training_due(min_rows_per_list=100)
+        index.add_many(image_ids=IDS[1000:], vectors=vectors[1000:])
+
+        results = index.search(queries=vectors[:16], k=10)
+        recall = numpy.mean(
+            [
+                len(
+                    {image_id for image_id, _ in result} & set(_exact_top_k(vectors=vectors, query=vectors[row], k=10))
+                )
+                / 10
+                for row, result in enumerate(results)
+            ]
+        )
+        assert recall >= 0.9
+        assert index.is_training_due(min_rows_per_list=100)
+
+    def test_index_persists_live_rows_and_centroids(self) -> None:
+        vectors = _sample_clustered_vectors(count=400)
+        index = EmbeddingIndex(dimension=16, list_count=4, probe_count=4)
+        index.add_many(image_ids=IDS[:400], vectors=vectors)
+        index.train()
+        index.remove(image_id=IDS[3])
+
+        with tempfile.TemporaryDirectory() as root_dir:
+            path = pathlib.Path(root_dir) / "index" / "embeddings.npz"
+            index.save(path=path, version="v1")
+            loaded_index = EmbeddingIndex(dimension=16, list_count=4, probe_count=4)
+
+            assert not loaded_index.load(path=path, version="v2")
+            assert loaded_index.load(path=path, version="v1")
+            assert [file.name for file in path.parent.iterdir()] == ["embeddings.npz"]
+
+        assert loaded_index.is_trained and len(loaded_index) == 399 and IDS[3] not in loaded_index
+        assert loaded_index.search(queries=vectors[:3], k=5) == index.search(queries=vectors[:3], k=5)
+
+    def test_projection_roughly_preserves_cosine_similarity(self) -> None:
+        projection = EmbeddingProjection(input_dimension=2048, dimension=256)
+        features = numpy.random.default_rng(2).standard_normal((20, 2048)).astype(numpy.float32)
+        features[1] = features[0] + 0.3 * features[1]
+
+        original = normalize_rows(features) @ normalize_rows(features).T
+        projected = normalize_rows(projection.project(features)) @ normalize_rows(projection.project(features)).T
+
+        assert numpy.abs(original - projected).max() < 0.25
+        assert numpy.array_equal(projection.matrix, EmbeddingProjection(input_dimension=2048, dimension=256).matrix)
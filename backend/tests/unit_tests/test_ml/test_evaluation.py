@@ -0,0 +1,193 @@
+import asyncio
+import datetime
+import pathlib
+import tempfile
+import typing
+import unittest
+import uuid
+
+import numpy
+
+from src.ml.evaluation import EVALUATION_RECORD_DTYPE, EvaluationLog, ModelEvaluator, summarize_evaluation
+from src.models.schema.prediction import PredictionInResponse
+from src.storage.memory import MemoryStorage
+from src.utility.exceptions.custom import ModelDoesNotExist
+
+LIVE_CONTENT_HASH: str = "f" * 64
+CANDIDATE_CONTENT_HASH: str = "0" * 64
+
+
+class FakePredictionCache:
+    def __init__(
+        self, labels: dict[str, str], delays: dict[str, float] | None = None, cached_models: set[str] | None = None
+    ) -> None:
+        self.labels = labels
+        self.delays = delays or dict()
+        self.cached_models = cached_models or set()
+        self.calls: list[tuple[str, str | None]] = list()
+
+    async def predict(self, **kwargs: typing.Any) -> PredictionInResponse:
+        prediction, _ = await self.predict_with_cache_status(**kwargs)
+        return prediction
+
+    async def predict_with_cache_status(
+        self,
+        storage: MemoryStorage,
+        content_hash: str,
+        source_key: str,
+        model_name: str,
+        model_version: str | None = None,
+    ) -> tuple[PredictionInResponse, bool]:
+        self.calls.append((model_name, model_version))
+        if model_name not in self.labels:
+            raise ModelDoesNotExist("missing")
+        await asyncio.sleep(self.delays.get(model_name, 0))
+        prediction = PredictionInResponse(
+            content_hash=content_hash,
+            model_name=model_name,
+            model_version=model_version or "1",
+            label=self.labels[model_name],
+            confidence=0.9,
+            created_at=datetime.datetime.now(tz=datetime.timezone.utc),
+        )
+        return prediction, model_name in self.cached_models
+
+
+def _encode_records(rows: list[tuple[int, uuid.UUID, str, bool, bool, str, float]]) -> numpy.ndarray:
+    records = numpy.zeros(len(rows), dtype=EVALUATION_RECORD_DTYPE)
+    for record, (request_id, pokemon_image_id, model_name, is_served, is_cache_hit, label, latency) in zip(
+        records, rows
+    ):
+        record["request_id"] = request_id
+        record["pokemon_image_id"] = pokemon_image_id.bytes
+        record["model_name"] = model_name.encode()
+        record["model_version"] = b"1"
+        record["is_served"] = is_served
+        record["is_cache_hit"] = is_cache_hit
+        record["label"] = label.encode()
+        record["latency"] = latency
+    return records
+
+
+class TestModelEvaluator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.log_dir = tempfile.TemporaryDirectory()
+
+    def _create_evaluator(
+        self, prediction_cache: FakePredictionCache, traffic_fraction: float = 0.5, max_pending_shadows: int = 8
+    ) -> ModelEvaluator:
+        return ModelEvaluator(
+            prediction_cache=prediction_cache,  # type: ignore
+            evaluation_log=EvaluationLog(log_dir=self.log_dir.name, flush_size=1000),
+            live_model_name="live",
+            candidate_model_name="candidate",
+            candidate_model_version="2",
+            traffic_fraction=traffic_fraction,
+            is_shadowed=True,
+            max_pending_shadows=max_pending_shadows,
+        )
+
+    def test_candidate_traffic_fraction_is_stable_per_content(self) -> None:
+        evaluator = self._create_evaluator(prediction_cache=FakePredictionCache(labels={}), traffic_fraction=0.25)
+        content_hashes = [f"{index:08x}" * 8 for index in range(0, 2**32, 2**32 // 1000)]
+
+        routed = [evaluator.is_routed_to_candidate(content_hash) for content_hash in content_hashes]
+
+        assert 0.24 < sum(routed) / len(routed) < 0.26
+        assert routed == [evaluator.is_routed_to_candidate(content_hash) for content_hash in content_hashes]
+        assert evaluator.is_routed_to_candidate(CANDIDATE_CONTENT_HASH)
+        assert not evaluator.is_routed_to_candidate(LIVE_CONTENT_HASH)
+
+    async def test_shadow_prediction_does_not_delay_the_served_one(self) -> None:
+        prediction_cache = FakePredictionCache(
+            labels={"live": "pikachu", "candidate": "raichu"}, delays={"candidate": 0.2}, cached_models={"live"}
+        )
+        evaluator = self._create_evaluator(prediction_cache=prediction_cache)
+
+        started_at = asyncio.get_running_loop().time()
+        prediction = await evaluator.predict(
+            storage=MemoryStorage(), pokemon_image_id=uuid.uuid4(), content_hash=LIVE_CONTENT_HASH, source_key="a"
+        )
+
+        assert asyncio.get_running_loop().time() - started_at < 0.1
+        assert (prediction.model_name, prediction.label) == ("live", "pikachu")
+
+        await evaluator.close()
+        records = EvaluationLog.read(paths=pathlib.Path(self.log_dir.name).glob("*.evaluation"))
+
+        assert prediction_cache.calls == [("live", None), ("candidate", "2")]
+        assert records["is_served"].tolist() == [True, False]
+        assert records["is_cache_hit"].tolist() == [True, False]
+        assert records["label"].tolist() == [b"pikachu", b"raichu"]
+        assert records["request_id"][0] == records["request_id"][1]
+        assert records["latency"][1] >= 0.2
+
+    async def test_broken_candidate_falls_back_to_the_live_model(self) -> None:
+        prediction_cache = FakePredictionCache(labels={"live": "pikachu"})
+        evaluator = self._create_evaluator(prediction_cache=prediction_cache, max_pending_shadows=0)
+
+        prediction = await evaluator.predict(
+            storage=MemoryStorage(), pokemon_image_id=uuid.uuid4(), content_hash=CANDIDATE_CONTENT_HASH, source_key="a"
+        )
+        await evaluator.close()
+
+        assert prediction.model_name == "live"
+        assert prediction_cache.calls == [("candidate", "2"), ("live", None)]
+
+    def test_values_wider_than_their_fields_are_not_recorded(self) -> None:
+        evaluation_log = EvaluationLog(log_dir=self.log_dir.name, flush_size=1000)
+        prediction = PredictionInResponse(
+            content_hash=LIVE_CONTENT_HASH,
+            model_name="live",
+            model_version="1",
+            label="pikachu",
+            confidence=0.9,
+            created_at=datetime.datetime.now(tz=datetime.timezone.utc),
+        )
+
+        for label in ("é" * 62, "é" * 63):
+            with self.subTest(label_size=len(label.encode())):
+                evaluation_log.record(
+                    request_id=1,
+                    pokemon_image_id=uuid.uuid4(),
+                    prediction=prediction.copy(update={"label": label}),
+                    is_served=True,
+                    is_cache_hit=False,
+                    latency=0.01,
+                )
+
+        assert len(evaluation_log) == 1
+
+    def tearDown(self) -> None:
+        self.log_dir.cleanup()
+
+
+class TestEvaluationSummary(unittest.TestCase):
+    def test_models_are_compared_with_player_names(self) -> None:
+        first_image, second_image, unnamed_image = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        records = _encode_records(
+            rows=[
+                (1, first_image, "live", True, False, "Pikachu", 0.010),
+                (1, first_image, "candidate", False, False, "pikachu", 0.030),
+                (2, second_image, "candidate", True, False, "Raichu", 0.020),
+                (2, second_image, "live", False, False, "pikachu", 0.010),
+                (3, unnamed_image, "live", True, False, "eevee", 0.010),
+                (4, first_image, "candidate", True, True, "pikachu", 0.0001),
+            ]
+        )
+
+        summaries: dict[str, typing.Any] = {
+            summary.model_name: summary
+            for summary in summarize_evaluation(
+                records=records, image_names={first_image: "PIKACHU", second_image: "raichu"}
+            )
+        }
+
+        assert (summaries["live"].served, summaries["live"].shadowed) == (2, 1)
+        assert (summaries["live"].correct, summaries["live"].labelled) == (1, 2)
+        assert (summaries["candidate"].correct, summaries["candidate"].labelled) == (3, 3)
+        assert (summaries["candidate"].agreed, summaries["candidate"].compared) == (1, 2)
+        assert (summaries["candidate"].cache_hits, summaries["live"].cache_hits) == (1, 0)
+        # The cache hit is counted, but only the misses make up the latency percentiles
+        assert summaries["candidate"].served_latency_p50 == numpy.float32(0.020)
+        assert str(summaries["candidate"]).startswith("candidate:1 --- served 2, shadowed 1, accuracy 100.00% of 3")
@@ -0,0 +1,131 @@
+import hashlib
+import tempfile
+import threading
+import unittest
+
+import numpy
+from PIL import Image
+
+from src.ml.feature_store import FeatureStore
+from src.ml.features import FeatureExtractor
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+from src.utility.concurrency.process_pool import ProcessPool
+from tests.utility import encode_image
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.read_keys: list[str] = list()
+
+    async def read(self, key: str) -> bytes:
+        self.read_keys.append(key)
+        return await super().read(key=key)
+
+
+class TestFeatureStore(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.process_pool = ProcessPool(max_workers=1)
+
+    def _create_store(self) -> FeatureStore:
+        return FeatureStore(
+            root_dir=self.root_dir.name,
+            extractor=FeatureExtractor(image_size=16, color_bins=4, orientation_bins=4, cell_size=8),
+            cache_size=2,
+            process_pool=self.process_pool,
+        )
+
+    @staticmethod
+    def _fill_features(store: FeatureStore, value: float) -> numpy.ndarray:
+        return numpy.full(store.extractor.dimension, value, dtype=numpy.float32)
+
+    def test_rows_persist_across_instances(self) -> None:
+        writer = self._create_store()
+        reader = self._create_store()
+        content_hashes = [hashlib.sha256(bytes([index])).hexdigest() for index in range(3)]
+
+        assert reader.get(content_hash=content_hashes[0]) is None
+        writer.put_many(
+            {content_hash: self._fill_features(writer, index) for index, content_hash in enumerate(content_hashes)}
+        )
+        # A second write of a stored hash is skipped instead of appended again
+        writer.put_many({content_hashes[0]: self._fill_features(writer, 9.0)})
+
+        assert len(reader) == 3
+        for index, content_hash in enumerate(content_hashes):
+            features = reader.get(content_hash=content_hash)
+            assert features.tolist() == self._fill_features(reader, index).tolist()  # type: ignore
+            assert not features.flags.writeable  # type: ignore
+        assert writer.features_path.stat().st_size == 3 * writer.row_size
+        assert reader.version_dir.name == reader.extractor.version
+
+    def test_cached_rows_do_not_pin_superseded_maps(self) -> None:
+        store = self._create_store()
+        store.put_many({"aa" * 32: self._fill_features(store, 1.0)})
+        first_features = store.get(content_hash="aa" * 32)
+        first_map = store._features
+
+        store.put_many({"bb" * 32: self._fill_features(store, 2.0)})
+        second_features = store.get(content_hash="bb" * 32)
+
+        assert first_features is not None and second_features is not None
+        assert first_features.base is None and second_features.base is None
+        assert store._features is not first_map and len(store._features) == 2  # type: ignore
+        assert store.get(content_hash="aa" * 32) is first_features
+
+    def test_partial_writes_are_cut_off(self) -> None:
+        store = self._create_store()
+        store.put_many({"aa" * 32: self._fill_features(store, 1.0)})
+        with open(store.features_path, "ab") as features_file:
+            features_file.write(b"\x00" * 10)
+        with open(store.index_path, "ab") as index_file:
+            index_file.write(b"\x00" * 7)
+
+        store.put_many({"bb" * 32: self._fill_features(store, 2.0)})
+
+        reopened_store = self._create_store()
+        assert len(reopened_store) == 2
+        features = reopened_store.get(content_hash="bb" * 32)
+        assert features is not None and features.tolist() == self._fill_features(store, 2.0).tolist()
+        assert store.features_path.stat().st_size == 2 * store.row_size
+
+    async def test_only_missing_images_are_extracted(self) -> None:
+        storage = CountingStorage()
+        images: list[tuple[str, str]] = list()
+        for color in ("red", "blue", "red"):
+            image_bytes = encode_image(Image.new("RGB", (24, 24), color))
+            content_hash = hashlib.sha256(image_bytes).hexdigest()
+            await storage.put(key=f"masters/{content_hash}", chunks=iterate_content(content=image_bytes))
+            images.append((content_hash, f"masters/{content_hash}"))
+        store = self._create_store()
+
+        first_features = await store.load(storage=storage, images=images)
+        second_features = await store.load(storage=storage, images=list(reversed(images)))
+
+        assert sorted(storage.read_keys) == sorted({storage_key for _, storage_key in images})
+        assert first_features.tolist() == second_features[::-1].tolist()
+        assert first_features[0].tolist() == first_features[2].tolist()
+        assert numpy.allclose(first_features[0, :3], [1.0, 0.0, 0.0])
+
+    async def test_stored_rows_are_looked_up_off_the_event_loop(self) -> None:
+        writer = self._create_store()
+        writer.put_many({"a" * 64: self._fill_features(writer, 3.0)})
+        store = self._create_store()
+        lookup_threads: list[threading.Thread] = list()
+        get = store.get
+
+        def recording_get(content_hash: str) -> numpy.ndarray | None:
+            lookup_threads.append(threading.current_thread())
+            return get(content_hash=content_hash)
+
+        store.get = recording_get  # type: ignore[method-assign]
+        features = await store.load(storage=CountingStorage(), images=[("a" * 64, "masters/a")])
+
+        assert features.tolist() == [[3.0] * store.extractor.dimension]
+        assert lookup_threads and threading.main_thread() not in lookup_threads
+
+    def tearDown(self) -> None:
+        self.process_pool.shutdown()
+        self.root_dir.cleanup()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy
+from PIL import Image
+
+from src.ml.features import FeatureExtractor
+from tests.utility import encode_image
+
+
+class TestFeatureExtractor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.extractor = FeatureExtractor(image_size=16, color_bins=4, orientation_bins=4, cell_size=8)
+
+    def test_rows_are_contiguous_float32(self) -> None:
+        images = [
+            encode_image(Image.new("RGB", (40, 30), "red")),
+            encode_image(Image.effect_noise((64, 64), 64).convert("RGB"), image_format="JPEG"),
+        ]
+
+        features = self.extractor.extract_from_bytes(images=images)
+
+        assert features.shape == (2, self.extractor.dimension) == (2, 16 * 16 * 3 + 3 * 4 + 4 * 4)
+        assert features.dtype == numpy.float32 and features.flags.c_contiguous
+        assert features[0, : self.extractor.pixel_dimension].reshape(16, 16, 3)[5, 5].tolist() == [1.0, 0.0, 0.0]
+        # Each channel histogram sums to one
+        color_histograms = features[
+            :, self.extractor.pixel_dimension : self.extractor.pixel_dimension + self.extractor.color_dimension
+        ]
+        assert numpy.allclose(color_histograms.reshape(2, 3, 4).sum(axis=2), numpy.ones((2, 3)))
+        assert color_histograms[0].tolist() == [0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0]
+
+    def test_batch_matches_single_images(self) -> None:
+        images = [encode_image(Image.effect_noise((32, 24), 32 + index * 16).convert("RGB")) for index in range(5)]
+        out = numpy.full((5, self.extractor.dimension), numpy.nan, dtype=numpy.float32)
+
+        batch_features = self.extractor.extract(pixels=self.extractor.decode_batch(images=images), out=out)
+
+        assert batch_features is out
+        for index, image_bytes in enumerate(images):
+            assert numpy.allclose(self.extractor.extract_from_bytes(images=[image_bytes])[0], batch_features[index])
+
+    def test_transparency_is_flattened_onto_white(self) -> None:
+        pixels = self.extractor.decode_batch(images=[encode_image(Image.new("RGBA", (16, 16), (0, 0, 0, 0)))])
+
+        assert (pixels == 255).all()
+
+    def test_gradient_orientations_are_binned(self) -> None:
+        stripes = numpy.zeros((16, 16, 3), dtype=numpy.uint8)
+        stripes[:, ::4] = 255
+
+        features = self.extractor.extract(pixels=stripes[None])
+        orientations = features[0, -self.extractor.orientation_dimension :].reshape(4, 4)
+
+        # Vertical stripes only have horizontal gradients, which all land in the first orientation bin
+        assert numpy.allclose(orientations[:, 1:], numpy.zeros((4, 3)))
+        assert numpy.isclose(numpy.linalg.norm(orientations), 1.0)
+
+    def test_version_tracks_parameters(self) -> None:
+        assert (
+            self.extractor.version
+            != FeatureExtractor(image_size=16, color_bins=8, orientation_bins=4, cell_size=8).version
+        )
+        with self.assertRaises(ValueError):
+            FeatureExtractor(image_size=16, color_bins=6, orientation_bins=4, cell_size=8)
+        with self.assertRaises(ValueError):
+            FeatureExtractor(image_size=20, color_bins=8, orientation_bins=4, cell_size=8)
@@ -0,0 +1,139 @@
+import asyncio
+import datetime
+import hashlib
+import io
+import tempfile
+import types
+import typing
+import unittest
+
+import joblib
+import numpy
+from PIL import Image
+from sklearn.linear_model import LogisticRegression
+
+from src.ml.feature_store import FeatureStore
+from src.ml.features import FeatureExtractor
+from src.ml.inference import InferenceEngine
+from src.ml.predictions import PredictionCache
+from src.ml.registry import ModelRegistry
+from src.models.schema.prediction import PredictionInResponse
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+from src.utility.concurrency.process_pool import ProcessPool
+from src.utility.enums.model import ModelFrameworks
+from src.utility.exceptions.custom import EntityDoesNotExist
+from tests.utility import encode_image
+
+EXTRACTOR: FeatureExtractor = FeatureExtractor(image_size=16, color_bins=4, orientation_bins=4, cell_size=8)
+
+
+class FakePredictionCRUDRepository:
+    def __init__(self, predictions: dict[tuple[str, str, str], types.SimpleNamespace]) -> None:
+        self.predictions = predictions
+        self.async_session = types.SimpleNamespace(close=self.close)
+
+    async def close(self) -> None:
+        pass
+
+    async def read_prediction(self, content_hash: str, model_name: str, model_version: str) -> types.SimpleNamespace:
+        if (content_hash, model_name, model_version) not in self.predictions:
+            raise EntityDoesNotExist("missing")
+        return self.predictions[(content_hash, model_name, model_version)]
+
+    async def create_prediction(self, **kwargs: typing.Any) -> types.SimpleNamespace:
+        prediction = types.SimpleNamespace(**kwargs, created_at=datetime.datetime.now(tz=datetime.timezone.utc))
+        self.predictions[(kwargs["content_hash"], kwargs["model_name"], kwargs["model_version"])] = prediction
+        return prediction
+
+
+async def _publish_classifier(storage: MemoryStorage, version: str, labels: tuple[str, str]) -> None:
+    features = EXTRACTOR.extract_from_bytes(
+        images=[encode_image(Image.new("RGB", (24, 24), "red")), encode_image(Image.new("RGB", (24, 24), "blue"))]
+    )
+    buffer = io.BytesIO()
+    joblib.dump(LogisticRegression().fit(features, labels), buffer)
+    key = f"models/sklearn/pokemon_classifier/{version}/model.joblib"
+    await storage.put(key=key, chunks=iterate_content(content=buffer.getvalue()))
+    await storage.put(
+        key=f"{key}.sha256", chunks=iterate_content(content=hashlib.sha256(buffer.getvalue()).hexdigest().encode())
+    )
+
+
+class TestPredictionCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.storage = MemoryStorage()
+        self.red_image = encode_image(Image.new("RGB", (24, 24), "red"))
+        self.content_hash = hashlib.sha256(self.red_image).hexdigest()
+        await self.storage.put(key=f"masters/{self.content_hash}", chunks=iterate_content(content=self.red_image))
+        await _publish_classifier(storage=self.storage, version="v1", labels=("charmander", "squirtle"))
+
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.predictions: dict[tuple[str, str, str], types.SimpleNamespace] = dict()
+        self.process_pool = ProcessPool(max_workers=1)
+        self.inference_engine = InferenceEngine(max_batch_size=8, max_wait_ms=1, max_workers=1)
+        self.registry = ModelRegistry(
+            model_dirs={ModelFrameworks.SKLEARN: "models/sklearn"},
+            model_extensions={ModelFrameworks.SKLEARN: (".joblib",)},
+            cache_dir=f"{self.root_dir.name}/models",
+        )
+        self.prediction_cache = PredictionCache(
+            max_size=16,
+            ttl=60,
+            registry=self.registry,
+            feature_store=FeatureStore(
+                root_dir=f"{self.root_dir.name}/features",
+                extractor=EXTRACTOR,
+                cache_size=16,
+                process_pool=self.process_pool,
+            ),
+            inference_engine=self.inference_engine,
+            prediction_crud_factory=lambda: FakePredictionCRUDRepository(predictions=self.predictions),  # type: ignore
+        )
+        self.registry.add_promotion_listener(listener=self.prediction_cache.invalidate_model)
+        await self.registry.discover(storage=self.storage)
+
+    async def _predict(self) -> PredictionInResponse:
+        return await self.prediction_cache.predict(
+            storage=self.storage,
+            content_hash=self.content_hash,
+            source_key=f"masters/{self.content_hash}",
+            model_name="pokemon_classifier",
+        )
+
+    async def test_one_inference_runs_per_content_and_model_version(self) -> None:
+        first_predictions = await asyncio.gather(*(self._predict() for _ in range(5)))
+
+        assert list(self.predictions) == [(self.content_hash, "pokemon_classifier", "v1")]
+        assert all(prediction is first_predictions[0] for prediction in first_predictions)
+        assert first_predictions[0].label == "charmander"
+        _, is_cache_hit = await self.prediction_cache.predict_with_cache_status(
+            storage=self.storage,
+            content_hash=self.content_hash,
+            source_key=f"masters/{self.content_hash}",
+            model_name="pokemon_classifier",
+        )
+        assert is_cache_hit
+
+    async def test_stored_rows_serve_a_cold_cache(self) -> None:
+        await self._predict()
+        # Rows written through to the table serve a cold cache without touching the image again
+        self.prediction_cache._cache.clear()
+        del self.storage.objects[f"masters/{self.content_hash}"]
+
+        assert (await self._predict()).model_version == "v1"
+        assert len(self.prediction_cache) == 1
+
+    async def test_promotion_invalidates_cached_predictions(self) -> None:
+        await self._predict()
+        await _publish_classifier(storage=self.storage, version="v2", labels=("vulpix", "totodile"))
+        await self.registry.discover(storage=self.storage)
+
+        assert len(self.prediction_cache) == 0
+        promoted_prediction = await self._predict()
+        assert (promoted_prediction.model_version, promoted_prediction.label) == ("v2", "vulpix")
+
+    async def asyncTearDown(self) -> None:
+        await self.inference_engine.close()
+        self.process_pool.shutdown()
+        self.root_dir.cleanup()
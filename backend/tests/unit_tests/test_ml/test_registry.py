@@ -0,0 +1,152 @@
+import asyncio
+import hashlib
+import io
+import pathlib
+import tempfile
+import unittest
+
+import joblib
+import numpy
+from sklearn.linear_model import LinearRegression
+
+from src.config.setup import settings
+from src.ml import registry as registry_module
+from src.ml.registry import get_version_sort_key, ModelRegistry, parse_model_artifact_key
+from src.storage.base import iterate_content
+from src.storage.memory import MemoryStorage
+from src.utility.enums.model import ModelFrameworks
+from src.utility.exceptions.custom import InvalidModelArtifact, ModelDoesNotExist
+
+
+def _dump_model(coefficient: float) -> bytes:
+    model = LinearRegression().fit(numpy.arange(10.0).reshape(-1, 1), numpy.arange(10.0) * coefficient)
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.getvalue()
+
+
+async def _publish_model(
+    storage: MemoryStorage, name: str, version: str, content: bytes, checksum: str | None = None
+) -> None:
+    key = f"models/sklearn/{name}/{version}/model.joblib"
+    await storage.put(key=key, chunks=iterate_content(content=content))
+    await storage.put(
+        key=f"{key}.sha256",
+        chunks=iterate_content(content=f"{checksum or hashlib.sha256(content).hexdigest()}  model.joblib\n".encode()),
+    )
+
+
+class TestModelArtifactKeys(unittest.TestCase):
+    def test_key_requires_name_version_and_extension(self) -> None:
+        artifact = parse_model_artifact_key(
+            key="models/sklearn/pricing/v2/model.joblib",
+            framework=ModelFrameworks.SKLEARN,
+            model_dir="models/sklearn",
+            extensions=(".joblib",),
+        )
+
+        assert (artifact.name, artifact.version, artifact.checksum_key) == (  # type: ignore
+            "pricing",
+            "v2",
+            "models/sklearn/pricing/v2/model.joblib.sha256",
+        )
+        for key in (
+            "models/sklearn/pricing/model.joblib",
+            "models/sklearn/pricing/v2/model.joblib.sha256",
+            "models/sklearn/pricing/v2/nested/model.joblib",
+        ):
+            with self.subTest(key=key):
+                assert (
+                    parse_model_artifact_key(
+                        key=key, framework=ModelFrameworks.SKLEARN, model_dir="models/sklearn", extensions=(".joblib",)
+                    )
+                    is None
+                )
+
+    def test_version_sort_key_compares_numbers_numerically(self) -> None:
+        assert sorted(["v10", "v9", "v1"], key=get_version_sort_key) == ["v1", "v9", "v10"]
+        assert sorted(["2024.1.10", "2024.1.9"], key=get_version_sort_key) == ["2024.1.9", "2024.1.10"]
+
+
+class TestModelRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.storage = MemoryStorage()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.registry = ModelRegistry(
+            model_dirs={ModelFrameworks.SKLEARN: "models/sklearn", ModelFrameworks.PT: "models/pt"},
+            model_extensions={ModelFrameworks.SKLEARN: (".joblib",), ModelFrameworks.PT: (".pt",)},
+            cache_dir=self.cache_dir.name,
+        )
+
+    async def test_latest_verified_version_is_loaded_once(self) -> None:
+        await _publish_model(storage=self.storage, name="pricing", version="v9", content=_dump_model(coefficient=2.0))
+        await _publish_model(storage=self.storage, name="pricing", version="v10", content=_dump_model(coefficient=3.0))
+        await self.registry.discover(storage=self.storage)
+
+        handles = await asyncio.gather(*(self.registry.load(storage=self.storage, name="pricing") for _ in range(8)))
+
+        assert self.registry.get_versions(name="pricing") == ["v9", "v10"]
+        assert all(handle is handles[0] for handle in handles)
+        assert handles[0].version == "v10"
+        assert numpy.isclose(handles[0].model.predict([[2.0]])[0], 6.0)
+        # The fitted arrays are mapped from the cached file instead of copied per worker
+        assert isinstance(handles[0].model.coef_, numpy.memmap)
+        assert [path.name for path in pathlib.Path(self.cache_dir.name).iterdir()] == [f"{handles[0].sha256}.joblib"]
+
+        pinned_handle = await self.registry.load(storage=self.storage, name="pricing", version="v9")
+        assert numpy.isclose(pinned_handle.model.predict([[2.0]])[0], 4.0)
+        assert await self.registry.load(storage=self.storage, name="pricing") is handles[0]
+
+    async def test_promotion_evicts_superseded_handles(self) -> None:
+        await _publish_model(storage=self.storage, name="pricing", version="v1", content=_dump_model(coefficient=2.0))
+        await _publish_model(storage=self.storage, name="ranking", version="v1", content=_dump_model(coefficient=5.0))
+        await self.registry.discover(storage=self.storage)
+        await self.registry.load(storage=self.storage, name="pricing")
+        ranking_handle = await self.registry.load(storage=self.storage, name="ranking")
+
+        await _publish_model(storage=self.storage, name="pricing", version="v2", content=_dump_model(coefficient=3.0))
+        await self.registry.discover(storage=self.storage)
+
+        assert self.registry.handles == [ranking_handle]
+        promoted_handle = await self.registry.load(storage=self.storage, name="pricing")
+        assert promoted_handle.version == "v2"
+        assert {(handle.name, handle.version) for handle in self.registry.handles} == {
+            ("ranking", "v1"),
+            ("pricing", "v2"),
+        }
+
+    async def test_checksum_mismatch_is_rejected(self) -> None:
+        await _publish_model(
+            storage=self.storage,
+            name="pricing",
+            version="v1",
+            content=_dump_model(coefficient=2.0),
+            checksum="0" * 64,
+        )
+        await self.registry.discover(storage=self.storage)
+
+        with self.assertRaises(InvalidModelArtifact):
+            await self.registry.load(storage=self.storage, name="pricing")
+        assert list(pathlib.Path(self.cache_dir.name).iterdir()) == []
+        assert self.registry.handles == []
+
+    async def test_missing_models_and_checksums_are_rejected(self) -> None:
+        await self.storage.put(key="models/pt/ranker/1/model.pt", chunks=iterate_content(content=b"weights"))
+        await self.registry.discover(storage=self.storage)
+
+        with self.assertRaises(ModelDoesNotExist):
+            await self.registry.load(storage=self.storage, name="pricing")
+        with self.assertRaises(ModelDoesNotExist):
+            await self.registry.load(storage=self.storage, name="ranker", version="2")
+        with self.assertRaises(InvalidModelArtifact):
+            await self.registry.load(storage=self.storage, name="ranker")
+
+    def test_singleton_uses_model_settings(self) -> None:
+        assert registry_module.model_registry.model_dirs[ModelFrameworks.SKLEARN] == settings.AWS_S3_SKLEARN_MODEL_DIR
+        assert registry_module.model_registry.model_extensions[ModelFrameworks.SKLEARN] == tuple(
+            filter(None, (settings.SKLEARN_MODEL_FILE_EXTENSION_1,))
+        )
+        assert registry_module.model_registry.cache_dir == pathlib.Path(settings.MODEL_CACHE_DIR)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+
+from src.ml.registry import get_version_sort_key, ModelHandle
+from src.ml.training import get_next_online_version, IncrementalTrainer, is_held_out
+from src.utility.enums.model import ModelFrameworks
+from src.utility.exceptions.custom import ModelNotTrainable
+
+FEATURES: numpy.ndarray = numpy.array([[0.0, 1.0], [0.1, 0.9], [1.0, 0.0], [0.9, 0.1]])
+
+
+def _create_handle(model: object) -> ModelHandle:
+    return ModelHandle(framework=ModelFrameworks.SKLEARN, name="classifier", version="3", sha256="", model=model)
+
+
+class TestIncrementalTraining(unittest.TestCase):
+    def test_online_versions_sort_between_regular_versions(self) -> None:
+        versions = ["3", get_next_online_version(version="3"), "4"]
+        versions.append(get_next_online_version(version=versions[1]))
+
+        assert versions[1:] == ["3+online.1", "4", "3+online.2"]
+        assert sorted(versions, key=get_version_sort_key) == ["3", "3+online.1", "3+online.2", "4"]
+
+    def test_holdout_fraction_is_stable_per_content(self) -> None:
+        content_hashes = [f"{index:064x}" for index in range(0, 2**32, 2**32 // 1000)]
+
+        held_out = [is_held_out(content_hash=content_hash, holdout_fraction=0.1) for content_hash in content_hashes]
+
+        assert 0.09 < sum(held_out) / len(held_out) < 0.11
+        assert not any(is_held_out(content_hash=content_hash, holdout_fraction=0.0) for content_hash in content_hashes)
+
+    def test_incremental_trainer_updates_a_copy_and_skips_unknown_labels(self) -> None:
+        model = SGDClassifier(loss="log_loss", random_state=0).fit(FEATURES, ["Pikachu", "Pikachu", "Eevee", "Eevee"])
+        coefficients = model.coef_.copy()
+        trainer = IncrementalTrainer(handle=_create_handle(model=model))
+
+        trained = trainer.fit_batch(
+            features=numpy.array([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]]),
+            labels=["pikachu", "EEVEE", "mew"],
+            sample_weight=numpy.ones(3),
+        )
+
+        assert trained == 2
+        assert numpy.array_equal(model.coef_, coefficients)
+        assert not numpy.array_equal(trainer.model.coef_, coefficients)
+        assert trainer.score(trainer.model, FEATURES, numpy.array(["Pikachu", "Pikachu", "Eevee", "Eevee"])) == 1.0
+
+    def test_incremental_trainer_rejects_models_without_partial_fit(self) -> None:
+        with self.assertRaises(ModelNotTrainable):
+            IncrementalTrainer(handle=_create_handle(model=LogisticRegression().fit(FEATURES, [0, 0, 1, 1])))
@@ -0,0 +1,45 @@
+import unittest
+
+from sqlalchemy.dialects import postgresql
+
+from src.repository.crud.blob import (
+    build_blob_reference_stmt,
+    build_blob_release_stmt,
+    build_blob_releases_stmt,
+    get_blob_storage_key,
+)
+
+SHA256: str = "ab" + "0" * 62
+
+
+class TestBlobStatements(unittest.TestCase):
+    def test_blob_storage_key_is_content_addressed(self) -> None:
+        assert get_blob_storage_key(storage_dir="pokemon_images", sha256=SHA256) == f"pokemon_images/ab/{SHA256}"
+
+    def test_blob_reference_is_a_single_upsert(self) -> None:
+        statement = str(
+            build_blob_reference_stmt(sha256=SHA256, storage_key="key", content_type="image/png", size=1).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "ON CONFLICT (sha256) DO UPDATE SET ref_count = (blob.ref_count +" in statement
+        assert "released_at" in statement
+        assert "RETURNING blob.storage_key, (xmax = 0) AS is_inserted" in statement
+
+    def test_blob_release_marks_last_reference(self) -> None:
+        statement = str(build_blob_release_stmt(sha256=SHA256).compile(dialect=postgresql.dialect()))
+
+        assert "ref_count=(blob.ref_count -" in statement
+        assert "CASE WHEN (blob.ref_count =" in statement
+
+    def test_blob_releases_take_every_blob_in_one_update(self) -> None:
+        statement = str(
+            build_blob_releases_stmt(released_references={SHA256: 2, "cd" + "0" * 62: 1}).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "ref_count=(blob.ref_count - released_blob.released_references)" in statement
+        assert "FROM (VALUES" in statement
+        assert "RETURNING blob.sha256, blob.size, blob.ref_count" in statement
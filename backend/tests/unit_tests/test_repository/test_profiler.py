@@ -0,0 +1,78 @@
+import unittest
+
+import loguru
+
+from src.repository.profiler import current_repository_method, get_parameter_shape, QueryProfiler
+from src.utility.metrics.request import current_request_stats, RequestStats
+from tests.plugins.statement_budget import find_budget_violations
+
+
+class TestQueryProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query_profiler = QueryProfiler(slow_query_threshold=1.0, n_plus_one_threshold=3)
+        self.request_stats = RequestStats(route="/api/v1/account/all")
+        self.stats_token = current_request_stats.set(self.request_stats)
+        self.warnings: list[str] = list()
+        self.handler_id = loguru.logger.add(self.warnings.append, level="WARNING", format="{message}")
+
+    def test_parameter_shape_hides_values(self) -> None:
+        shape = get_parameter_shape(parameters={"username_1": "secret-user", "id_1": 3})
+
+        assert shape == "{username_1: str, id_1: int}"
+        assert "secret-user" not in shape
+
+    def test_parameter_shape_of_executemany(self) -> None:
+        assert get_parameter_shape(parameters=[{"id": 1}, {"id": 2}], executemany=True) == "2 x {id: int}"
+
+    def test_repeated_statements_are_counted_per_request(self) -> None:
+        for _ in range(4):
+            self.query_profiler.inspect_statement(
+                statement="SELECT 1", parameters={}, duration=0.001, executemany=False
+            )
+
+        assert self.request_stats.statement_counts["SELECT 1"] == 4
+
+    def test_only_statements_over_the_threshold_are_logged_as_slow(self) -> None:
+        method_token = current_repository_method.set("AccountCRUDRepository.read_account")
+        self.query_profiler.inspect_statement(
+            statement="SELECT 1", parameters={"username_1": "ash"}, duration=0.999, executemany=False
+        )
+        self.query_profiler.inspect_statement(
+            statement="SELECT *\n  FROM account", parameters={"username_1": "ash"}, duration=1.5, executemany=False
+        )
+        current_repository_method.reset(method_token)
+
+        assert len(self.warnings) == 1
+        assert self.warnings[0].startswith("Slow Query --- 1500.0 ms in AccountCRUDRepository.read_account")
+        assert self.warnings[0].rstrip().endswith("| params {username_1: str} | SELECT * FROM account")
+        assert "ash" not in self.warnings[0]
+
+    def test_request_observers_are_notified(self) -> None:
+        observed_requests: list = list()
+        observer = lambda method, route, count: observed_requests.append((method, route, count))  # noqa: E731
+
+        self.query_profiler.add_request_observer(observer)
+        self.query_profiler.notify_request_completed(method="GET", route="/metrics", statement_count=0)
+        self.query_profiler.remove_request_observer(observer)
+        self.query_profiler.notify_request_completed(method="GET", route="/metrics", statement_count=0)
+
+        assert observed_requests == [("GET", "/metrics", 0)]
+
+    def tearDown(self) -> None:
+        loguru.logger.remove(self.handler_id)
+        current_request_stats.reset(self.stats_token)
+
+
+class TestStatementBudget(unittest.TestCase):
+    def setUp(self) -> None:
+        self.observed_requests = [("POST /api/v1/auth/signin", 6), ("GET /api/v1/account", 2)]
+
+    def test_global_budget_applies_to_every_request(self) -> None:
+        assert find_budget_violations(budget=5, observed_requests=self.observed_requests) == [
+            "POST /api/v1/auth/signin issued 6 statements (budget: 5)"
+        ]
+
+    def test_endpoint_budget_ignores_other_endpoints(self) -> None:
+        assert find_budget_violations(budget={"GET /api/v1/account": 1}, observed_requests=self.observed_requests) == [
+            "GET /api/v1/account issued 2 statements (budget: 1)"
+        ]
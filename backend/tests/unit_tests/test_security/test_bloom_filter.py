@@ -0,0 +1,59 @@
+import pathlib
+import tempfile
+import unittest
+
+from src.security.validation.bloom_filter import (
+    BLOOM_FILTER_MAGIC,
+    BloomFilter,
+    build_password_filter,
+    get_false_positive_rate,
+    get_optimal_parameters,
+)
+
+
+class TestBloomFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.word_list_path = pathlib.Path(self.temporary_directory.name) / "passwords.txt"
+        self.filter_path = pathlib.Path(self.temporary_directory.name) / "passwords.bloom"
+        self.word_list_path.write_text("\n".join(f"Password{index}!" for index in range(5000)) + "\n\n")
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_optimal_parameters(self) -> None:
+        bit_count, hash_count = get_optimal_parameters(item_count=1_000_000, false_positive_rate=0.001)
+
+        assert bit_count % 64 == 0
+        assert 20_000_000 < bit_count < 25_000_000
+        assert get_false_positive_rate(bits_per_item=bit_count / 1_000_000, hash_count=hash_count) <= 0.001
+        assert get_false_positive_rate(bits_per_item=bit_count / 1_000_000 - 1, hash_count=hash_count) > 0.001
+
+    def test_built_filter_is_loaded_through_mmap(self) -> None:
+        entries = build_password_filter(
+            word_list_path=self.word_list_path, output_path=self.filter_path, false_positive_rate=0.01
+        )
+        bloom_filter = BloomFilter.load(path=self.filter_path)
+
+        assert entries == 5000
+        assert all(f"password{index}!" in bloom_filter for index in range(5000))
+        false_positives = sum(f"unseen-{index}" in bloom_filter for index in range(10000))
+        assert false_positives < 300
+
+    def test_invalid_file_is_rejected(self) -> None:
+        self.filter_path.write_bytes(b"not a bloom filter at all")
+
+        with self.assertRaises(ValueError):
+            BloomFilter.load(path=self.filter_path)
+
+    def test_truncated_file_is_rejected(self) -> None:
+        build_password_filter(
+            word_list_path=self.word_list_path, output_path=self.filter_path, false_positive_rate=0.01
+        )
+        built_filter = self.filter_path.read_bytes()
+
+        for content in (b"", BLOOM_FILTER_MAGIC, built_filter[:19], built_filter[:-8]):
+            with self.subTest(size=len(content)):
+                self.filter_path.write_bytes(content)
+                with self.assertRaises(ValueError):
+                    BloomFilter.load(path=self.filter_path)
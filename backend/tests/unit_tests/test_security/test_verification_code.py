@@ -0,0 +1,23 @@
+import unittest
+
+from src.security.authentication.verification_code import generate_verification_code, hash_verification_code
+
+
+class TestVerificationCode(unittest.TestCase):
+    def setUp(self) -> None:
+        self.verification_code = generate_verification_code()
+
+    def test_generate_six_digit_verification_code(self) -> None:
+        assert 100000 <= self.verification_code <= 999999
+
+    def test_hash_verification_code_is_deterministic(self) -> None:
+        assert hash_verification_code(self.verification_code) == hash_verification_code(self.verification_code)
+
+    def test_hash_verification_code_hides_the_code(self) -> None:
+        hashed_code = hash_verification_code(self.verification_code)
+
+        assert str(self.verification_code) not in hashed_code
+        assert len(hashed_code) == 64
+
+    def tearDown(self) -> None:
+        pass
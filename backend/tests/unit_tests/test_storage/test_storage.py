@@ -0,0 +1,232 @@
+import tempfile
+import unittest
+import urllib.parse
+
+import fastapi
+import httpx
+
+from src.api.dependency.storage import get_storage
+from src.api.routes.storage import router as storage_router
+from src.storage.base import BaseStorage, iterate_content
+from src.storage.local import LocalStorage
+from src.storage.memory import MemoryStorage
+from src.storage.s3 import MIN_MULTIPART_PART_SIZE, S3Storage
+from src.utility.exceptions.custom import StorageObjectDoesNotExist
+
+CONTENT: bytes = bytes(range(256)) * 64
+
+
+class TestStorageBackends(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.root_dir = tempfile.TemporaryDirectory()
+
+    async def _assert_round_trip(self, storage: BaseStorage) -> None:
+        written_bytes = await storage.put(
+            key="images/a", chunks=iterate_content(content=CONTENT, chunk_size=1000), content_type="image/png"
+        )
+
+        assert written_bytes == len(CONTENT)
+        assert await storage.read(key="images/a") == CONTENT
+        assert b"".join([chunk async for chunk in storage.get(key="images/a", start=10, end=2000)]) == CONTENT[10:2001]
+        assert (await storage.stat(key="images/a")).size == len(CONTENT)
+        assert await storage.exists(key="images/a")
+
+        await storage.move(source_key="images/a", destination_key="images/b/a")
+
+        assert not await storage.exists(key="images/a")
+        assert await storage.read(key="images/b/a") == CONTENT
+        with self.assertRaises(StorageObjectDoesNotExist):
+            await storage.move(source_key="images/a", destination_key="images/c")
+
+        await storage.move(source_key="images/b/a", destination_key="images/a")
+        await storage.delete(key="images/a")
+        await storage.delete(key="images/a")
+
+        assert not await storage.exists(key="images/a")
+        with self.assertRaises(StorageObjectDoesNotExist):
+            await storage.read(key="images/a")
+
+    async def _assert_listing(self, storage: BaseStorage) -> None:
+        for key in ("images/ab/1", "images/ab/2", "images/cd/3", "imagesx/4", "other/5"):
+            await storage.put(key=key, chunks=iterate_content(content=key.encode()))
+
+        listed_objects = {
+            stored_object.key: stored_object async for stored_object in storage.list_objects(prefix="images/")
+        }
+
+        assert sorted(listed_objects) == ["images/ab/1", "images/ab/2", "images/cd/3"]
+        assert listed_objects["images/cd/3"].size == len(b"images/cd/3")
+        assert listed_objects["images/cd/3"].last_modified is not None
+        assert [stored_object.key async for stored_object in storage.list_objects(prefix="images/ab/2")] == [
+            "images/ab/2"
+        ]
+        assert [stored_object.key async for stored_object in storage.list_objects(prefix="missing/")] == []
+
+    async def test_memory_storage_round_trip(self) -> None:
+        await self._assert_round_trip(storage=MemoryStorage(chunk_size=512))
+
+    async def test_memory_storage_listing(self) -> None:
+        await self._assert_listing(storage=MemoryStorage())
+
+    async def test_local_storage_round_trip(self) -> None:
+        await self._assert_round_trip(
+            storage=LocalStorage(
+                root_dir=self.root_dir.name, base_url="/storage", signing_key=b"secret", chunk_size=512
+            )
+        )
+
+    async def test_local_storage_listing(self) -> None:
+        await self._assert_listing(
+            storage=LocalStorage(root_dir=self.root_dir.name, base_url="/storage", signing_key=b"secret")
+        )
+
+    async def test_local_storage_presigned_url_is_bound_to_its_key(self) -> None:
+        storage = LocalStorage(root_dir=self.root_dir.name, base_url="/storage", signing_key=b"secret")
+
+        url = urllib.parse.urlsplit(await storage.presigned_url(key="images/a", expires_in=60))
+        query = dict(urllib.parse.parse_qsl(url.query))
+
+        assert url.path == "/storage/images/a"
+        assert storage.verify_presigned_url(
+            key="images/a", method="GET", expires_at=int(query["expires"]), signature=query["signature"]
+        )
+        assert not storage.verify_presigned_url(
+            key="images/b", method="GET", expires_at=int(query["expires"]), signature=query["signature"]
+        )
+
+    async def test_local_storage_rejects_keys_outside_its_root(self) -> None:
+        storage = LocalStorage(root_dir=self.root_dir.name, base_url="/storage", signing_key=b"secret")
+
+        with self.assertRaises(ValueError):
+            await storage.delete(key="../outside")
+
+    def tearDown(self) -> None:
+        self.root_dir.cleanup()
+
+
+class FakeS3Client:
+    def __init__(self, failing_part: int | None = None) -> None:
+        self.failing_part = failing_part
+        self.calls: list[str] = list()
+        self.parts: dict[int, bytes] = dict()
+        self.completed_parts: list[dict] = list()
+
+    def put_object(self, **kwargs) -> dict:
+        self.calls.append("put_object")
+        return {}
+
+    def create_multipart_upload(self, **kwargs) -> dict:
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, PartNumber: int, Body: bytes, **kwargs) -> dict:
+        if PartNumber == self.failing_part:
+            raise ConnectionError("connection reset")
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, MultipartUpload: dict, **kwargs) -> dict:
+        self.calls.append("complete_multipart_upload")
+        self.completed_parts = MultipartUpload["Parts"]
+        return {}
+
+    def abort_multipart_upload(self, **kwargs) -> dict:
+        self.calls.append("abort_multipart_upload")
+        return {}
+
+    def list_objects_v2(self, Prefix: str, ContinuationToken: str | None = None, **kwargs) -> dict:
+        self.calls.append(f"list_objects_v2:{ContinuationToken}")
+        if ContinuationToken is None:
+            return {
+                "Contents": [{"Key": f"{Prefix}a", "Size": 1}],
+                "IsTruncated": True,
+                "NextContinuationToken": "page-2",
+            }
+        return {"Contents": [{"Key": f"{Prefix}b", "Size": 2}], "IsTruncated": False}
+
+
+class TestS3Storage(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = FakeS3Client()
+        self.storage = S3Storage(
+            bucket="ggea", region_name="eu-central-1", access_key="key", secret_access_key="secret"
+        )
+        self.storage._client = self.client  # type: ignore
+
+    async def test_small_objects_use_a_single_put(self) -> None:
+        await self.storage.put(key="images/a", chunks=iterate_content(content=CONTENT))
+
+        assert self.client.calls == ["put_object"]
+
+    async def test_large_objects_are_uploaded_in_ordered_parts(self) -> None:
+        data = b"x" * (self.storage.part_size * 2 + 10)
+
+        written_bytes = await self.storage.put(
+            key="images/a", chunks=iterate_content(content=data, chunk_size=1024 * 1024)
+        )
+
+        assert written_bytes == len(data)
+        assert self.client.calls == ["create_multipart_upload", "complete_multipart_upload"]
+        assert [part["PartNumber"] for part in self.client.completed_parts] == [1, 2, 3]
+        assert b"".join(self.client.parts[part_number] for part_number in (1, 2, 3)) == data
+
+    async def test_failed_multipart_upload_is_aborted(self) -> None:
+        self.client.failing_part = 2
+        self.storage.part_size = MIN_MULTIPART_PART_SIZE
+
+        with self.assertRaises(ConnectionError):
+            await self.storage.put(
+                key="images/a",
+                chunks=iterate_content(content=b"x" * (MIN_MULTIPART_PART_SIZE * 4), chunk_size=1024 * 1024),
+            )
+
+        assert self.client.calls[-1] == "abort_multipart_upload"
+        assert "complete_multipart_upload" not in self.client.calls
+
+    async def test_listing_follows_every_page(self) -> None:
+        listed_objects = [stored_object async for stored_object in self.storage.list_objects("x/")]
+
+        assert [(stored_object.key, stored_object.size) for stored_object in listed_objects] == [
+            ("x/a", 1),
+            ("x/b", 2),
+        ]
+        assert self.client.calls == ["list_objects_v2:None", "list_objects_v2:page-2"]
+
+
+class TestLocalStorageRoute(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorage(root_dir=self.root_dir.name, base_url="/storage", signing_key=b"secret")
+        await self.storage.put(key="variants/ab/thumbnail.webp", chunks=iterate_content(content=CONTENT))
+
+        app = fastapi.FastAPI()
+        app.include_router(router=storage_router)
+        app.dependency_overrides[get_storage] = lambda: self.storage
+        self.client = httpx.AsyncClient(app=app, base_url="http://testserver")
+
+    async def test_presigned_url_streams_the_object(self) -> None:
+        url = await self.storage.presigned_url(key="variants/ab/thumbnail.webp", expires_in=60)
+
+        response = await self.client.get(url)
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["cache-control"].startswith("private")
+
+    async def test_tampered_or_expired_url_is_forbidden(self) -> None:
+        url = await self.storage.presigned_url(key="variants/ab/thumbnail.webp", expires_in=60)
+        expired_url = await self.storage.presigned_url(key="variants/ab/thumbnail.webp", expires_in=-1)
+
+        assert (await self.client.get(url.replace("thumbnail", "original"))).status_code == 403
+        assert (await self.client.get(url.replace("method=GET", "method=PUT"))).status_code == 403
+        assert (await self.client.get(expired_url)).status_code == 403
+
+    async def test_missing_object_is_not_found(self) -> None:
+        url = await self.storage.presigned_url(key="variants/ab/missing.webp", expires_in=60)
+
+        assert (await self.client.get(url)).status_code == 404
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+        self.root_dir.cleanup()
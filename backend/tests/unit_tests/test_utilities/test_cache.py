@@ -0,0 +1,46 @@
+import unittest
+
+from src.utility.cache.ttl import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10, clock=lambda: self.now)
+
+    def test_entry_expires_after_ttl(self) -> None:
+        self.cache.set(key="a", value=1)
+        self.now = 9.9
+
+        assert self.cache.get(key="a") == 1
+
+        self.now = 10.0
+
+        assert self.cache.get(key="a") is None
+        assert len(self.cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        self.cache.set(key="a", value=1)
+        self.cache.set(key="b", value=2)
+        self.cache.get(key="a")
+        self.cache.set(key="c", value=3)
+
+        assert self.cache.get(key="b") is None
+        assert (self.cache.get(key="a"), self.cache.get(key="c")) == (1, 3)
+
+    def test_invalidate_drops_entry(self) -> None:
+        self.cache.set(key="a", value=0)
+        self.cache.invalidate(key="a")
+        self.cache.invalidate(key="missing")
+
+        assert self.cache.get(key="a") is None
+
+    def test_invalidate_where_drops_matching_entries(self) -> None:
+        self.cache.set(key="a:1", value=1)
+        self.cache.set(key="b:1", value=2)
+
+        assert self.cache.invalidate_where(predicate=lambda key: key.startswith("a:")) == 1
+        assert (self.cache.get(key="a:1"), self.cache.get(key="b:1")) == (None, 2)
+
+    def tearDown(self) -> None:
+        self.cache.clear()
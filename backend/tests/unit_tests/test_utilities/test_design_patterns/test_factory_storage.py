@@ -0,0 +1,20 @@
+import unittest
+
+from src.storage.local import LocalStorage
+from src.storage.memory import MemoryStorage
+from src.utility.design_patterns.factory.storage import get_storage_backend
+
+
+class TestStorageFactory(unittest.TestCase):
+    def test_create_local_storage_from_storage_factory(self) -> None:
+        assert isinstance(get_storage_backend(backend="local"), LocalStorage)
+
+    def test_create_memory_storage_from_storage_factory(self) -> None:
+        assert isinstance(get_storage_backend(backend="memory"), MemoryStorage)
+
+    def test_storage_backend_is_shared(self) -> None:
+        assert get_storage_backend(backend="memory") is get_storage_backend(backend="memory")
+
+    def test_unknown_storage_backend_is_rejected(self) -> None:
+        with self.assertRaises(Exception):
+            get_storage_backend(backend="ftp")
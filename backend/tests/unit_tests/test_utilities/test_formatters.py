@@ -1,6 +1,9 @@
 import datetime
 import unittest
+import uuid
 
+from src.utility.exceptions.custom import InvalidPaginationCursor
+from src.utility.formatters.cursor import decode_keyset_cursor, encode_keyset_cursor
 from src.utility.formatters.date_time import datetime_2_isoformat
 from src.utility.formatters.name_case import any_2_snake, snake_2_camel, snake_2_pascal
 
@@ -31,5 +34,16 @@ class TestFormatters(unittest.TestCase):
         assert any_2_snake(var=self.any_case_var_2) == self.snake_case_var_2
         assert any_2_snake(var=self.any_case_var_3) == self.snake_case_var_2
 
+    def test_keyset_cursor_round_trip(self) -> None:
+        created_at = datetime.datetime(2023, 2, 10, 8, 30, 1, 250000, tzinfo=datetime.timezone.utc)
+        id = uuid.uuid4()
+
+        cursor = encode_keyset_cursor(created_at=created_at, id=id)
+
+        assert "=" not in cursor
+        assert decode_keyset_cursor(cursor=cursor) == (created_at, id)
+        with self.assertRaises(InvalidPaginationCursor):
+            decode_keyset_cursor(cursor="not-a-cursor")
+
     def tearDown(self):
         pass
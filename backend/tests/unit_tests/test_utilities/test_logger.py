@@ -0,0 +1,85 @@
+import io
+import json
+import unittest
+
+import loguru
+
+from src.utility.logger.context import current_request_id
+from src.utility.logger.redaction import redact_message, redact_value, REDACTED
+from src.utility.logger.sampling import LogSampler, parse_logger_rates
+from src.utility.logger.setup import configure_logger, dispose_sink
+
+
+class TestLogSampling(unittest.TestCase):
+    def test_parse_logger_rates(self) -> None:
+        assert parse_logger_rates(rates="src.api=0.1, src.repository = 2 ,") == {"src.api": 0.1, "src.repository": 2.0}
+        assert parse_logger_rates(rates="") == {}
+
+    def test_sampler_uses_longest_prefix_and_keeps_warnings(self) -> None:
+        sampler = LogSampler(sampling_rates={"src": 1.0, "src.api.dependency": 0.0}, rate_limits={})
+        info_level = loguru.logger.level("INFO")
+        warning_level = loguru.logger.level("WARNING")
+
+        assert sampler({"name": "src.api.dependency.header", "level": info_level}) is False
+        assert sampler({"name": "src.api.routes", "level": info_level}) is True
+        assert sampler({"name": "src.api.dependency.header", "level": warning_level}) is True
+
+    def test_sampler_rate_limit(self) -> None:
+        sampler = LogSampler(sampling_rates={}, rate_limits={"src": 2})
+        info_level = loguru.logger.level("INFO")
+
+        passed_records = [sampler({"name": "src.jobs", "level": info_level}) for _ in range(10)]
+
+        assert passed_records.count(True) == 2
+
+
+class TestLogRedaction(unittest.TestCase):
+    def test_redact_value_masks_secret_fields(self) -> None:
+        redacted_extra = redact_value(field_name="", value={"password": "Secret123!", "nested": {"jwt_token": "abc"}})
+
+        assert redacted_extra == {"password": REDACTED, "nested": {"jwt_token": REDACTED}}
+
+    def test_redact_message_masks_assignments(self) -> None:
+        assert redact_message(message="Updating password to Secret123!") == f"Updating password to {REDACTED}"
+        assert redact_message(message="token=abc user=ash") == f"token={REDACTED} user=ash"
+
+
+class TestJSONLogPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stream = io.StringIO()
+        self.sink = configure_logger(level="INFO", is_json=True, sampling_rates={}, rate_limits={}, stream=self.stream)
+
+    def tearDown(self) -> None:
+        dispose_sink()
+        loguru.logger.remove()
+
+    def test_records_are_json_with_request_id_and_redacted(self) -> None:
+        request_id_token = current_request_id.set("req-1")
+        loguru.logger.debug("Dropped below level")
+        loguru.logger.bind(password="Secret123!").info("Updating password to Secret123!")
+        current_request_id.reset(request_id_token)
+        self.sink.flush(timeout=5)
+
+        lines = self.stream.getvalue().splitlines()
+        record = json.loads(lines[0])
+
+        assert len(lines) == 1
+        assert record["level"] == "INFO"
+        assert record["request_id"] == "req-1"
+        assert record["message"] == f"Updating password to {REDACTED}"
+        assert record["extra"] == {"password": REDACTED}
+
+    def test_exception_records_keep_a_redacted_traceback(self) -> None:
+        try:
+            raise ValueError("Rejected password=Secret123!")
+        except ValueError:
+            loguru.logger.exception("Signup failed")
+        self.sink.flush(timeout=5)
+
+        exception = json.loads(self.stream.getvalue())["exception"]
+
+        assert exception["type"] == "ValueError"
+        assert exception["traceback"].startswith("Traceback (most recent call last):")
+        assert "test_exception_records_keep_a_redacted_traceback" in exception["traceback"]
+        assert f"ValueError: Rejected password={REDACTED}" in exception["traceback"]
+        assert "Secret123!" not in exception["traceback"]
@@ -0,0 +1,70 @@
+import unittest
+
+from src.utility.metrics.prometheus import Counter, Histogram, MetricsRegistry
+from src.utility.metrics.request import current_request_stats, record_pool_wait, record_statement, RequestStats
+
+
+class TestPrometheusMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry()
+        self.counter: Counter = self.registry.counter(
+            name="test_requests_total", documentation="Test counter.", label_names=("route",)
+        )
+        self.histogram: Histogram = self.registry.histogram(
+            name="test_latency_seconds", documentation="Test histogram.", label_names=("route",), buckets=(0.1, 1.0)
+        )
+
+    def test_counter_accumulates_per_label(self) -> None:
+        self.counter.inc("/a")
+        self.counter.inc("/a", amount=2)
+        self.counter.inc("/b")
+
+        assert self.counter.value("/a") == 3
+        assert self.counter.value("/b") == 1
+
+    def test_histogram_renders_cumulative_buckets(self) -> None:
+        for latency in (0.05, 0.5, 5.0):
+            self.histogram.observe(latency, "/a")
+
+        rendered_metrics = self.registry.render()
+
+        assert "# TYPE test_latency_seconds histogram" in rendered_metrics
+        assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in rendered_metrics
+        assert 'test_latency_seconds_bucket{route="/a",le="1"} 2' in rendered_metrics
+        assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in rendered_metrics
+        assert 'test_latency_seconds_count{route="/a"} 3' in rendered_metrics
+
+    def test_histogram_quantile_interpolates_inside_bucket(self) -> None:
+        for _ in range(10):
+            self.histogram.observe(0.5, "/a")
+
+        assert 0.1 < self.histogram.quantile(0.5, "/a") <= 1.0
+
+    def test_registry_rejects_duplicate_metric(self) -> None:
+        with self.assertRaises(ValueError):
+            self.registry.counter(name="test_requests_total", documentation="Duplicate.")
+
+    def test_wrong_label_count_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.counter.inc("/a", "GET")
+
+    def tearDown(self) -> None:
+        pass
+
+
+class TestRequestStats(unittest.TestCase):
+    def setUp(self) -> None:
+        self.request_stats = RequestStats()
+        self.stats_token = current_request_stats.set(self.request_stats)
+
+    def test_statements_and_pool_wait_are_recorded_in_current_request(self) -> None:
+        record_statement(duration=0.002)
+        record_statement(duration=0.003)
+        record_pool_wait(duration=0.001)
+
+        assert self.request_stats.statement_count == 2
+        assert abs(self.request_stats.db_duration - 0.005) < 1e-9
+        assert 'desc="2 statements"' in self.request_stats.as_server_timing(app_duration=0.01)
+
+    def tearDown(self) -> None:
+        current_request_stats.reset(self.stats_token)
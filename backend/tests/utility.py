@@ -0,0 +1,13 @@
+import io
+import typing
+
+from PIL import Image
+
+
+def encode_image(image: Image.Image, image_format: str = "PNG", **save_options: typing.Any) -> bytes:
+    """
+    The bytes of `image` saved in `image_format`, as an upload or a stored master would hold them.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, **save_options)
+    return buffer.getvalue()